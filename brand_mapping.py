@@ -8,62 +8,90 @@ JSON 파일로 데이터 저장/불러오기 지원
 import json
 import os
 from typing import Optional
+from id_allocator import NameIdAllocator
+from id_sequence import ID_SEQUENCE
+from sql_segment_writer import get_segment_writer
 
 # 브랜드 데이터 파일 경로
 DEFAULT_DATA_FILE = "brand_data.json"
 SQL_OUTPUT_FILE = "brand_sql.txt"
 
+# brands INSERT 문 머리말
+BRAND_SQL_HEADER = "INSERT INTO brands (id, name, is_deleted, created_at, updated_at) VALUES"
+
+# brands VALUES 세그먼트 기록기 (brand_sql.txt는 export_all_sql() 시점에 생성)
+BRAND_SQL_WRITER = get_segment_writer(SQL_OUTPUT_FILE, BRAND_SQL_HEADER)
+
+# 브랜드명 -> 브랜드 ID 할당기 (brand_data.json 스냅샷 + brand_data.json.journal)
+BRAND_ID_ALLOCATOR = NameIdAllocator(DEFAULT_DATA_FILE, "brands", sequence=ID_SEQUENCE, sequence_name="brand")
+
 # 전역 변수
 BRAND_NAME_TO_ID = {}
 BRAND_ID_TO_NAME = {}
 _current_max_id = 0
 _id_sequence = 1
+_initialized = False
+
+def init_brand_data():
+    """
+    브랜드 데이터를 불러옵니다. (최초 1회만 수행, 이후 호출은 무시)
+    모듈 임포트 시에는 파일을 읽지 않으며, 브랜드 조회 함수가 처음 호출될 때 자동으로 실행됩니다.
+    """
+    if not _initialized:
+        _initialize_data()
 
 def _initialize_data():
     """데이터 초기화"""
-    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _current_max_id, _id_sequence
+    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _current_max_id, _id_sequence, _initialized
+
+    _initialized = True
 
     # JSON 파일에서 불러오기 시도
     if os.path.exists(DEFAULT_DATA_FILE):
         load_from_file(DEFAULT_DATA_FILE)
     else:
         # 파일이 없으면 빈 데이터로 시작
-        BRAND_NAME_TO_ID = {}
+        BRAND_ID_ALLOCATOR.load()
+        BRAND_NAME_TO_ID = BRAND_ID_ALLOCATOR.index
         BRAND_ID_TO_NAME = {}
         _current_max_id = 0
         _id_sequence = 1
         print(f"'{DEFAULT_DATA_FILE}' 파일을 찾을 수 없습니다. 새로 생성합니다.")
 
+    # 세그먼트도 SQL 파일도 없으면 불러온 브랜드 목록으로 세그먼트를 한 번만 생성
+    if not os.path.exists(BRAND_SQL_WRITER.segment_path) and not os.path.exists(SQL_OUTPUT_FILE):
+        BRAND_SQL_WRITER.reset([format_brand_values(name, id_val) for name, id_val in get_all_brands()])
+
+def format_brand_values(name: str, id_val: int) -> str:
+    """
+    brands VALUES 튜플 한 개를 만듭니다.
+
+    Args:
+        name (str): 브랜드 이름
+        id_val (int): 브랜드 ID
+
+    Returns:
+        str: "(id, 'name', FALSE, NOW(), NOW())" 형식의 문자열
+    """
+    return f"({id_val}, '{name}', FALSE, NOW(), NOW())"
+
 def _update_sql_file(transaction=None):
     """
-    전체 브랜드 목록으로 SQL 파일을 업데이트합니다.
-    ID 포함하여 생성합니다.
+    전체 브랜드 목록으로 SQL 세그먼트를 다시 만들고 SQL 파일로 내보냅니다.
+    ID 포함하여 생성합니다. (새 브랜드마다 호출하지 않음)
 
     Args:
         transaction: FileTransaction 객체 (트랜잭션 사용 시)
     """
     try:
-        sql_content = "INSERT INTO brands (id, name, is_deleted, created_at, updated_at) VALUES"
-
         all_brands = get_all_brands()
-        sql_lines = []
-
-        for name, id_val in all_brands:
-            sql_line = f"({id_val}, '{name}', FALSE, NOW(), NOW())"
-            sql_lines.append(sql_line)
+        sql_lines = [format_brand_values(name, id_val) for name, id_val in all_brands]
 
-        if sql_lines:
-            sql_content += "\n" + ",\n".join(sql_lines) + ";"
-        else:
-            sql_content += ";"
+        BRAND_SQL_WRITER.reset(sql_lines, transaction)
 
-        if transaction:
-            # 트랜잭션 사용
-            transaction.write_file(SQL_OUTPUT_FILE, sql_content)
-        else:
-            # 일반 파일 쓰기
-            with open(SQL_OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                f.write(sql_content)
+        if not transaction:
+            # 트랜잭션 사용 시에는 커밋 후 export_all_sql()에서 내보냄
+            BRAND_SQL_WRITER.export()
 
         print(f"SQL 파일이 업데이트되었습니다: {SQL_OUTPUT_FILE} (총 {len(all_brands)}개)")
 
@@ -74,6 +102,7 @@ def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     """
     브랜드 이름으로 ID를 조회합니다.
     브랜드가 없으면 자동으로 새로 생성합니다.
+    새 브랜드는 할당 저널과 SQL 세그먼트에 한 줄씩만 추가합니다.
 
     Args:
         brand_name (str): 브랜드 이름
@@ -84,6 +113,8 @@ def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     """
     global _current_max_id, _id_sequence
 
+    init_brand_data()
+
     # 브랜드 이름 정리
     cleaned_name = brand_name.strip()
 
@@ -95,31 +126,22 @@ def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     if cleaned_name in BRAND_NAME_TO_ID:
         return BRAND_NAME_TO_ID[cleaned_name]
 
-    # 새로운 브랜드 자동 생성
-    new_id = _id_sequence
-    BRAND_NAME_TO_ID[cleaned_name] = new_id
+    # 새로운 브랜드 자동 생성 (저널에 추가, 롤백 시 메모리 인덱스도 취소됨)
+    new_id = BRAND_ID_ALLOCATOR.allocate(cleaned_name, transaction)
     BRAND_ID_TO_NAME[new_id] = cleaned_name
 
     # 시퀀스 업데이트
-    _id_sequence += 1
-    _current_max_id = new_id
+    _id_sequence = BRAND_ID_ALLOCATOR.next_id
+    _current_max_id = max(_current_max_id, new_id)
 
     print(f"새로운 브랜드 생성: '{cleaned_name}' -> ID: {new_id}")
 
-    # SQL 파일 업데이트 (트랜잭션 또는 일반 파일 쓰기)
-    _update_sql_file(transaction)
+    # SQL 세그먼트 끝에 추가 (트랜잭션 또는 일반 파일 쓰기)
+    BRAND_SQL_WRITER.append([format_brand_values(cleaned_name, new_id)], transaction)
 
-    # 변경사항 파일에 저장
     if transaction:
-        # 트랜잭션 사용
-        data = {
-            'brands': BRAND_NAME_TO_ID,
-            'next_id': _id_sequence
-        }
-        transaction.write_json(DEFAULT_DATA_FILE, data)
-    else:
-        # 일반 파일 쓰기
-        save_to_file(DEFAULT_DATA_FILE)
+        # 롤백되면 ID -> 이름 매핑도 되돌림
+        transaction.add_rollback_hook(lambda: BRAND_ID_TO_NAME.pop(new_id, None))
 
     return new_id
 
@@ -133,6 +155,7 @@ def get_brand_name(brand_id: int) -> Optional[str]:
     Returns:
         str or None: 브랜드 이름 (존재하지 않으면 None)
     """
+    init_brand_data()
     return BRAND_ID_TO_NAME.get(brand_id)
 
 def get_all_brands() -> list:
@@ -142,6 +165,7 @@ def get_all_brands() -> list:
     Returns:
         list of tuple: (브랜드 이름, 브랜드 ID) 리스트, ID순으로 정렬
     """
+    init_brand_data()
     return sorted([(name, id_val) for name, id_val in BRAND_NAME_TO_ID.items()],
                   key=lambda x: x[1])  # ID순으로 정렬
 
@@ -152,6 +176,7 @@ def get_brand_count() -> int:
     Returns:
         int: 브랜드 수
     """
+    init_brand_data()
     return len(BRAND_NAME_TO_ID)
 
 def get_next_brand_id() -> int:
@@ -161,11 +186,12 @@ def get_next_brand_id() -> int:
     Returns:
         int: 다음 브랜드 ID
     """
-    return _id_sequence
+    return ID_SEQUENCE.peek("brand")
 
 def save_to_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     """
     브랜드 데이터를 JSON 파일로 저장합니다.
+    기본 데이터 파일이면 저널을 스냅샷에 합치고 저널을 비웁니다.
 
     Args:
         filename (str): 저장할 파일 이름
@@ -173,7 +199,13 @@ def save_to_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     Returns:
         bool: 성공 여부
     """
+    init_brand_data()
+
     try:
+        if filename == BRAND_ID_ALLOCATOR.json_path:
+            BRAND_ID_ALLOCATOR.compact()
+            return True
+
         data = {
             'brands': BRAND_NAME_TO_ID,
             'next_id': _id_sequence
@@ -190,7 +222,8 @@ def save_to_file(filename: str = DEFAULT_DATA_FILE) -> bool:
 
 def load_from_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     """
-    JSON 파일에서 브랜드 데이터를 불러옵니다.
+    JSON 파일(및 할당 저널)에서 브랜드 데이터를 불러옵니다.
+    SQL 파일은 다시 만들지 않습니다. (필요하면 generate_sql_file() 호출)
 
     Args:
         filename (str): 불러올 파일 이름
@@ -198,27 +231,27 @@ def load_from_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     Returns:
         bool: 성공 여부
     """
-    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _id_sequence, _current_max_id
+    global BRAND_ID_ALLOCATOR, BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _id_sequence, _current_max_id, _initialized
 
     if not os.path.exists(filename):
         print(f"파일을 찾을 수 없습니다: {filename}")
         return False
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if filename != BRAND_ID_ALLOCATOR.json_path:
+            BRAND_ID_ALLOCATOR = NameIdAllocator(filename, "brands", sequence=ID_SEQUENCE, sequence_name="brand")
 
         # 데이터 로드
-        BRAND_NAME_TO_ID = data['brands']
+        BRAND_ID_ALLOCATOR.loaded = False
+        BRAND_ID_ALLOCATOR.load()
+        BRAND_NAME_TO_ID = BRAND_ID_ALLOCATOR.index
         BRAND_ID_TO_NAME = {v: k for k, v in BRAND_NAME_TO_ID.items()}
-        _id_sequence = data['next_id']
+        _id_sequence = BRAND_ID_ALLOCATOR.next_id
         _current_max_id = max(BRAND_ID_TO_NAME.keys()) if BRAND_ID_TO_NAME else 0
+        _initialized = True
 
         print(f"브랜드 데이터를 '{filename}' 파일에서 불러왔습니다. (총 {len(BRAND_NAME_TO_ID)}개)")
 
-        # SQL 파일 업데이트
-        _update_sql_file()
-
         return True
 
     except Exception as e:
@@ -235,6 +268,7 @@ def search_brands(keyword: str) -> list:
     Returns:
         list: 검색된 브랜드 목록 [(name, id), ...]
     """
+    init_brand_data()
     keyword = keyword.lower()
     results = []
 
@@ -271,18 +305,19 @@ def export_brands_to_txt(filename: str = "brands_export.txt") -> bool:
 
 def generate_sql_file(transaction=None):
     """
-    현재 브랜드 목록으로 SQL 파일을 생성합니다.
+    현재 브랜드 목록으로 SQL 세그먼트와 SQL 파일을 처음부터 다시 생성합니다.
+    (평소에는 새 브랜드가 세그먼트에 추가되므로 호출할 필요 없음)
 
     Args:
         transaction: FileTransaction 객체 (트랜잭션 사용 시)
     """
     _update_sql_file(transaction)
 
-# 모듈 로드 시 데이터 초기화
-_initialize_data()
-
 # 디버깅 및 테스트용
 if __name__ == "__main__":
+    # 데이터 초기화
+    init_brand_data()
+
     # 현재 상태 출력
     print(f"현재 브랜드 수: {get_brand_count()}")
     print(f"현재 최대 ID: {_current_max_id}")
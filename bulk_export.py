@@ -0,0 +1,209 @@
+"""
+대량 적재(bulk load)용 내보내기 모듈
+SQLite 스테이징 DB(crawl_sink.SQLiteSink)의 크롤링 결과를 테이블별 TSV/CSV 파일로 스트리밍하고,
+PostgreSQL COPY / MySQL LOAD DATA 적재 스크립트를 함께 생성합니다.
+
+- tsv: PostgreSQL COPY text 형식 = MySQL LOAD DATA 기본 형식
+       (탭 구분, 역슬래시 이스케이프, NULL은 \\N)
+- csv: 모든 값을 큰따옴표로 감싸고 따옴표는 두 번 씀, NULL은 따옴표 없는 NULL, 첫 줄은 헤더
+
+거대한 INSERT 문 대신 DB의 대량 적재 경로를 사용하므로 적재 시간이 크게 줄어듭니다.
+NOW()로 채우던 created_at/updated_at은 내보내기 시각 하나로 고정됩니다.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+from crawl_sink import SQLITE_DB_PATH, DETAIL_INFO_COLUMNS
+from product_mapping import PRODUCT_COLUMNS, build_product_row
+
+# 출력 형식
+FORMAT_TSV = "tsv"
+FORMAT_CSV = "csv"
+
+# 기본 출력 디렉토리
+BULK_EXPORT_DIR = "bulk_export"
+
+# 생성할 적재 스크립트 파일명
+POSTGRES_LOAD_SCRIPT = "load_postgres.sql"
+MYSQL_LOAD_SCRIPT = "load_mysql.sql"
+
+# COPY text 형식에서 이스케이프할 문자
+_COPY_TEXT_ESCAPES = {
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+}
+
+
+def escape_copy_text(value):
+    """
+    값 하나를 COPY text / LOAD DATA 기본 형식의 필드로 바꿉니다.
+
+    Args:
+        value: None, bool, int, str 등
+
+    Returns:
+        str: 이스케이프된 필드 문자열 (None이면 \\N)
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return "".join(_COPY_TEXT_ESCAPES.get(ch, ch) for ch in str(value))
+
+
+def escape_csv(value):
+    """
+    값 하나를 CSV 필드로 바꿉니다. (항상 큰따옴표로 감쌈, NULL은 따옴표 없이)
+
+    Args:
+        value: None, bool, int, str 등
+
+    Returns:
+        str: CSV 필드 문자열
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        value = "1" if value else "0"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _table_specs(conn, exported_at):
+    """
+    내보낼 테이블 목록을 반환합니다.
+
+    Returns:
+        list of tuple: [(테이블명, 컬럼 리스트, 행 iterator), ...]
+    """
+    return [
+        ("brands", ["id", "name", "is_deleted", "created_at", "updated_at"], (
+            (id_val, name, False, exported_at, exported_at)
+            for id_val, name in conn.execute("SELECT id, name FROM brands ORDER BY id")
+        )),
+        ("products", PRODUCT_COLUMNS, (
+            build_product_row(*row)
+            for row in conn.execute("SELECT id, product_detail_info_id, brand_id, category_id, product_name, "
+                                    "created_at FROM products ORDER BY id")
+        )),
+        ("product_detail_info", ["id"] + DETAIL_INFO_COLUMNS + ["created_at", "updated_at"], (
+            tuple(row) + (exported_at, exported_at)
+            for row in conn.execute(f"SELECT id, {', '.join(DETAIL_INFO_COLUMNS)} "
+                                    f"FROM product_detail_info ORDER BY id")
+        )),
+        ("product_main_images", ["product_id", "image_type", "display_order", "image_url"], (
+            conn.execute("SELECT product_id, image_type, display_order, image_url "
+                         "FROM product_main_images ORDER BY product_id, display_order")
+        )),
+        ("product_detail_images", ["product_id", "display_order", "image_url"], (
+            conn.execute("SELECT product_id, display_order, image_url "
+                         "FROM product_detail_images ORDER BY product_id, display_order")
+        )),
+        ("product_options", ["product_id", "option_name", "purchase_price", "selling_price",
+                             "current_stock", "initial_stock", "safety_stock", "image_url",
+                             "display_order", "is_deleted", "created_at", "updated_at"], (
+            tuple(row[:9]) + (bool(row[9]), exported_at, exported_at)
+            for row in conn.execute("SELECT product_id, option_name, purchase_price, selling_price, "
+                                    "current_stock, initial_stock, safety_stock, image_url, display_order, "
+                                    "is_deleted FROM product_options ORDER BY product_id, display_order")
+        )),
+    ]
+
+
+def _postgres_load_statement(table, columns, path, fmt):
+    """PostgreSQL \\copy 문 (클라이언트 쪽 파일을 읽으므로 서버 파일 권한 불필요)"""
+    options = "FORMAT csv, HEADER true, NULL 'NULL'" if fmt == FORMAT_CSV else "FORMAT text"
+    return f"\\copy {table} ({', '.join(columns)}) FROM '{path}' WITH ({options})"
+
+
+def _mysql_load_statement(table, columns, path, fmt):
+    """MySQL LOAD DATA LOCAL INFILE 문"""
+    if fmt == FORMAT_CSV:
+        fields = "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY ''"
+        ignore = " IGNORE 1 LINES"
+    else:
+        fields = "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'"
+        ignore = ""
+    return (f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table} CHARACTER SET utf8mb4 "
+            f"{fields} LINES TERMINATED BY '\\n'{ignore} ({', '.join(columns)});")
+
+
+def export_bulk(db_path=SQLITE_DB_PATH, output_dir=BULK_EXPORT_DIR, fmt=FORMAT_TSV):
+    """
+    스테이징 DB의 각 테이블을 대량 적재용 파일로 내보냅니다.
+
+    Args:
+        db_path: SQLite DB 파일 경로
+        output_dir: 출력 디렉토리
+        fmt: "tsv" 또는 "csv"
+
+    Returns:
+        dict: {데이터 파일 경로: 행 수}
+    """
+    if fmt not in (FORMAT_TSV, FORMAT_CSV):
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"스테이징 DB를 찾을 수 없습니다: {db_path}")
+
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    escape = escape_csv if fmt == FORMAT_CSV else escape_copy_text
+    separator = "," if fmt == FORMAT_CSV else "\t"
+    exported_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    results = {}
+    postgres_lines = ["BEGIN;"]
+    mysql_lines = ["START TRANSACTION;"]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        for table, columns, rows in _table_specs(conn, exported_at):
+            file_name = f"{table}.{fmt}"
+            path = os.path.join(output_dir, file_name)
+
+            count = 0
+            temp_path = path + ".tmp"
+            # newline='' : 줄바꿈을 \n 그대로 기록 (Windows에서도 \r\n으로 바뀌지 않음)
+            with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+                if fmt == FORMAT_CSV:
+                    f.write(separator.join(columns) + "\n")
+                for row in rows:
+                    f.write(separator.join(escape(value) for value in row) + "\n")
+                    count += 1
+            os.replace(temp_path, path)
+
+            results[path] = count
+            postgres_lines.append(_postgres_load_statement(table, columns, file_name, fmt))
+            mysql_lines.append(_mysql_load_statement(table, columns, file_name, fmt))
+    finally:
+        conn.close()
+
+    postgres_lines.append("COMMIT;")
+    mysql_lines.append("COMMIT;")
+
+    # 적재 스크립트는 출력 디렉토리에서 실행하는 것을 기준으로 상대 경로 사용
+    with open(os.path.join(output_dir, POSTGRES_LOAD_SCRIPT), 'w', encoding='utf-8', newline='') as f:
+        f.write("\n".join(postgres_lines) + "\n")
+    with open(os.path.join(output_dir, MYSQL_LOAD_SCRIPT), 'w', encoding='utf-8', newline='') as f:
+        f.write("\n".join(mysql_lines) + "\n")
+
+    for path, count in results.items():
+        print(f"✓ {path} ({count}행)")
+    print(f"✓ 적재 스크립트: {POSTGRES_LOAD_SCRIPT} (psql), {MYSQL_LOAD_SCRIPT} (mysql --local-infile=1)")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 사용법: python bulk_export.py [tsv|csv] [DB 경로] [출력 디렉토리]
+    export_bulk(
+        sys.argv[2] if len(sys.argv) > 2 else SQLITE_DB_PATH,
+        sys.argv[3] if len(sys.argv) > 3 else BULK_EXPORT_DIR,
+        sys.argv[1] if len(sys.argv) > 1 else FORMAT_TSV
+    )
@@ -132,6 +132,28 @@ CATEGORY_NAME_TO_ID = {
     '차량용방향제/샤셰': 169
 }
 
+# 카테고리 name을 key, 올리브영 목록 페이지의 카테고리 번호(dispCatNo)를 value로 하는 딕셔너리
+# (category_scheduler의 기본 매니페스트, 확인된 카테고리만)
+CATEGORY_NAME_TO_DISP_CAT_NO = {
+    '클렌징 비누': '1000001001000010002',
+    '선크림': '1000001001100060001',
+    '샴푸': '1000001000400080001',
+    '바디로션': '1000001000300250001',
+    '바디크림': '1000001000300250002',
+    '바디미스트': '1000001000300220002',
+    '여성향수': '1000001000500130001',
+    '남성향수': '1000001000500130002',
+    '고체향수': '1000001000500100001',
+    '립틴트': '1000001000200060003',
+    '립스틱': '1000001000200060004',
+    '쿠션': '1000001000200010009',
+    '파운데이션': '1000001000200010002',
+    '블러셔': '1000001000200010006',
+    '파우더/팩트': '1000001000200010004',
+    '컨실러': '1000001000200010005',
+    '프라이머/베이스': '1000001000200010003',
+}
+
 # 역참조용 딕셔너리 (id를 key로, name을 value로)
 CATEGORY_ID_TO_NAME = {v: k for k, v in CATEGORY_NAME_TO_ID.items()}
 
@@ -156,6 +178,11 @@ def get_all_categories():
     return CATEGORY_NAME_TO_ID.items()
 
 
+def get_disp_cat_no(category_name):
+    """카테고리 이름으로 목록 페이지 카테고리 번호(dispCatNo) 조회, 없을 경우 None 반환"""
+    return CATEGORY_NAME_TO_DISP_CAT_NO.get(category_name)
+
+
 def get_total_category_count():
     """총 카테고리 수 반환"""
     return len(CATEGORY_NAME_TO_ID)
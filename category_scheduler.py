@@ -0,0 +1,370 @@
+"""
+여러 카테고리 크롤링 스케줄러 모듈
+카테고리 → 목록 카테고리 번호(dispCatNo) 매니페스트를 받아 여러 카테고리를 한 번에 크롤링합니다.
+
+- 번갈아 순회: 카테고리 하나를 끝까지 돌지 않고, 목록 페이지 1개씩 카테고리를 바꿔 가며 수집
+  (목록 페이지는 pageIdx URL로 바로 열기 때문에 카테고리를 바꿔도 페이지를 다시 넘길 필요 없음)
+- 워커 풀 사용 시: 모든 카테고리의 상세 페이지 URL이 같은 작업 큐로 들어가 워커가 동시에 처리,
+  처리 중 URL 수를 워커당 MAX_IN_FLIGHT_PER_WORKER개로 제한해 목록 순회가 너무 앞서 나가지 않게 함
+- 부하 분산: 카테고리마다 사용한 시간(목록 로드 + 상세 페이지 처리)을 우선순위로 나눈 값이
+  가장 작은 카테고리를 다음 차례로 선택 → 상세 페이지가 느린 카테고리는 시간을 빨리 소모해 차례가 줄어들고,
+  나머지 카테고리가 그 카테고리를 기다리지 않음
+- 카테고리별 예산(budget): 처리할 최대 상품 수 (0이면 모두)
+- 카테고리별 프론티어(crawl_frontier)와 수집 완료 인덱스(crawled_index)를 그대로 사용 (중단 후 재시작 가능)
+
+매니페스트 파일 형식 (JSON):
+    [{"category": "선크림", "dispCatNo": "1000001001100060001", "priority": 2, "budget": 100}, ...]
+    (dispCatNo를 생략하면 category_mapping.CATEGORY_NAME_TO_DISP_CAT_NO에서 찾음)
+
+사용 예:
+    crawl_categories(driver, "category_manifest.json", workers=4)
+"""
+
+import json
+import time
+import traceback
+
+from category_mapping import CATEGORY_NAME_TO_DISP_CAT_NO, get_category_id, get_disp_cat_no
+from crawl import crawl_product_url
+from crawl_frontier import CrawlFrontier, frontier_path
+from crawl_sink import SqlTextSink
+from crawled_index import CrawledIndex, skip_known_links
+from listing import build_listing_url, build_listing_page_url, get_rows_per_page
+from listing_pager import read_listing_page
+from worker_pool import CrawlWorkerPool, RESULT_RECORD, RESULT_FAILED
+
+# 기본 우선순위 (클수록 더 많은 시간을 배정)
+DEFAULT_PRIORITY = 1
+
+# 워커당 처리 중 URL 최대 수 (작업 큐 길이 제한)
+MAX_IN_FLIGHT_PER_WORKER = 3
+
+# 상세 페이지 1개 처리 시간 초기 추정값 (초, 실제 처리 시간이 쌓이면 평균으로 대체)
+INITIAL_TASK_SECONDS = 10.0
+
+# 목록 페이지 로드 오류가 이만큼 이어지면 해당 카테고리 중단 (프론티어에는 완료로 기록하지 않음)
+MAX_LISTING_ERRORS = 3
+
+
+class CategoryJob:
+    """카테고리 하나의 크롤링 상태"""
+
+    def __init__(self, name, disp_cat_no, priority=DEFAULT_PRIORITY, budget=0, url=None):
+        """
+        Args:
+            name: 카테고리 이름 (category_mapping 기준)
+            disp_cat_no: 목록 페이지 카테고리 번호
+            priority: 우선순위 (클수록 더 많은 시간을 배정, 0보다 커야 함)
+            budget: 처리할 최대 상품 수 (0이면 모두)
+            url: 목록 시작 URL (None이면 dispCatNo로 생성)
+        """
+        self.name = name
+        self.disp_cat_no = disp_cat_no
+        self.priority = max(priority, 0.01)
+        self.budget = budget
+        self.url = url or build_listing_url(disp_cat_no)
+
+        self.frontier = None
+        self.pending_links = []  # 이전 실행에서 남은 링크 (목록을 다시 열지 않고 먼저 처리)
+        self.next_page = 1
+        self.listing_done = False
+        self.listing_errors = 0
+
+        # 통계
+        self.pages = 0
+        self.dispatched = 0
+        self.in_flight = 0
+        self.saved = 0
+        self.skipped = 0
+        self.failed = 0
+        self.cost = 0.0  # 사용한 시간 (초)
+
+    @property
+    def remaining(self):
+        """예산 안에서 더 처리할 수 있는 상품 수 (예산이 없으면 None)"""
+        return max(0, self.budget - self.dispatched) if self.budget > 0 else None
+
+    @property
+    def finished(self):
+        """더 처리할 상품이 없으면 True"""
+        if self.remaining == 0 or self.listing_errors >= MAX_LISTING_ERRORS:
+            return True
+        return self.listing_done and not self.pending_links
+
+    def score(self, task_seconds):
+        """다음 차례 선택 기준 (작을수록 먼저), 처리 중인 URL은 예상 처리 시간으로 포함"""
+        return (self.cost + self.in_flight * task_seconds) / self.priority
+
+
+def load_manifest(path=None, default_budget=0):
+    """
+    카테고리 매니페스트를 읽어 CategoryJob 목록을 만듭니다.
+
+    Args:
+        path: 매니페스트 JSON 파일 경로 (None이면 CATEGORY_NAME_TO_DISP_CAT_NO의 모든 카테고리)
+        default_budget: budget을 지정하지 않은 카테고리의 예산 (0이면 모두)
+
+    Returns:
+        list: CategoryJob 리스트 (우선순위가 높은 순)
+
+    Raises:
+        ValueError: dispCatNo를 알 수 없는 카테고리가 있는 경우
+    """
+    if path is None:
+        entries = [{"category": name, "dispCatNo": disp_cat_no}
+                   for name, disp_cat_no in CATEGORY_NAME_TO_DISP_CAT_NO.items()]
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+
+    jobs = []
+    for entry in entries:
+        name = entry["category"]
+        disp_cat_no = str(entry.get("dispCatNo") or get_disp_cat_no(name) or "")
+        if not disp_cat_no:
+            raise ValueError(f"카테고리 '{name}'의 dispCatNo를 알 수 없습니다. 매니페스트에 dispCatNo를 지정하세요.")
+        if not get_category_id(name):
+            print(f"[Scheduler] ⚠ '{name}'은(는) category_mapping에 없는 카테고리입니다. (상품 카테고리는 상세 페이지 기준)")
+
+        jobs.append(CategoryJob(name, disp_cat_no, entry.get("priority", DEFAULT_PRIORITY),
+                                entry.get("budget", default_budget), entry.get("url")))
+
+    jobs.sort(key=lambda job: -job.priority)
+    return jobs
+
+
+class CategoryScheduler:
+    """
+    카테고리 여러 개를 목록 페이지 단위로 번갈아 순회하며 상세 페이지를 크롤링(또는 워커 풀에 분배)합니다.
+    """
+
+    def __init__(self, driver, jobs, sink, pool=None, index=None, resume=True, max_in_flight=None):
+        """
+        Args:
+            driver: 목록 페이지를 순회할 웹드라이버 (pool이 없으면 상세 페이지도 이 드라이버로 크롤링)
+            jobs: CategoryJob 리스트
+            sink: 저장소
+            pool: 상세 페이지 추출 워커 풀 (None이면 순차 크롤링, on_result에 self.on_result를 연결해야 함)
+            index: 수집 완료 인덱스 (None이면 모든 상품의 상세 페이지를 엶)
+            resume: True면 카테고리마다 프론티어로 이전 실행을 이어서 진행
+            max_in_flight: 워커 풀 처리 중 URL 최대 수 (None이면 워커 수 × MAX_IN_FLIGHT_PER_WORKER)
+        """
+        self.driver = driver
+        self.jobs = jobs
+        self.sink = sink
+        self.pool = pool
+        self.index = index
+        self.resume = resume
+        self.max_in_flight = max_in_flight or (pool.workers * MAX_IN_FLIGHT_PER_WORKER if pool else 0)
+
+        self.url_jobs = {}  # {상세 페이지 URL: (CategoryJob, 작업 큐에 넣은 시각)}
+        self.task_seconds = INITIAL_TASK_SECONDS
+        self.tasks_measured = 0
+        self.listing_loaded = False
+        self.product_counter = 0
+
+    # ------------------------------------------------------------
+    # 준비 / 선택
+    # ------------------------------------------------------------
+
+    def _prepare(self, job):
+        """카테고리의 프론티어를 열고 이전 실행에서 남은 링크와 다음 페이지를 복원합니다."""
+        if not self.resume:
+            return
+        job.frontier = CrawlFrontier(frontier_path(job.url), job.url)
+        job.pending_links = skip_known_links(job.frontier.pending(), job.frontier, self.index)
+        job.next_page = job.frontier.next_page
+        job.listing_done = job.frontier.listing_done
+
+    def _pick(self):
+        """사용 시간 / 우선순위가 가장 작은 카테고리 (없으면 None)"""
+        active = [job for job in self.jobs if not job.finished]
+        if not active:
+            return None
+        return min(active, key=lambda job: (job.score(self.task_seconds), -job.priority))
+
+    # ------------------------------------------------------------
+    # 한 차례 처리
+    # ------------------------------------------------------------
+
+    def _load_listing_page(self, job):
+        """
+        카테고리의 다음 목록 페이지를 URL로 바로 열어 상품 링크를 수집합니다.
+
+        Returns:
+            list: 처리할 링크 (프론티어에서 끝난 상품과 수집 완료 상품 제외)
+        """
+        page = job.next_page
+        self.driver.get(build_listing_page_url(job.url, page) if page > 1 else job.url)
+        result = read_listing_page(self.driver, page, get_rows_per_page(job.url), first=not self.listing_loaded)
+        self.listing_loaded = True
+        if result is None:
+            self._finish_listing(job)
+            return []
+
+        links, has_next = result
+        job.pages += 1
+        job.next_page = page + 1
+        if job.frontier:
+            links = job.frontier.add_page(page, links)
+        links = skip_known_links(links, job.frontier, self.index)
+
+        if not has_next:
+            self._finish_listing(job)
+        print(f"[Scheduler] {job.name}: 목록 {page}페이지, 처리할 상품 {len(links)}개")
+        return links
+
+    @staticmethod
+    def _finish_listing(job):
+        job.listing_done = True
+        if job.frontier:
+            job.frontier.finish_listing()
+
+    def _dispatch(self, job, links):
+        """링크를 워커 풀에 넘기거나 이 드라이버로 차례로 크롤링합니다."""
+        for link in links:
+            self.product_counter += 1
+            job.dispatched += 1
+            print(f"\n{'─' * 30}")
+            print(f"[{job.name}] 상품 {self.product_counter}: {link['name'] or '상품명 없음'}")
+
+            if self.pool:
+                self.url_jobs[link["url"]] = (job, time.monotonic())
+                job.in_flight += 1
+                self.pool.submit(link["url"], self.product_counter, frontier=job.frontier)
+                self.pool.collect()
+                continue
+
+            # 결과 종류로 건너뜀과 실패를 구분해 기록 (크롤링 오류는 None 반환만으로는 구분되지 않음)
+            crawl_product_url(self.driver, link["url"], self.product_counter, self.sink,
+                              frontier=job.frontier, index=self.index,
+                              on_result=lambda url, kind: self._count(job, kind))
+
+    @staticmethod
+    def _count(job, kind):
+        """URL 하나의 결과 종류를 카테고리 통계에 더합니다."""
+        if kind == RESULT_RECORD:
+            job.saved += 1
+        elif kind == RESULT_FAILED:
+            job.failed += 1
+        else:
+            job.skipped += 1
+
+    def on_result(self, url, kind):
+        """워커 풀이 URL 하나의 처리를 끝낼 때 호출 (CrawlWorkerPool의 on_result)"""
+        entry = self.url_jobs.pop(url, None)
+        if entry is None:
+            return
+        job, submitted_at = entry
+        job.in_flight -= 1
+
+        # 작업 큐 대기 시간을 포함한 처리 시간을 워커 수로 나눠 카테고리 사용 시간에 더함
+        elapsed = time.monotonic() - submitted_at
+        job.cost += elapsed / self.pool.workers
+        self.tasks_measured += 1
+        self.task_seconds += (elapsed / self.pool.workers - self.task_seconds) / self.tasks_measured
+
+        self._count(job, kind)
+
+    def _turn(self, job):
+        """카테고리 하나의 차례: 남은 링크 또는 목록 페이지 1개를 처리합니다."""
+        started = time.monotonic()
+        try:
+            if job.pending_links:
+                links, job.pending_links = job.pending_links, []
+                print(f"[Scheduler] {job.name}: 이전 실행에서 남은 상품 {len(links)}개를 먼저 처리합니다.")
+            else:
+                links = self._load_listing_page(job)
+            job.listing_errors = 0
+
+            if job.remaining is not None:
+                links = links[:job.remaining]
+            self._dispatch(job, links)
+
+        except Exception as e:
+            job.listing_errors += 1
+            print(f"[Scheduler] ✗ {job.name} 처리 중 오류 ({job.listing_errors}/{MAX_LISTING_ERRORS}): {e}")
+            traceback.print_exc()
+
+        finally:
+            job.cost += time.monotonic() - started
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+
+    def run(self):
+        """모든 카테고리를 끝까지(또는 예산까지) 크롤링합니다."""
+        for job in self.jobs:
+            self._prepare(job)
+
+        print(f"[Scheduler] 카테고리 {len(self.jobs)}개 크롤링 시작 "
+              f"({'워커 ' + str(self.pool.workers) + '개' if self.pool else '순차 크롤링'})")
+        started = time.monotonic()
+
+        while True:
+            if self.pool:
+                # 처리 중 URL이 많으면 결과를 기록하며 대기 (대기 중 도착한 결과로 사용 시간이 갱신됨)
+                self.pool.wait_for_capacity(self.max_in_flight)
+
+            job = self._pick()
+            if job is None:
+                break
+            self._turn(job)
+
+        if self.pool:
+            self.pool.collect(block=False)
+        self.report(time.monotonic() - started)
+
+    def close(self):
+        """카테고리별 프론티어를 닫습니다."""
+        for job in self.jobs:
+            if job.frontier:
+                job.frontier.close()
+                job.frontier = None
+
+    def report(self, elapsed):
+        """카테고리별 처리 결과를 출력합니다. (워커 풀 사용 시 처리 중인 결과는 풀을 닫을 때 기록됨)"""
+        print(f"\n{'=' * 60}")
+        print(f"[Scheduler] 카테고리 순회 완료 ({elapsed:.1f}초)")
+        for job in self.jobs:
+            state = "완료" if job.listing_done else ("예산 소진" if job.remaining == 0 else "중단")
+            print(f"  - {job.name} (우선순위 {job.priority:g}): 목록 {job.pages}페이지, 처리 {job.dispatched}개 "
+                  f"(저장 {job.saved}, 건너뜀 {job.skipped}, 실패 {job.failed}, 처리 중 {job.in_flight}), "
+                  f"사용 시간 {job.cost:.1f}초, {state}")
+        print(f"{'=' * 60}")
+
+
+def crawl_categories(driver, manifest_path=None, workers=0, default_budget=0, group_commit_size=20, sink=None,
+                     resume=True, skip_known=True):
+    """
+    매니페스트의 모든 카테고리를 크롤링하는 메인 함수
+
+    Args:
+        driver: 목록 페이지를 순회할 웹드라이버
+        manifest_path: 매니페스트 JSON 파일 경로 (None이면 CATEGORY_NAME_TO_DISP_CAT_NO의 모든 카테고리)
+        workers: 상세 페이지 추출 워커(브라우저) 수 (1 이하면 이 드라이버로 순차 크롤링)
+        default_budget: 예산을 지정하지 않은 카테고리의 최대 상품 수 (0이면 모두)
+        group_commit_size: 한 번에 커밋할 상품 수 (sink가 None일 때만 사용)
+        sink: 저장소 (None이면 SqlTextSink(group_commit_size))
+        resume: True면 카테고리마다 프론티어로 이전 실행을 이어서 진행
+        skip_known: True면 수집 완료 인덱스로 이미 수집한 상품을 건너뜀
+    """
+    jobs = load_manifest(manifest_path, default_budget)
+    index = CrawledIndex() if skip_known else None
+    scheduler = None
+    try:
+        with (sink or SqlTextSink(group_commit_size)) as sink:
+            if workers > 1:
+                with CrawlWorkerPool(workers, sink, index=index) as pool:
+                    scheduler = CategoryScheduler(driver, jobs, sink, pool, index, resume)
+                    pool.on_result = scheduler.on_result
+                    scheduler.run()
+            else:
+                scheduler = CategoryScheduler(driver, jobs, sink, index=index, resume=resume)
+                scheduler.run()
+    finally:
+        if scheduler:
+            scheduler.close()
+        if index:
+            index.close()
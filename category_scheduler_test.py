@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+from category_mapping import CATEGORY_NAME_TO_DISP_CAT_NO
+from category_scheduler import load_manifest, CategoryJob, CategoryScheduler
+
+work_dir = tempfile.mkdtemp()
+
+# 매니페스트가 없으면 알려진 모든 카테고리
+jobs = load_manifest()
+assert len(jobs) == len(CATEGORY_NAME_TO_DISP_CAT_NO)
+assert "dispCatNo=1000001001100060001" in next(job for job in jobs if job.name == "선크림").url
+
+# dispCatNo 생략 시 매핑에서 찾고, 우선순위가 높은 순으로 정렬
+manifest_path = os.path.join(work_dir, "manifest.json")
+with open(manifest_path, "w", encoding="utf-8") as f:
+    json.dump([{"category": "샴푸"}, {"category": "선크림", "priority": 3, "budget": 50}], f, ensure_ascii=False)
+jobs = load_manifest(manifest_path, default_budget=10)
+assert [job.name for job in jobs] == ["선크림", "샴푸"]
+assert jobs[0].budget == 50 and jobs[1].budget == 10
+
+with open(manifest_path, "w", encoding="utf-8") as f:
+    json.dump([{"category": "없는 카테고리"}], f, ensure_ascii=False)
+try:
+    load_manifest(manifest_path)
+    assert False, "dispCatNo를 모르는 카테고리는 오류"
+except ValueError:
+    pass
+
+# 예산을 다 쓰거나 목록이 끝나고 남은 링크가 없으면 종료
+job = CategoryJob("선크림", "1000001001100060001", budget=2)
+job.dispatched = 2
+assert job.remaining == 0 and job.finished
+job = CategoryJob("샴푸", "1000001000400080001")
+job.listing_done = True
+job.pending_links = [{"url": "u"}]
+assert job.remaining is None and not job.finished
+
+# 사용 시간 / 우선순위가 가장 작은 카테고리를 선택 (처리 중 URL은 예상 처리 시간으로 포함)
+slow = CategoryJob("느린 카테고리", "1", priority=1)
+fast = CategoryJob("빠른 카테고리", "2", priority=1)
+high = CategoryJob("우선 카테고리", "3", priority=4)
+slow.cost, fast.cost, high.cost = 60.0, 30.0, 100.0
+scheduler = CategoryScheduler(None, [slow, fast, high], sink=None, resume=False)
+assert scheduler._pick() is high      # 100 / 4 = 25 < 30
+high.cost = 160.0                     # 160 / 4 = 40 > 30
+assert scheduler._pick() is fast
+fast.in_flight = 2                    # 30 + 2 × 10 = 50 > 40
+assert scheduler._pick() is high
+high.listing_done = slow.listing_done = fast.listing_done = True
+assert scheduler._pick() is None
+
+
+# 순차 크롤링: 검증 오류는 건너뜀, 크롤링 오류는 실패로 따로 기록
+class FailingDriver:
+    def get(self, url):
+        if "invalid" in url:
+            raise ValueError("필수 데이터 누락")
+        raise ConnectionError("네트워크 오류")
+
+    def save_screenshot(self, path):
+        pass
+
+
+job = CategoryJob("선크림", "1000001001100060001")
+scheduler = CategoryScheduler(FailingDriver(), [job], sink=None, resume=False)
+scheduler._dispatch(job, [{"url": "https://test/invalid", "name": "검증 실패"},
+                          {"url": "https://test/offline", "name": "크롤링 실패"}])
+assert (job.dispatched, job.saved, job.skipped, job.failed) == (2, 0, 1, 1)
+
+print("카테고리 스케줄러 테스트 통과")
@@ -0,0 +1,108 @@
+"""
+콜드 스타트(모듈 임포트) 벤치마크
+각 모듈을 새 파이썬 프로세스에서 임포트하는 데 걸리는 시간을 측정하고,
+임포트 도중 작업 디렉토리의 파일이 생성/수정되었는지 확인합니다.
+
+사용법:
+    python cold_start_benchmark.py [반복 횟수]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 측정할 모듈 (crawl은 크롤러 워커가 실제로 임포트하는 진입점)
+BENCHMARK_MODULES = [
+    "brand_mapping",
+    "product_mapping",
+    "main_images_mapping",
+    "product_options_mapping",
+    "productDetailInfoProvided",
+    "crawl",
+]
+
+DEFAULT_RUNS = 10
+
+
+def _snapshot_files(directory="."):
+    """디렉토리의 파일별 (크기, 수정 시각)을 반환합니다."""
+    snapshot = {}
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in ("__pycache__", ".git")]
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def measure_import(module_name, runs=DEFAULT_RUNS):
+    """
+    모듈을 새 프로세스에서 runs번 임포트하여 시간을 측정합니다.
+
+    Args:
+        module_name: 모듈 이름
+        runs: 반복 횟수
+
+    Returns:
+        dict: {"times": [초, ...], "changed": [변경된 파일, ...], "error": 오류 메시지 또는 None}
+    """
+    times = []
+    changed = set()
+    error = None
+
+    for _ in range(runs):
+        before = _snapshot_files()
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", f"import {module_name}"],
+                                capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        after = _snapshot_files()
+
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "알 수 없는 오류"
+            break
+
+        times.append(elapsed)
+        changed.update(path for path in after if before.get(path) != after[path])
+        changed.update(path for path in before if path not in after)
+
+    return {"times": times, "changed": sorted(changed), "error": error}
+
+
+def run_benchmark(runs=DEFAULT_RUNS):
+    """모든 모듈의 임포트 시간을 측정하고 결과를 출력합니다."""
+    # 인터프리터 자체 기동 시간 (기준값)
+    baseline = measure_import("sys", runs)
+    baseline_median = statistics.median(baseline["times"])
+
+    print(f"[Benchmark] 반복 {runs}회, 인터프리터 기동 중앙값 {baseline_median * 1000:.1f}ms")
+    print("=" * 60)
+
+    for module_name in BENCHMARK_MODULES:
+        result = measure_import(module_name, runs)
+
+        if result["error"]:
+            print(f"✗ {module_name}: 임포트 실패 ({result['error']})")
+            continue
+
+        median = statistics.median(result["times"])
+        print(f"✓ {module_name}: 중앙값 {median * 1000:.1f}ms "
+              f"(기동 제외 {(median - baseline_median) * 1000:.1f}ms, "
+              f"최소 {min(result['times']) * 1000:.1f}ms / 최대 {max(result['times']) * 1000:.1f}ms)")
+
+        if result["changed"]:
+            print(f"  ✗ 임포트 중 변경된 파일 {len(result['changed'])}개:")
+            for path in result["changed"]:
+                print(f"    - {path}")
+        else:
+            print("  ✓ 임포트 중 변경된 파일 없음")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS)
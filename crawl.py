@@ -1,55 +1,156 @@
 """
 상품 상세 페이지 크롤링 모듈
-트랜잭션을 적용하여 원자성을 보장합니다.
+추출(extract_product_record)과 저장(crawl_sink의 저장소)을 분리하고,
+저장은 트랜잭션을 적용하여 원자성을 보장합니다.
 """
 
-from file_transaction import FileTransaction
-from brand_mapping import get_brand_id
+import traceback
+
+from selenium.webdriver.common.by import By
+
 from category_mapping import get_category_id
 from mainImgCol import get_main_image_urls
-from main_images_mapping import update_product_main_images_sql
 from productInfo import print_product_info, get_product_basic_info
-from detailImg import get_detail_image_urls
-from product_mapping import create_product_id, update_product_data_sql, create_product_id_with_transaction
-from productDetailInfoProvided import get_product_dtailinfo_provided
+from detailImg import extract_detail_image_urls
+from productDetailInfoProvided import extract_product_detailinfo
 from option import get_product_options, save_product_options # 민석 추가, 저장 함수 추가
-from product_options_mapping import create_product_options_sql, create_product_options_sql_with_validation
+from detail_bundle import extract_detail_bundle
+from html_extract import save_snapshot, parse_snapshot
+from crawl_sink import SqlTextSink
+from wait_engine import wait_for, all_of, document_ready, element_present
+from lean_profile import LEAN_PROFILE
+from network_capture import install_network_capture, extract_from_network
+
+# sink를 지정하지 않았을 때 사용하는 기본 저장소 (기존 SQL 텍스트 출력)
+DEFAULT_SINK = SqlTextSink()
+
+# 상세 페이지 추출 방식
+EXTRACT_MODE_BUNDLE = "bundle"        # 스크립트 1회 실행으로 일괄 추출 (detail_bundle), 실패 시 요소별 추출
+EXTRACT_MODE_ELEMENTS = "elements"    # 요소마다 WebDriver 명령으로 추출 (기존 방식)
+EXTRACT_MODE_SNAPSHOT = "snapshot"    # HTML 스냅샷을 저장하고 lxml로 추출 (html_extract, 나중에 재추출 가능)
+EXTRACT_MODE_NETWORK = "network"      # 페이지가 받은 JSON 응답에서 추출 (network_capture), 실패 시 요소별 추출
+
+# mode를 지정하지 않았을 때 사용하는 추출 방식
+DEFAULT_EXTRACT_MODE = EXTRACT_MODE_BUNDLE
+
+# URL 하나의 처리 결과 종류 (crawl_product_url / worker_pool의 on_result에 전달)
+RESULT_RECORD = "record"    # 추출 성공 (레코드 포함)
+RESULT_SKIPPED = "skipped"  # 검증 실패 (필수 데이터 누락 등)
+RESULT_DUPLICATE = "duplicate"  # 이미 저장된 상품
+RESULT_FAILED = "failed"    # 크롤링 오류
+
+
+class DuplicateProductError(ValueError):
+    """이미 저장된 상품 (다른 검증 오류와 달리 수집 완료 인덱스에 기록)"""
+
+
+def _extract_bundle(driver, product_counter):
+    """
+    일괄 추출을 시도합니다. 실패하거나 상품명을 읽지 못하면 None (요소별 추출로 대체)
+    """
+    print("\n[0단계] 상세 페이지 일괄 추출 중 (스크립트 1회 실행)...")
+    try:
+        bundle = extract_detail_bundle(driver)
+    except Exception as e:
+        print(f"✗ 상품 {product_counter} 일괄 추출 실패, 요소별 추출로 진행: {e}")
+        return None
+
+    if not bundle["product_name"]:
+        print(f"✗ 상품 {product_counter} 일괄 추출에서 상품명을 찾지 못해 요소별 추출로 진행")
+        return None
+    return bundle
+
+
+def _extract_snapshot(driver, product_counter):
+    """
+    스냅샷을 저장하고 오프라인 파서로 추출합니다. 실패하면 None (요소별 추출로 대체)
+    """
+    print("\n[0단계] HTML 스냅샷 저장 및 파싱 중...")
+    try:
+        with open(save_snapshot(driver), 'r', encoding='utf-8') as f:
+            record = parse_snapshot(f.read())
+    except Exception as e:
+        print(f"✗ 상품 {product_counter} 스냅샷 추출 실패, 요소별 추출로 진행: {e}")
+        return None
+
+    if not record["product_name"]:
+        print(f"✗ 상품 {product_counter} 스냅샷에서 상품명을 찾지 못해 요소별 추출로 진행")
+        return None
+    return record
 
 
-def crawl_product_on_detail_page(driver, transaction, product_counter):
+def _extract_network(driver, product_counter):
+    """
+    캡처한 JSON 응답으로 추출합니다. 실패하면 None (요소별 추출로 대체)
     """
-    상품 상세 페이지에서 데이터를 크롤링하고 파일을 업데이트합니다.
-    모든 작업은 트랜잭션 내에서 수행되며, 예외 발생 시 자동으로 롤백됩니다.
+    print("\n[0단계] 네트워크 응답(JSON)에서 추출 중...")
+    try:
+        record = extract_from_network(driver)
+    except Exception as e:
+        print(f"✗ 상품 {product_counter} 네트워크 응답 추출 실패, 요소별 추출로 진행: {e}")
+        return None
+
+    if record is None:
+        print(f"✗ 상품 {product_counter} 네트워크 응답에서 상품명을 찾지 못해 요소별 추출로 진행")
+    return record
+
+
+def extract_product_record(driver, product_counter, sink=None, mode=None, prefetched=None, check_duplicate=True):
+    """
+    상품 상세 페이지에서 데이터를 추출하고 검증합니다. (파일/DB 쓰기 없음)
 
     Args:
         driver: Selenium WebDriver 객체
-        transaction: FileTransaction 객체
         product_counter: 현재 상품 번호 (로깅용)
+        sink: 중복 상품 확인에 사용할 저장소 (None이면 기본 저장소)
+        mode: 추출 방식 (EXTRACT_MODE_BUNDLE / EXTRACT_MODE_SNAPSHOT / EXTRACT_MODE_NETWORK /
+              EXTRACT_MODE_ELEMENTS, None이면 DEFAULT_EXTRACT_MODE)
+        prefetched: 미리 추출한 필드 (detail_bundle / html_extract 형식, 지정하면 mode 무시)
+                    detail_image_urls까지 있으면 driver를 전혀 사용하지 않음 (driver=None 가능)
+        check_duplicate: 추출 도중 sink로 중복 상품을 미리 확인할지 여부
+                         (저장소를 직접 볼 수 없는 워커 프로세스는 False, 저장 시 다시 확인)
+
+    Returns:
+        dict: 상품 레코드 (crawl_sink 모듈 설명 참고)
 
     Raises:
         ValueError: 필수 데이터가 없거나 유효하지 않은 경우
-        Exception: 크롤링 중 발생하는 모든 예외
     """
-
-    print(f"\n{'=' * 60}")
-    print(f"상품 {product_counter} 데이터 수집 시작")
-    print(f"{'=' * 60}")
+    sink = sink or DEFAULT_SINK
+    mode = mode or DEFAULT_EXTRACT_MODE
+
+    # 일괄 추출 결과 (None이면 각 단계에서 요소별 추출)
+    bundle = prefetched
+    if bundle is None and mode == EXTRACT_MODE_BUNDLE:
+        bundle = _extract_bundle(driver, product_counter)
+    elif bundle is None and mode == EXTRACT_MODE_SNAPSHOT:
+        bundle = _extract_snapshot(driver, product_counter)
+    elif bundle is None and mode == EXTRACT_MODE_NETWORK:
+        bundle = _extract_network(driver, product_counter)
 
     # ============================================================
     # 1단계: 상품 기본 정보 수집 (병국)
     # ============================================================
     print("\n[1단계] 상품 기본 정보 수집 중...")
-    category, brand, product_name = get_product_basic_info(driver)
+    if bundle:
+        category, brand, product_name = bundle["category"], bundle["brand"], bundle["product_name"]
+    else:
+        category, brand, product_name = get_product_basic_info(driver)
 
     print(f"  - 카테고리: {category}")
     print(f"  - 브랜드: {brand}")
     print(f"  - 상품명: {product_name}")
 
+    # 예외 처리: 이미 존재하는 상품 (나머지 추출 전에 확인)
+    if check_duplicate and sink.contains_product(product_name):
+        raise DuplicateProductError(
+            f"Error: 상품 {product_counter} - 이미 존재하는 제품명입니다. (product_name: {product_name})")
+
     # ============================================================
     # 2단계: 상품 메인 이미지 수집
     # ============================================================
     print("\n[2단계] 메인 이미지 수집 중...")
-    main_image_urls = get_main_image_urls(driver, 3)
+    main_image_urls = bundle["main_image_urls"] if bundle else get_main_image_urls(driver, 3)
 
     # 예외 처리: 메인 이미지가 없는 경우
     if not main_image_urls:
@@ -58,15 +159,9 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     print(f"  ✓ {len(main_image_urls)}개의 메인 이미지 수집 완료")
 
     # ============================================================
-    # 3단계: Brand ID 및 Category ID 확인
+    # 3단계: Category ID 확인
     # ============================================================
-    print("\n[3단계] Brand ID 및 Category ID 확인 중...")
-
-    # brand_id 찾기 및 브랜드 SQL 파일 업데이트 (트랜잭션 적용)
-    brand_id = get_brand_id(brand, transaction)
-    print(f"  - Brand ID: {brand_id}")
-
-    # category_id 찾기
+    print("\n[3단계] Category ID 확인 중...")
     category_id = get_category_id(category)
     print(f"  - Category ID: {category_id}")
 
@@ -75,38 +170,29 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
         raise ValueError(f"Error: 상품 {product_counter} - 유효한 카테고리 ID를 찾지 못했습니다. (category: {category})")
 
     # ============================================================
-    # 4단계: Product ID 생성
+    # 4단계: 상품 정보 제공 고시 수집 (소라)
     # ============================================================
-    print("\n[4단계] Product ID 생성 중...")
-    product_id = create_product_id_with_transaction(product_name, transaction)
-    print(f"  - Product ID: {product_id}")
-
-    # 예외 처리: product_id가 0인 경우 (이미 존재하는 상품)
-    if product_id == 0:
-        raise ValueError(f"Error: 상품 {product_counter} - 이미 존재하는 제품명입니다. (product_name: {product_name})")
-
-    # ============================================================
-    # 5단계: 상품 정보 제공 고시 수집 (소라)
-    # ============================================================
-    print("\n[5단계] 상품 정보 제공 고시 수집 중...")
-    product_detail_info, product_detail_info_id = get_product_dtailinfo_provided(
-        driver,
-        transaction,
-        filename="product_detailinfo_provided_sql.txt"
-    )
-    print(f"  ✓ 상품 정보 제공 고시 수집 완료 (ID: {product_detail_info_id})")
+    print("\n[4단계] 상품 정보 제공 고시 수집 중...")
+    try:
+        detail_info = bundle["detail_info"] if bundle else extract_product_detailinfo(driver)
+    except Exception as e:
+        # 제공고시가 없어도 상품은 저장 (빈 값으로 기록)
+        print(f"✗ 상품정보 제공고시 수집 실패: {e}")
+        detail_info = {}
+    print(f"  ✓ 상품 정보 제공 고시 {len(detail_info)}개 항목 수집 완료")
 
     # ============================================================
-    # 6단계: 상품 상세 이미지 수집 (소라)
+    # 5단계: 상품 상세 이미지 수집 (소라)
     # ============================================================
-    print("\n[6단계] 상품 상세 이미지 수집 중...")
-
-    detail_image_urls = get_detail_image_urls(
-        driver,
-        product_id,
-        transaction,
-        filename="detail_image_urls_sql.txt"
-    )
+    print("\n[5단계] 상품 상세 이미지 수집 중...")
+    try:
+        if bundle and "detail_image_urls" in bundle:
+            detail_image_urls = bundle["detail_image_urls"]
+        else:
+            detail_image_urls = extract_detail_image_urls(driver)
+    except Exception as e:
+        print("상세 이미지 가져오기 실패:", e)
+        detail_image_urls = []
 
     # 예외 처리: 상세 이미지가 없는 경우
     if not detail_image_urls:
@@ -115,48 +201,10 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     print(f"  ✓ {len(detail_image_urls)}개의 상세 이미지 수집 완료")
 
     # ============================================================
-    # 7단계: 상품 데이터 SQL 업데이트
+    # 6단계: 상품 옵션 정보 수집 (민석)
     # ============================================================
-    print("\n[7단계] 상품 데이터 SQL 업데이트 중...")
-
-    # 현재 SQL 파일 읽기
-    try:
-        with open("product_data_sql.txt", "r", encoding="utf-8") as f:
-            current_sql = f.read()
-    except FileNotFoundError:
-        current_sql = "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, use_restock_noti, product_name, product_code, search_keywords, exposure_status, sale_status, description, is_cancelable, is_deleted, created_at, updated_at) VALUES"
-
-    # SQL 생성
-    from product_mapping import generate_random_datetime
-    created_at = generate_random_datetime()
-
-    insert_statement = f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{product_name}', 'NONE', '{product_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
-
-    # SQL 업데이트 (트랜잭션 적용)
-    current_sql = current_sql.strip()
-    if current_sql.endswith(';'):
-        current_sql = current_sql[:-1].rstrip()
-
-    if current_sql.endswith('VALUES'):
-        new_sql = current_sql + f"\n{insert_statement};"
-    else:
-        new_sql = current_sql + f",\n{insert_statement};"
-
-    transaction.write_file("product_data_sql.txt", new_sql)
-    print(f"  ✓ 상품 데이터 SQL 업데이트 완료 (ID: {product_id})")
-
-    # ============================================================
-    # 8단계: 메인 이미지 SQL 업데이트
-    # ============================================================
-    print("\n[8단계] 메인 이미지 SQL 업데이트 중...")
-    update_product_main_images_sql(product_id, main_image_urls, transaction)
-    print(f"  ✓ 메인 이미지 SQL 업데이트 완료")
-
-    # ============================================================
-    # 9단계: 상품 옵션 정보 수집 (민석)
-    # ============================================================
-    print("\n[9단계] 상품 옵션 정보 수집 중...")
-    product_options = get_product_options(driver)
+    print("\n[6단계] 상품 옵션 정보 수집 중...")
+    product_options = bundle["options"] if bundle else get_product_options(driver)
 
     # 예외 처리: 옵션이 없는 경우
     if not product_options:
@@ -170,20 +218,55 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
                 f"Error: 상품 {product_counter} - 옵션 {idx}의 price 값이 0입니다. 전체 옵션: {product_options}"
             )
 
-
     print(f"  ✓ {len(product_options)}개의 옵션 수집 완료")
 
+    return {
+        "category": category,
+        "category_id": category_id,
+        "brand": brand,
+        "product_name": product_name,
+        "main_image_urls": main_image_urls,
+        "detail_info": detail_info,
+        "detail_image_urls": detail_image_urls,
+        "options": product_options,
+    }
+
+
+def crawl_product_on_detail_page(driver, transaction, product_counter, sink=None, mode=None, prefetched=None):
+    """
+    상품 상세 페이지에서 데이터를 크롤링하고 저장소에 기록합니다.
+    추출(extract_product_record)이 모두 끝난 뒤에 한 번에 저장하므로,
+    검증 실패 시에는 아무것도 기록되지 않습니다.
+
+    Args:
+        driver: Selenium WebDriver 객체
+        transaction: sink.product()가 반환한 트랜잭션 객체 (FileTransaction 등)
+        product_counter: 현재 상품 번호 (로깅용)
+        sink: 저장소 (SqlTextSink 또는 SQLiteSink, None이면 기본 SQL 텍스트 저장소)
+        mode: 추출 방식 (None이면 DEFAULT_EXTRACT_MODE)
+        prefetched: 미리 추출한 필드 (extract_product_record 참고)
+
+    Returns:
+        int: 저장된 Product ID
+
+    Raises:
+        ValueError: 필수 데이터가 없거나 유효하지 않은 경우
+        Exception: 크롤링 중 발생하는 모든 예외
+    """
+    sink = sink or DEFAULT_SINK
+
+    print(f"\n{'=' * 60}")
+    print(f"상품 {product_counter} 데이터 수집 시작")
+    print(f"{'=' * 60}")
+
+    record = extract_product_record(driver, product_counter, sink, mode, prefetched)
+
     # ============================================================
-    # 10단계: 옵션 SQL 생성 및 저장
+    # 7단계: 저장소에 기록 (브랜드/상품/제공고시/이미지/옵션)
     # ============================================================
-    print("\n[10단계] 옵션 SQL 생성 중...")
-    create_product_options_sql_with_validation(
-        product_id=product_id,
-        product_options=product_options,
-        transaction=transaction,
-        filename="product_options_sql.txt"
-    )
-    print(f"  ✓ 옵션 SQL 생성 완료")
+    print("\n[7단계] 상품 데이터 저장 중...")
+    product_id = sink.save_product(record, transaction)
+    print(f"  ✓ 상품 데이터 저장 완료 (ID: {product_id})")
 
     # ============================================================
     # 완료
@@ -191,10 +274,107 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     print(f"\n{'=' * 60}")
     print(f"상품 {product_counter} 데이터 수집 완료!")
     print(f"  - Product ID: {product_id}")
-    print(f"  - 상품명: {product_name}")
-    print(f"  - 메인 이미지: {len(main_image_urls)}개")
-    print(f"  - 상세 이미지: {len(detail_image_urls)}개")
-    print(f"  - 옵션: {len(product_options)}개")
+    print(f"  - 상품명: {record['product_name']}")
+    print(f"  - 메인 이미지: {len(record['main_image_urls'])}개")
+    print(f"  - 상세 이미지: {len(record['detail_image_urls'])}개")
+    print(f"  - 옵션: {len(record['options'])}개")
     print(f"{'=' * 60}\n")
 
+    return product_id
 
+
+def open_detail_page(driver, url, mode=None):
+    """
+    상세 페이지 URL로 이동하고 상세 정보 영역이 표시될 때까지 대기합니다. (표시되지 않으면 TimeoutError)
+    경량 프로필을 적용한 드라이버면 페이지 전송량을 기록합니다. (lean_profile.BASELINE_PAGES를 지정한 경우
+    첫 페이지는 차단 없이 기준 전송량도 측정)
+    EXTRACT_MODE_NETWORK면 JSON 응답 캡처 스크립트도 여기서 설치합니다. (드라이버마다 1회)
+    """
+    if (mode or DEFAULT_EXTRACT_MODE) == EXTRACT_MODE_NETWORK:
+        install_network_capture(driver)
+    if LEAN_PROFILE.needs_baseline(driver):
+        LEAN_PROFILE.measure_baseline(driver, url)
+
+    driver.get(url)
+    # 로드가 덜 된 페이지에서 추출하면 검증 오류(건너뜀)로 끝나므로, 적응형 타임아웃 없이 기다리고 실패는 오류로 처리
+    if not wait_for(driver, "detail.load", all_of(document_ready(), element_present(By.ID, "main")),
+                    timeout=15, budget=5, adaptive=False):
+        raise TimeoutError(f"상세 페이지가 15초 안에 로드되지 않았습니다: {url}")
+    LEAN_PROFILE.measure(driver, "상세 페이지")
+
+
+def crawl_product_url(driver, url, product_counter, sink=None, mode=None, frontier=None, index=None,
+                      on_result=None):
+    """
+    상세 페이지 URL로 직접 이동해 크롤링하고 저장합니다. (목록 페이지로 돌아가지 않음)
+    상품 하나의 실패(검증 오류, 크롤링 오류)는 여기서 처리하고 다음 상품으로 진행할 수 있게 합니다.
+
+    Args:
+        driver: Selenium WebDriver 객체
+        url: 상세 페이지 URL
+        product_counter: 현재 상품 번호 (로깅용)
+        sink: 저장소 (None이면 기본 SQL 텍스트 저장소)
+        mode: 추출 방식 (None이면 DEFAULT_EXTRACT_MODE)
+        frontier: URL 상태를 기록할 크롤링 프론티어 (crawl_frontier.CrawlFrontier, None이면 기록 안 함)
+        index: 저장했거나 이미 존재하는 상품을 기록할 수집 완료 인덱스 (crawled_index.CrawledIndex)
+        on_result: 처리가 끝나면 호출할 함수 (url, 결과 종류 RESULT_*, 건너뜀과 실패를 구분할 때 사용)
+
+    Returns:
+        int or None: 저장된 Product ID (실패 시 None)
+    """
+    sink = sink or DEFAULT_SINK
+    result = RESULT_FAILED
+    if frontier:
+        frontier.begin(url)
+
+    try:
+        open_detail_page(driver, url, mode)
+
+        # 저장소가 상품 단위 트랜잭션을 결정 (개별 커밋, 그룹 커밋, SQLite SAVEPOINT)
+        with sink.product() as transaction:
+            product_id = crawl_product_on_detail_page(driver, transaction, product_counter, sink, mode)
+            # 그룹 커밋이면 배치가 디스크에 반영된 뒤에 완료로 기록 (반영 전에 중단되면 재시작 시 다시 처리)
+            if frontier:
+                transaction.add_commit_hook(lambda: frontier.mark_done(url, product_id))
+            if index:
+                transaction.add_commit_hook(lambda: index.add(url))
+        print(f"✓ 상품 {product_counter} 처리 완료 및 커밋됨")
+        if on_result:
+            on_result(url, RESULT_RECORD)
+        return product_id
+
+    except DuplicateProductError as de:
+        result = RESULT_DUPLICATE
+        # 이미 저장된 상품 - 다음 순회부터는 상세 페이지를 열지 않도록 인덱스에 기록
+        print(f"✗ 상품 {product_counter} 검증 오류: {de}")
+        print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
+        if frontier:
+            frontier.mark_skipped(url, de)
+        if index:
+            index.add(url)
+
+    except ValueError as ve:
+        # 비즈니스 로직 예외 (중복 상품, 필수 데이터 누락 등) - 트랜잭션은 자동으로 rollback됨
+        result = RESULT_SKIPPED
+        print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
+        print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
+        if frontier:
+            frontier.mark_skipped(url, ve)
+
+    except Exception as e:
+        # 일반 예외 (네트워크 오류, 크롤링 실패 등) - 트랜잭션은 자동으로 rollback됨
+        print(f"✗ 상품 {product_counter} 크롤링 중 오류: {e}")
+        traceback.print_exc()
+        if frontier:
+            frontier.mark_failed(url, e)
+
+        try:
+            driver.save_screenshot(f"error_detail_page_{product_counter}.png")
+            print(f"상세 페이지 오류 스크린샷 저장: error_detail_page_{product_counter}.png")
+        except:
+            pass
+
+    print(f"✗ 상품 {product_counter} 처리 실패 및 롤백됨")
+    if on_result:
+        on_result(url, result)
+    return None
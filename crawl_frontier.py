@@ -0,0 +1,298 @@
+"""
+크롤링 프론티어 모듈
+목록 순회 위치(마지막으로 상품 링크를 수집한 페이지)와 수집한 상세 페이지 URL별 상태를 파일에 기록해
+중단된 크롤링을 중단된 지점부터 다시 시작합니다.
+
+- URL 상태: pending(대기) → done(저장) / skipped(검증 오류, 중복 상품 등) / failed(오류 MAX_ATTEMPTS회)
+  오류가 난 URL은 시도 횟수가 MAX_ATTEMPTS보다 적으면 다시 pending
+- 재시작: 이전 실행에서 남은 pending URL부터 처리하고, 목록은 커서 다음 페이지부터 순회
+  (이미 수집한 목록 페이지와 처리가 끝난 상세 페이지는 다시 열지 않음)
+- 기록: 상태가 바뀔 때마다 저널(.journal)에 한 줄 추가하고, CHECKPOINT_EVERY번마다
+  전체 상태를 스냅샷 파일로 다시 써서 저널을 비움 (중단 시 스냅샷 + 저널로 복원)
+
+파일 형식:
+    스냅샷: {"start_url", "cursor": {"page", "listing_done"}, "urls": {키: {"url", "name", "page", "state", "attempts", ...}}}
+    저널: {"op": "add" / "page" / "state" / "listing_done", ...} 한 줄씩
+    (키는 상품 번호 goodsNo, 없으면 URL)
+
+사용 예:
+    with CrawlFrontier(frontier_path(start_url), start_url) as frontier:
+        links = frontier.add_page(page, harvest_product_links(driver))
+        for link in links:
+            crawl_product_url(driver, link["url"], counter, sink, frontier=frontier)
+        frontier.finish_listing()
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from listing import extract_goods_no
+
+# 프론티어 파일을 저장할 디렉토리
+FRONTIER_DIR = "crawl_frontier"
+
+# URL 하나를 최대 몇 번 시도할지 (이 횟수만큼 오류가 나면 failed)
+MAX_ATTEMPTS = 3
+
+# 저널에 이만큼 기록하면 스냅샷을 다시 쓰고 저널을 비움
+CHECKPOINT_EVERY = 200
+
+# URL 상태
+STATE_PENDING = "pending"
+STATE_DONE = "done"
+STATE_SKIPPED = "skipped"
+STATE_FAILED = "failed"
+
+
+def frontier_path(start_url, frontier_dir=FRONTIER_DIR):
+    """
+    목록 시작 URL에 대응하는 프론티어 파일 경로를 만듭니다.
+    (카테고리 번호 dispCatNo + URL 해시, 같은 카테고리라도 필터가 다르면 다른 파일)
+
+    Args:
+        start_url: 목록 시작 URL
+        frontier_dir: 프론티어 디렉토리
+
+    Returns:
+        str: 프론티어 파일 경로
+    """
+    match = re.search(r"dispCatNo=(\d+)", start_url or "")
+    digest = hashlib.sha1((start_url or "").encode("utf-8")).hexdigest()[:8]
+    name = f"{match.group(1)}_{digest}" if match else digest
+    return os.path.join(frontier_dir, f"{name}.json")
+
+
+def link_key(url, goods_no=None):
+    """프론티어 키 (상품 번호, 없으면 URL) - listing.harvest_product_links의 중복 제거 기준과 같음"""
+    return goods_no or extract_goods_no(url) or url
+
+
+class CrawlFrontier:
+    """
+    목록 커서와 상세 페이지 URL 상태를 파일로 유지하는 크롤링 프론티어
+    """
+
+    def __init__(self, path, start_url=None, max_attempts=MAX_ATTEMPTS, checkpoint_every=CHECKPOINT_EVERY):
+        """
+        Args:
+            path: 스냅샷 파일 경로 (저널은 path + ".journal")
+            start_url: 목록 시작 URL (기록용, 기존 파일과 다르면 경고)
+            max_attempts: URL당 최대 시도 횟수
+            checkpoint_every: 저널 기록 몇 번마다 스냅샷을 다시 쓸지
+        """
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.start_url = start_url
+        self.max_attempts = max_attempts
+        self.checkpoint_every = checkpoint_every
+
+        self.urls = {}  # {키: URL 상태 딕셔너리} (목록 순서 유지)
+        self.cursor_page = 0  # 상품 링크를 모두 기록한 마지막 목록 페이지
+        self.listing_done = False
+        self.journal = None
+        self.journal_entries = 0
+
+        self._load()
+
+    # ------------------------------------------------------------
+    # 파일 읽기 / 쓰기
+    # ------------------------------------------------------------
+
+    def _load(self):
+        """스냅샷을 읽고 저널을 다시 적용합니다."""
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                if self.start_url and snapshot.get("start_url") not in (None, self.start_url):
+                    print(f"[Frontier] ⚠ 시작 URL이 기존 프론티어와 다릅니다: {self.path}")
+                cursor = snapshot.get("cursor") or {}
+                self.cursor_page = cursor.get("page", 0)
+                self.listing_done = cursor.get("listing_done", False)
+                self.urls = snapshot.get("urls") or {}
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"[Frontier] ✗ 스냅샷 읽기 실패, 저널만 적용합니다: {e}")
+
+        replayed = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                        replayed += 1
+                    except (json.JSONDecodeError, KeyError):
+                        # 쓰다가 중단된 마지막 줄
+                        continue
+
+        if self.urls or self.cursor_page:
+            counts = self.counts()
+            print(f"[Frontier] 이전 진행 상황 복원: 목록 {self.cursor_page}페이지까지 수집, "
+                  f"대기 {counts[STATE_PENDING]}개, 완료 {counts[STATE_DONE]}개, "
+                  f"건너뜀 {counts[STATE_SKIPPED]}개, 실패 {counts[STATE_FAILED]}개 (저널 {replayed}줄)")
+
+    def _apply(self, entry):
+        """저널 한 줄을 메모리 상태에 적용합니다. (기록할 때와 복원할 때 같은 함수 사용)"""
+        op = entry["op"]
+        if op == "add":
+            if entry["key"] not in self.urls:
+                self.urls[entry["key"]] = {
+                    "url": entry["url"], "name": entry.get("name", ""), "page": entry.get("page"),
+                    "state": STATE_PENDING, "attempts": 0,
+                }
+        elif op == "page":
+            self.cursor_page = max(self.cursor_page, entry["page"])
+        elif op == "state":
+            item = self.urls[entry["key"]]
+            item["state"] = entry["state"]
+            item["attempts"] = entry.get("attempts", item["attempts"])
+            for field in ("product_id", "error"):
+                if field in entry:
+                    item[field] = entry[field]
+        elif op == "listing_done":
+            self.listing_done = True
+
+    def _record(self, entry):
+        """상태를 바꾸고 저널에 한 줄 추가합니다."""
+        self._apply(entry)
+
+        if self.journal is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.journal = open(self.journal_path, 'a', encoding='utf-8')
+        self.journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.journal.flush()
+
+        self.journal_entries += 1
+        if self.journal_entries >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """전체 상태를 스냅샷 파일로 쓰고(임시 파일 → 교체) 저널을 비웁니다."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        snapshot = {
+            "start_url": self.start_url,
+            "cursor": {"page": self.cursor_page, "listing_done": self.listing_done},
+            "urls": self.urls,
+        }
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        # 스냅샷에 반영된 저널은 비움
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_entries = 0
+
+    # ------------------------------------------------------------
+    # 목록 커서
+    # ------------------------------------------------------------
+
+    @property
+    def next_page(self):
+        """다음에 수집할 목록 페이지 번호"""
+        return self.cursor_page + 1
+
+    def add_page(self, page, links):
+        """
+        목록 페이지 하나에서 수집한 상품 링크를 기록하고 커서를 이 페이지로 옮깁니다.
+
+        Args:
+            page: 목록 페이지 번호
+            links: listing.harvest_product_links() 결과 (페이지의 모든 링크)
+
+        Returns:
+            list: 아직 처리하지 않은(pending) 링크 (목록 순서, 이전 실행에서 끝난 상품은 제외)
+        """
+        pending = []
+        for link in links:
+            key = link_key(link["url"], link.get("goods_no"))
+            if key not in self.urls:
+                self._record({"op": "add", "key": key, "url": link["url"], "name": link.get("name", ""), "page": page})
+            if self.urls[key]["state"] == STATE_PENDING:
+                pending.append(link)
+
+        if page > self.cursor_page:
+            self._record({"op": "page", "page": page})
+
+        skipped = len(links) - len(pending)
+        if skipped:
+            print(f"[Frontier] 페이지 {page}: 이전 실행에서 처리한 상품 {skipped}개 건너뜀")
+        return pending
+
+    def finish_listing(self):
+        """목록의 마지막 페이지까지 수집했음을 기록합니다."""
+        if not self.listing_done:
+            self._record({"op": "listing_done"})
+
+    # ------------------------------------------------------------
+    # URL 상태
+    # ------------------------------------------------------------
+
+    def pending(self):
+        """
+        처리하지 않은 URL 목록 (이전 실행에서 남은 URL, 기록된 순서)
+
+        Returns:
+            list of dict: [{"goods_no", "url", "name"}, ...] (harvest_product_links와 같은 형식)
+        """
+        return [{"goods_no": extract_goods_no(item["url"]), "url": item["url"], "name": item.get("name", "")}
+                for item in self.urls.values() if item["state"] == STATE_PENDING]
+
+    def _item(self, url):
+        key = link_key(url)
+        if key not in self.urls:
+            self._record({"op": "add", "key": key, "url": url, "page": None})
+        return key, self.urls[key]
+
+    def begin(self, url):
+        """URL 처리를 시작할 때 호출합니다. (시도 횟수 증가, 처리 중 중단되어도 횟수가 남음)"""
+        key, item = self._item(url)
+        self._record({"op": "state", "key": key, "state": STATE_PENDING, "attempts": item["attempts"] + 1})
+
+    def mark_done(self, url, product_id=None):
+        """URL을 저장 완료로 기록합니다."""
+        key, _ = self._item(url)
+        self._record({"op": "state", "key": key, "state": STATE_DONE, "product_id": product_id})
+
+    def mark_skipped(self, url, reason=None):
+        """URL을 건너뜀(검증 오류, 중복 상품 등 다시 시도해도 같은 결과)으로 기록합니다."""
+        key, _ = self._item(url)
+        self._record({"op": "state", "key": key, "state": STATE_SKIPPED, "error": str(reason or "")})
+
+    def mark_failed(self, url, error=None):
+        """
+        URL 처리 오류를 기록합니다.
+        시도 횟수가 max_attempts보다 적으면 다음 실행에서 다시 시도하도록 pending으로 남깁니다.
+        """
+        key, item = self._item(url)
+        state = STATE_FAILED if item["attempts"] >= self.max_attempts else STATE_PENDING
+        self._record({"op": "state", "key": key, "state": state, "error": str(error or "")})
+
+    def counts(self):
+        """상태별 URL 수"""
+        counts = {STATE_PENDING: 0, STATE_DONE: 0, STATE_SKIPPED: 0, STATE_FAILED: 0}
+        for item in self.urls.values():
+            counts[item["state"]] = counts.get(item["state"], 0) + 1
+        return counts
+
+    def close(self):
+        """스냅샷을 쓰고 진행 상황을 출력합니다."""
+        self.checkpoint()
+        counts = self.counts()
+        listing = "목록 순회 완료" if self.listing_done else f"목록 {self.cursor_page}페이지까지 수집"
+        print(f"[Frontier] {listing}: 대기 {counts[STATE_PENDING]}개, 완료 {counts[STATE_DONE]}개, "
+              f"건너뜀 {counts[STATE_SKIPPED]}개, 실패 {counts[STATE_FAILED]}개 ({self.path})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
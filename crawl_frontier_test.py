@@ -0,0 +1,66 @@
+import os
+import tempfile
+from crawl_frontier import CrawlFrontier, frontier_path, STATE_DONE, STATE_SKIPPED, STATE_FAILED, STATE_PENDING
+from listing import build_detail_url
+
+START_URL = "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo=100000100020001&pageIdx=1"
+
+work_dir = tempfile.mkdtemp()
+path = frontier_path(START_URL, work_dir)
+assert os.path.basename(path).startswith("100000100020001_")
+
+
+def links(*goods_nos):
+    return [{"goods_no": no, "url": build_detail_url(no), "name": f"상품 {no}"} for no in goods_nos]
+
+
+# 첫 실행: 1페이지 수집 후 일부만 처리하고 중단 (close 없이 저널만 남음)
+frontier = CrawlFrontier(path, START_URL, max_attempts=2)
+assert frontier.next_page == 1
+pending = frontier.add_page(1, links("A1", "A2", "A3", "A4"))
+assert [link["goods_no"] for link in pending] == ["A1", "A2", "A3", "A4"]
+
+frontier.begin(pending[0]["url"])
+frontier.mark_done(pending[0]["url"], 101)
+frontier.begin(pending[1]["url"])
+frontier.mark_skipped(pending[1]["url"], "중복 상품")
+frontier.begin(pending[2]["url"])
+frontier.mark_failed(pending[2]["url"], "타임아웃")   # 1회 실패 → 다시 시도 대상
+frontier.begin(pending[3]["url"])                       # 처리 중 중단
+frontier.journal.close()
+assert not os.path.exists(path) and os.path.exists(path + ".journal")
+
+# 재시작: 저널로 복원, 목록은 2페이지부터, 남은 상품만 처리
+frontier = CrawlFrontier(path, START_URL, max_attempts=2)
+assert frontier.next_page == 2 and not frontier.listing_done
+assert [link["goods_no"] for link in frontier.pending()] == ["A3", "A4"]
+assert frontier.urls["A1"]["product_id"] == 101
+
+# 같은 페이지를 다시 수집해도 끝난 상품은 다시 처리하지 않음
+assert [link["goods_no"] for link in frontier.add_page(1, links("A1", "A2", "A3", "A4"))] == ["A3", "A4"]
+assert frontier.next_page == 2
+
+# 최대 시도 횟수에 도달하면 failed
+frontier.begin(build_detail_url("A3"))
+frontier.mark_failed(build_detail_url("A3"), "타임아웃")
+frontier.begin(build_detail_url("A4"))
+frontier.mark_done(build_detail_url("A4"), 102)
+frontier.add_page(2, links("B1"))
+frontier.finish_listing()
+frontier.close()
+assert os.path.exists(path) and not os.path.exists(path + ".journal")
+
+# 스냅샷에서 복원
+frontier = CrawlFrontier(path, START_URL)
+assert frontier.listing_done and frontier.next_page == 3
+assert frontier.counts() == {STATE_PENDING: 1, STATE_DONE: 2, STATE_SKIPPED: 1, STATE_FAILED: 1}
+assert [link["goods_no"] for link in frontier.pending()] == ["B1"]
+
+# 저널 기록이 checkpoint_every에 도달하면 스냅샷으로 합침
+frontier = CrawlFrontier(path, START_URL, checkpoint_every=3)
+frontier.add_page(3, links("C1", "C2", "C3"))
+assert frontier.journal_entries < 3 and os.path.exists(path)
+frontier.close()
+assert len(CrawlFrontier(path, START_URL).pending()) == 4
+
+print("크롤링 프론티어 테스트 통과")
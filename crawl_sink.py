@@ -0,0 +1,542 @@
+"""
+크롤링 결과 저장소(sink) 모듈
+상세 페이지에서 추출한 상품 레코드를 어디에 저장할지 결정합니다.
+
+- SqlTextSink: 기존 방식. SQL 텍스트 세그먼트 + JSON/저널 파일에 트랜잭션으로 기록
+- SQLiteSink: 로컬 SQLite 스테이징 DB에 배치 트랜잭션으로 기록
+              (상품명 UNIQUE 인덱스로 중복 확인, FileTransaction 백업 불필요)
+              export_sqlite_to_sql()로 기존 SQL 텍스트 형식을 다시 만들 수 있음
+
+상품 레코드 형식 (crawl.extract_product_record 반환값):
+    {
+        "category": str, "category_id": int, "brand": str, "product_name": str,
+        "main_image_urls": [str, ...], "detail_info": {항목명: 값},
+        "detail_image_urls": [str, ...], "options": [옵션 dict, ...]
+    }
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from file_transaction import FileTransaction, MODE_WAL
+from group_commit import GroupCommitTransaction
+from id_sequence import ID_SEQUENCE
+from brand_mapping import get_brand_id, get_all_brands, format_brand_values, BRAND_SQL_HEADER, SQL_OUTPUT_FILE
+from product_mapping import (create_product_id_with_transaction, update_product_data_sql, generate_random_datetime,
+                             format_product_values, PRODUCT_ID_ALLOCATOR, PRODUCT_SQL_HEADER,
+                             SQL_FILE_PATH as PRODUCT_SQL_FILE)
+from main_images_mapping import (update_product_main_images_sql, build_main_image_rows, format_main_image_values,
+                                 MAIN_IMAGES_SQL_HEADER, SQL_FILE_PATH as MAIN_IMAGES_SQL_FILE)
+from productDetailInfoProvided import (get_next_detailinfo_id, save_product_detailinfo, build_detailinfo_row,
+                                       format_detailinfo_values, FIELD_MAP, DETAIL_INFO_SQL_HEADER,
+                                       SQL_FILE_PATH as DETAIL_INFO_SQL_FILE)
+from detailImg import save_detail_image_urls, format_detail_images_sql
+from product_options_mapping import (create_product_options_sql_with_validation, build_product_option_rows,
+                                     format_product_option_values, PRODUCT_OPTIONS_SQL_HEADER,
+                                     SQL_FILE_PATH as PRODUCT_OPTIONS_SQL_FILE)
+
+# 상세 이미지 SQL 파일 경로 (상품별 INSERT 문 블록이 이어짐)
+DETAIL_IMAGES_SQL_FILE = "detail_image_urls_sql.txt"
+
+# SQLite 스테이징 DB 기본 경로
+SQLITE_DB_PATH = "crawl_staging.db"
+
+# SQLite에서 SQL 텍스트로 내보낼 기본 디렉토리 (기존 SQL 파일을 덮어쓰지 않도록 분리)
+SQLITE_EXPORT_DIR = "sqlite_export"
+
+# 한 번에 커밋할 상품 수
+DEFAULT_SQLITE_BATCH_SIZE = 20
+
+DETAIL_INFO_COLUMNS = list(FIELD_MAP.values())
+
+# 상품명 UNIQUE 인덱스 위반 시 sqlite3.IntegrityError 메시지
+PRODUCT_NAME_UNIQUE_ERROR = "UNIQUE constraint failed: products.product_name"
+
+SQLITE_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS brands (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    product_detail_info_id INTEGER NOT NULL,
+    brand_id INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,
+    product_name TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_products_product_name ON products (product_name);
+CREATE TABLE IF NOT EXISTS product_detail_info (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{column} TEXT NOT NULL" for column in DETAIL_INFO_COLUMNS)}
+);
+CREATE TABLE IF NOT EXISTS product_main_images (
+    product_id INTEGER NOT NULL,
+    image_type TEXT NOT NULL,
+    display_order INTEGER NOT NULL,
+    image_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_product_main_images_product_id ON product_main_images (product_id);
+CREATE TABLE IF NOT EXISTS product_detail_images (
+    product_id INTEGER NOT NULL,
+    display_order INTEGER NOT NULL,
+    image_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_product_detail_images_product_id ON product_detail_images (product_id);
+CREATE TABLE IF NOT EXISTS product_options (
+    product_id INTEGER NOT NULL,
+    option_name TEXT NOT NULL,
+    purchase_price INTEGER NOT NULL,
+    selling_price INTEGER NOT NULL,
+    current_stock INTEGER NOT NULL,
+    initial_stock INTEGER NOT NULL,
+    safety_stock INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    display_order INTEGER NOT NULL,
+    is_deleted INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_product_options_product_id ON product_options (product_id);
+"""
+
+
+class SqlTextSink:
+    """
+    기존 SQL 텍스트 출력 저장소
+    상품마다 WAL 트랜잭션(또는 그룹 커밋)으로 세그먼트/저널 파일에 기록합니다.
+    """
+
+    def __init__(self, group_commit_size=0):
+        """
+        Args:
+            group_commit_size: 한 번에 커밋할 상품 수 (0이면 상품마다 개별 커밋)
+        """
+        self.group_commit = GroupCommitTransaction(batch_size=group_commit_size) if group_commit_size > 0 else None
+
+    def product(self):
+        """상품 1개의 쓰기 범위 (with 문으로 사용, 트랜잭션 객체를 반환)"""
+        if self.group_commit:
+            return self.group_commit.product()
+        return FileTransaction(mode=MODE_WAL)
+
+    def contains_product(self, product_name):
+        """이미 저장된 상품명이면 True"""
+        return PRODUCT_ID_ALLOCATOR.contains(product_name)
+
+    def save_product(self, record, transaction):
+        """
+        상품 레코드를 SQL 텍스트 세그먼트에 기록합니다.
+
+        Args:
+            record: 상품 레코드 dict
+            transaction: product()가 반환한 트랜잭션 객체
+
+        Returns:
+            int: 저장된 Product ID
+
+        Raises:
+            ValueError: 이미 존재하는 상품명인 경우
+        """
+        # brand_id 찾기 (새 브랜드면 저널/세그먼트에 추가)
+        brand_id = get_brand_id(record["brand"], transaction)
+        print(f"  - Brand ID: {brand_id}")
+
+        product_id = create_product_id_with_transaction(record["product_name"], transaction)
+        print(f"  - Product ID: {product_id}")
+
+        # 예외 처리: product_id가 0인 경우 (이미 존재하는 상품)
+        if product_id == 0:
+            raise ValueError(f"Error: 이미 존재하는 제품명입니다. (product_name: {record['product_name']})")
+
+        product_detail_info_id = get_next_detailinfo_id(transaction)
+        save_product_detailinfo(product_detail_info_id, record["detail_info"], transaction, DETAIL_INFO_SQL_FILE)
+
+        save_detail_image_urls(product_id, record["detail_image_urls"], transaction, DETAIL_IMAGES_SQL_FILE)
+
+        update_product_data_sql(
+            product_id=product_id,
+            product_detail_info_id=product_detail_info_id,
+            brand_id=brand_id,
+            category_id=record["category_id"],
+            product_name=record["product_name"],
+            transaction=transaction
+        )
+
+        update_product_main_images_sql(product_id, record["main_image_urls"], transaction)
+
+        create_product_options_sql_with_validation(
+            product_id=product_id,
+            product_options=record["options"],
+            transaction=transaction,
+            filename=PRODUCT_OPTIONS_SQL_FILE
+        )
+
+        return product_id
+
+    def close(self):
+        """남은 그룹 커밋 배치를 반영합니다. (SQL 파일 내보내기는 export_all_sql())"""
+        if self.group_commit:
+            self.group_commit.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class SQLiteSink:
+    """
+    SQLite 스테이징 DB 저장소
+    상품마다 SAVEPOINT로 격리하고, batch_size개마다 실제 트랜잭션을 커밋합니다.
+    각 테이블 행은 executemany로 한 번에 삽입합니다.
+    """
+
+    def __init__(self, db_path=SQLITE_DB_PATH, batch_size=DEFAULT_SQLITE_BATCH_SIZE):
+        """
+        Args:
+            db_path: SQLite DB 파일 경로
+            batch_size: 한 번에 커밋할 상품 수
+        """
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.conn = None
+        self.pending_products = 0
+        self.allocated_ids = []  # 현재 상품에서 꺼낸 ID [(시퀀스_이름, ID)]
+        self.batch_commit_hooks = []  # 배치 커밋 후 호출할 함수
+        self.staged_commit_hooks = []  # 현재 상품의 커밋 훅
+        self.staged_rollback_hooks = []  # 현재 상품이 버려질 때 호출할 함수
+        self.in_product = False
+
+        # 통계
+        self.total_committed = 0
+        self.total_dropped = 0
+
+    def open(self):
+        """DB를 열고 스키마를 만듭니다. 새 DB면 기존 브랜드 목록을 가져옵니다."""
+        if self.conn is not None:
+            return
+
+        # isolation_level=None: BEGIN/COMMIT/SAVEPOINT를 직접 제어
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+
+        if self.conn.execute("SELECT COUNT(*) FROM brands").fetchone()[0] == 0:
+            brands = [(id_val, name) for name, id_val in get_all_brands()]
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT INTO brands (id, name) VALUES (?, ?)", brands)
+            self.conn.execute("COMMIT")
+            print(f"[SQLiteSink] 기존 브랜드 {len(brands)}개 가져오기 완료")
+
+        self.conn.execute("BEGIN")
+        print(f"[SQLiteSink] '{self.db_path}' 열기 완료")
+
+    # ------------------------------------------------------------
+    # 상품 단위 격리
+    # ------------------------------------------------------------
+    @contextmanager
+    def product(self):
+        """
+        상품 1개의 쓰기 범위 (SAVEPOINT)
+        예외가 발생하면 해당 상품의 행과 ID 할당만 취소하고 예외를 다시 발생시킵니다.
+        """
+        self.open()
+        if self.in_product:
+            raise Exception("이미 상품 트랜잭션이 진행 중입니다.")
+
+        self.conn.execute("SAVEPOINT product")
+        self.allocated_ids = []
+        self.staged_commit_hooks = []
+        self.staged_rollback_hooks = []
+        self.in_product = True
+
+        try:
+            yield self
+        except Exception:
+            self.conn.execute("ROLLBACK TO product")
+            self.conn.execute("RELEASE product")
+            for name, allocated_id in reversed(self.allocated_ids):
+                ID_SEQUENCE.unget(name, allocated_id)
+            self.total_dropped += 1
+            rollback_hooks = self.staged_rollback_hooks
+            self.staged_rollback_hooks = []
+            for hook in reversed(rollback_hooks):
+                hook()
+            raise
+        else:
+            self.conn.execute("RELEASE product")
+            self.pending_products += 1
+            self.batch_commit_hooks.extend(self.staged_commit_hooks)
+        finally:
+            self.allocated_ids = []
+            self.staged_commit_hooks = []
+            self.staged_rollback_hooks = []
+            self.in_product = False
+
+        if self.pending_products >= self.batch_size:
+            self.commit()
+
+    def add_commit_hook(self, hook):
+        """
+        현재 상품이 포함된 배치가 커밋된 뒤 호출할 함수를 등록합니다.
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+        self.staged_commit_hooks.append(hook)
+
+    def add_rollback_hook(self, hook):
+        """
+        현재 상품이 버려질 때 호출할 함수를 등록합니다.
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+        self.staged_rollback_hooks.append(hook)
+
+    def _next_id(self, name):
+        new_id = ID_SEQUENCE.next_id(name)
+        self.allocated_ids.append((name, new_id))
+        return new_id
+
+    def contains_product(self, product_name):
+        """이미 저장된 상품명이면 True (UNIQUE 인덱스 조회)"""
+        self.open()
+        row = self.conn.execute("SELECT 1 FROM products WHERE product_name = ?", (product_name,)).fetchone()
+        return row is not None
+
+    def _get_brand_id(self, brand_name):
+        """브랜드 ID를 조회하고, 없으면 새로 생성합니다."""
+        cleaned_name = brand_name.strip()
+        if not cleaned_name:
+            return None
+
+        row = self.conn.execute("SELECT id FROM brands WHERE name = ?", (cleaned_name,)).fetchone()
+        if row:
+            return row[0]
+
+        brand_id = self._next_id("brand")
+        self.conn.execute("INSERT INTO brands (id, name) VALUES (?, ?)", (brand_id, cleaned_name))
+        print(f"새로운 브랜드 생성: '{cleaned_name}' -> ID: {brand_id}")
+        return brand_id
+
+    def save_product(self, record, transaction=None):
+        """
+        상품 레코드를 스테이징 DB에 기록합니다. product() 범위 안에서 호출해야 합니다.
+
+        Args:
+            record: 상품 레코드 dict
+            transaction: 사용하지 않음 (SqlTextSink와 같은 호출 형태를 위한 인자)
+
+        Returns:
+            int: 저장된 Product ID
+
+        Raises:
+            ValueError: 이미 존재하는 상품명인 경우
+            sqlite3.IntegrityError: 상품명 중복 외의 제약 조건 위반
+        """
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+
+        brand_id = self._get_brand_id(record["brand"])
+        print(f"  - Brand ID: {brand_id}")
+
+        product_id = self._next_id("product")
+        product_detail_info_id = self._next_id("detailinfo")
+
+        try:
+            self.conn.execute(
+                "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, product_name, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (product_id, product_detail_info_id, brand_id, record["category_id"],
+                 record["product_name"], generate_random_datetime())
+            )
+        except sqlite3.IntegrityError as e:
+            # 상품명 UNIQUE 위반만 중복으로 처리 (NOT NULL 등 다른 제약 위반은 그대로 전달)
+            if PRODUCT_NAME_UNIQUE_ERROR not in str(e):
+                raise
+            raise ValueError(f"Error: 이미 존재하는 제품명입니다. (product_name: {record['product_name']})")
+        print(f"  - Product ID: {product_id}")
+
+        self.conn.execute(
+            f"INSERT INTO product_detail_info (id, {', '.join(DETAIL_INFO_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in DETAIL_INFO_COLUMNS)})",
+            [product_detail_info_id] + build_detailinfo_row(record["detail_info"])
+        )
+
+        self.conn.executemany(
+            "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES (?, ?, ?, ?)",
+            build_main_image_rows(product_id, record["main_image_urls"])
+        )
+
+        self.conn.executemany(
+            "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES (?, ?, ?)",
+            [(product_id, idx, url) for idx, url in enumerate(record["detail_image_urls"])]
+        )
+
+        self.conn.executemany(
+            "INSERT INTO product_options (product_id, option_name, purchase_price, selling_price, "
+            "current_stock, initial_stock, safety_stock, image_url, display_order, is_deleted) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            build_product_option_rows(product_id, record["options"])
+        )
+
+        return product_id
+
+    # ------------------------------------------------------------
+    # 커밋
+    # ------------------------------------------------------------
+    def commit(self):
+        """쌓인 상품들을 커밋하고 새 트랜잭션을 시작합니다."""
+        if self.conn is None or self.pending_products == 0:
+            return 0
+
+        self.conn.execute("COMMIT")
+        self.conn.execute("BEGIN")
+
+        committed = self.pending_products
+        self.total_committed += committed
+        self.pending_products = 0
+        print(f"[SQLiteSink] 상품 {committed}개 커밋 완료")
+
+        commit_hooks = self.batch_commit_hooks
+        self.batch_commit_hooks = []
+        for hook in commit_hooks:
+            hook()
+        return committed
+
+    def close(self):
+        """남은 상품을 커밋하고 DB를 닫습니다."""
+        if self.conn is None:
+            return
+
+        self.commit()
+        self.conn.execute("COMMIT")
+        self.conn.close()
+        self.conn = None
+        print(f"[SQLiteSink] 총 커밋 상품 {self.total_committed}개, 버린 상품 {self.total_dropped}개")
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# ------------------------------------------------------------
+# SQLite -> SQL 텍스트 내보내기
+# ------------------------------------------------------------
+def _write_values_sql(path, header, values):
+    """
+    'header\\n(값),\\n(값);' 형식의 SQL 파일을 씁니다. (SqlSegmentWriter.export와 같은 형식)
+
+    Returns:
+        int: 기록한 VALUES 튜플 수
+    """
+    count = 0
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(header)
+        for value in values:
+            f.write(("\n" if count == 0 else ",\n") + value)
+            count += 1
+        f.write(";")
+    os.replace(temp_path, path)
+    return count
+
+
+def export_sqlite_to_sql(db_path=SQLITE_DB_PATH, output_dir=SQLITE_EXPORT_DIR):
+    """
+    스테이징 DB 내용을 기존 SQL 텍스트 형식 6종으로 내보냅니다.
+
+    Args:
+        db_path: SQLite DB 파일 경로
+        output_dir: SQL 파일을 저장할 디렉토리
+
+    Returns:
+        dict: {SQL 파일 경로: 기록한 행 수}
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    conn = sqlite3.connect(db_path)
+    results = {}
+
+    try:
+        path = os.path.join(output_dir, SQL_OUTPUT_FILE)
+        results[path] = _write_values_sql(path, BRAND_SQL_HEADER, (
+            format_brand_values(name, id_val)
+            for id_val, name in conn.execute("SELECT id, name FROM brands ORDER BY id")
+        ))
+
+        path = os.path.join(output_dir, PRODUCT_SQL_FILE)
+        results[path] = _write_values_sql(path, PRODUCT_SQL_HEADER, (
+            format_product_values(*row)
+            for row in conn.execute("SELECT id, product_detail_info_id, brand_id, category_id, product_name, "
+                                    "created_at FROM products ORDER BY id")
+        ))
+
+        path = os.path.join(output_dir, DETAIL_INFO_SQL_FILE)
+        results[path] = _write_values_sql(path, DETAIL_INFO_SQL_HEADER, (
+            format_detailinfo_values(row[0], row[1:])
+            for row in conn.execute(f"SELECT id, {', '.join(DETAIL_INFO_COLUMNS)} "
+                                    f"FROM product_detail_info ORDER BY id")
+        ))
+
+        path = os.path.join(output_dir, MAIN_IMAGES_SQL_FILE)
+        results[path] = _write_values_sql(path, MAIN_IMAGES_SQL_HEADER, (
+            format_main_image_values(row)
+            for row in conn.execute("SELECT product_id, image_type, display_order, image_url "
+                                    "FROM product_main_images ORDER BY product_id, display_order")
+        ))
+
+        path = os.path.join(output_dir, PRODUCT_OPTIONS_SQL_FILE)
+        results[path] = _write_values_sql(path, PRODUCT_OPTIONS_SQL_HEADER, (
+            format_product_option_values(row)
+            for row in conn.execute("SELECT product_id, option_name, purchase_price, selling_price, "
+                                    "current_stock, initial_stock, safety_stock, image_url, display_order, "
+                                    "is_deleted FROM product_options ORDER BY product_id, display_order")
+        ))
+
+        # 상세 이미지는 상품별 INSERT 문 블록
+        path = os.path.join(output_dir, DETAIL_IMAGES_SQL_FILE)
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            product_id, urls = None, []
+            for row_product_id, image_url in conn.execute(
+                    "SELECT product_id, image_url FROM product_detail_images ORDER BY product_id, display_order"):
+                if row_product_id != product_id and urls:
+                    f.write(format_detail_images_sql(product_id, urls))
+                    urls = []
+                product_id = row_product_id
+                urls.append(image_url)
+                count += 1
+            if urls:
+                f.write(format_detail_images_sql(product_id, urls))
+        results[path] = count
+
+    finally:
+        conn.close()
+
+    for path, count in results.items():
+        print(f"✓ {path} ({count}행)")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 사용법: python crawl_sink.py [DB 경로] [출력 디렉토리]
+    export_sqlite_to_sql(
+        sys.argv[1] if len(sys.argv) > 1 else SQLITE_DB_PATH,
+        sys.argv[2] if len(sys.argv) > 2 else SQLITE_EXPORT_DIR
+    )
@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import tempfile
+
+import crawl_sink
+from crawl_sink import SQLiteSink, export_sqlite_to_sql
+from id_sequence import IdSequence
+
+# 임시 디렉토리의 DB와 ID 시퀀스 사용 (작업 디렉토리에 파일을 만들지 않음)
+work_dir = tempfile.mkdtemp()
+db_path = os.path.join(work_dir, "crawl_staging.db")
+crawl_sink.ID_SEQUENCE = IdSequence(state_path=os.path.join(work_dir, "id_sequence.json"), seed_files={},
+                                    mirror_files={})
+
+
+def make_record(product_name, category_id=1):
+    return {
+        "category": "스킨케어", "category_id": category_id, "brand": "헤라", "product_name": product_name,
+        "main_image_urls": ["https://img/main-1.jpg", "https://img/main-2.jpg"],
+        "detail_info": {"제조국": "대한민국"},
+        "detail_image_urls": ["https://img/detail-1.jpg"],
+        "options": [{"name": "50ml", "price": "12000", "image_url": "", "is_soldout": False}],
+    }
+
+
+committed = []
+rolled_back = []
+sink = SQLiteSink(db_path=db_path, batch_size=10)
+
+# 저장 (커밋 훅은 배치 커밋 뒤에만 호출)
+with sink.product() as transaction:
+    product_id = sink.save_product(make_record("테스트 세럼"), transaction)
+    transaction.add_commit_hook(lambda: committed.append(product_id))
+assert sink.contains_product("테스트 세럼")
+assert committed == []
+
+# 상품명 중복은 ValueError, 해당 상품만 롤백
+try:
+    with sink.product() as transaction:
+        transaction.add_rollback_hook(lambda: rolled_back.append("중복"))
+        sink.save_product(make_record("테스트 세럼"), transaction)
+    raise AssertionError("중복 상품명이 저장되었습니다.")
+except ValueError:
+    pass
+assert rolled_back == ["중복"]
+
+# 다른 제약 조건 위반은 중복으로 바꾸지 않고 그대로 전달
+try:
+    with sink.product() as transaction:
+        sink.save_product(make_record("카테고리 없는 상품", category_id=None), transaction)
+    raise AssertionError("NOT NULL 위반이 무시되었습니다.")
+except sqlite3.IntegrityError:
+    pass
+assert not sink.contains_product("카테고리 없는 상품")
+
+# 저장 중 예외가 나면 이미 넣은 행도 취소
+try:
+    with sink.product() as transaction:
+        sink.save_product(make_record("중간 실패 상품"), transaction)
+        raise RuntimeError("추출 실패")
+except RuntimeError:
+    pass
+assert not sink.contains_product("중간 실패 상품")
+
+sink.close()
+assert committed == [product_id]
+assert (sink.total_committed, sink.total_dropped) == (1, 3)
+
+# 커밋된 상품 1개만 SQL 텍스트로 내보냄
+export_dir = os.path.join(work_dir, "sqlite_export")
+results = export_sqlite_to_sql(db_path, export_dir)
+counts = {os.path.basename(path): count for path, count in results.items()}
+assert counts[crawl_sink.PRODUCT_SQL_FILE] == 1
+assert counts[crawl_sink.MAIN_IMAGES_SQL_FILE] == 2
+assert counts[crawl_sink.DETAIL_INFO_SQL_FILE] == 1
+assert counts[crawl_sink.PRODUCT_OPTIONS_SQL_FILE] == 1
+assert counts[crawl_sink.DETAIL_IMAGES_SQL_FILE] == 1
+with open(os.path.join(export_dir, crawl_sink.PRODUCT_SQL_FILE), encoding="utf-8") as f:
+    product_sql = f.read()
+assert "테스트 세럼" in product_sql and "중간 실패 상품" not in product_sql
+print("SQLite 저장소 테스트 통과")
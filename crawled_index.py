@@ -0,0 +1,344 @@
+"""
+수집 완료 상품 인덱스 모듈
+중복 상품 확인은 상세 페이지를 열고 기본 정보를 읽은 뒤에야 가능하므로(crawl 1단계),
+이미 수집한 카테고리를 다시 순회하면 상품마다 상세 페이지 로드 비용을 그대로 냅니다.
+이 모듈은 상품 번호(goodsNo)와 상품명으로 수집 완료 여부를 기록해 두고,
+목록에서 링크를 수집한 직후(상세 페이지를 열기 전)에 이미 수집한 상품을 걸러냅니다.
+
+- 키: "g:상품번호"(번호가 없으면 "u:URL"), "n:정규화한 상품명" (목록의 상품명으로도 확인)
+- 저장: 스냅샷(crawled_index.json) + 추가된 키만 한 줄씩 기록하는 저널(.journal), 닫을 때 스냅샷으로 합침
+- 인덱스 파일이 없으면 기존 product_data.json(+ 저널)의 상품명으로 다시 만듦
+  제품 데이터가 초기화된 경우(next_id가 인덱스가 기록해 둔 값보다 작음)에도 다시 만듦
+- 저장한 상품은 커밋 훅에서 기록 (그룹 커밋 flush 전에 중단되어도 저장하지 않은 상품을 건너뛰지 않음)
+- bloom_capacity를 지정하면 키 집합 대신 블룸 필터로 저장 (카탈로그가 매우 클 때 메모리/파일 크기 절약)
+  오탐률(error_rate)만큼 수집하지 않은 상품을 수집한 것으로 판단할 수 있음 (미탐은 없음)
+
+사용 예:
+    with CrawledIndex() as index:
+        links, known = index.filter_links(harvest_product_links(driver))
+        ...
+        index.add(url)
+"""
+
+import base64
+import hashlib
+import json
+import math
+import os
+import re
+
+from id_allocator import NameIdAllocator
+from listing import extract_goods_no
+from product_mapping import JSON_FILE_PATH as PRODUCT_JSON_PATH
+
+# 인덱스 스냅샷 파일 경로 (저널은 + ".journal")
+CRAWLED_INDEX_PATH = "crawled_index.json"
+
+# 블룸 필터 기본 오탐률
+DEFAULT_ERROR_RATE = 0.001
+
+# 저널에 이만큼 기록하면 스냅샷으로 합침
+DEFAULT_COMPACT_EVERY = 1000
+
+
+def normalize_name(name):
+    """상품명 비교용 정규화 (앞뒤 공백 제거, 연속 공백을 하나로)"""
+    return re.sub(r"\s+", " ", name or "").strip()
+
+
+def goods_key(url, goods_no=None):
+    """상품 번호 키 (번호가 없으면 URL 키)"""
+    goods_no = goods_no or extract_goods_no(url)
+    return f"g:{goods_no}" if goods_no else f"u:{url}"
+
+
+def name_key(name):
+    """상품명 키 (빈 이름이면 None)"""
+    name = normalize_name(name)
+    return f"n:{name}" if name else None
+
+
+class BloomFilter:
+    """
+    고정 크기 블룸 필터 (비트 배열 + 이중 해싱)
+    """
+
+    def __init__(self, capacity, error_rate=DEFAULT_ERROR_RATE, size=None, hashes=None, bits=None, count=0):
+        """
+        Args:
+            capacity: 예상 최대 키 수
+            error_rate: 목표 오탐률
+            size, hashes, bits, count: 파일에서 복원할 때 사용 (비트 수, 해시 수, 비트 배열, 추가한 키 수)
+        """
+        capacity = max(1, capacity)
+        self.size = size or max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = hashes or max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_dict(self):
+        return {"size": self.size, "hashes": self.hashes, "count": self.count,
+                "bits": base64.b64encode(bytes(self.bits)).decode("ascii")}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(1, size=data["size"], hashes=data["hashes"], count=data.get("count", 0),
+                   bits=bytearray(base64.b64decode(data["bits"])))
+
+
+class CrawledIndex:
+    """
+    수집 완료 상품 인덱스 (상품 번호 / 상품명)
+    """
+
+    def __init__(self, path=CRAWLED_INDEX_PATH, bloom_capacity=0, error_rate=DEFAULT_ERROR_RATE,
+                 seed_json_path=PRODUCT_JSON_PATH, compact_every=DEFAULT_COMPACT_EVERY):
+        """
+        Args:
+            path: 인덱스 스냅샷 파일 경로
+            bloom_capacity: 0이면 키 집합으로 저장, 양수면 이 용량의 블룸 필터로 저장
+                            (새로 만들 때만 적용, 기존 파일은 파일의 저장 방식을 따름)
+            error_rate: 블룸 필터 오탐률
+            seed_json_path: 인덱스 파일이 없을 때 상품명을 가져올 제품 데이터 파일 (None이면 빈 인덱스)
+            compact_every: 저널 항목이 이 개수 이상이면 스냅샷으로 합침
+        """
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+        self.seed_json_path = seed_json_path
+        self.compact_every = compact_every
+
+        self.keys = None   # 키 집합 (블룸 필터를 쓰면 None)
+        self.bloom = None  # BloomFilter (키 집합을 쓰면 None)
+        self.journal_entries = 0
+        self.seed_next_id = 0  # 인덱스가 확인한 제품 데이터의 next_id (이보다 작아지면 초기화된 것)
+
+        # 통계
+        self.checked = 0
+        self.known = 0
+
+        self._load()
+
+    # ------------------------------------------------------------
+    # 읽기 / 쓰기
+    # ------------------------------------------------------------
+
+    def _new_store(self):
+        if self.bloom_capacity > 0:
+            self.bloom = BloomFilter(self.bloom_capacity, self.error_rate)
+        else:
+            self.keys = set()
+
+    def _load(self):
+        """
+        스냅샷과 저널을 읽습니다.
+        스냅샷이 없거나 제품 데이터가 초기화되었으면 제품 데이터의 상품명으로 다시 만듭니다.
+        """
+        data = None
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            seed_next_id = self._read_seed_next_id()
+            if seed_next_id is not None and seed_next_id < data.get("seed_next_id", 0):
+                print(f"[CrawledIndex] ⚠ '{self.seed_json_path}'가 초기화되었습니다 "
+                      f"(next_id {seed_next_id} < {data['seed_next_id']}). 인덱스를 다시 만듭니다.")
+                data = None
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+            else:
+                self.seed_next_id = max(data.get("seed_next_id", 0), seed_next_id or 0)
+
+        if data is not None:
+            if "bloom" in data:
+                self.bloom = BloomFilter.from_dict(data["bloom"])
+            else:
+                self.keys = set(data.get("keys") or [])
+        else:
+            self._new_store()
+            self._seed()
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._add_key(json.loads(line)["key"])
+                        self.journal_entries += 1
+                    except (json.JSONDecodeError, KeyError):
+                        # 기록 도중 끊긴 마지막 줄
+                        continue
+
+        store = f"블룸 필터 {self.bloom.size}비트" if self.bloom else "키 집합"
+        print(f"[CrawledIndex] '{self.path}' 로드 완료 (키 {len(self)}개, {store}, 저널 {self.journal_entries}개)")
+
+    def _load_seed(self):
+        """제품 데이터(product_data.json + 할당 저널)를 읽은 할당기 (경로가 없거나 읽기 실패 시 None)"""
+        if not self.seed_json_path:
+            return None
+
+        allocator = NameIdAllocator(self.seed_json_path, "products")
+        try:
+            allocator.load()
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[CrawledIndex] ⚠ '{self.seed_json_path}' 읽기 실패: {e}")
+            return None
+        return allocator
+
+    def _read_seed_next_id(self):
+        """제품 데이터의 현재 next_id (확인할 수 없으면 None)"""
+        allocator = self._load_seed()
+        return allocator.next_id if allocator else None
+
+    def _seed(self):
+        """기존 제품 데이터의 상품명으로 인덱스를 만들고 스냅샷을 씁니다."""
+        allocator = self._load_seed()
+        if allocator is None:
+            print("[CrawledIndex] 빈 인덱스로 시작합니다.")
+            return
+
+        self.seed_next_id = allocator.next_id
+        for name in allocator.index:
+            key = name_key(name)
+            if key:
+                self._add_key(key)
+        print(f"[CrawledIndex] '{self.seed_json_path}'의 상품명 {len(allocator.index)}개로 인덱스를 다시 만들었습니다.")
+        self.compact()
+
+    def _add_key(self, key):
+        if self.bloom is not None:
+            if key not in self.bloom:
+                self.bloom.add(key)
+        else:
+            self.keys.add(key)
+
+    def _has_key(self, key):
+        return key in (self.bloom if self.bloom is not None else self.keys)
+
+    def __len__(self):
+        return self.bloom.count if self.bloom is not None else len(self.keys)
+
+    def compact(self):
+        """현재 인덱스를 스냅샷 파일에 쓰고(임시 파일 → 교체) 저널을 비웁니다."""
+        data = {"bloom": self.bloom.to_dict()} if self.bloom is not None else {"keys": sorted(self.keys)}
+        data["seed_next_id"] = self.seed_next_id
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_entries = 0
+
+    # ------------------------------------------------------------
+    # 조회 / 기록
+    # ------------------------------------------------------------
+
+    def contains(self, url, goods_no=None, name=None):
+        """
+        이미 수집한 상품이면 True
+
+        Args:
+            url: 상세 페이지 URL
+            goods_no: 상품 번호 (None이면 URL에서 추출)
+            name: 목록에 표시된 상품명 (상품 번호로 찾지 못하면 상품명으로 확인)
+        """
+        self.checked += 1
+        key = name_key(name)
+        if self._has_key(goods_key(url, goods_no)) or (key and self._has_key(key)):
+            self.known += 1
+            return True
+        return False
+
+    def filter_links(self, links):
+        """
+        목록 링크 중 수집하지 않은 링크만 남깁니다.
+
+        Args:
+            links: listing.harvest_product_links() 결과
+
+        Returns:
+            tuple: (수집하지 않은 링크 리스트, 이미 수집한 링크 리스트)
+        """
+        new_links, known_links = [], []
+        for link in links:
+            if self.contains(link["url"], link.get("goods_no"), link.get("name")):
+                known_links.append(link)
+            else:
+                new_links.append(link)
+        if known_links:
+            print(f"[CrawledIndex] 이미 수집한 상품 {len(known_links)}개는 상세 페이지를 열지 않고 건너뜁니다.")
+        return new_links, known_links
+
+    def add(self, url, goods_no=None, name=None):
+        """
+        수집한 상품을 기록합니다. (이미 존재하는 상품으로 확인된 경우, 또는 저장한 상품이 커밋된 뒤 커밋 훅에서)
+
+        Args:
+            url: 상세 페이지 URL
+            goods_no: 상품 번호 (None이면 URL에서 추출)
+            name: 상품명 (있으면 함께 기록)
+        """
+        for key in (goods_key(url, goods_no), name_key(name)):
+            if not key or self._has_key(key):
+                continue
+            self._add_key(key)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"key": key}, ensure_ascii=False) + "\n")
+            self.journal_entries += 1
+
+        if self.journal_entries >= self.compact_every:
+            self.compact()
+
+    def close(self):
+        """스냅샷으로 합치고 건너뛴 상품 수를 출력합니다."""
+        if self.journal_entries:
+            self.compact()
+        if self.checked:
+            print(f"[CrawledIndex] 확인 {self.checked}개 중 {self.known}개를 상세 페이지 로드 없이 건너뜀")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def skip_known_links(links, frontier=None, index=None):
+    """
+    수집 완료 인덱스에 있는 상품 링크를 상세 페이지를 열기 전에 걸러내는 함수
+
+    Args:
+        links: [{"goods_no", "url", "name"}, ...]
+        frontier: 걸러낸 링크를 건너뜀으로 기록할 크롤링 프론티어 (None이면 기록 안 함)
+        index: 수집 완료 인덱스 (None이면 걸러내지 않음)
+
+    Returns:
+        list: 수집하지 않은 링크
+    """
+    if not index:
+        return links
+
+    new_links, known_links = index.filter_links(links)
+    if frontier:
+        for link in known_links:
+            frontier.mark_skipped(link["url"], "수집 완료 인덱스에 있는 상품")
+    return new_links
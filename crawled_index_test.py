@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+from crawled_index import CrawledIndex, BloomFilter
+from listing import build_detail_url
+
+work_dir = tempfile.mkdtemp()
+seed_path = os.path.join(work_dir, "product_data.json")
+with open(seed_path, "w", encoding="utf-8") as f:
+    json.dump({"products": {"달바 퍼스트 스프레이 세럼 100ml": 1}, "next_id": 3}, f, ensure_ascii=False)
+with open(seed_path + ".journal", "w", encoding="utf-8") as f:
+    f.write(json.dumps({"name": "구달 청귤 비타C  아이크림 30ml", "id": 2}, ensure_ascii=False) + "\n")
+
+# 인덱스 파일이 없으면 제품 데이터(스냅샷 + 저널)의 상품명으로 다시 만듦
+index_path = os.path.join(work_dir, "crawled_index.json")
+index = CrawledIndex(index_path, seed_json_path=seed_path)
+assert len(index) == 2 and os.path.exists(index_path)
+
+links = [
+    {"goods_no": "A001", "url": build_detail_url("A001"), "name": " 달바 퍼스트 스프레이 세럼 100ml "},
+    {"goods_no": "A002", "url": build_detail_url("A002"), "name": "구달 청귤 비타C 아이크림 30ml"},
+    {"goods_no": "A003", "url": build_detail_url("A003"), "name": "새 상품"},
+]
+new_links, known_links = index.filter_links(links)
+assert [link["goods_no"] for link in known_links] == ["A001", "A002"]
+assert [link["goods_no"] for link in new_links] == ["A003"]
+
+# 상품 번호로 기록하면 목록 상품명이 달라도 건너뜀 (저널에 기록 후 닫을 때 스냅샷으로 합침)
+index.add(build_detail_url("A003"))
+assert index.contains(build_detail_url("A003"), name="이름이 바뀐 상품")
+assert os.path.exists(index_path + ".journal")
+index.close()
+assert not os.path.exists(index_path + ".journal")
+
+index = CrawledIndex(index_path, seed_json_path=seed_path)
+assert index.contains("https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo=A003&dispCatNo=1")
+assert not index.contains(build_detail_url("A004"))
+
+# 블룸 필터: 추가한 키는 항상 찾고, 오탐률은 목표 근처
+bloom = BloomFilter(2000, error_rate=0.01)
+for i in range(2000):
+    bloom.add(f"g:{i}")
+assert all(f"g:{i}" in bloom for i in range(2000))
+false_positives = sum(f"g:x{i}" in bloom for i in range(10000))
+assert false_positives < 300, false_positives
+
+# 블룸 필터 인덱스도 파일에서 복원 (저장 방식은 파일을 따름)
+bloom_path = os.path.join(work_dir, "crawled_bloom.json")
+index = CrawledIndex(bloom_path, bloom_capacity=1000, seed_json_path=seed_path)
+assert index.bloom is not None and index.keys is None
+index.add(build_detail_url("B001"), name="블룸 상품")
+index.close()
+index = CrawledIndex(bloom_path, seed_json_path=seed_path)
+assert index.bloom is not None
+assert index.contains(build_detail_url("B001")) and index.contains(build_detail_url("B999"), name="블룸 상품")
+assert index.contains(build_detail_url("B998"), name="달바 퍼스트 스프레이 세럼 100ml")
+
+# 제품 데이터가 초기화되면(next_id가 인덱스가 본 값보다 작음) 오래된 인덱스를 버리고 다시 만듦
+index = CrawledIndex(index_path, seed_json_path=seed_path)
+index.add(build_detail_url("A005"))
+index.close()
+with open(seed_path, "w", encoding="utf-8") as f:
+    json.dump({"products": {"초기화 후 상품": 1}, "next_id": 2}, f, ensure_ascii=False)
+os.remove(seed_path + ".journal")
+index = CrawledIndex(index_path, seed_json_path=seed_path)
+assert len(index) == 1 and not os.path.exists(index_path + ".journal")
+assert not index.contains(build_detail_url("A003")) and not index.contains(build_detail_url("A005"))
+assert index.contains(build_detail_url("A006"), name="초기화 후 상품")
+
+print("수집 완료 인덱스 테스트 통과")
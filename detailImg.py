@@ -1,65 +1,220 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
+from wait_engine import wait_for, wait_settled, element_clickable, lazy_images_loaded
 
 
-def get_detail_image_urls(driver, product_id: int, transaction, filename: str = None): # transaction 인자 추가
+# 상세 이미지 선택자
+DETAIL_IMAGE_SELECTOR = ".speedycat-container img"
+
+# 상세 이미지 URL을 찾을 속성 (앞에서부터 우선)
+DETAIL_IMAGE_ATTRIBUTES = ["data-src", "data-original", "src"]
+
+# "상품설명 더보기" 버튼
+MORE_BUTTON_SELECTOR = "button.GoodsDetailTabs_btn-more__zrJGJ"
+
+# product_detail_images INSERT 문 머리말
+DETAIL_IMAGES_SQL_HEADER = "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES"
+
+# 상세 이미지 수집 방식
+DETAIL_IMAGE_MODE_SCAN = "scan"      # 스크립트 1회 실행으로 속성 값 수집, URL이 없는 이미지만 강제 로딩
+DETAIL_IMAGE_MODE_SCROLL = "scroll"  # 500px씩 스크롤하며 지연 로딩 대기 (기존 방식)
+
+# mode를 지정하지 않았을 때 사용하는 수집 방식
+DEFAULT_DETAIL_IMAGE_MODE = DETAIL_IMAGE_MODE_SCAN
+
+# 더보기 클릭 후 상세 이미지 목록이 더 늘지 않을 때까지 기다리는 최대 시간 (밀리초)
+DETAIL_IMAGE_EXPAND_MS = 1000
+
+# URL 속성이 없는 이미지를 강제 로딩하는 데 쓸 최대 시간 (밀리초)
+DETAIL_IMAGE_FORCE_BUDGET_MS = 3000
+
+# 상세 이미지 URL을 한 번에 수집하는 스크립트
+# (arguments[0]: 선택자/속성/시간 설정, 마지막 인자: 완료 콜백)
+COLLECT_DETAIL_IMAGES_SCRIPT = """
+var config = arguments[0];
+var done = arguments[arguments.length - 1];
+
+function sleep(ms) { return new Promise(function (resolve) { setTimeout(resolve, ms); }); }
+function urlOf(img) {
+    for (var i = 0; i < config.attributes.length; i++) {
+        var url = img.getAttribute(config.attributes[i]);
+        if (url && url.indexOf('data:image') !== 0) { return url; }
+    }
+    return null;
+}
+
+async function collect() {
+    // 더보기 버튼이 있으면 펼치고, 이미지 수가 더 늘지 않을 때까지 짧게 대기
+    var more = document.querySelector(config.more_button);
+    if (more) {
+        more.click();
+        var count = -1, start = Date.now();
+        while (Date.now() - start < config.expand_ms) {
+            var current = document.querySelectorAll(config.image).length;
+            if (current > 0 && current === count) { break; }
+            count = current;
+            await sleep(100);
+        }
+    }
+
+    // URL 속성이 없는 이미지만 화면으로 가져와 지연 로딩을 강제 (시간 제한)
+    var images = Array.prototype.slice.call(document.querySelectorAll(config.image));
+    var missing = images.filter(function (img) { return !urlOf(img); });
+    var deadline = Date.now() + config.force_budget_ms;
+    var x = window.scrollX, y = window.scrollY;
+    for (var i = 0; i < missing.length && Date.now() < deadline; i++) {
+        missing[i].setAttribute('loading', 'eager');
+        missing[i].scrollIntoView({block: 'center'});
+        while (!urlOf(missing[i]) && Date.now() < deadline) { await sleep(50); }
+    }
+    if (missing.length) { window.scrollTo(x, y); }
+
+    return {
+        urls: images.map(urlOf).filter(function (url) { return url; }),
+        total: images.length,
+        forced: missing.length,
+        expanded: !!more
+    };
+}
+
+collect().then(done, function (error) { done({error: String(error)}); });
+"""
+
+
+def _scan_detail_image_urls(driver):
     """
-    상품 상세 이미지 가져오는 함수 (트랜잭션 적용)
+    스크롤 없이 상세 이미지 URL을 수집합니다. (스크립트 1회 실행)
+
+    Returns:
+        tuple: (상세 이미지 URL 리스트 또는 None(스크립트 오류), 더보기 버튼을 눌렀는지 여부)
     """
     try:
-        wait = WebDriverWait(driver, 10)
-
-        # "상품설명 더보기" 버튼 클릭
-        try:
-            more_button = wait.until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "button.GoodsDetailTabs_btn-more__zrJGJ")
-                )
-            )
+        result = driver.execute_async_script(COLLECT_DETAIL_IMAGES_SCRIPT, {
+            "image": DETAIL_IMAGE_SELECTOR,
+            "attributes": DETAIL_IMAGE_ATTRIBUTES,
+            "more_button": MORE_BUTTON_SELECTOR,
+            "expand_ms": DETAIL_IMAGE_EXPAND_MS,
+            "force_budget_ms": DETAIL_IMAGE_FORCE_BUDGET_MS,
+        })
+    except Exception as e:
+        result = {"error": str(e)}
+
+    if not result or result.get("error"):
+        print(f"상세 이미지 스크립트 수집 실패: {(result or {}).get('error')}")
+        return None, False
+
+    urls = result.get("urls") or []
+    if len(urls) < result.get("total", 0):
+        print(f"⚠ 상세 이미지 {result['total']}개 중 {result['total'] - len(urls)}개는 시간 안에 URL을 얻지 못함")
+    elif result.get("forced"):
+        print(f"URL 속성이 없던 상세 이미지 {result['forced']}개 강제 로딩")
+    return urls, bool(result.get("expanded"))
+
+
+def extract_detail_image_urls(driver, mode=None):
+    """
+    상품 상세 이미지 URL을 수집합니다. (파일 저장 없음)
+
+    Args:
+        driver: Selenium WebDriver
+        mode: 수집 방식 (DETAIL_IMAGE_MODE_SCAN / DETAIL_IMAGE_MODE_SCROLL, None이면 DEFAULT_DETAIL_IMAGE_MODE)
+              SCAN에서 이미지를 하나도 찾지 못하면 SCROLL로 다시 수집
+
+    Returns:
+        list: 상세 이미지 URL 리스트
+    """
+    expanded = False
+    if (mode or DEFAULT_DETAIL_IMAGE_MODE) == DETAIL_IMAGE_MODE_SCAN:
+        detail_urls, expanded = _scan_detail_image_urls(driver)
+        if detail_urls:
+            print(f"상세 이미지 {len(detail_urls)}개 수집 완료 (스크롤 없음)")
+            return detail_urls
+        print("스크롤 없이 상세 이미지를 찾지 못해 스크롤 방식으로 수집")
+
+    # "상품설명 더보기" 버튼 클릭 (스크립트에서 이미 눌렀으면 다시 누르지 않음)
+    # (버튼이 없는 상품은 매번 타임아웃까지 기다리므로 적응형 타임아웃으로 대기 시간을 줄임)
+    try:
+        if not expanded:
+            more_button = wait_for(driver, "detail_image.more_button",
+                                   element_clickable(By.CSS_SELECTOR, MORE_BUTTON_SELECTOR),
+                                   timeout=10)
             more_button.click()
-            time.sleep(1)
-        except:
-            print("더보기 버튼 없음")
+        # 펼쳐진 상세 설명 영역이 안정화될 때까지 대기
+        wait_settled(driver, "detail_image.expand", timeout=3, budget=1)
+    except:
+        print("더보기 버튼 없음")
+
+    # 페이지 조금씩 스크롤하며 화면 안의 지연 로딩 이미지가 로드될 때까지 대기
+    SCROLL_PAUSE = 0.5
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    current_pos = 0
 
-        # 페이지 조금씩 스크롤하며 이미지 로딩 대기
-        SCROLL_PAUSE = 0.5
+    while current_pos < last_height:
+        driver.execute_script(f"window.scrollTo(0, {current_pos});")
+        wait_for(driver, "detail_image.scroll", lazy_images_loaded(DETAIL_IMAGE_SELECTOR),
+                 timeout=SCROLL_PAUSE * 4, budget=SCROLL_PAUSE)
+        current_pos += 500  # 500px씩 스크롤
         last_height = driver.execute_script("return document.body.scrollHeight")
-        current_pos = 0
-
-        while current_pos < last_height:
-            driver.execute_script(f"window.scrollTo(0, {current_pos});")
-            time.sleep(SCROLL_PAUSE)
-            current_pos += 500  # 500px씩 스크롤
-            last_height = driver.execute_script("return document.body.scrollHeight")
-
-        # 이미지 URL 수집
-        imgs = driver.find_elements(By.CSS_SELECTOR, ".speedycat-container img")
-        detail_urls = []
-        for img in imgs:
-            for attr in ["data-src", "data-original", "src"]:
-                url = img.get_attribute(attr)
-                if url and not url.startswith("data:image"):
-                    detail_urls.append(url)
-                    break
-
-        print(f"상세 이미지 {len(detail_urls)}개 수집 완료")
+
+    # 이미지 URL 수집
+    imgs = driver.find_elements(By.CSS_SELECTOR, DETAIL_IMAGE_SELECTOR)
+    detail_urls = []
+    for img in imgs:
+        for attr in DETAIL_IMAGE_ATTRIBUTES:
+            url = img.get_attribute(attr)
+            if url and not url.startswith("data:image"):
+                detail_urls.append(url)
+                break
+
+    print(f"상세 이미지 {len(detail_urls)}개 수집 완료")
+    return detail_urls
+
+
+def format_detail_images_sql(product_id: int, detail_urls):
+    """
+    상품 하나의 상세 이미지 INSERT 문 블록을 만듭니다.
+
+    Args:
+        product_id: 상품 ID
+        detail_urls: 상세 이미지 URL 리스트
+
+    Returns:
+        str: "INSERT ... VALUES ...;" 문장과 빈 줄
+    """
+    sql_lines = []
+    for idx, url in enumerate(detail_urls):
+        sql_lines.append(f"({product_id}, {idx}, '{url}')")
+    sql_text = DETAIL_IMAGES_SQL_HEADER + "\n"
+    sql_text += ",\n".join(sql_lines) + ";\n\n"
+    return sql_text
+
+
+def save_detail_image_urls(product_id: int, detail_urls, transaction, filename: str):
+    """
+    상세 이미지 INSERT 문을 트랜잭션으로 파일 끝에 추가합니다.
+
+    Args:
+        product_id: 상품 ID
+        detail_urls: 상세 이미지 URL 리스트
+        transaction: FileTransaction 객체
+        filename: SQL 파일명
+    """
+    transaction.append_file(filename, format_detail_images_sql(product_id, detail_urls))
+    print(f"상세 이미지 INSERT문이 '{filename}'에 트랜잭션으로 저장되었습니다.")
+
+
+def get_detail_image_urls(driver, product_id: int, transaction, filename: str = None): # transaction 인자 추가
+    """
+    상품 상세 이미지 가져오는 함수 (트랜잭션 적용)
+    """
+    try:
+        detail_urls = extract_detail_image_urls(driver)
 
         # INSERT문 생성 및 트랜잭션으로 파일 추가
         if detail_urls and filename:
-            sql_lines = []
-            for idx, url in enumerate(detail_urls):
-                sql_lines.append(f"({product_id}, {idx}, '{url}')")
-            sql_text = "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES\n"
-            sql_text += ",\n".join(sql_lines) + ";\n\n"
-
-            # 트랜잭션으로 파일에 추가
-            transaction.append_file(filename, sql_text)
-            print(f"상세 이미지 INSERT문이 '{filename}'에 트랜잭션으로 저장되었습니다.")
+            save_detail_image_urls(product_id, detail_urls, transaction, filename)
 
         return detail_urls if detail_urls else None
 
     except Exception as e:
         print("상세 이미지 가져오기 실패:", e)
-        return None
\ No newline at end of file
+        return None
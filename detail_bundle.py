@@ -0,0 +1,144 @@
+"""
+상세 페이지 일괄 추출 모듈
+find_element / .text / get_attribute를 요소마다 호출하면 상품 하나에 WebDriver 왕복이 100번 가까이 생깁니다.
+이 모듈은 스크립트 하나(execute_async_script)를 주입해
+카테고리, 브랜드, 상품명, 가격, 메인 이미지, 옵션, 상품정보 제공고시를 JSON 객체 하나로 받아옵니다.
+
+- 옵션 드롭다운과 제공고시 아코디언 클릭, 렌더링 대기도 스크립트 안에서 처리
+- 선택자는 기존 추출 모듈(productInfo, option, productDetailInfoProvided)의 상수를 그대로 사용
+- 반환 형식은 기존 추출 함수와 같음 (crawl.extract_product_record에서 바로 사용)
+"""
+
+from productInfo import CATEGORY_XPATH, BRAND_LINK_XPATH, BRAND_BUTTON_XPATH, PRODUCT_NAME_XPATH
+from mainImgCol import clean_image_url as clean_main_image_url, CAROUSEL_SLIDE_SELECTOR, CAROUSEL_SLIDES_JS
+from option import build_option_list, OPTION_ITEMS_JS, OPTION_LIST_CONFIG
+from productDetailInfoProvided import DETAIL_INFO_BUTTON_XPATH, DETAIL_INFO_ROW_SELECTOR
+
+# 스크립트 안에서 제공고시 테이블이 렌더링되기를 기다리는 최대 시간 (밀리초)
+# (옵션 리스트 대기 시간은 option.OPTION_LIST_TIMEOUT_MS)
+DETAIL_INFO_TIMEOUT_MS = 5000
+
+# 스크립트에 전달할 선택자
+BUNDLE_SELECTORS = {
+    "category": CATEGORY_XPATH,
+    "brand_link": BRAND_LINK_XPATH,
+    "brand_button": BRAND_BUTTON_XPATH,
+    "product_name": PRODUCT_NAME_XPATH,
+    "carousel_slide": CAROUSEL_SLIDE_SELECTOR,
+    "option": OPTION_LIST_CONFIG,
+    "detail_info_button": DETAIL_INFO_BUTTON_XPATH,
+    "detail_info_rows": DETAIL_INFO_ROW_SELECTOR,
+    "detail_info_timeout_ms": DETAIL_INFO_TIMEOUT_MS,
+}
+
+# 일괄 추출 스크립트 (arguments[0]: BUNDLE_SELECTORS, 마지막 인자: 완료 콜백)
+# 메인 이미지 슬라이드는 mainImgCol의 readSlideSources, 옵션은 option의 readOptions 스크립트 함수로 읽음
+DETAIL_BUNDLE_SCRIPT = CAROUSEL_SLIDES_JS + OPTION_ITEMS_JS + """
+var selectors = arguments[0];
+var done = arguments[arguments.length - 1];
+
+function byXPath(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+
+async function collect() {
+    var result = {
+        category: textOf(byXPath(selectors.category)),
+        brand: textOf(byXPath(selectors.brand_link)) || textOf(byXPath(selectors.brand_button)),
+        product_name: textOf(byXPath(selectors.product_name)),
+        main_image_urls: [],
+        detail_info: {}
+    };
+
+    // 메인 이미지: loop 모드의 복제 슬라이드는 인덱스로 중복 제거 후 인덱스 순으로 정렬
+    result.main_image_urls = readSlideSources(selectors.carousel_slide);
+
+    // 옵션: options, single_name, single_price, single_thumbnail
+    var options = await readOptions(selectors.option);
+    ['options', 'single_name', 'single_price', 'single_thumbnail'].forEach(function (key) {
+        result[key] = options[key];
+    });
+
+    // 상품정보 제공고시: 아코디언을 펼쳐 테이블 행이 렌더링되면 th/td를 읽음
+    var infoButton = byXPath(selectors.detail_info_button);
+    if (infoButton) {
+        infoButton.scrollIntoView(true);
+        infoButton.click();
+        var rows = await waitFor(function () { return queryAll(selectors.detail_info_rows); },
+                                 selectors.detail_info_timeout_ms);
+        Array.prototype.forEach.call(rows || [], function (row) {
+            var key = textOf(row.querySelector('th'));
+            var value = row.querySelector('td');
+            if (key && value) { result.detail_info[key] = textOf(value) || ''; }
+        });
+    }
+
+    return result;
+}
+
+collect().then(done, function (error) { done({error: String(error)}); });
+"""
+
+
+def _absolute_url(url):
+    """//로 시작하는 URL을 https: URL로 바꿉니다."""
+    if url and url.startswith('//'):
+        return 'https:' + url
+    return url
+
+
+def build_bundle_record(bundle, num_images=3):
+    """
+    일괄 추출 결과(스크립트 또는 html_extract가 만든 원시 딕셔너리)를 상품 레코드 필드로 변환합니다.
+
+    Args:
+        bundle: DETAIL_BUNDLE_SCRIPT 실행 결과 형식의 딕셔너리
+        num_images: 수집할 메인 이미지 수
+
+    Returns:
+        dict: {"category", "brand", "product_name", "main_image_urls", "detail_info", "options"}
+    """
+    main_image_urls = []
+    for url in bundle.get("main_image_urls") or []:
+        url = _absolute_url(url)
+        if url and url.startswith('http'):
+            main_image_urls.append(clean_main_image_url(url))
+        if len(main_image_urls) >= num_images:
+            break
+
+    return {
+        "category": bundle.get("category"),
+        "brand": bundle.get("brand"),
+        "product_name": bundle.get("product_name"),
+        "main_image_urls": main_image_urls,
+        "detail_info": bundle.get("detail_info") or {},
+        "options": build_option_list(bundle),
+    }
+
+
+def extract_detail_bundle(driver, num_images=3):
+    """
+    상세 페이지 데이터를 스크립트 1회 실행으로 추출합니다.
+    (상세 이미지는 스크롤이 필요하므로 detailImg 모듈에서 따로 수집)
+
+    Args:
+        driver: Selenium WebDriver
+        num_images: 수집할 메인 이미지 수
+
+    Returns:
+        dict: {"category", "brand", "product_name", "main_image_urls", "detail_info", "options"}
+
+    Raises:
+        RuntimeError: 스크립트 실행 결과가 없거나 스크립트 안에서 오류가 난 경우
+    """
+    bundle = driver.execute_async_script(DETAIL_BUNDLE_SCRIPT, BUNDLE_SELECTORS)
+
+    if not bundle:
+        raise RuntimeError("일괄 추출 스크립트 결과가 없습니다.")
+    if bundle.get("error"):
+        raise RuntimeError(f"일괄 추출 스크립트 오류: {bundle['error']}")
+
+    record = build_bundle_record(bundle, num_images)
+    print(f"✓ 일괄 추출 완료: 메인 이미지 {len(record['main_image_urls'])}개, "
+          f"옵션 {len(record['options'])}개, 제공고시 {len(record['detail_info'])}개 항목")
+    return record
@@ -0,0 +1,304 @@
+"""
+드라이버 풀 모듈
+브라우저 시작(수 초)과 Cloudflare 확인 통과(최대 수십 초) 비용을 실행마다 다시 내지 않도록
+준비가 끝난 브라우저 세션을 유지하고 재사용합니다.
+
+- 준비(warm-up): 드라이버를 만들 때 한 번만 시작 페이지를 열어 Cloudflare 확인 통과까지 대기
+- 프로필 유지: 슬롯마다 Chrome 사용자 데이터 디렉토리를 고정해 확인 통과 쿠키가 다음 실행까지 남음
+- 상태 확인: 꺼낼 때마다 스크립트 1회 실행으로 응답 여부 확인, 응답이 없으면 새로 만듦
+- 경량 프로필: 드라이버를 만들 때 이미지/폰트/트래커 차단 적용 (lean_profile)
+- 재활용: N페이지를 처리했거나 브라우저 메모리가 기준 이상 늘어나면 종료 후 새로 만듦
+  (메모리 확인은 psutil이 있을 때만)
+
+사용 예:
+    pool = DriverPool()
+    with pool.session() as driver:
+        crawl_product_url(driver, url, 1)
+    pool.close()
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import undetected_chromedriver as uc
+except ImportError:
+    uc = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from wait_engine import wait_for
+from lean_profile import LEAN_PROFILE
+
+# 슬롯별 Chrome 프로필 디렉토리의 상위 경로
+DRIVER_PROFILE_DIR = "driver_profiles"
+
+# 준비 단계에서 여는 페이지 (Cloudflare 확인 통과용)
+WARMUP_URL = "https://www.oliveyoung.co.kr/store/main/main.do"
+
+# Cloudflare 확인 통과 대기 최대 시간 (초)
+CLEARANCE_TIMEOUT = 30
+
+# 이 페이지 수를 처리하면 드라이버를 새로 만듦
+RECYCLE_AFTER_PAGES = 200
+
+# 브라우저 메모리가 시작 시점보다 이만큼(MB) 늘어나면 드라이버를 새로 만듦
+RECYCLE_MEMORY_GROWTH_MB = 1024
+
+# 페이지 로드 타임아웃 (초)
+PAGE_LOAD_TIMEOUT = 60
+
+# Cloudflare 확인 페이지가 아니고 문서 로드가 끝났는지 확인하는 스크립트
+_CLEARANCE_SCRIPT = """
+return document.readyState === 'complete'
+    && document.title.indexOf('Just a moment') === -1
+    && !document.querySelector('#challenge-running, #challenge-form, #cf-challenge-running');
+"""
+
+
+def clearance_passed():
+    """Cloudflare 확인 페이지를 통과했는지 확인하는 대기 조건 (wait_engine 조건과 같은 형식)"""
+    def predicate(driver):
+        return driver.execute_script(_CLEARANCE_SCRIPT)
+    return predicate
+
+
+def create_pooled_driver(profile_dir=None):
+    """
+    드라이버 생성 함수 (singleProductCrawler3.create_driver와 같은 옵션, 고정 대기 없음)
+
+    Args:
+        profile_dir: Chrome 사용자 데이터 디렉토리 (None이면 임시 프로필)
+    """
+    if uc is None:
+        raise ImportError("undetected-chromedriver 패키지가 필요합니다: pip install undetected-chromedriver")
+
+    options = uc.ChromeOptions()
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-software-rasterizer")
+    options.add_argument("--log-level=3")
+    options.add_argument(
+        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
+
+    driver = uc.Chrome(options=options, user_data_dir=profile_dir, use_subprocess=True)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+def browser_memory_mb(driver):
+    """
+    브라우저 프로세스(하위 렌더러 포함)의 메모리 사용량(MB)을 반환합니다.
+    psutil이 없거나 브라우저 PID를 알 수 없으면 None
+    """
+    pid = getattr(driver, "browser_pid", None)
+    if psutil is None or not pid:
+        return None
+
+    try:
+        process = psutil.Process(pid)
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+class PooledDriver:
+    """풀에서 관리하는 드라이버 1개와 사용 기록"""
+
+    def __init__(self, driver, slot):
+        self.driver = driver
+        self.slot = slot
+        self.pages = 0
+        self.created_at = time.monotonic()
+        self.baseline_mb = browser_memory_mb(driver)
+
+
+class DriverPool:
+    """
+    준비된 브라우저 세션 풀
+    슬롯(size개)마다 드라이버를 필요할 때 만들고, 상태 확인과 재활용을 거쳐 계속 재사용합니다.
+    """
+
+    def __init__(self, size=1, factory=create_pooled_driver, name="driver", profile_root=DRIVER_PROFILE_DIR,
+                 warmup_url=WARMUP_URL, recycle_pages=RECYCLE_AFTER_PAGES,
+                 recycle_memory_mb=RECYCLE_MEMORY_GROWTH_MB, lean=True):
+        """
+        Args:
+            size: 드라이버 최대 수
+            factory: 드라이버 생성 함수 (profile_dir 인자를 받음)
+            name: 프로필 디렉토리 이름 접두사 (동시에 실행되는 풀끼리 겹치지 않게 지정)
+            profile_root: 프로필 상위 디렉토리 (None이면 프로필을 유지하지 않음)
+            warmup_url: 준비 단계에서 여는 페이지 (None이면 준비 생략)
+            recycle_pages: 이 페이지 수를 처리하면 재활용 (0이면 사용 안 함)
+            recycle_memory_mb: 메모리가 이만큼 늘어나면 재활용 (0이면 사용 안 함)
+            lean: True면 경량 프로필(리소스 차단) 적용
+        """
+        self.size = max(1, size)
+        self.factory = factory
+        self.name = name
+        self.profile_root = profile_root
+        self.warmup_url = warmup_url
+        self.recycle_pages = recycle_pages
+        self.recycle_memory_mb = recycle_memory_mb
+        self.lean = lean
+
+        self.idle = queue.LifoQueue()  # 최근에 쓴 드라이버부터 재사용
+        self.free_slots = list(range(self.size - 1, -1, -1))
+        self.lock = threading.Lock()
+
+        # 통계
+        self.created = 0
+        self.recycled = 0
+        self.unhealthy = 0
+        self.acquired = 0
+
+    def _profile_dir(self, slot):
+        if not self.profile_root:
+            return None
+        path = os.path.join(self.profile_root, f"{self.name}_{slot}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _create(self, slot):
+        """슬롯에 드라이버를 만들고 준비 단계(Cloudflare 확인 통과)를 거칩니다."""
+        started = time.monotonic()
+        driver = None
+        try:
+            driver = self.factory(self._profile_dir(slot))
+            self.created += 1
+
+            if self.lean:
+                LEAN_PROFILE.apply(driver)
+
+            if self.warmup_url:
+                driver.get(self.warmup_url)
+                if not wait_for(driver, "driver.clearance", clearance_passed(),
+                                timeout=CLEARANCE_TIMEOUT, budget=10, adaptive=False):
+                    print(f"[DriverPool] ⚠ 슬롯 {slot} Cloudflare 확인 통과 대기 타임아웃, 계속 진행")
+        except Exception:
+            # 실패한 슬롯은 다음 acquire에서 다시 만들 수 있게 돌려놓음
+            if driver is not None:
+                self._quit(driver)
+            with self.lock:
+                self.free_slots.append(slot)
+            raise
+
+        print(f"[DriverPool] ✓ 슬롯 {slot} 드라이버 준비 완료 ({time.monotonic() - started:.1f}초)")
+        return PooledDriver(driver, slot)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _is_healthy(self, pooled):
+        """스크립트 1회 실행으로 브라우저가 응답하는지 확인합니다."""
+        try:
+            return bool(pooled.driver.execute_script("return document.readyState"))
+        except Exception:
+            return False
+
+    def _recycle_reason(self, pooled):
+        """재활용해야 하면 이유 문자열, 아니면 None"""
+        if self.recycle_pages > 0 and pooled.pages >= self.recycle_pages:
+            return f"{pooled.pages}페이지 처리"
+
+        if self.recycle_memory_mb > 0 and pooled.baseline_mb is not None:
+            current_mb = browser_memory_mb(pooled.driver)
+            if current_mb is not None and current_mb - pooled.baseline_mb >= self.recycle_memory_mb:
+                return f"메모리 {pooled.baseline_mb:.0f}MB → {current_mb:.0f}MB"
+
+        return None
+
+    def acquire(self, timeout=None):
+        """
+        사용할 드라이버를 꺼냅니다. (상태 확인 후 필요하면 새로 만듦)
+
+        Args:
+            timeout: 모든 슬롯이 사용 중일 때 기다릴 최대 시간 (None이면 계속 대기)
+
+        Returns:
+            PooledDriver: release()로 반드시 돌려줘야 함
+        """
+        pooled = None
+        slot = None
+        with self.lock:
+            try:
+                pooled = self.idle.get_nowait()
+            except queue.Empty:
+                slot = self.free_slots.pop() if self.free_slots else None
+        if pooled is None:
+            pooled = self._create(slot) if slot is not None else self.idle.get(timeout=timeout)
+
+        # 재활용 / 상태 확인 (실패하면 같은 슬롯에 새로 만듦)
+        reason = self._recycle_reason(pooled)
+        if reason is None and not self._is_healthy(pooled):
+            self.unhealthy += 1
+            reason = "응답 없음"
+        if reason:
+            print(f"[DriverPool] 슬롯 {pooled.slot} 드라이버 재활용 ({reason})")
+            self.recycled += 1
+            self._quit(pooled.driver)
+            pooled = self._create(pooled.slot)
+
+        self.acquired += 1
+        return pooled
+
+    def release(self, pooled, pages=1):
+        """
+        드라이버를 풀에 돌려줍니다.
+
+        Args:
+            pooled: acquire()가 반환한 PooledDriver
+            pages: 이번에 처리한 페이지 수
+        """
+        pooled.pages += pages
+        self.idle.put(pooled)
+
+    @contextmanager
+    def session(self, pages=1):
+        """with 문으로 드라이버를 빌려 쓰고 자동으로 돌려줍니다."""
+        pooled = self.acquire()
+        try:
+            yield pooled.driver
+        finally:
+            self.release(pooled, pages)
+
+    def close(self):
+        """풀의 모든 드라이버를 종료합니다. (사용 중인 드라이버는 release 후에 종료해야 함)"""
+        closed = 0
+        while True:
+            try:
+                pooled = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(pooled.driver)
+            self.free_slots.append(pooled.slot)
+            closed += 1
+
+        print(f"[DriverPool] 드라이버 {closed}개 종료 (생성 {self.created}회, 재활용 {self.recycled}회, "
+              f"응답 없음 {self.unhealthy}회, 사용 {self.acquired}회)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,48 @@
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    """execute_script / quit만 흉내 내는 드라이버"""
+
+    def __init__(self, profile_dir):
+        self.profile_dir = profile_dir
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("브라우저 응답 없음")
+        return "complete"
+
+    def quit(self):
+        self.quit_called = True
+
+
+created = []
+
+def factory(profile_dir):
+    created.append(FakeDriver(profile_dir))
+    return created[-1]
+
+
+pool = DriverPool(factory=factory, profile_root=None, warmup_url=None, recycle_pages=3)
+
+# 같은 드라이버를 계속 재사용
+for _ in range(3):
+    with pool.session() as driver:
+        assert driver is created[0]
+assert len(created) == 1
+
+# N페이지를 처리하면 종료 후 새로 만듦
+with pool.session() as driver:
+    assert driver is created[1] and created[0].quit_called
+
+# 응답이 없는 드라이버는 꺼낼 때 새로 만듦
+created[1].alive = False
+with pool.session() as driver:
+    assert driver is created[2]
+assert (pool.created, pool.recycled, pool.unhealthy) == (3, 2, 1)
+
+pool.close()
+assert created[2].quit_called
+print("드라이버 풀 테스트 통과")
@@ -4,21 +4,55 @@ import json
 import traceback
 from datetime import datetime
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 트랜잭션 모드
+MODE_BACKUP = "backup"  # 파일 전체를 백업 복사 후 롤백 시 복원
+MODE_WAL = "wal"  # 추가(append)된 바이트 오프셋만 저널에 기록하고 롤백 시 잘라내기
+
+# 저널 파일 확장자
+WAL_SUFFIX = ".wal"
+
+# 저널 파일 이름에서 프로세스 ID 앞에 붙는 구분자 ("{트랜잭션_ID}.pid{프로세스_ID}.wal")
+WAL_PID_SEPARATOR = ".pid"
+
+# 이번 프로세스에서 저널 복구를 마친 백업 디렉토리
+_recovered_dirs = set()
+
+# 이번 프로세스에서 진행 중인 트랜잭션의 저널 (복구 대상에서 제외)
+_active_journals = set()
+
 
 class FileTransaction:
     """
     파일 기반 트랜잭션 관리 클래스
     여러 파일 작업을 하나의 트랜잭션으로 묶어서 원자성을 보장합니다.
+
+    mode="wal"이면 추가(append) 작업은 파일을 복사하지 않고
+    원래 파일 길이(오프셋)와 추가한 바이트 수만 저널에 기록합니다.
+    롤백은 기록된 오프셋으로 파일을 잘라내고, 커밋은 fsync 후 저널을 삭제합니다.
     """
 
-    def __init__(self, backup_dir=".transaction_backup"):
+    def __init__(self, backup_dir=".transaction_backup", mode=MODE_BACKUP):
         """
         Args:
-            backup_dir: 백업 파일을 저장할 디렉토리
+            backup_dir: 백업 파일(및 저널)을 저장할 디렉토리
+            mode: 트랜잭션 모드 ("backup" 또는 "wal")
         """
+        if mode not in (MODE_BACKUP, MODE_WAL):
+            raise ValueError(f"지원하지 않는 트랜잭션 모드입니다: {mode}")
+
         self.backup_dir = backup_dir
+        self.mode = mode
         self.backup_files = {}  # {원본_파일_경로: 백업_파일_경로}
         self.new_files = []  # 트랜잭션 중 새로 생성된 파일 목록
+        self.append_offsets = {}  # {파일_경로: 트랜잭션 시작 전 파일 길이 (없던 파일이면 None)}
+        self.journal_path = None
+        self.commit_hooks = []  # 커밋 후 호출할 함수 목록
+        self.rollback_hooks = []  # 롤백 후 호출할 함수 목록
         self.is_active = False
         self.transaction_id = None
 
@@ -30,13 +64,62 @@ class FileTransaction:
         self.transaction_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         self.backup_files = {}
         self.new_files = []
+        self.append_offsets = {}
+        self.journal_path = None
+        self.commit_hooks = []
+        self.rollback_hooks = []
         self.is_active = True
 
         # 백업 디렉토리 생성
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir)
 
-        print(f"[Transaction] 트랜잭션 시작 (ID: {self.transaction_id})")
+        if self.mode == MODE_WAL:
+            # 이전 실행에서 남은 저널이 있으면 먼저 롤백
+            recover_journals_once(self.backup_dir)
+
+            # 같은 디렉토리를 쓰는 다른 프로세스가 진행 중인 저널을 복구하지 않도록 프로세스 ID를 이름에 기록
+            self.journal_path = os.path.join(
+                self.backup_dir, f"{self.transaction_id}{WAL_PID_SEPARATOR}{os.getpid()}{WAL_SUFFIX}")
+            _active_journals.add(os.path.abspath(self.journal_path))
+
+        print(f"[Transaction] 트랜잭션 시작 (ID: {self.transaction_id}, 모드: {self.mode})")
+
+    def add_commit_hook(self, hook):
+        """
+        커밋이 끝난 뒤 호출할 함수를 등록합니다.
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        self.commit_hooks.append(hook)
+
+    def add_rollback_hook(self, hook):
+        """
+        롤백이 끝난 뒤 호출할 함수를 등록합니다.
+        (메모리에 올려둔 상태를 트랜잭션과 함께 되돌릴 때 사용)
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        self.rollback_hooks.append(hook)
+
+    def _write_journal(self, entry):
+        """
+        저널 파일에 한 줄을 기록합니다. (WAL 모드)
+        데이터 파일을 건드리기 전에 호출되어야 합니다.
+        데이터보다 저널이 먼저 디스크에 남도록 fsync합니다. (전원이 꺼져도 추가된 데이터만 남지 않음)
+
+        Args:
+            entry: 저널에 기록할 dict
+        """
+        created = not os.path.exists(self.journal_path)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if created:
+            _fsync_dir(self.backup_dir)
 
     def backup_file(self, file_path):
         """
@@ -58,11 +141,18 @@ class FileTransaction:
                 self.backup_dir,
                 f"{self.transaction_id}_{os.path.basename(file_path)}.backup"
             )
+            if self.mode == MODE_WAL:
+                self._write_journal({"op": "backup", "path": file_path, "backup": backup_path})
             shutil.copy2(file_path, backup_path)
+            if self.mode == MODE_WAL:
+                # 원본을 덮어쓰기 전에 백업 사본을 디스크에 반영
+                _fsync_file(backup_path)
             self.backup_files[file_path] = backup_path
             print(f"[Transaction] 파일 백업: {file_path} -> {backup_path}")
         else:
             # 파일이 존재하지 않으면 새로 생성될 파일로 간주
+            if self.mode == MODE_WAL:
+                self._write_journal({"op": "new", "path": file_path})
             self.new_files.append(file_path)
             print(f"[Transaction] 새 파일로 등록: {file_path}")
 
@@ -79,6 +169,12 @@ class FileTransaction:
         if not self.is_active:
             raise Exception("트랜잭션이 시작되지 않았습니다.")
 
+        # WAL 모드의 추가 쓰기는 백업 복사 없이 오프셋만 기록
+        if self.mode == MODE_WAL and 'a' in mode:
+            data = content if 'b' in mode else content.encode(encoding)
+            self._append_with_journal(file_path, data)
+            return
+
         # 파일 백업
         self.backup_file(file_path)
 
@@ -125,11 +221,76 @@ class FileTransaction:
         """
         self.write_file(file_path, content, mode='a', encoding=encoding)
 
+    def read_file(self, file_path, encoding='utf-8'):
+        """
+        트랜잭션에서 보이는 파일 내용을 반환합니다.
+        (GroupCommitTransaction과 같은 방식으로 호출할 수 있도록 제공)
+
+        Args:
+            file_path: 파일 경로
+            encoding: 인코딩
+
+        Returns:
+            str or None: 파일 내용 (파일이 없으면 None)
+        """
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'r', encoding=encoding) as f:
+            return f.read()
+
+    def _append_with_journal(self, file_path, data):
+        """
+        WAL 모드에서 파일 끝에 바이트를 추가합니다.
+        처음 건드리는 파일은 원래 길이를 저널에 먼저 기록합니다.
+
+        Args:
+            file_path: 파일 경로
+            data: 추가할 바이트
+        """
+        if file_path in self.backup_files or file_path in self.new_files:
+            # 이미 전체 백업(또는 새 파일)으로 보호되는 파일
+            offset = None
+        elif file_path not in self.append_offsets:
+            offset = os.path.getsize(file_path) if os.path.exists(file_path) else None
+            self.append_offsets[file_path] = offset
+        else:
+            offset = self.append_offsets[file_path]
+
+        self._write_journal({"op": "append", "path": file_path, "offset": offset, "length": len(data)})
+
+        with open(file_path, 'ab') as f:
+            f.write(data)
+
+        print(f"[Transaction] 파일 추가: {file_path} (+{len(data)} bytes)")
+
+    def _sync_files(self):
+        """
+        WAL 모드 커밋 시 이번 트랜잭션에서 변경한 파일을 디스크에 반영합니다.
+        os.sync가 있으면(POSIX) 변경한 파일 수와 관계없이 한 번만 호출하고,
+        없으면(Windows) 변경한 파일마다 fsync합니다.
+        """
+        touched = set(self.append_offsets) | set(self.backup_files) | set(self.new_files)
+        if not touched:
+            return
+        if hasattr(os, "sync"):
+            os.sync()
+            return
+        for file_path in touched:
+            if os.path.exists(file_path):
+                _fsync_file(file_path)
+
     def commit(self):
         """트랜잭션 커밋 (백업 파일 삭제)"""
         if not self.is_active:
             raise Exception("트랜잭션이 시작되지 않았습니다.")
 
+        if self.mode == MODE_WAL:
+            # 변경된 파일을 디스크에 반영한 뒤 저널 삭제 (저널 삭제 시점이 커밋 시점)
+            self._sync_files()
+            if self.journal_path and os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            _active_journals.discard(os.path.abspath(self.journal_path))
+
         # 백업 파일 삭제
         for backup_path in self.backup_files.values():
             if os.path.exists(backup_path):
@@ -138,9 +299,20 @@ class FileTransaction:
 
         print(f"[Transaction] 트랜잭션 커밋 완료 (ID: {self.transaction_id})")
 
-        # 상태 초기화
+        # 상태 초기화 후 커밋 훅 실행
+        hooks = self.commit_hooks
+        self._reset_state()
+        for hook in hooks:
+            hook()
+
+    def _reset_state(self):
+        """트랜잭션 상태 초기화"""
         self.backup_files = {}
         self.new_files = []
+        self.append_offsets = {}
+        self.journal_path = None
+        self.commit_hooks = []
+        self.rollback_hooks = []
         self.is_active = False
         self.transaction_id = None
 
@@ -159,19 +331,30 @@ class FileTransaction:
                 print(f"[Transaction] 파일 복원: {backup_path} -> {original_path}")
                 os.remove(backup_path)
 
+        # 추가(append)된 파일은 원래 길이로 잘라내기 (WAL 모드)
+        # 추가 후에 백업된 파일도 있으므로 백업 복원 다음에 수행
+        for file_path, offset in self.append_offsets.items():
+            _truncate_or_remove(file_path, offset)
+
         # 새로 생성된 파일 삭제
         for new_file in self.new_files:
             if os.path.exists(new_file):
                 os.remove(new_file)
                 print(f"[Transaction] 새 파일 삭제: {new_file}")
 
+        # 저널 삭제 (WAL 모드)
+        if self.journal_path and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        if self.journal_path:
+            _active_journals.discard(os.path.abspath(self.journal_path))
+
         print(f"[Transaction] 트랜잭션 롤백 완료 (ID: {self.transaction_id})")
 
-        # 상태 초기화
-        self.backup_files = {}
-        self.new_files = []
-        self.is_active = False
-        self.transaction_id = None
+        # 상태 초기화 후 롤백 훅 실행 (등록 역순)
+        hooks = self.rollback_hooks
+        self._reset_state()
+        for hook in reversed(hooks):
+            hook()
 
     def __enter__(self):
         """Context manager 진입"""
@@ -191,6 +374,165 @@ class FileTransaction:
             return True
 
 
+def _fsync_file(file_path):
+    """파일 내용을 디스크에 반영합니다."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(dir_path):
+    """디렉토리 항목(새로 만든 파일)을 디스크에 반영합니다. (POSIX만, Windows는 디렉토리를 열 수 없음)"""
+    if os.name == "nt":
+        return
+    try:
+        _fsync_file(dir_path)
+    except OSError:
+        pass
+
+
+def _process_alive(pid):
+    """
+    프로세스가 실행 중이면 True
+
+    Args:
+        pid: 프로세스 ID
+    """
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+
+    if os.name == "nt":
+        # Windows의 os.kill은 프로세스를 종료시키므로 핸들을 열어 확인
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _journal_owner_alive(journal_path):
+    """
+    저널을 만든 트랜잭션이 아직 진행 중일 수 있으면 True
+
+    - 이번 프로세스의 저널: 진행 중인 트랜잭션의 저널일 때만
+    - 다른 프로세스의 저널: 해당 프로세스가 실행 중일 때
+    - 프로세스 ID가 없는 이전 형식의 저널: 항상 복구 대상
+    """
+    name = os.path.basename(journal_path)[:-len(WAL_SUFFIX)]
+    _, separator, pid = name.rpartition(WAL_PID_SEPARATOR)
+    if not separator or not pid.isdigit():
+        return False
+
+    pid = int(pid)
+    if pid == os.getpid():
+        return os.path.abspath(journal_path) in _active_journals
+    return _process_alive(pid)
+
+
+def _truncate_or_remove(file_path, offset):
+    """
+    파일을 트랜잭션 시작 전 상태로 되돌립니다.
+
+    Args:
+        file_path: 파일 경로
+        offset: 원래 파일 길이 (None이면 트랜잭션 중 새로 만든 파일)
+    """
+    if not os.path.exists(file_path):
+        return
+
+    if offset is None:
+        os.remove(file_path)
+        print(f"[Transaction] 새 파일 삭제: {file_path}")
+    else:
+        with open(file_path, 'r+b') as f:
+            f.truncate(offset)
+        print(f"[Transaction] 파일 잘라내기: {file_path} -> {offset} bytes")
+
+
+def recover_journals(backup_dir=".transaction_backup"):
+    """
+    비정상 종료로 남은 WAL 저널을 찾아 해당 트랜잭션을 롤백합니다.
+    같은 디렉토리를 쓰는 다른 프로세스가 실행 중이면 그 프로세스의 저널은 건드리지 않습니다.
+
+    Args:
+        backup_dir: 저널이 저장된 디렉토리
+
+    Returns:
+        int: 복구(롤백)한 저널 수
+    """
+    if not os.path.exists(backup_dir):
+        return 0
+
+    recovered = 0
+    for name in sorted(os.listdir(backup_dir)):
+        if not name.endswith(WAL_SUFFIX):
+            continue
+
+        journal_path = os.path.join(backup_dir, name)
+        if _journal_owner_alive(journal_path):
+            continue
+        print(f"[Transaction] 미완료 저널 발견, 롤백합니다: {journal_path}")
+
+        first_ops = {}  # {파일_경로: 해당 파일의 첫 번째 저널 항목}
+        backups = {}  # {파일_경로: 백업_파일_경로}
+
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 끊긴 마지막 줄
+                    continue
+
+                first_ops.setdefault(entry["path"], entry)
+                if entry["op"] == "backup":
+                    backups[entry["path"]] = entry["backup"]
+
+        # 1. 백업 복원
+        for original_path, backup_path in backups.items():
+            if os.path.exists(backup_path):
+                shutil.copy2(backup_path, original_path)
+                os.remove(backup_path)
+                print(f"[Transaction] 파일 복원: {backup_path} -> {original_path}")
+
+        # 2. 추가된 파일 잘라내기 / 새 파일 삭제
+        for file_path, entry in first_ops.items():
+            if entry["op"] == "append":
+                _truncate_or_remove(file_path, entry["offset"])
+            elif entry["op"] == "new":
+                _truncate_or_remove(file_path, None)
+
+        os.remove(journal_path)
+        recovered += 1
+
+    return recovered
+
+
+def recover_journals_once(backup_dir=".transaction_backup"):
+    """
+    이번 프로세스에서 아직 복구하지 않은 디렉토리에 한해 recover_journals를 실행합니다.
+
+    Args:
+        backup_dir: 저널이 저장된 디렉토리
+    """
+    if backup_dir in _recovered_dirs:
+        return
+    recover_journals(backup_dir)
+    _recovered_dirs.add(backup_dir)
+
+
 # 사용 예제 함수
 def example_usage():
     """FileTransaction 사용 예제"""
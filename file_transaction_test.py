@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import tempfile
+from file_transaction import FileTransaction, MODE_WAL
+
+# 임시 디렉토리에서 WAL 모드 롤백 확인 (작업 디렉토리는 바꾸지 않고 절대 경로 사용)
+work_dir = tempfile.mkdtemp()
+backup_dir = os.path.join(work_dir, ".transaction_backup")
+segment_path = os.path.join(work_dir, "segment.txt")
+new_segment_path = os.path.join(work_dir, "new_segment.txt")
+
+with open(segment_path, "w", encoding="utf-8") as f:
+    f.write("(1, 'a'),\n")
+
+try:
+    with FileTransaction(backup_dir=backup_dir, mode=MODE_WAL) as transaction:
+        transaction.append_file(segment_path, "(2, 'b'),\n")
+        transaction.append_file(new_segment_path, "(3, 'c'),\n")
+        raise ValueError("의도적인 예외 발생!")
+except ValueError as e:
+    print(f"예외 발생: {e}")
+
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(1, 'a'),\n"
+assert not os.path.exists(new_segment_path)
+
+# 커밋 후에는 저널이 남지 않아야 함
+with FileTransaction(backup_dir=backup_dir, mode=MODE_WAL) as transaction:
+    transaction.append_file(segment_path, "(2, 'b'),\n")
+
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(1, 'a'),\n(2, 'b'),\n"
+assert os.listdir(backup_dir) == []
+
+# 다른 프로세스가 진행 중인 트랜잭션의 저널은 복구(롤백)하지 않음
+HOLD_SCRIPT = """
+import sys
+from file_transaction import FileTransaction, MODE_WAL
+transaction = FileTransaction(backup_dir=sys.argv[1], mode=MODE_WAL)
+transaction.begin()
+transaction.append_file(sys.argv[2], "(3, 'c'),\\n")
+print("appended", flush=True)
+sys.stdin.readline()
+transaction.commit()
+"""
+shared_dir = os.path.join(work_dir, "shared_backup")
+holder = subprocess.Popen([sys.executable, "-c", HOLD_SCRIPT, shared_dir, segment_path],
+                          cwd=os.path.dirname(os.path.abspath(__file__)),
+                          stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+while holder.stdout.readline().strip() != "appended":
+    pass
+
+with FileTransaction(backup_dir=shared_dir, mode=MODE_WAL) as transaction:
+    transaction.append_file(new_segment_path, "(4, 'd'),\n")
+assert len(os.listdir(shared_dir)) == 1
+
+holder.stdin.write("\n")
+holder.stdin.flush()
+assert holder.wait(timeout=30) == 0
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(1, 'a'),\n(2, 'b'),\n(3, 'c'),\n"
+assert os.listdir(shared_dir) == []
+print("WAL 모드 테스트 통과")
@@ -0,0 +1,266 @@
+"""
+상품 트랜잭션 그룹 커밋 모듈
+성공한 상품 N개(또는 T초 동안의 상품)의 파일 쓰기를 메모리에 모았다가
+하나의 WAL 트랜잭션으로 한 번에 디스크에 반영합니다.
+검증에 실패한 상품은 해당 상품의 쓰기만 버리고 배치는 유지합니다.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from file_transaction import FileTransaction, MODE_WAL, recover_journals_once
+
+# 기본 그룹 커밋 설정
+DEFAULT_BATCH_SIZE = 20  # 상품 N개마다 커밋
+DEFAULT_FLUSH_INTERVAL = 120.0  # 또는 T초마다 커밋
+
+
+class GroupCommitTransaction:
+    """
+    FileTransaction과 같은 쓰기 API(write_file, write_json, append_file)를 제공하지만
+    실제 디스크 쓰기는 flush() 시점까지 미룹니다.
+
+    사용 예:
+        with GroupCommitTransaction(batch_size=20) as group:
+            for url in urls:
+                try:
+                    with group.product() as transaction:
+                        crawl_product_on_detail_page(driver, transaction, counter)
+                except ValueError:
+                    pass  # 이 상품만 버려짐
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 backup_dir=".transaction_backup"):
+        """
+        Args:
+            batch_size: 한 번에 커밋할 상품 수
+            flush_interval: 첫 상품이 버퍼에 들어온 뒤 커밋까지의 최대 시간(초)
+            backup_dir: 커밋 시 사용할 WAL 저널 디렉토리
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backup_dir = backup_dir
+
+        self.batch_ops = []  # 배치에 확정된 쓰기 작업 [(op, 파일_경로, 바이트)]
+        self.staged_ops = []  # 현재 상품의 쓰기 작업
+        self.batch_commit_hooks = []  # 배치 커밋 후 호출할 함수
+        self.staged_commit_hooks = []  # 현재 상품의 커밋 훅
+        self.staged_rollback_hooks = []  # 현재 상품이 버려질 때 호출할 함수
+        self.batched_products = 0
+        self.batch_started_at = None
+        self.in_product = False
+
+        # 통계
+        self.total_flushes = 0
+        self.total_committed = 0
+        self.total_dropped = 0
+
+        # 이전 실행에서 중단된 flush가 있으면 먼저 롤백
+        # (버퍼 내용을 읽기 전에 디스크 상태를 정리)
+        recover_journals_once(backup_dir)
+
+    # ------------------------------------------------------------
+    # 상품 단위 격리
+    # ------------------------------------------------------------
+    @contextmanager
+    def product(self):
+        """
+        상품 1개의 쓰기 범위를 지정합니다.
+        예외가 발생하면 해당 상품의 쓰기만 버리고 예외를 다시 발생시킵니다.
+        """
+        if self.in_product:
+            raise Exception("이미 상품 트랜잭션이 진행 중입니다.")
+
+        self.staged_ops = []
+        self.staged_commit_hooks = []
+        self.staged_rollback_hooks = []
+        self.in_product = True
+
+        try:
+            yield self
+        except Exception as e:
+            self.total_dropped += 1
+            print(f"[GroupCommit] 상품 쓰기 {len(self.staged_ops)}건 버림: {type(e).__name__}: {e}")
+            rollback_hooks = self.staged_rollback_hooks
+            self.staged_rollback_hooks = []
+            for hook in reversed(rollback_hooks):
+                hook()
+            raise
+        else:
+            if self.batch_started_at is None:
+                self.batch_started_at = time.time()
+            self.batch_ops.extend(self.staged_ops)
+            self.batch_commit_hooks.extend(self.staged_commit_hooks)
+            self.batched_products += 1
+            print(f"[GroupCommit] 상품 배치에 추가 ({self.batched_products}/{self.batch_size})")
+        finally:
+            self.staged_ops = []
+            self.staged_commit_hooks = []
+            self.staged_rollback_hooks = []
+            self.in_product = False
+
+        if self._should_flush():
+            self.flush()
+
+    def _should_flush(self):
+        """배치 크기 또는 시간 조건을 만족하면 True"""
+        if self.batched_products == 0:
+            return False
+        if self.batched_products >= self.batch_size:
+            return True
+        return time.time() - self.batch_started_at >= self.flush_interval
+
+    # ------------------------------------------------------------
+    # FileTransaction 호환 쓰기 API
+    # ------------------------------------------------------------
+    def _stage(self, op, file_path, data):
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+        self.staged_ops.append((op, file_path, data))
+
+    def backup_file(self, file_path):
+        """그룹 커밋에서는 flush 시점의 WAL 트랜잭션이 백업을 담당합니다."""
+        pass
+
+    def add_commit_hook(self, hook):
+        """
+        현재 상품이 포함된 배치가 커밋된 뒤 호출할 함수를 등록합니다.
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+        self.staged_commit_hooks.append(hook)
+
+    def add_rollback_hook(self, hook):
+        """
+        현재 상품이 버려질 때 호출할 함수를 등록합니다.
+
+        Args:
+            hook: 인자 없는 함수
+        """
+        if not self.in_product:
+            raise Exception("상품 트랜잭션이 시작되지 않았습니다.")
+        self.staged_rollback_hooks.append(hook)
+
+    def write_file(self, file_path, content, mode='w', encoding='utf-8'):
+        """
+        파일 쓰기를 버퍼에 기록합니다.
+
+        Args:
+            file_path: 파일 경로
+            content: 파일 내용
+            mode: 쓰기 모드 ('w', 'a', 'wb' 등)
+            encoding: 인코딩 (바이너리 모드가 아닐 때만)
+        """
+        data = content if 'b' in mode else content.encode(encoding)
+        self._stage("append" if 'a' in mode else "write", file_path, data)
+
+    def write_json(self, file_path, data, indent=2, encoding='utf-8'):
+        """
+        JSON 파일 쓰기를 버퍼에 기록합니다.
+
+        Args:
+            file_path: JSON 파일 경로
+            data: JSON으로 저장할 데이터
+            indent: 들여쓰기
+            encoding: 인코딩
+        """
+        content = json.dumps(data, ensure_ascii=False, indent=indent)
+        self._stage("write", file_path, content.encode(encoding))
+
+    def append_file(self, file_path, content, encoding='utf-8'):
+        """
+        파일 추가 쓰기를 버퍼에 기록합니다.
+
+        Args:
+            file_path: 파일 경로
+            content: 추가할 내용
+            encoding: 인코딩
+        """
+        self.write_file(file_path, content, mode='a', encoding=encoding)
+
+    def read_file(self, file_path, encoding='utf-8'):
+        """
+        아직 디스크에 반영되지 않은 쓰기까지 포함한 파일 내용을 반환합니다.
+
+        Args:
+            file_path: 파일 경로
+            encoding: 인코딩
+
+        Returns:
+            str or None: 파일 내용 (파일이 없으면 None)
+        """
+        content = None
+        ops = [op for op in self.batch_ops + self.staged_ops if op[1] == file_path]
+
+        # 마지막 전체 쓰기 이후의 작업만 적용
+        last_write = max((i for i, op in enumerate(ops) if op[0] == "write"), default=None)
+        if last_write is not None:
+            content = ops[last_write][2]
+            ops = ops[last_write + 1:]
+        elif os.path.exists(file_path):
+            with open(file_path, 'rb') as f:
+                content = f.read()
+
+        for _, _, data in ops:
+            content = (content or b"") + data
+
+        return content.decode(encoding) if content is not None else None
+
+    # ------------------------------------------------------------
+    # 커밋
+    # ------------------------------------------------------------
+    def flush(self):
+        """
+        버퍼에 모인 모든 상품의 쓰기를 하나의 WAL 트랜잭션으로 반영합니다.
+
+        Returns:
+            int: 커밋한 상품 수
+        """
+        if self.batched_products == 0:
+            return 0
+
+        # 파일별로 작업을 합쳐 파일당 한 번만 쓰기
+        merged = {}  # {파일_경로: [op, 바이트]}
+        for op, file_path, data in self.batch_ops:
+            if op == "write" or file_path not in merged:
+                merged[file_path] = [op, data]
+            else:
+                merged[file_path][1] += data
+
+        with FileTransaction(backup_dir=self.backup_dir, mode=MODE_WAL) as transaction:
+            for file_path, (op, data) in merged.items():
+                transaction.write_file(file_path, data, mode='ab' if op == "append" else 'wb')
+
+        committed = self.batched_products
+        self.total_flushes += 1
+        self.total_committed += committed
+        print(f"[GroupCommit] 상품 {committed}개 커밋 완료 (파일 {len(merged)}개)")
+
+        commit_hooks = self.batch_commit_hooks
+        self.batch_ops = []
+        self.batch_commit_hooks = []
+        self.batched_products = 0
+        self.batch_started_at = None
+
+        for hook in commit_hooks:
+            hook()
+        return committed
+
+    def close(self):
+        """남은 배치를 커밋하고 통계를 출력합니다."""
+        self.flush()
+        print(f"[GroupCommit] 총 커밋 상품 {self.total_committed}개, "
+              f"버린 상품 {self.total_dropped}개, 커밋 횟수 {self.total_flushes}회")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 배치에 확정된 상품은 예외 여부와 관계없이 커밋
+        self.close()
+        return False
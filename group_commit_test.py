@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from file_transaction import FileTransaction, MODE_WAL
+from group_commit import GroupCommitTransaction
+
+# 임시 디렉토리의 절대 경로만 사용
+work_dir = tempfile.mkdtemp()
+backup_dir = os.path.join(work_dir, ".transaction_backup")
+segment_path = os.path.join(work_dir, "segment.txt")
+data_path = os.path.join(work_dir, "data.json")
+
+with open(segment_path, "w", encoding="utf-8") as f:
+    f.write("(0, 'seed'),\n")
+
+committed = []
+rolled_back = []
+group = GroupCommitTransaction(batch_size=2, flush_interval=3600, backup_dir=backup_dir)
+
+# 상품 1: 배치에만 쌓이고 디스크에는 아직 쓰지 않음 (같은 상품 안의 쓰기는 read_file에 보임)
+with group.product() as transaction:
+    transaction.append_file(segment_path, "(1, 'a'),\n")
+    transaction.write_json(data_path, {"next_id": 2})
+    transaction.add_commit_hook(lambda: committed.append(1))
+    assert transaction.read_file(segment_path) == "(0, 'seed'),\n(1, 'a'),\n"
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(0, 'seed'),\n"
+assert not os.path.exists(data_path)
+assert committed == []
+
+# 예외가 난 상품은 그 상품의 쓰기만 버리고 롤백 훅 호출 (배치는 유지)
+try:
+    with group.product() as transaction:
+        transaction.append_file(segment_path, "(9, 'bad'),\n")
+        transaction.add_commit_hook(lambda: committed.append(9))
+        transaction.add_rollback_hook(lambda: rolled_back.append(9))
+        raise ValueError("의도적인 예외 발생!")
+except ValueError:
+    pass
+assert rolled_back == [9]
+assert group.batched_products == 1 and group.total_dropped == 1
+
+# 상품 2: 배치 크기에 도달하면 파일별로 합쳐 한 번에 커밋하고, 그 뒤에 커밋 훅 호출
+with group.product() as transaction:
+    transaction.append_file(segment_path, "(2, 'b'),\n")
+    transaction.write_json(data_path, {"next_id": 3})
+    transaction.add_commit_hook(lambda: committed.append(2))
+assert group.total_flushes == 1 and group.total_committed == 2
+assert committed == [1, 2]
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(0, 'seed'),\n(1, 'a'),\n(2, 'b'),\n"
+with open(data_path, "r", encoding="utf-8") as f:
+    assert json.load(f) == {"next_id": 3}
+assert os.listdir(backup_dir) == []
+
+# 남은 상품이 없으면 close는 커밋하지 않음
+group.close()
+assert group.total_flushes == 1
+
+# 중단된 flush: 다른 프로세스가 WAL 저널만 남기고 종료한 상태에서 새로 만든 그룹 커밋이 먼저 롤백
+crashed_dir = os.path.join(work_dir, "crashed_backup")
+CRASH_SCRIPT = """
+import os, sys
+from file_transaction import FileTransaction, MODE_WAL
+transaction = FileTransaction(backup_dir=sys.argv[1], mode=MODE_WAL)
+transaction.begin()
+transaction.append_file(sys.argv[2], "(3, 'partial'),\\n")
+os._exit(1)
+"""
+subprocess.run([sys.executable, "-c", CRASH_SCRIPT, crashed_dir, segment_path],
+               cwd=os.path.dirname(os.path.abspath(__file__)), stdout=subprocess.DEVNULL)
+assert len(os.listdir(crashed_dir)) == 1
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read().endswith("(3, 'partial'),\n")
+
+GroupCommitTransaction(backup_dir=crashed_dir)
+with open(segment_path, "r", encoding="utf-8") as f:
+    assert f.read() == "(0, 'seed'),\n(1, 'a'),\n(2, 'b'),\n"
+assert os.listdir(crashed_dir) == []
+print("그룹 커밋 테스트 통과")
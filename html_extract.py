@@ -0,0 +1,390 @@
+"""
+오프라인 HTML 추출 모듈
+브라우저는 페이지를 렌더링하고 HTML 스냅샷(driver.page_source)만 남기고,
+추출은 저장된 스냅샷을 lxml로 파싱해서 수행합니다.
+
+- 선택자/XPath는 기존 추출 모듈(productInfo, option, mainImgCol, detailImg, productDetailInfoProvided)과 동일
+- 결과 형식은 detail_bundle과 같음 (crawl.extract_product_record(prefetched=...)로 검증/저장)
+- 파싱은 브라우저와 무관하므로 프로세스 풀에서 병렬 실행 가능
+- 과거 스냅샷을 다시 크롤링하지 않고 재추출 가능 (python html_extract.py [스냅샷 디렉토리])
+
+lxml과 cssselect가 필요합니다. (pip install lxml cssselect)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from detail_bundle import BUNDLE_SELECTORS, build_bundle_record
+from detailImg import DETAIL_IMAGE_SELECTOR, DETAIL_IMAGE_ATTRIBUTES, MORE_BUTTON_SELECTOR
+from listing import extract_goods_no
+from mainImgCol import pick_image_src, order_slide_sources
+from wait_engine import WAIT_FOR_JS
+
+try:
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    lxml_html = None
+    CSSSelector = None
+
+# 스냅샷 저장 디렉토리
+SNAPSHOT_DIR = "snapshots"
+
+# 스냅샷 파일 확장자
+SNAPSHOT_EXTENSION = ".html"
+
+# 스냅샷 전에 접힌 영역(상품설명 더보기, 옵션 드롭다운, 제공고시 아코디언)을 펼치는 스크립트
+# (arguments[0]: 선택자, 마지막 인자: 완료 콜백)
+EXPAND_FOR_SNAPSHOT_SCRIPT = WAIT_FOR_JS + """
+var selectors = arguments[0];
+var done = arguments[arguments.length - 1];
+
+function byXPath(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function present(selector) {
+    return function () { return document.querySelector(selector); };
+}
+
+async function expand() {
+    var moreButton = document.querySelector(selectors.more_button);
+    if (moreButton) { moreButton.click(); }
+
+    // 옵션 리스트가 이미 DOM에 있으면 드롭다운을 열지 않음
+    var optionButton = document.querySelector(selectors.option.items) ? null
+        : document.querySelector(selectors.option.button);
+    if (optionButton) {
+        optionButton.click();
+        await waitFor(present(selectors.option.items), selectors.option.timeout_ms);
+    }
+
+    var infoButton = byXPath(selectors.detail_info_button);
+    if (infoButton) {
+        infoButton.click();
+        await waitFor(present(selectors.detail_info_rows), selectors.detail_info_timeout_ms);
+    }
+}
+
+expand().then(function () { done(true); }, function (error) { done(String(error)); });
+"""
+
+# {CSS 선택자: CSSSelector} (같은 선택자를 반복해서 XPath로 변환하지 않도록 캐시)
+_CSS_CACHE = {}
+
+
+def _require_lxml():
+    """lxml이 없으면 ImportError를 발생시킵니다."""
+    if lxml_html is None:
+        raise ImportError("오프라인 추출에는 lxml과 cssselect가 필요합니다. (pip install lxml cssselect)")
+
+
+def _css(element, selector):
+    """CSS 선택자에 맞는 하위 요소 리스트"""
+    compiled = _CSS_CACHE.get(selector)
+    if compiled is None:
+        compiled = CSSSelector(selector)
+        _CSS_CACHE[selector] = compiled
+    return compiled(element)
+
+
+def _css_first(element, selector):
+    """CSS 선택자에 맞는 첫 번째 하위 요소 (없으면 None)"""
+    found = _css(element, selector)
+    return found[0] if found else None
+
+
+def _xpath_first(tree, xpath):
+    """XPath에 맞는 첫 번째 요소 (없으면 None)"""
+    found = tree.xpath(xpath)
+    return found[0] if found else None
+
+
+def _text(element):
+    """요소의 텍스트 (공백 정리, 비어 있으면 None)"""
+    if element is None:
+        return None
+    text = element.text_content().strip()
+    return text or None
+
+
+def _image_src(img):
+    """이미지 요소의 src (없거나 data: 자리표시자면 data-src)"""
+    if img is None:
+        return None
+    return pick_image_src(img.get('src'), img.get('data-src'))
+
+
+# ============================================================
+# 개별 추출 함수 (기존 live driver 추출 함수에 대응)
+# ============================================================
+
+def parse_basic_info(tree):
+    """
+    productInfo.get_product_basic_info()에 대응
+
+    Returns:
+        tuple: (카테고리, 브랜드, 상품명)
+    """
+    category = _text(_xpath_first(tree, BUNDLE_SELECTORS["category"]))
+    brand = (_text(_xpath_first(tree, BUNDLE_SELECTORS["brand_link"]))
+             or _text(_xpath_first(tree, BUNDLE_SELECTORS["brand_button"])))
+    product_name = _text(_xpath_first(tree, BUNDLE_SELECTORS["product_name"]))
+    return category, brand, product_name
+
+
+def parse_main_image_sources(tree):
+    """
+    mainImgCol.get_main_image_urls()에 대응 (정제 전 원본 URL)
+    loop 모드의 복제 슬라이드는 data-swiper-slide-index로 중복 제거하고 인덱스 순으로 정렬합니다.
+
+    Returns:
+        list: 이미지 URL 리스트
+    """
+    return order_slide_sources(
+        (slide.get('data-swiper-slide-index'), _image_src(_css_first(slide, "img")))
+        for slide in _css(tree, BUNDLE_SELECTORS["carousel_slide"])
+    )
+
+
+def parse_options(tree):
+    """
+    option.get_product_options()에 대응하는 원시 옵션 데이터
+
+    Returns:
+        list or None: [{'name', 'price', 'image_url', 'is_soldout'}, ...] (옵션 리스트가 없으면 None)
+    """
+    config = BUNDLE_SELECTORS["option"]
+    items = _css(tree, config["items"])
+    if not items:
+        return None
+
+    return [{
+        'name': _text(_css_first(item, config["name"])),
+        'price': _text(_css_first(item, config["price"])),
+        'image_url': _image_src(_css_first(item, config["image"])),
+        'is_soldout': 'is-soldout' in (item.get('class') or ''),
+    } for item in items]
+
+
+def parse_detail_info(tree):
+    """
+    productDetailInfoProvided.extract_product_detailinfo()에 대응
+
+    Returns:
+        dict: {항목명: 값}
+    """
+    product_info = {}
+    for row in _css(tree, BUNDLE_SELECTORS["detail_info_rows"]):
+        key = _text(_css_first(row, "th"))
+        value = _css_first(row, "td")
+        if key and value is not None:
+            product_info[key] = _text(value) or ""
+    return product_info
+
+
+def parse_detail_image_urls(tree):
+    """
+    detailImg.extract_detail_image_urls()에 대응
+
+    Returns:
+        list: 상세 이미지 URL 리스트
+    """
+    detail_urls = []
+    for img in _css(tree, DETAIL_IMAGE_SELECTOR):
+        for attr in DETAIL_IMAGE_ATTRIBUTES:
+            url = img.get(attr)
+            if url and not url.startswith("data:image"):
+                detail_urls.append(url)
+                break
+    return detail_urls
+
+
+# ============================================================
+# 스냅샷 단위 추출
+# ============================================================
+
+def parse_snapshot(page_source, num_images=3):
+    """
+    HTML 스냅샷 하나에서 상품 필드를 추출합니다.
+
+    Args:
+        page_source: HTML 문자열
+        num_images: 수집할 메인 이미지 수
+
+    Returns:
+        dict: detail_bundle 형식 + "detail_image_urls"
+              (crawl.extract_product_record(prefetched=...)에 그대로 전달 가능)
+    """
+    _require_lxml()
+    tree = lxml_html.fromstring(page_source)
+
+    category, brand, product_name = parse_basic_info(tree)
+    option_config = BUNDLE_SELECTORS["option"]
+    bundle = {
+        "category": category,
+        "brand": brand,
+        "product_name": product_name,
+        "single_name": _text(_css_first(tree, option_config["single_name"])),
+        "single_price": _text(_css_first(tree, option_config["single_price"])),
+        "single_thumbnail": _image_src(_css_first(tree, option_config["single_thumbnail"])),
+        "main_image_urls": parse_main_image_sources(tree),
+        "options": parse_options(tree),
+        "detail_info": parse_detail_info(tree),
+    }
+
+    record = build_bundle_record(bundle, num_images)
+    record["detail_image_urls"] = parse_detail_image_urls(tree)
+    return record
+
+
+def parse_snapshot_file(path, num_images=3):
+    """
+    저장된 스냅샷 파일 하나를 파싱합니다. (프로세스 풀 작업 단위)
+
+    Args:
+        path: 스냅샷 파일 경로
+        num_images: 수집할 메인 이미지 수
+
+    Returns:
+        tuple: (파일 경로, 레코드 또는 None, 오류 메시지 또는 None)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return path, parse_snapshot(f.read(), num_images), None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def parse_snapshot_files(paths, workers=None):
+    """
+    여러 스냅샷 파일을 프로세스 풀에서 병렬로 파싱합니다.
+
+    Args:
+        paths: 스냅샷 파일 경로 리스트
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+
+    Returns:
+        list of tuple: [(파일 경로, 레코드 또는 None, 오류 메시지 또는 None), ...] (입력 순서 유지)
+    """
+    _require_lxml()
+
+    if workers == 1 or len(paths) <= 1:
+        return [parse_snapshot_file(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_snapshot_file, paths, chunksize=4))
+
+
+def list_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    """스냅샷 디렉토리의 파일 경로 리스트 (이름순)"""
+    if not os.path.isdir(snapshot_dir):
+        return []
+    return [os.path.join(snapshot_dir, name) for name in sorted(os.listdir(snapshot_dir))
+            if name.endswith(SNAPSHOT_EXTENSION)]
+
+
+# ============================================================
+# 스냅샷 저장 (브라우저 쪽)
+# ============================================================
+
+def capture_snapshot(driver):
+    """
+    접힌 영역을 펼친 뒤 현재 페이지의 HTML 스냅샷을 반환합니다.
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        str: HTML 문자열
+    """
+    selectors = dict(BUNDLE_SELECTORS, more_button=MORE_BUTTON_SELECTOR)
+    result = driver.execute_async_script(EXPAND_FOR_SNAPSHOT_SCRIPT, selectors)
+    if result is not True:
+        print(f"⚠ 스냅샷 전 영역 펼치기 실패 (계속 진행): {result}")
+    return driver.page_source
+
+
+def save_snapshot(driver, name=None, snapshot_dir=SNAPSHOT_DIR):
+    """
+    현재 상세 페이지의 스냅샷을 파일로 저장합니다.
+
+    Args:
+        driver: Selenium WebDriver
+        name: 파일 이름 (None이면 URL의 goodsNo, 없으면 현재 시각)
+        snapshot_dir: 저장 디렉토리
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    page_source = capture_snapshot(driver)
+
+    if name is None:
+        name = extract_goods_no(driver.current_url) or datetime.now().strftime('%Y%m%d%H%M%S%f')
+
+    if not os.path.exists(snapshot_dir):
+        os.makedirs(snapshot_dir)
+
+    path = os.path.join(snapshot_dir, name + SNAPSHOT_EXTENSION)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(page_source)
+    os.replace(temp_path, path)
+
+    print(f"✓ 스냅샷 저장: {path} ({len(page_source) / 1024:.0f}KB)")
+    return path
+
+
+# ============================================================
+# 과거 스냅샷 재추출
+# ============================================================
+
+def reextract_snapshots(snapshot_dir=SNAPSHOT_DIR, sink=None, workers=None):
+    """
+    저장된 스냅샷을 병렬로 파싱하고, 기존 검증/저장 경로(crawl_product_on_detail_page)로 저장합니다.
+    저장은 현재 프로세스에서 순서대로 수행합니다.
+
+    Args:
+        snapshot_dir: 스냅샷 디렉토리
+        sink: 저장소 (None이면 SQLite 스테이징 저장소)
+        workers: 파싱 프로세스 수 (None이면 CPU 수)
+
+    Returns:
+        tuple: (저장한 상품 수, 실패한 스냅샷 수)
+    """
+    # 저장 경로(crawl → crawl_sink)는 재추출할 때만 필요
+    from crawl import crawl_product_on_detail_page
+    from crawl_sink import SQLiteSink
+
+    paths = list_snapshots(snapshot_dir)
+    print(f"[Snapshot] {len(paths)}개 스냅샷 파싱 시작 ({snapshot_dir})")
+
+    saved = 0
+    failed = 0
+    with (sink or SQLiteSink()) as sink:
+        for product_counter, (path, record, error) in enumerate(parse_snapshot_files(paths, workers), start=1):
+            if record is None:
+                print(f"✗ 스냅샷 파싱 실패: {path} ({error})")
+                failed += 1
+                continue
+
+            try:
+                with sink.product() as transaction:
+                    crawl_product_on_detail_page(None, transaction, product_counter, sink, prefetched=record)
+                saved += 1
+            except ValueError as ve:
+                print(f"✗ 스냅샷 {path} 검증 오류: {ve}")
+                failed += 1
+
+    print(f"[Snapshot] 재추출 완료: 저장 {saved}개, 실패 {failed}개")
+    return saved, failed
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 사용법: python html_extract.py [스냅샷 디렉토리] [프로세스 수]
+    reextract_snapshots(
+        sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_DIR,
+        workers=int(sys.argv[2]) if len(sys.argv) > 2 else None
+    )
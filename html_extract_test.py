@@ -0,0 +1,74 @@
+import os
+import tempfile
+from html_extract import parse_snapshot, parse_snapshot_files
+
+# 상세 페이지 구조를 흉내 낸 스냅샷 (기존 추출 모듈의 XPath/선택자와 같은 위치)
+SNAPSHOT = """
+<html><body>
+<div id="main">
+  <div><div><a>홈</a><a>스킨케어</a><a>에센스/세럼/앰플</a></div></div>
+  <div class="page_product-details-wrapper___t38G"><div>
+    <div class="page_left-section__qXr0Q">
+      <div class="GoodsDetailCarousel_visual-container__1kSZN"><div><div><div class="swiper-wrapper">
+        <div class="swiper-slide swiper-slide-duplicate" data-swiper-slide-index="1"><div><img src="//img.test/b.jpg?QT=85"></div></div>
+        <div class="swiper-slide swiper-slide-active" data-swiper-slide-index="0"><div><img src="https://img.test/a.jpg?x=1&amp;QT=85"></div></div>
+        <div class="swiper-slide" data-swiper-slide-index="1"><div><img src="//img.test/b.jpg?QT=85"></div></div>
+        <div class="swiper-slide" data-swiper-slide-index="2"><div><img src="data:image/gif;base64,AAA" data-src="//img.test/c.jpg"></div></div>
+      </div></div></div></div>
+    </div>
+    <div class="page_right-section__Plw5V"><div>
+      <div><div><a> 테스트브랜드 </a></div><div><h3>테스트 세럼</h3></div></div>
+    </div></div>
+  </div></div>
+</div>
+<ul class="OptionSelector_option-list__9iV9W">
+  <li class="OptionSelector_option-item__yMYbC"><img src="//img.test/o1.jpg?QT=1">
+    <span class="OptionSelector_option-item-tit__8zEjW">01 라이트</span>
+    <span class="OptionSelector_option-item-price__QiVwN">12,000원</span></li>
+  <li class="OptionSelector_option-item__yMYbC is-soldout">
+    <span class="OptionSelector_option-item-tit__8zEjW">02 미디엄</span>
+    <span class="OptionSelector_option-item-price__QiVwN">13,000원</span></li>
+</ul>
+<div class="Accordion_content__aIya4"><table class="Accordion_table__mcFPq">
+  <tr><th>제조국</th><td>대한민국</td></tr>
+  <tr><th>사용방법</th><td></td></tr>
+</table></div>
+<div class="speedycat-container">
+  <img src="data:image/gif;base64,AAA" data-src="https://img.test/d1.jpg">
+  <img src="https://img.test/d2.jpg">
+</div>
+</body></html>
+"""
+
+record = parse_snapshot(SNAPSHOT)
+print(record)
+
+assert (record["category"], record["brand"], record["product_name"]) == ("에센스/세럼/앰플", "테스트브랜드", "테스트 세럼")
+# 복제 슬라이드 제거, 인덱스 순 정렬, data: 자리표시자 대신 data-src, URL 정제
+assert record["main_image_urls"] == ["https://img.test/a.jpg?x=1", "https://img.test/b.jpg?QT=85",
+                                     "https://img.test/c.jpg"]
+assert [(o["name"], o["price"], o["is_soldout"]) for o in record["options"]] == [
+    ("01 라이트", "12000", False), ("02 미디엄", "13000", True)]
+assert record["options"][0]["image_url"] == "https://img.test/o1.jpg"
+assert record["detail_info"] == {"제조국": "대한민국", "사용방법": ""}
+# 클래스명 해시가 바뀌어도 옵션을 찾음 (제목/가격 span의 클래스는 아이템 선택자에 걸리지 않음)
+rehashed = parse_snapshot(SNAPSHOT.replace("__9iV9W", "__zz111").replace("__yMYbC", "__zz222")
+                          .replace("__8zEjW", "__zz333").replace("__QiVwN", "__zz444"))
+assert rehashed["options"] == record["options"]
+assert record["detail_image_urls"] == ["https://img.test/d1.jpg", "https://img.test/d2.jpg"]
+
+# 스냅샷 파일 병렬 파싱 (입력 순서 유지, 실패는 오류 메시지로 반환)
+work_dir = tempfile.mkdtemp()
+paths = []
+for idx in range(3):
+    path = os.path.join(work_dir, f"A{idx}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(SNAPSHOT)
+    paths.append(path)
+paths.append(os.path.join(work_dir, "missing.html"))
+
+results = parse_snapshot_files(paths, workers=2)
+assert [path for path, _, _ in results] == paths
+assert all(record == parsed for _, parsed, _ in results[:3])
+assert results[3][1] is None and results[3][2]
+print("오프라인 HTML 추출 테스트 통과")
@@ -0,0 +1,185 @@
+"""
+이름 -> ID 할당기 모듈
+JSON 스냅샷(예: product_data.json)을 한 번만 읽어 메모리 해시 인덱스로 유지하고,
+새로 할당한 ID는 append-only 저널 파일에 한 줄씩 기록합니다.
+저널이 일정 길이 이상 쌓이면 스냅샷으로 합치는 압축(compaction)을 수행합니다.
+중복 확인과 ID 할당 비용은 카탈로그 크기와 관계없이 O(1)입니다.
+"""
+
+import json
+import os
+
+# 저널 파일 확장자
+JOURNAL_SUFFIX = ".journal"
+
+# 저널 항목이 이 개수 이상이면 커밋 후 스냅샷으로 압축
+DEFAULT_COMPACT_EVERY = 1000
+
+
+class NameIdAllocator:
+    """
+    이름별로 고유 ID를 할당하는 상주형 할당기
+
+    스냅샷 형식: {map_key: {이름: ID, ...}, "next_id": 다음 ID}
+    저널 형식: 한 줄에 {"name": 이름, "id": ID} 하나
+    """
+
+    def __init__(self, json_path, map_key, journal_path=None, compact_every=DEFAULT_COMPACT_EVERY,
+                 sequence=None, sequence_name=None):
+        """
+        Args:
+            json_path: 스냅샷 JSON 파일 경로
+            map_key: 스냅샷에서 이름->ID 딕셔너리가 들어있는 키 (예: "products")
+            journal_path: 저널 파일 경로 (None이면 json_path + ".journal")
+            compact_every: 압축을 수행할 저널 항목 수
+            sequence: 새 ID를 꺼낼 IdSequence 객체 (None이면 스냅샷의 next_id 사용)
+            sequence_name: sequence에서 사용할 시퀀스 이름 (예: "product")
+        """
+        self.json_path = json_path
+        self.map_key = map_key
+        self.journal_path = journal_path or json_path + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.sequence = sequence
+        self.sequence_name = sequence_name
+
+        self.index = {}  # {이름: ID}
+        self.next_id = 1
+        self.journal_entries = 0
+        self.loaded = False
+
+    # ------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------
+    def load(self):
+        """스냅샷과 저널을 읽어 메모리 인덱스를 구성합니다. (최초 1회)"""
+        if self.loaded:
+            return
+
+        self.index = {}
+        self.next_id = 1
+        self.journal_entries = 0
+
+        if os.path.exists(self.json_path):
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.index = dict(data.get(self.map_key, {}))
+            self.next_id = data.get("next_id", 1)
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 기록 도중 끊긴 마지막 줄
+                        continue
+                    self.index[entry["name"]] = entry["id"]
+                    self.next_id = max(self.next_id, entry["id"] + 1)
+                    self.journal_entries += 1
+
+        self.loaded = True
+        print(f"[IdAllocator] '{self.json_path}' 로드 완료 "
+              f"(총 {len(self.index)}개, 저널 {self.journal_entries}개, 다음 ID: {self.next_id})")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def contains(self, name):
+        """이미 ID가 할당된 이름이면 True"""
+        self.load()
+        return name in self.index
+
+    def get_id(self, name):
+        """이름에 할당된 ID (없으면 None)"""
+        self.load()
+        return self.index.get(name)
+
+    def snapshot(self):
+        """현재 인덱스를 스냅샷 형식의 dict로 반환합니다."""
+        self.load()
+        return {self.map_key: dict(self.index), "next_id": self.next_id}
+
+    # ------------------------------------------------------------
+    # 할당
+    # ------------------------------------------------------------
+    def allocate(self, name, transaction=None):
+        """
+        새 ID를 할당합니다.
+
+        Args:
+            name: 이름
+            transaction: FileTransaction 또는 GroupCommitTransaction 객체
+                         (롤백되면 메모리 인덱스에서도 할당이 취소됨)
+
+        Returns:
+            int: 새로 생성된 ID 또는 0(이미 존재하는 이름인 경우)
+        """
+        self.load()
+
+        if name in self.index:
+            return 0
+
+        if self.sequence is not None:
+            new_id = self.sequence.next_id(self.sequence_name)
+            if new_id < self.next_id:
+                # 시퀀스 상태 파일이 없어져 이미 할당한 ID부터 다시 발급한 경우 - 인덱스의 다음 ID부터 사용
+                print(f"[IdAllocator] ⚠ 시퀀스 ID {new_id}가 이미 할당된 범위입니다. {self.next_id}부터 할당합니다.")
+                self.sequence.skip_to(self.sequence_name, self.next_id)
+                new_id = self.sequence.next_id(self.sequence_name)
+        else:
+            new_id = self.next_id
+        self.index[name] = new_id
+        self.next_id = max(self.next_id, new_id + 1)
+        self.journal_entries += 1
+
+        line = json.dumps({"name": name, "id": new_id}, ensure_ascii=False) + "\n"
+
+        if transaction:
+            transaction.append_file(self.journal_path, line)
+            transaction.add_rollback_hook(lambda: self._forget(name, new_id))
+            transaction.add_commit_hook(self.maybe_compact)
+        else:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self.maybe_compact()
+
+        return new_id
+
+    def _forget(self, name, allocated_id):
+        """롤백된 할당을 메모리 인덱스에서 제거합니다."""
+        if self.index.get(name) == allocated_id:
+            del self.index[name]
+            self.journal_entries -= 1
+        if self.next_id == allocated_id + 1:
+            self.next_id = allocated_id
+        if self.sequence is not None:
+            self.sequence.unget(self.sequence_name, allocated_id)
+
+    # ------------------------------------------------------------
+    # 압축
+    # ------------------------------------------------------------
+    def maybe_compact(self):
+        """저널 항목이 compact_every 이상이면 압축합니다."""
+        if self.journal_entries >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """
+        메모리 인덱스를 스냅샷 파일에 쓰고 저널을 비웁니다.
+        커밋된 상태에서만 호출해야 합니다. (진행 중인 트랜잭션의 할당이 없어야 함)
+        """
+        self.load()
+
+        temp_path = self.json_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.json_path)
+
+        # 스냅샷 교체 후 저널 비우기 (중간에 중단되어도 저널 재적용은 멱등)
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+
+        print(f"[IdAllocator] '{self.json_path}' 압축 완료 (저널 {self.journal_entries}개 반영)")
+        self.journal_entries = 0
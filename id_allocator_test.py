@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+from file_transaction import FileTransaction, MODE_WAL
+from id_allocator import NameIdAllocator
+from id_sequence import IdSequence
+
+# 임시 디렉토리의 절대 경로만 사용
+work_dir = tempfile.mkdtemp()
+json_path = os.path.join(work_dir, "product_data.json")
+backup_dir = os.path.join(work_dir, ".transaction_backup")
+
+with open(json_path, "w", encoding="utf-8") as f:
+    json.dump({"products": {"기존 상품": 1}, "next_id": 2}, f, ensure_ascii=False)
+
+# 스냅샷 + 저널 재적용 (기록 도중 끊긴 마지막 줄은 무시)
+with open(json_path + ".journal", "w", encoding="utf-8") as f:
+    f.write(json.dumps({"name": "저널 상품", "id": 2}, ensure_ascii=False) + "\n")
+    f.write('{"name": "끊긴 상')
+
+allocator = NameIdAllocator(json_path, "products", compact_every=3)
+assert allocator.get_id("기존 상품") == 1
+assert allocator.get_id("저널 상품") == 2
+assert not allocator.contains("끊긴 상")
+assert (allocator.next_id, allocator.journal_entries) == (3, 1)
+
+# 이미 있는 이름은 0
+assert allocator.allocate("기존 상품") == 0
+
+# 롤백된 트랜잭션의 할당은 메모리 인덱스에서도 취소
+try:
+    with FileTransaction(backup_dir=backup_dir, mode=MODE_WAL) as transaction:
+        assert allocator.allocate("롤백 상품", transaction) == 3
+        raise ValueError("의도적인 예외 발생!")
+except ValueError:
+    pass
+assert not allocator.contains("롤백 상품")
+assert (allocator.next_id, allocator.journal_entries) == (3, 1)
+
+# 저널 항목이 compact_every에 도달하면 스냅샷으로 합치고 저널을 비움
+assert allocator.allocate("새 상품 1") == 3
+with open(json_path, "r", encoding="utf-8") as f:
+    assert "새 상품 1" not in json.load(f)["products"]
+with FileTransaction(backup_dir=backup_dir, mode=MODE_WAL) as transaction:
+    assert allocator.allocate("새 상품 2", transaction) == 4
+assert allocator.journal_entries == 0
+with open(json_path, "r", encoding="utf-8") as f:
+    snapshot = json.load(f)
+assert snapshot["next_id"] == 5
+assert snapshot["products"] == {"기존 상품": 1, "저널 상품": 2, "새 상품 1": 3, "새 상품 2": 4}
+assert os.path.getsize(json_path + ".journal") == 0
+
+# 다시 로드해도 같은 인덱스
+reloaded = NameIdAllocator(json_path, "products", compact_every=3)
+assert reloaded.snapshot() == allocator.snapshot()
+
+# 시퀀스가 이미 할당한 범위의 ID를 주면(상태 파일 유실) 인덱스의 다음 ID부터 할당
+sequence = IdSequence(state_path=os.path.join(work_dir, "id_sequence.json"), block_size=10,
+                      seed_files={}, mirror_files={})
+sequenced = NameIdAllocator(json_path, "products", sequence=sequence, sequence_name="product")
+assert sequenced.allocate("시퀀스 상품") == 5
+assert sequence.next_id("product") == 6
+print("ID 할당기 테스트 통과")
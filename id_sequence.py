@@ -0,0 +1,279 @@
+"""
+통합 ID 시퀀스 모듈
+브랜드/제품/상세정보 ID를 하나의 작은 상태 파일(id_sequence.json)로 관리합니다.
+
+각 프로세스(워커)는 시퀀스별로 ID 블록(기본 1000개)을 한 번에 예약해 두고
+메모리에서 하나씩 꺼내 씁니다. 상태 파일은 블록을 예약할 때만 잠금 후 갱신하므로
+여러 워커가 동시에 ID를 할당해도 파일 경합이 거의 없습니다.
+
+상태 파일 형식: {"brand": 다음 예약 시작 ID, "product": ..., "detailinfo": ...}
+"""
+
+import atexit
+import json
+import os
+import time
+
+# 상태 파일 경로
+SEQUENCE_FILE_PATH = "id_sequence.json"
+
+# 한 번에 예약할 ID 개수
+DEFAULT_BLOCK_SIZE = 1000
+
+# 상태 파일이 없을 때 시작값을 가져올 기존 데이터 파일 (각 파일의 "next_id" 사용)
+# 상태 파일은 저장소에 포함하지 않으므로, 새로 받은 저장소에서도 이미 쓴 ID를 다시 발급하지 않도록
+# 압축 전 저널까지 포함
+SEED_FILES = {
+    "brand": ["brand_data.json", "brand_data.json.journal"],
+    "product": ["product_data.json", "product_data.json.journal"],
+    "detailinfo": ["detailinfo_data.json"],
+}
+
+# 상태 파일을 저장할 때 다음 예약 시작 ID를 함께 기록할 파일 ({"last_id", "next_id"} 형식)
+# (이름 -> ID 스냅샷이 없는 시퀀스의 시작값 파일이 상태 파일 없이도 최신으로 유지되도록)
+MIRROR_FILES = {
+    "detailinfo": "detailinfo_data.json",
+}
+
+# 잠금 파일 대기 설정
+LOCK_TIMEOUT = 10.0  # 이 시간(초)이 지난 잠금 파일은 비정상 종료로 남은 것으로 간주
+LOCK_RETRY_INTERVAL = 0.05
+
+
+def _read_seed_next_id(file_path):
+    """
+    기존 데이터 파일에서 다음 ID를 읽습니다.
+    JSON 파일은 "next_id" 키를, 저널 파일(.journal)은 가장 큰 "id" + 1을 사용합니다.
+
+    Returns:
+        int: 다음 ID (파일이 없거나 읽을 수 없으면 1)
+    """
+    if not os.path.exists(file_path):
+        return 1
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if file_path.endswith(".journal"):
+                next_id = 1
+                for line in f:
+                    try:
+                        next_id = max(next_id, json.loads(line)["id"] + 1)
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+                return next_id
+            return json.load(f).get("next_id", 1)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"[IdSequence] '{file_path}' 시작값 읽기 실패: {e}")
+        return 1
+
+
+class IdSequence:
+    """
+    블록 예약 방식의 ID 시퀀스
+
+    사용 예:
+        new_id = ID_SEQUENCE.next_id("product")
+    """
+
+    def __init__(self, state_path=SEQUENCE_FILE_PATH, block_size=DEFAULT_BLOCK_SIZE, seed_files=None,
+                 mirror_files=None):
+        """
+        Args:
+            state_path: 상태 파일 경로
+            block_size: 한 번에 예약할 ID 개수
+            seed_files: 상태 파일이 없을 때 시작값을 가져올 파일 {시퀀스_이름: [파일_경로, ...]}
+            mirror_files: 상태를 저장할 때 다음 예약 시작 ID를 기록할 파일 {시퀀스_이름: 파일_경로}
+                          (None이면 MIRROR_FILES)
+        """
+        self.state_path = state_path
+        self.lock_path = state_path + ".lock"
+        self.block_size = block_size
+        self.seed_files = SEED_FILES if seed_files is None else seed_files
+        self.mirror_files = MIRROR_FILES if mirror_files is None else mirror_files
+
+        self.blocks = {}  # {시퀀스_이름: [다음 ID, 블록 끝 ID(미포함)]}
+
+    # ------------------------------------------------------------
+    # 상태 파일 (잠금 상태에서만 호출)
+    # ------------------------------------------------------------
+    def _acquire_lock(self):
+        """잠금 파일을 만들어 상태 파일 접근을 직렬화합니다."""
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > LOCK_TIMEOUT:
+                        print(f"[IdSequence] 오래된 잠금 파일 제거: {self.lock_path}")
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(LOCK_RETRY_INTERVAL)
+
+    def _release_lock(self):
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+
+    def _load_state(self):
+        """상태 파일을 읽습니다. 없으면 기존 데이터 파일에서 시작값을 가져옵니다."""
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        state = {}
+        for name, file_paths in self.seed_files.items():
+            state[name] = max([_read_seed_next_id(path) for path in file_paths] + [1])
+        print(f"[IdSequence] '{self.state_path}' 생성 (시작값: {state})")
+        return state
+
+    def _save_state(self, state):
+        """상태 파일을 원자적으로 교체합니다."""
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.state_path)
+
+        for name, mirror_path in self.mirror_files.items():
+            if name in state:
+                self._save_mirror(mirror_path, state[name])
+
+    @staticmethod
+    def _save_mirror(mirror_path, next_id):
+        """시작값 파일에 다음 예약 시작 ID를 기록합니다. ({"last_id", "next_id"} 형식)"""
+        temp_path = mirror_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"last_id": next_id - 1, "next_id": next_id}, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, mirror_path)
+
+    # ------------------------------------------------------------
+    # 블록 예약 / 반납
+    # ------------------------------------------------------------
+    def reserve(self, name, count=None):
+        """
+        상태 파일에서 ID 블록을 예약합니다.
+
+        Args:
+            name: 시퀀스 이름 ("brand", "product", "detailinfo" 등)
+            count: 예약할 ID 개수 (None이면 block_size)
+
+        Returns:
+            tuple: (블록 시작 ID, 블록 끝 ID(미포함))
+        """
+        count = count or self.block_size
+
+        self._acquire_lock()
+        try:
+            state = self._load_state()
+            start = state.get(name, 1)
+            state[name] = start + count
+            self._save_state(state)
+        finally:
+            self._release_lock()
+
+        self.blocks[name] = [start, start + count]
+        print(f"[IdSequence] '{name}' ID 블록 예약: {start} ~ {start + count - 1}")
+        return start, start + count
+
+    def skip_to(self, name, min_id):
+        """
+        시퀀스가 min_id보다 작은 ID를 발급하지 않도록 건너뜁니다.
+        (상태 파일이 없어져 시작값 파일보다 뒤에 이미 쓴 ID가 있는 경우)
+
+        Args:
+            name: 시퀀스 이름
+            min_id: 다음에 발급할 최소 ID
+        """
+        block = self.blocks.get(name)
+        if block is not None and min_id < block[1]:
+            # 현재 블록 안에서 건너뜀
+            block[0] = max(block[0], min_id)
+            return
+
+        # 현재 블록은 반납하지 않고 버림 (빈 ID는 생기지만 중복은 생기지 않음)
+        self.blocks.pop(name, None)
+        self._acquire_lock()
+        try:
+            state = self._load_state()
+            if state.get(name, 1) < min_id:
+                state[name] = min_id
+                self._save_state(state)
+        finally:
+            self._release_lock()
+        print(f"[IdSequence] '{name}' 시퀀스를 {min_id}부터 발급하도록 건너뜀")
+
+    def release(self):
+        """
+        쓰지 않은 블록 끝부분을 반납합니다.
+        다른 워커가 그 뒤로 블록을 예약하지 않았을 때만 상태 파일을 되돌립니다.
+        """
+        if not self.blocks:
+            return
+
+        self._acquire_lock()
+        try:
+            state = self._load_state()
+            for name, (next_id, end) in self.blocks.items():
+                if next_id < end and state.get(name) == end:
+                    state[name] = next_id
+            self._save_state(state)
+        finally:
+            self._release_lock()
+
+        self.blocks = {}
+
+    # ------------------------------------------------------------
+    # 할당
+    # ------------------------------------------------------------
+    def next_id(self, name):
+        """
+        시퀀스에서 다음 ID를 꺼냅니다. 블록이 비어 있으면 새 블록을 예약합니다.
+
+        Args:
+            name: 시퀀스 이름
+
+        Returns:
+            int: 새 ID
+        """
+        block = self.blocks.get(name)
+        if block is None or block[0] >= block[1]:
+            self.reserve(name)
+            block = self.blocks[name]
+
+        new_id = block[0]
+        block[0] += 1
+        return new_id
+
+    def unget(self, name, allocated_id):
+        """
+        롤백된 ID를 블록에 되돌립니다. (가장 최근에 꺼낸 ID일 때만)
+
+        Args:
+            name: 시퀀스 이름
+            allocated_id: 되돌릴 ID
+        """
+        block = self.blocks.get(name)
+        if block is not None and block[0] == allocated_id + 1:
+            block[0] = allocated_id
+
+    def peek(self, name):
+        """다음에 할당될 ID를 반환합니다. (블록을 예약하지 않음)"""
+        block = self.blocks.get(name)
+        if block is not None and block[0] < block[1]:
+            return block[0]
+        return self._load_state().get(name, 1)
+
+
+# 프로세스 전역 시퀀스 (워커 프로세스마다 별도 블록을 가짐)
+ID_SEQUENCE = IdSequence()
+
+# 정상 종료 시 남은 블록 반납
+atexit.register(ID_SEQUENCE.release)
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+from id_sequence import IdSequence
+
+# 임시 디렉토리에서 블록 예약/반납 확인 (작업 디렉토리는 바꾸지 않고 절대 경로 사용)
+work_dir = tempfile.mkdtemp()
+state_path = os.path.join(work_dir, "id_sequence.json")
+seed_path = os.path.join(work_dir, "seed.json")
+
+with open(seed_path, "w", encoding="utf-8") as f:
+    f.write('{"next_id": 10}')
+
+worker_a = IdSequence(state_path=state_path, block_size=3, seed_files={"product": [seed_path]})
+worker_b = IdSequence(state_path=state_path, block_size=3, seed_files={"product": [seed_path]})
+
+ids = [worker_a.next_id("product"), worker_b.next_id("product"), worker_a.next_id("product")]
+print(f"할당된 ID: {ids}")
+assert ids == [10, 13, 11]
+
+# 롤백된 마지막 ID는 다시 사용
+worker_a.unget("product", 11)
+assert worker_a.next_id("product") == 11
+
+# worker_b 뒤로 예약한 워커가 없으므로 남은 ID(14, 15) 반납
+worker_a.release()
+worker_b.release()
+assert worker_a.peek("product") == 14
+
+# 상태 파일이 없으면 압축 전 저널까지 포함해 시작값을 정하고, 미러 파일에 다음 예약 시작 ID를 기록
+journal_path = os.path.join(work_dir, "brand_data.json.journal")
+with open(journal_path, "w", encoding="utf-8") as f:
+    f.write('{"name": "새브랜드", "id": 268}\n')
+mirror_path = os.path.join(work_dir, "detailinfo_data.json")
+sequence = IdSequence(state_path=os.path.join(work_dir, "fresh_sequence.json"), block_size=5,
+                      seed_files={"brand": [seed_path, journal_path], "detailinfo": [mirror_path]},
+                      mirror_files={"detailinfo": mirror_path})
+assert sequence.next_id("brand") == 269
+assert sequence.next_id("detailinfo") == 1
+with open(mirror_path, "r", encoding="utf-8") as f:
+    assert json.load(f) == {"last_id": 5, "next_id": 6}
+
+# 상태 파일을 지워도 미러 파일 덕분에 이미 예약한 ID를 다시 발급하지 않음
+os.remove(os.path.join(work_dir, "fresh_sequence.json"))
+restarted = IdSequence(state_path=os.path.join(work_dir, "fresh_sequence.json"), block_size=5,
+                       seed_files={"detailinfo": [mirror_path]}, mirror_files={"detailinfo": mirror_path})
+assert restarted.next_id("detailinfo") == 6
+
+# skip_to 이후에는 min_id 이상만 발급
+restarted.skip_to("detailinfo", 20)
+assert restarted.next_id("detailinfo") == 20
+print("ID 시퀀스 테스트 통과")
@@ -0,0 +1,189 @@
+"""
+경량 페이지 로드 프로필 모듈
+상세 페이지에서 필요한 것은 이미지 "URL"(속성 값)이지 이미지 파일이 아니므로,
+CDP Network.setBlockedURLs로 이미지/폰트/미디어 다운로드와 외부 트래커 스크립트를 차단합니다.
+
+- 자사 스크립트와 CSS는 차단하지 않음 (swiper 캐러셀, 옵션 드롭다운, 제공고시 아코디언 렌더링에 필요)
+- 차단된 이미지도 src / data-src 속성은 그대로 바뀌고, img.complete는 true가 되므로 기존 대기 조건이 그대로 동작
+- 페이지마다 Resource Timing으로 전송량을 측정하고, 차단 없이 한 번 불러온 기준 페이지와 비교해 절약량을 보고
+  (Timing-Allow-Origin이 없는 외부 리소스의 전송량은 0으로 집계되므로 측정 가능한 범위의 값)
+- 기준 페이지 측정은 차단 없는 페이지 로드가 프로세스마다 추가되므로 기본으로 하지 않음
+  (절약량을 확인할 때만 BASELINE_PAGES를 1 이상으로 설정)
+
+사용 예:
+    LEAN_PROFILE.apply(driver)
+    LEAN_PROFILE.measure_baseline(driver, detail_url)  # 선택 (절약량 보고용)
+    ...
+    LEAN_PROFILE.report()
+"""
+
+import weakref
+
+from wait_engine import wait_for, document_ready
+
+# 차단할 URL 패턴 (Network.setBlockedURLs 형식, *는 임의 문자열)
+BLOCKED_IMAGE_PATTERNS = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.bmp*", "*.ico*"]
+BLOCKED_FONT_PATTERNS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+BLOCKED_MEDIA_PATTERNS = ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"]
+BLOCKED_TRACKER_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googleadservices.com*",
+    "*facebook.net*", "*connect.facebook.*", "*analytics.tiktok.com*", "*criteo.*", "*amplitude.com*",
+    "*wcs.naver.net*", "*clarity.ms*", "*hotjar.com*", "*braze.com*", "*appsflyer.com*", "*airbridge.io*",
+]
+
+LEAN_BLOCKED_URL_PATTERNS = (BLOCKED_IMAGE_PATTERNS + BLOCKED_FONT_PATTERNS + BLOCKED_MEDIA_PATTERNS
+                             + BLOCKED_TRACKER_PATTERNS)
+
+# 차단 없이 불러와 기준 전송량을 잴 페이지 수 (프로세스마다, 0이면 측정하지 않음)
+BASELINE_PAGES = 0
+
+# Resource Timing 버퍼 크기 (기본 250개는 상세 페이지 리소스 수보다 작음)
+RESOURCE_TIMING_BUFFER_SIZE = 3000
+
+_RESOURCE_BUFFER_SCRIPT = f"performance.setResourceTimingBufferSize({RESOURCE_TIMING_BUFFER_SIZE});"
+
+# 현재 페이지의 전송량 / 요청 수를 읽는 스크립트
+_PAGE_TRANSFER_SCRIPT = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) { bytes += entries[i].transferSize || 0; }
+return {bytes: bytes, requests: entries.length};
+"""
+
+
+class LeanProfile:
+    """
+    리소스 차단 프로필
+    적용한 드라이버의 페이지 전송량을 기록하고, 기준(차단 없음) 대비 절약량을 보고합니다.
+    """
+
+    def __init__(self, patterns=None, baseline_pages=BASELINE_PAGES):
+        """
+        Args:
+            patterns: 차단할 URL 패턴 목록 (None이면 LEAN_BLOCKED_URL_PATTERNS)
+            baseline_pages: 차단 없이 불러와 기준 전송량을 잴 페이지 수 (0이면 측정하지 않음)
+        """
+        self.patterns = list(patterns if patterns is not None else LEAN_BLOCKED_URL_PATTERNS)
+        self.baseline_pages_limit = baseline_pages
+        self.drivers = weakref.WeakSet()  # 프로필을 적용한 드라이버
+        self.baseline_attempts = 0  # 기준 전송량 측정 시도 수 (실패 포함)
+
+        # 통계
+        self.pages = 0
+        self.total_bytes = 0
+        self.total_requests = 0
+        self.baseline_pages = 0
+        self.baseline_bytes = 0
+        self.baseline_requests = 0
+
+    def apply(self, driver):
+        """
+        드라이버에 차단 목록을 적용합니다. (이후 모든 페이지 로드에 적용)
+
+        Args:
+            driver: Chromium 계열 WebDriver (execute_cdp_cmd 지원)
+
+        Returns:
+            bool: 적용 여부 (CDP를 지원하지 않으면 False, 차단 없이 계속 진행)
+        """
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _RESOURCE_BUFFER_SCRIPT})
+        except Exception as e:
+            print(f"[LeanProfile] ⚠ 리소스 차단 적용 실패, 전체 리소스를 불러옵니다: {e}")
+            return False
+
+        self.drivers.add(driver)
+        print(f"[LeanProfile] ✓ 리소스 차단 적용 (패턴 {len(self.patterns)}개)")
+        return True
+
+    def _set_blocked(self, driver, patterns):
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def _page_transfer(self, driver):
+        result = driver.execute_script(_PAGE_TRANSFER_SCRIPT) or {}
+        return int(result.get("bytes") or 0), int(result.get("requests") or 0)
+
+    def measure(self, driver, label=None):
+        """
+        현재 페이지의 전송량을 기록합니다. (페이지 로드가 끝난 뒤 호출, 프로필을 적용한 드라이버만)
+
+        Args:
+            driver: WebDriver
+            label: 로그에 표시할 이름 (None이면 로그 없음)
+
+        Returns:
+            int or None: 현재 페이지 전송량 (바이트)
+        """
+        if driver not in self.drivers:
+            return None
+
+        try:
+            page_bytes, requests = self._page_transfer(driver)
+        except Exception:
+            return None
+
+        self.pages += 1
+        self.total_bytes += page_bytes
+        self.total_requests += requests
+
+        if label and self.baseline_pages:
+            saved = self.baseline_bytes / self.baseline_pages - page_bytes
+            print(f"[LeanProfile] {label}: 전송 {page_bytes / 1024:.0f}KB, 요청 {requests}개 "
+                  f"(기준 대비 {saved / 1024:.0f}KB 절약)")
+        return page_bytes
+
+    def needs_baseline(self, driver):
+        """기준 전송량 측정을 아직 baseline_pages만큼 시도하지 않았으면 True (실패한 시도도 셈)"""
+        return driver in self.drivers and self.baseline_attempts < self.baseline_pages_limit
+
+    def measure_baseline(self, driver, url, timeout=30):
+        """
+        차단 없이 페이지를 한 번 불러와 기준 전송량을 기록합니다. (절약량 계산용, 추가 페이지 로드 1회)
+
+        Args:
+            driver: 프로필을 적용한 WebDriver
+            url: 기준으로 삼을 페이지 URL (상세 페이지 권장)
+            timeout: 페이지 로드 대기 최대 시간 (초)
+        """
+        if driver not in self.drivers:
+            return
+
+        # 실패해도 시도한 것으로 기록 (실패할 때마다 차단 없는 페이지 로드를 반복하지 않도록)
+        self.baseline_attempts += 1
+        try:
+            self._set_blocked(driver, [])
+            driver.get(url)
+            wait_for(driver, "lean.baseline", document_ready(), timeout=timeout, adaptive=False)
+            page_bytes, requests = self._page_transfer(driver)
+            self.baseline_pages += 1
+            self.baseline_bytes += page_bytes
+            self.baseline_requests += requests
+            print(f"[LeanProfile] 기준 페이지(차단 없음): 전송 {page_bytes / 1024:.0f}KB, 요청 {requests}개")
+        except Exception as e:
+            print(f"[LeanProfile] ⚠ 기준 전송량 측정 실패: {e}")
+        finally:
+            try:
+                self._set_blocked(driver, self.patterns)
+            except Exception:
+                pass
+
+    def report(self):
+        """페이지당 평균 전송량과 절약량을 출력합니다."""
+        if not self.pages:
+            return
+
+        average = self.total_bytes / self.pages
+        print(f"\n[LeanProfile] 페이지 {self.pages}개, 평균 전송 {average / 1024:.0f}KB, "
+              f"평균 요청 {self.total_requests / self.pages:.0f}개")
+        if self.baseline_pages:
+            baseline = self.baseline_bytes / self.baseline_pages
+            saved = baseline - average
+            ratio = saved / baseline * 100 if baseline else 0
+            print(f"[LeanProfile] 기준 {baseline / 1024:.0f}KB 대비 페이지당 {saved / 1024:.0f}KB 절약 "
+                  f"({ratio:.0f}%), 전체 약 {saved * self.pages / (1024 * 1024):.1f}MB 절약")
+
+
+# 기본 경량 프로필 (드라이버 생성 시 적용, crawl.open_detail_page에서 측정)
+LEAN_PROFILE = LeanProfile()
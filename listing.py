@@ -0,0 +1,200 @@
+"""
+상품 목록 페이지 모듈
+목록 페이지를 한 번만 읽어 모든 상품의 상세 페이지 URL(goodsNo)을 수집합니다.
+상품마다 클릭 → 뒤로가기(목록 재로딩)를 반복하지 않고, 수집한 URL로 상세 페이지에 바로 접속합니다.
+"""
+
+import math
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 목록 한 페이지 상품 수로 사이트가 허용하는 값 (목록의 "N개씩 보기" 선택지) / 기본 요청 값
+# 한 페이지에 더 많이 받으면 같은 상품 수를 더 적은 목록 페이지 로드로 수집
+LISTING_ROWS_PER_PAGE_CHOICES = (24, 36, 48)
+LISTING_ROWS_PER_PAGE = 48
+
+# 목록 한 줄(ul)의 상품 수
+LISTING_PRODUCTS_PER_ROW = 4
+
+# 카테고리 목록 페이지 URL (dispCatNo: 올리브영 카테고리 번호, 인기순)
+LISTING_URL_TEMPLATE = ("https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo={disp_cat_no}"
+                        "&fltDispCatNo=&prdSort=01&pageIdx=1&rowsPerPage={rows_per_page}&searchTypeSort=btn_thumb"
+                        "&plusButtonFlag=N&isLoginCnt=0&aShowCnt=0&bShowCnt=0&cShowCnt=0")
+
+# 목록의 현재 페이지 번호 요소 / 페이지 번호 링크 영역
+CURRENT_PAGE_XPATH = '//*[@id="Container"]/div[2]/strong[@title="현재 페이지"]'
+PAGINATION_XPATH = '//*[@id="Container"]/div[2]'
+
+# 다음 페이지 링크(페이지 번호 또는 "다음 10 페이지")가 있는지 확인하는 스크립트
+# (arguments[0]: PAGINATION_XPATH, arguments[1]: 다음 페이지 번호)
+NEXT_PAGE_SCRIPT = """
+var container = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!container) { return false; }
+return !!(container.querySelector('a[data-page-no="' + arguments[1] + '"]') || container.querySelector('a.next'));
+"""
+
+# 상세 페이지 URL
+DETAIL_URL_TEMPLATE = "https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}"
+
+# 상품 URL에서 상품 번호(goodsNo)를 찾는 정규식
+GOODS_NO_PATTERN = re.compile(r"goodsNo=([A-Za-z0-9]+)")
+
+# 목록의 상품 링크 (ul[2]부터 상품 줄 수만큼 각 행의 li/div/a, 24개씩 보기면 ul[7]까지)
+PRODUCT_LINK_XPATH_TEMPLATE = '//*[@id="Contents"]/ul[position() >= 2 and position() <= {last_row}]/li/div/a'
+
+# 목록 상품 카드 안의 상품명 (상세 페이지를 열기 전에 수집 완료 여부를 상품명으로 확인할 때 사용)
+LISTING_NAME_SELECTOR = ".tx_name"
+
+# 목록의 상품 링크 정보를 한 번에 읽는 스크립트 (arguments[0]: product_link_xpath(), arguments[1]: LISTING_NAME_SELECTOR)
+HARVEST_SCRIPT = """
+var snapshot = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var links = [];
+for (var i = 0; i < snapshot.snapshotLength; i++) {
+    var a = snapshot.snapshotItem(i);
+    var card = a.closest('li');
+    var nameElement = card ? card.querySelector(arguments[1]) : null;
+    links.push({
+        href: a.href || '',
+        goods_no: a.getAttribute('data-ref-goodsno') || a.getAttribute('data-ref-goodsNo') || '',
+        name: (nameElement && nameElement.textContent.trim()) || a.getAttribute('title') || (a.textContent || '').trim()
+    });
+}
+return links;
+"""
+
+
+def extract_goods_no(url):
+    """
+    URL에서 상품 번호(goodsNo)를 추출합니다.
+
+    Args:
+        url: 상세 페이지 URL
+
+    Returns:
+        str or None: 상품 번호
+    """
+    match = GOODS_NO_PATTERN.search(url or "")
+    return match.group(1) if match else None
+
+
+def build_detail_url(goods_no):
+    """상품 번호로 상세 페이지 URL을 만듭니다."""
+    return DETAIL_URL_TEMPLATE.format(goods_no=goods_no)
+
+
+def product_link_xpath(rows_per_page=LISTING_ROWS_PER_PAGE):
+    """한 페이지 상품 수에 맞는 상품 링크 XPath (24개면 ul[2]~ul[7])"""
+    return PRODUCT_LINK_XPATH_TEMPLATE.format(last_row=1 + math.ceil(rows_per_page / LISTING_PRODUCTS_PER_ROW))
+
+
+def allowed_rows_per_page(rows_per_page):
+    """
+    사이트가 허용하는 한 페이지 상품 수 중 rows_per_page 이하에서 가장 큰 값 (허용 값보다 작으면 가장 작은 값)
+    """
+    allowed = [rows for rows in LISTING_ROWS_PER_PAGE_CHOICES if rows <= rows_per_page]
+    return max(allowed) if allowed else min(LISTING_ROWS_PER_PAGE_CHOICES)
+
+
+def build_listing_url(disp_cat_no, page=1, rows_per_page=LISTING_ROWS_PER_PAGE):
+    """카테고리 번호(dispCatNo)로 목록 페이지 URL을 만듭니다."""
+    url = LISTING_URL_TEMPLATE.format(disp_cat_no=disp_cat_no, rows_per_page=allowed_rows_per_page(rows_per_page))
+    return build_listing_page_url(url, page) if page > 1 else url
+
+
+def listing_has_next_page(driver, page):
+    """
+    현재 목록 페이지(page)에 다음 페이지 링크가 있는지 스크립트 1회 실행으로 확인합니다.
+
+    Args:
+        driver: Selenium WebDriver
+        page: 현재 페이지 번호
+
+    Returns:
+        bool: 다음 페이지 존재 여부
+    """
+    return bool(driver.execute_script(NEXT_PAGE_SCRIPT, PAGINATION_XPATH, page + 1))
+
+
+def build_listing_page_url(url, page):
+    """
+    목록 URL의 페이지 번호(pageIdx)를 바꾼 URL을 만듭니다. (나머지 파라미터와 순서는 유지)
+
+    Args:
+        url: 목록 페이지 URL
+        page: 페이지 번호 (1부터)
+
+    Returns:
+        str: 해당 페이지의 목록 URL
+    """
+    return _set_query_param(url, "pageIdx", page)
+
+
+def set_rows_per_page(url, rows_per_page=LISTING_ROWS_PER_PAGE):
+    """
+    목록 URL의 한 페이지 상품 수(rowsPerPage)를 허용되는 값으로 바꾼 URL을 만듭니다.
+
+    Args:
+        url: 목록 페이지 URL
+        rows_per_page: 원하는 한 페이지 상품 수 (허용 값이 아니면 그 이하의 가장 큰 허용 값)
+
+    Returns:
+        str: 목록 URL
+    """
+    return _set_query_param(url, "rowsPerPage", allowed_rows_per_page(rows_per_page))
+
+
+def get_rows_per_page(url):
+    """목록 URL의 한 페이지 상품 수 (없거나 숫자가 아니면 사이트 기본값 24)"""
+    value = dict(parse_qsl(urlsplit(url).query)).get("rowsPerPage", "")
+    return int(value) if value.isdigit() else min(LISTING_ROWS_PER_PAGE_CHOICES)
+
+
+def _set_query_param(url, name, value):
+    """URL 쿼리 파라미터 하나를 바꾸거나 추가합니다. (나머지 파라미터와 순서는 유지)"""
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    if any(key == name for key, _ in params):
+        params = [(key, str(value) if key == name else v) for key, v in params]
+    else:
+        params.append((name, str(value)))
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
+def harvest_product_links(driver, max_products=0, rows_per_page=min(LISTING_ROWS_PER_PAGE_CHOICES)):
+    """
+    현재 목록 페이지의 모든 상품 링크를 스크립트 1회 실행으로 수집합니다.
+
+    Args:
+        driver: Selenium WebDriver
+        max_products: 최대 수집 수 (0이면 모두)
+        rows_per_page: 목록 URL의 한 페이지 상품 수 (get_rows_per_page, 상품 링크를 찾을 줄 수 결정)
+
+    Returns:
+        list of dict: [{"goods_no", "url", "name"}, ...] (목록 순서, 같은 상품은 한 번만)
+    """
+    links = []
+    seen = set()
+
+    for item in driver.execute_script(HARVEST_SCRIPT, product_link_xpath(rows_per_page), LISTING_NAME_SELECTOR) or []:
+        href = item.get("href") or ""
+        goods_no = item.get("goods_no") or extract_goods_no(href)
+
+        # javascript: 링크 등은 상품 번호로 상세 URL을 만듦
+        if goods_no:
+            url = href if href.startswith("http") and extract_goods_no(href) == goods_no else build_detail_url(goods_no)
+        elif href.startswith("http"):
+            url = href
+        else:
+            print(f"⚠ 상세 페이지 URL을 알 수 없는 상품 링크: {item}")
+            continue
+
+        key = goods_no or url
+        if key in seen:
+            continue
+        seen.add(key)
+
+        links.append({"goods_no": goods_no, "url": url, "name": (item.get("name") or "").strip()})
+        if max_products > 0 and len(links) >= max_products:
+            break
+
+    return links
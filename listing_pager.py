@@ -0,0 +1,180 @@
+"""
+목록 페이지 URL 순회 모듈
+페이지 번호 링크를 클릭하고 번호가 바뀌기를 기다리는 대신, pageIdx를 바꾼 URL로 목록 페이지를 바로 엽니다.
+
+- 한 페이지 상품 수(rowsPerPage)는 사이트가 허용하는 가장 큰 값으로 요청 (listing.LISTING_ROWS_PER_PAGE)
+- 다음 목록 페이지 몇 개를 새 탭에 미리 열어 두어, 현재 페이지의 상품을 처리하는 동안 백그라운드에서 로드
+  (다음 페이지 차례가 되면 이미 로드된 탭에서 링크만 읽고 탭을 닫음)
+- 표시된 페이지 번호가 요청한 번호보다 작으면(마지막 페이지를 넘겨 마지막 페이지가 표시된 경우) 목록 끝으로 판단
+  번호를 읽지 못했거나 1페이지로 돌아간 경우 등 나머지 불일치는 오류로 처리 (목록을 끝난 것으로 기록하지 않음)
+
+사용 예:
+    pager = ListingPager(driver, set_rows_per_page(start_url), first_page=1)
+    for page, links in pager:
+        ...
+    if pager.listing_done:
+        frontier.finish_listing()
+"""
+
+from selenium.webdriver.common.by import By
+
+from listing import (harvest_product_links, build_listing_page_url, get_rows_per_page, listing_has_next_page,
+                     CURRENT_PAGE_XPATH)
+from wait_engine import wait_for, element_present
+
+# 미리 열어 둘 다음 목록 페이지 탭 수
+LISTING_PREFETCH_TABS = 2
+
+# 새 탭에서 목록 페이지를 여는 스크립트 (arguments[0]: URL)
+OPEN_TAB_SCRIPT = "window.open(arguments[0], '_blank');"
+
+
+def read_listing_page(driver, page, rows_per_page, first=False):
+    """
+    현재 창에 표시된 목록 페이지가 page인지 확인하고 상품 링크를 수집합니다.
+
+    Args:
+        driver: 웹드라이버
+        page: 기대하는 페이지 번호
+        rows_per_page: 목록 URL의 한 페이지 상품 수
+        first: True면 Cloudflare 확인 통과까지 기다림 (첫 목록 페이지)
+
+    Returns:
+        tuple or None: (링크 리스트, 다음 페이지 존재 여부), 마지막 페이지를 넘긴 경우 None (목록 끝)
+
+    Raises:
+        RuntimeError: 목록 페이지가 표시되지 않았거나, 목록 끝이 아닌데 다른 페이지가 표시된 경우
+    """
+    # 페이지 로드는 적응형 타임아웃 미사용 (Cloudflare 확인 시간은 매번 다르고, 줄인 타임아웃은 목록 누락으로 이어짐)
+    if first:
+        loaded = wait_for(driver, "listing.cloudflare", element_present(By.XPATH, CURRENT_PAGE_XPATH),
+                          timeout=30, budget=10, adaptive=False)
+    else:
+        loaded = wait_for(driver, "listing.page", element_present(By.XPATH, CURRENT_PAGE_XPATH),
+                          timeout=15, budget=3, adaptive=False)
+    if not loaded:
+        raise RuntimeError(f"목록 {page}페이지가 표시되지 않았습니다.")
+
+    # 마지막 페이지를 넘기면 사이트가 마지막 페이지를 보여주므로 표시된 페이지 번호로 확인
+    shown_page = driver.find_element(By.XPATH, CURRENT_PAGE_XPATH).text.strip()
+    if shown_page != str(page):
+        if is_past_last_page(shown_page, page):
+            print(f"[ListingPager] {page}페이지 대신 {shown_page}페이지가 표시됨 → 목록 끝")
+            return None
+        raise RuntimeError(f"목록 {page}페이지 대신 '{shown_page}'페이지가 표시되었습니다.")
+
+    links = harvest_product_links(driver, rows_per_page=rows_per_page)
+    return links, listing_has_next_page(driver, page)
+
+
+def is_past_last_page(shown_page, page):
+    """
+    page를 요청했을 때 shown_page가 표시된 것이 마지막 페이지를 넘긴 경우인지 확인합니다.
+    (표시된 번호가 숫자이고 요청한 번호보다 작을 때만, 단 1페이지로 돌아간 것은 2페이지 요청일 때만 목록 끝)
+    """
+    if not shown_page.isdigit():
+        return False
+    shown = int(shown_page)
+    return shown < page and (shown > 1 or page == 2)
+
+
+class ListingPager:
+    """
+    목록 페이지를 URL로 순회하는 반복자 ((페이지 번호, 링크 리스트)를 차례로 반환)
+    """
+
+    def __init__(self, driver, start_url, first_page=1, prefetch_tabs=LISTING_PREFETCH_TABS):
+        """
+        Args:
+            driver: 웹드라이버 (목록을 읽은 뒤 원래 창으로 돌아오므로 상세 페이지 크롤링에 같이 사용해도 됨)
+            start_url: 목록 URL (pageIdx만 바꿔 각 페이지를 엶)
+            first_page: 시작 페이지 번호
+            prefetch_tabs: 미리 열어 둘 다음 페이지 탭 수 (0이면 현재 창에서 차례로 엶)
+        """
+        self.driver = driver
+        self.start_url = start_url
+        self.first_page = first_page
+        self.prefetch_tabs = max(0, prefetch_tabs)
+        self.rows_per_page = get_rows_per_page(start_url)
+
+        self.main_window = None
+        self.tabs = {}  # {페이지 번호: 미리 연 탭 핸들}
+        self.listing_done = False
+
+        # 통계
+        self.pages = 0
+        self.prefetched = 0
+
+    def page_url(self, page):
+        return build_listing_page_url(self.start_url, page)
+
+    def _open_tab(self, page):
+        """다음 페이지를 새 탭에서 엽니다. (현재 창은 바뀌지 않음)"""
+        handles = set(self.driver.window_handles)
+        self.driver.execute_script(OPEN_TAB_SCRIPT, self.page_url(page))
+        new_handles = [handle for handle in self.driver.window_handles if handle not in handles]
+        if new_handles:
+            self.tabs[page] = new_handles[0]
+
+    def _prefetch_after(self, page):
+        """page 다음 페이지들 중 아직 열지 않은 페이지를 탭으로 엽니다."""
+        for next_page in range(page + 1, page + 1 + self.prefetch_tabs):
+            if next_page not in self.tabs:
+                self._open_tab(next_page)
+
+    def _read(self, page):
+        """page를 미리 연 탭 또는 현재 창에서 읽습니다. (탭은 읽은 뒤 닫고 원래 창으로 돌아옴)"""
+        handle = self.tabs.pop(page, None)
+        if handle is None:
+            self.driver.get(self.page_url(page))
+            return read_listing_page(self.driver, page, self.rows_per_page, first=self.pages == 0)
+
+        self.prefetched += 1
+        self.driver.switch_to.window(handle)
+        try:
+            return read_listing_page(self.driver, page, self.rows_per_page, first=self.pages == 0)
+        finally:
+            self.driver.close()
+            self.driver.switch_to.window(self.main_window)
+
+    def __iter__(self):
+        self.main_window = self.driver.current_window_handle
+        page = self.first_page
+        try:
+            while True:
+                result = self._read(page)
+                if result is None:
+                    self.listing_done = True
+                    return
+
+                links, has_next = result
+                self.pages += 1
+                if has_next:
+                    # 현재 페이지의 상품을 처리하는 동안 다음 페이지들을 백그라운드 탭에서 로드
+                    self._prefetch_after(page)
+                else:
+                    self.listing_done = True
+
+                print(f"[ListingPager] 목록 {page}페이지: 상품 링크 {len(links)}개 "
+                      f"(한 페이지 {self.rows_per_page}개, 미리 연 탭 {len(self.tabs)}개)")
+                yield page, links
+
+                if not has_next:
+                    return
+                page += 1
+        finally:
+            self.close()
+
+    def close(self):
+        """남은 탭을 닫고 원래 창으로 돌아옵니다."""
+        if not self.tabs:
+            return
+        for handle in self.tabs.values():
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception as e:
+                print(f"[ListingPager] ⚠ 탭 닫기 실패: {e}")
+        self.tabs = {}
+        if self.main_window:
+            self.driver.switch_to.window(self.main_window)
@@ -0,0 +1,110 @@
+from urllib.parse import urlsplit, parse_qsl
+from listing import (build_listing_url, set_rows_per_page, get_rows_per_page, product_link_xpath, HARVEST_SCRIPT,
+                     NEXT_PAGE_SCRIPT, LISTING_ROWS_PER_PAGE)
+from listing_pager import ListingPager, OPEN_TAB_SCRIPT, is_past_last_page
+
+# 한 페이지 상품 수는 허용 값 중 요청 이하의 가장 큰 값 (상품 줄 수에 맞춰 링크 XPath 결정)
+url = "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo=100000100020001&pageIdx=1&rowsPerPage=24"
+assert get_rows_per_page(set_rows_per_page(url, 40)) == 36
+assert get_rows_per_page(set_rows_per_page(url, 10)) == 24
+assert get_rows_per_page(build_listing_url("100000100020001")) == LISTING_ROWS_PER_PAGE
+assert "position() <= 7]" in product_link_xpath(24) and "position() <= 13]" in product_link_xpath(48)
+
+LAST_PAGE = 4
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.windows
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """창(탭)마다 URL을 가진 가짜 드라이버 (마지막 페이지를 넘기면 마지막 페이지를 표시)"""
+
+    def __init__(self):
+        self.windows = {"main": None}
+        self.current_window_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.gets = []
+        self.tabs_opened = 0
+        self.harvest_xpaths = set()
+
+    @property
+    def window_handles(self):
+        return list(self.windows)
+
+    def _page(self):
+        return min(int(dict(parse_qsl(urlsplit(self.windows[self.current_window_handle]).query))["pageIdx"]), LAST_PAGE)
+
+    def get(self, url):
+        self.gets.append(url)
+        self.windows[self.current_window_handle] = url
+
+    def close(self):
+        del self.windows[self.current_window_handle]
+
+    def find_elements(self, by, selector):
+        return [FakeElement(str(self._page()))]
+
+    def find_element(self, by, selector):
+        return self.find_elements(by, selector)[0]
+
+    def execute_script(self, script, *args):
+        if script == OPEN_TAB_SCRIPT:
+            self.tabs_opened += 1
+            self.windows[f"tab{self.tabs_opened}"] = args[0]
+        elif script == NEXT_PAGE_SCRIPT:
+            return args[1] <= LAST_PAGE
+        elif script == HARVEST_SCRIPT:
+            self.harvest_xpaths.add(args[0])
+            page = self._page()
+            return [{"href": "", "goods_no": f"P{page}_{i}", "name": f"상품 {page}-{i}"} for i in range(2)]
+
+
+# 첫 페이지만 현재 창에서 열고, 나머지는 미리 연 탭에서 읽은 뒤 탭을 닫음
+driver = FakeDriver()
+start_url = set_rows_per_page(url, 48)
+pager = ListingPager(driver, start_url, first_page=1, prefetch_tabs=2)
+pages = [(page, [link["goods_no"] for link in links]) for page, links in pager]
+assert [page for page, _ in pages] == [1, 2, 3, 4]
+assert pages[1][1] == ["P2_0", "P2_1"]
+assert len(driver.gets) == 1 and pager.prefetched == 3
+assert pager.listing_done
+assert driver.window_handles == ["main"] and driver.current_window_handle == "main"
+assert driver.harvest_xpaths == {product_link_xpath(48)}
+
+# 마지막 페이지 다음부터 시작하면 표시된 페이지 번호가 달라 목록 끝으로 판단
+driver = FakeDriver()
+pager = ListingPager(driver, start_url, first_page=LAST_PAGE + 1)
+assert list(pager) == [] and pager.listing_done
+
+# 표시된 번호가 숫자이고 요청보다 작을 때만 목록 끝 (빈 텍스트, 1페이지로 돌아간 경우는 오류로 다시 시도)
+assert is_past_last_page("4", 5) and is_past_last_page("1", 2)
+assert not is_past_last_page("", 5) and not is_past_last_page("1", 5) and not is_past_last_page("6", 5)
+
+driver = FakeDriver()
+driver.find_elements = lambda by, selector: [FakeElement("")]
+try:
+    list(ListingPager(driver, start_url, first_page=3))
+    assert False, "페이지 번호를 읽지 못하면 오류"
+except RuntimeError:
+    pass
+
+# 중간에 멈추면 미리 연 탭을 닫음
+driver = FakeDriver()
+pager = ListingPager(driver, start_url, first_page=1, prefetch_tabs=2)
+for page, links in pager:
+    break
+pager.close()
+assert driver.window_handles == ["main"] and not pager.listing_done
+
+print("목록 페이지 URL 순회 테스트 통과")
@@ -8,6 +8,72 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 from typing import List
 import re
+from wait_engine import wait_for, attribute_changes
+
+# 메인 이미지 캐러셀의 슬라이드
+CAROUSEL_SLIDE_SELECTOR = "div.GoodsDetailCarousel_visual-container__1kSZN .swiper-slide"
+
+# 이미지 요소의 URL을 읽는 스크립트 함수 (src가 없거나 data: 자리표시자면 data-src)
+# detail_bundle, network_capture 스크립트도 이 함수를 그대로 사용 (오프라인 추출은 pick_image_src)
+IMAGE_SRC_JS = """
+function imageSrc(img) {
+    if (!img) { return null; }
+    var src = img.getAttribute('src');
+    if (!src || src.indexOf('data:') === 0) { src = img.getAttribute('data-src'); }
+    return src || null;
+}
+"""
+
+# 캐러셀 슬라이드의 이미지 URL을 슬라이드 순서대로 읽는 스크립트 함수 (오프라인 추출은 order_slide_sources)
+# loop 모드의 복제 슬라이드는 data-swiper-slide-index가 같으므로 인덱스로 중복 제거 후 인덱스 순으로 정렬
+CAROUSEL_SLIDES_JS = IMAGE_SRC_JS + """
+function readSlideSources(selector) {
+    var slides = {};
+    Array.prototype.forEach.call(document.querySelectorAll(selector), function (slide, position) {
+        var index = slide.getAttribute('data-swiper-slide-index');
+        index = /^[0-9]+$/.test(index || '') ? Number(index) : position;
+        var src = imageSrc(slide.querySelector('img'));
+        if (src && !slides.hasOwnProperty(index)) { slides[index] = src; }
+    });
+    return Object.keys(slides).map(Number).sort(function (a, b) { return a - b; })
+        .map(function (index) { return slides[index]; });
+}
+"""
+
+# 캐러셀의 모든 슬라이드를 한 번에 읽는 스크립트 (arguments[0]: CAROUSEL_SLIDE_SELECTOR)
+CAROUSEL_SLIDES_SCRIPT = CAROUSEL_SLIDES_JS + "return readSlideSources(arguments[0]);"
+
+
+def pick_image_src(src, data_src):
+    """
+    이미지 요소의 URL을 고릅니다. (IMAGE_SRC_JS와 같은 규칙)
+    src가 없거나 data: 자리표시자(지연 로딩 전)면 data-src를 사용합니다.
+
+    Returns:
+        str or None: 이미지 URL
+    """
+    if not src or src.startswith('data:'):
+        src = data_src
+    return src or None
+
+
+def order_slide_sources(slides):
+    """
+    캐러셀 슬라이드의 이미지 URL을 슬라이드 순서로 정리합니다. (CAROUSEL_SLIDES_JS와 같은 규칙)
+    loop 모드의 복제 슬라이드는 data-swiper-slide-index가 같으므로 인덱스별 첫 URL만 남기고 인덱스 순으로 정렬합니다.
+
+    Args:
+        slides: 문서 순서의 (data-swiper-slide-index 속성 값, 이미지 URL) 목록 (속성이 없으면 문서 순서를 인덱스로 사용)
+
+    Returns:
+        list: 이미지 URL 리스트
+    """
+    sources = {}
+    for position, (index, src) in enumerate(slides):
+        index = int(index) if index is not None and index.isdigit() else position
+        if src and index not in sources:
+            sources[index] = src
+    return [sources[index] for index in sorted(sources)]
 
 
 def clean_image_url(url: str) -> str:
@@ -52,25 +118,73 @@ def get_active_image_element(driver: WebDriver):
                     raise NoSuchElementException("활성 이미지 요소를 찾을 수 없습니다.")
 
 
-def wait_for_image_change(driver: WebDriver, previous_src: str, timeout: int = 5):
+def get_active_image_src(driver: WebDriver):
     """
-    이미지가 변경될 때까지 기다립니다.
+    현재 활성화된 슬라이드 이미지의 src(없거나 data: 자리표시자면 data-src)를 반환합니다. 로드 전이면 None
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            current_element = get_active_image_element(driver)
-            current_src = current_element.get_attribute('src') or current_element.get_attribute('data-src')
+    image_element = get_active_image_element(driver)
+    if not image_element.get_property('complete'):
+        return None
+    return pick_image_src(image_element.get_attribute('src'), image_element.get_attribute('data-src'))
+
+
+def wait_for_image_change(driver: WebDriver, previous_src: str, timeout: int = 5, budget: float = 0):
+    """
+    이미지가 변경(새 이미지 로드 완료)될 때까지 기다립니다.
+    """
+    def image_changed(d):
+        current_src = get_active_image_src(d)
+        return bool(current_src) and current_src != previous_src
+
+    return bool(wait_for(driver, "main_image.change", image_changed, timeout=timeout, budget=budget))
 
-            if current_src and current_src != previous_src:
-                return True
-        except:
-            pass
-        time.sleep(0.5)
-    return False
+
+def collect_carousel_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
+    """
+    캐러셀의 모든 슬라이드를 스크립트 1회 실행으로 읽어 메인 이미지 URL을 수집합니다. (클릭 없음)
+    복제 슬라이드는 data-swiper-slide-index로 중복 제거하고 인덱스 순으로 정렬합니다.
+
+    Args:
+        driver: Selenium WebDriver
+        num_images: 수집할 이미지 수 (0이면 모두)
+
+    Returns:
+        list: 정제된 이미지 URL 리스트 (슬라이드를 찾지 못하면 빈 리스트)
+    """
+    image_urls = []
+    for src in driver.execute_script(CAROUSEL_SLIDES_SCRIPT, CAROUSEL_SLIDE_SELECTOR) or []:
+        if src.startswith('//'):
+            src = 'https:' + src
+        if src.startswith('http'):
+            image_urls.append(clean_image_url(src))
+        if num_images > 0 and len(image_urls) >= num_images:
+            break
+    return image_urls
 
 
 def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
+    """
+    현재 상세 페이지에서 메인 이미지 슬라이더의 이미지 URL을 지정된 개수만큼 수집합니다.
+    모든 슬라이드를 한 번에 읽고(collect_carousel_image_urls), 실패하면 슬라이드를 하나씩 넘기며 수집합니다.
+    """
+    # 활성 슬라이드 이미지가 로드될 때까지 대기
+    wait_for(driver, "main_image.load", get_active_image_src, timeout=10, budget=4)
+
+    try:
+        image_urls = collect_carousel_image_urls(driver, num_images)
+    except Exception as e:
+        print(f"캐러셀 한 번에 읽기 실패: {e}")
+        image_urls = []
+
+    if image_urls:
+        print(f"메인 이미지 {len(image_urls)}개 수집 완료 (클릭 없음)")
+        return image_urls
+
+    print("캐러셀 슬라이드를 읽지 못해 슬라이드를 하나씩 넘기며 수집")
+    return get_main_image_urls_by_clicking(driver, num_images)
+
+
+def get_main_image_urls_by_clicking(driver: WebDriver, num_images: int = 3) -> List[str]:
     """
     현재 상세 페이지에서 메인 이미지 슬라이더의 이미지 URL을 지정된 개수만큼 수집합니다.
     swiper-slide-active 클래스를 사용하여 현재 보이는 이미지를 정확히 찾습니다.
@@ -79,7 +193,8 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
 
     # 상세 페이지 로딩 대기
     print(f"이미지 URL 수집 시작... (목표: {num_images}개)")
-    time.sleep(4)  # 페이지 로딩을 위한 충분한 대기
+    # 활성 슬라이드 이미지가 로드될 때까지 대기
+    wait_for(driver, "main_image.load", get_active_image_src, timeout=10, budget=4)
 
     # 먼저 첫 번째 이미지(인덱스 0)로 이동 시도
     try:
@@ -88,12 +203,21 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
         prev_button = driver.find_element(By.CSS_SELECTOR, '.swiper-button-prev')
         for _ in range(10):  # 최대 10번 클릭
             try:
+                active_slide = driver.find_element(By.CSS_SELECTOR, '.swiper-slide-active')
+                previous_index = active_slide.get_attribute('data-swiper-slide-index')
+                if previous_index == '0':
+                    print("첫 번째 이미지(인덱스 0)로 이동 성공")
+                    break
+
                 driver.execute_script("arguments[0].click();", prev_button)
-                time.sleep(0.5)
 
-                # 현재 활성 슬라이드 인덱스 확인
-                active_slide = driver.find_element(By.CSS_SELECTOR, '.swiper-slide-active')
-                slide_index = active_slide.get_attribute('data-swiper-slide-index')
+                # 활성 슬라이드 인덱스가 바뀔 때까지 대기
+                slide_index = wait_for(
+                    driver, "main_image.slide",
+                    attribute_changes(By.CSS_SELECTOR, '.swiper-slide-active', 'data-swiper-slide-index',
+                                      previous_index),
+                    timeout=2, budget=0.5
+                )
                 if slide_index == '0':
                     print("첫 번째 이미지(인덱스 0)로 이동 성공")
                     break
@@ -118,11 +242,8 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
                 print("  슬라이드 인덱스 확인 불가")
 
             # 2. 이미지 URL 가져오기
-            img_src = image_element.get_attribute('src')
-
-            # src가 없는 경우 data-src 확인 (lazy loading)
-            if not img_src:
-                img_src = image_element.get_attribute('data-src')
+            # src가 없거나 data: 자리표시자면 data-src 사용 (lazy loading)
+            img_src = pick_image_src(image_element.get_attribute('src'), image_element.get_attribute('data-src'))
 
             # alt 속성에서도 URL 가져오기 (백업)
             if not img_src:
@@ -166,22 +287,19 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
                     driver.execute_script("arguments[0].click();", next_button)
                     print("  다음 버튼 클릭")
 
-                    # 이미지 변경 대기
-                    if wait_for_image_change(driver, previous_src, 3):
+                    # 이미지 변경 대기 (새 이미지 로드 완료까지 확인하므로 추가 대기 불필요)
+                    if wait_for_image_change(driver, previous_src, 3, budget=1):
                         print("  이미지 변경 확인됨")
                     else:
                         print("  이미지 변경되지 않음 (동일 이미지일 수 있음)")
 
-                    # 추가 대기
-                    time.sleep(1)
-
                 except NoSuchElementException:
                     print("  다음 버튼을 찾을 수 없습니다.")
                     # 버튼이 없으면 키보드 이벤트로 대체
                     from selenium.webdriver.common.keys import Keys
                     body = driver.find_element(By.TAG_NAME, 'body')
                     body.send_keys(Keys.ARROW_RIGHT)
-                    time.sleep(2)
+                    wait_for_image_change(driver, img_src, 3, budget=2)
                     print("  오른쪽 화살표 키 입력")
 
                 except Exception as e:
@@ -192,18 +310,18 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
             print(f"  이미지 요소를 찾을 수 없음: {e}")
             # 빈 문자열 추가
             image_urls.append("")
-            time.sleep(1)
+            wait_for(driver, "main_image.retry", get_active_image_src, timeout=1, budget=1)
 
         except StaleElementReferenceException:
             # 요소가 새로고침되어 발생하는 오류
             print(f"  요소 참조 오류 발생. 재시도합니다.")
 
-            # 잠시 대기 후 다시 시도
-            time.sleep(1.5)
+            # 새 이미지 요소가 로드될 때까지 대기 후 다시 시도
+            wait_for(driver, "main_image.retry", get_active_image_src, timeout=3, budget=1.5)
 
             try:
                 image_element = get_active_image_element(driver)
-                img_src = image_element.get_attribute('src') or image_element.get_attribute('data-src')
+                img_src = pick_image_src(image_element.get_attribute('src'), image_element.get_attribute('data-src'))
 
                 if img_src and img_src.startswith('//'):
                     img_src = 'https:' + img_src
@@ -226,7 +344,7 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
             print(f"  예상치 못한 에러 발생: {type(e).__name__}: {str(e)}")
             # 빈 문자열 추가
             image_urls.append("")
-            time.sleep(1)
+            wait_for(driver, "main_image.retry", get_active_image_src, timeout=1, budget=1)
 
     print(f"\n총 {len(image_urls)}개의 이미지 URL 수집 완료.")
 
@@ -261,52 +379,12 @@ def save_urls_to_file(urls: List[str], filename: str = "urls.txt"):
         print(f"파일 저장 중 에러 발생: {e}")
 
 
-# 대안: 모든 이미지 URL을 한번에 가져오는 함수
 def get_all_image_urls_at_once(driver: WebDriver) -> List[str]:
     """
-    페이지의 모든 이미지 URL을 한번에 가져옵니다.
+    캐러셀의 모든 이미지 URL을 한번에 가져옵니다. (복제 슬라이드 제외, 슬라이드 인덱스 순)
     """
     print("모든 이미지 URL 한번에 수집...")
-
-    image_urls = []
-
-    # 모든 슬라이드 찾기
-    try:
-        slides = driver.find_elements(By.CSS_SELECTOR, '.swiper-slide')
-        print(f"총 {len(slides)}개의 슬라이드 발견")
-
-        for idx, slide in enumerate(slides):
-            try:
-                # 각 슬라이드의 이미지 찾기
-                img_element = slide.find_element(By.TAG_NAME, 'img')
-                img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
-
-                if not img_src:
-                    # alt 속성에서 URL 가져오기
-                    img_alt = img_element.get_attribute('alt')
-                    if img_alt and img_alt.startswith('http'):
-                        img_src = img_alt
-
-                if img_src:
-                    if img_src.startswith('//'):
-                        img_src = 'https:' + img_src
-
-                    cleaned_url = clean_image_url(img_src)
-                    image_urls.append(cleaned_url)
-
-                    # 슬라이드 인덱스 정보
-                    slide_index = slide.get_attribute('data-swiper-slide-index')
-                    print(f"  슬라이드 {idx} (인덱스: {slide_index}): {cleaned_url[:60]}...")
-                else:
-                    print(f"  슬라이드 {idx}: 이미지 URL 없음")
-
-            except Exception as e:
-                print(f"  슬라이드 {idx} 처리 실패: {e}")
-
-    except Exception as e:
-        print(f"슬라이드 수집 실패: {e}")
-
-    return image_urls
+    return collect_carousel_image_urls(driver, 0)
 
 
 # 테스트용 코드
@@ -0,0 +1,33 @@
+from mainImgCol import pick_image_src, order_slide_sources
+
+# 실제 src가 있으면 src, 없거나 data: 자리표시자면 data-src
+assert pick_image_src("https://img.test/a.jpg", "https://img.test/lazy.jpg") == "https://img.test/a.jpg"
+assert pick_image_src("data:image/gif;base64,AAA", "https://img.test/lazy.jpg") == "https://img.test/lazy.jpg"
+assert pick_image_src(None, "https://img.test/lazy.jpg") == "https://img.test/lazy.jpg"
+assert pick_image_src("data:image/gif;base64,AAA", None) is None
+assert pick_image_src("", "") is None
+
+# loop 모드: 앞뒤 복제 슬라이드는 인덱스별 첫 URL만 남기고 인덱스 순으로 정렬
+slides = [
+    ("2", "https://img.test/c.jpg"),
+    ("0", "https://img.test/a.jpg"),
+    ("1", None),  # 아직 URL이 없는 슬라이드는 뒤의 복제 슬라이드로 채움
+    ("1", "https://img.test/b.jpg"),
+    ("2", "https://img.test/c-dup.jpg"),
+    ("0", "https://img.test/a-dup.jpg"),
+]
+assert order_slide_sources(slides) == ["https://img.test/a.jpg", "https://img.test/b.jpg", "https://img.test/c.jpg"]
+
+# 인덱스 속성이 없으면 문서 순서
+assert order_slide_sources([(None, "https://img.test/x.jpg"), (None, "https://img.test/y.jpg")]) == [
+    "https://img.test/x.jpg", "https://img.test/y.jpg"]
+assert order_slide_sources([]) == []
+
+# 숫자가 아닌 인덱스 속성은 문서 순서로 취급하고, data: 자리표시자 슬라이드는 data-src URL을 사용
+slides = [
+    ("abc", pick_image_src("https://img.test/a.jpg", None)),
+    ("1", pick_image_src("data:image/gif;base64,AAA", None)),
+    ("1", pick_image_src("data:image/gif;base64,AAA", "https://img.test/b.jpg")),
+]
+assert order_slide_sources(slides) == ["https://img.test/a.jpg", "https://img.test/b.jpg"]
+print("메인 이미지 슬라이드 테스트 통과")
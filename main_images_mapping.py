@@ -1,8 +1,15 @@
 import os
+from sql_segment_writer import get_segment_writer
 
 # SQL 파일 경로
 SQL_FILE_PATH = "product_main_images_sql.txt"
 
+# product_main_images INSERT 문 머리말
+MAIN_IMAGES_SQL_HEADER = "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES"
+
+# product_main_images VALUES 세그먼트 기록기
+MAIN_IMAGES_SQL_WRITER = get_segment_writer(SQL_FILE_PATH, MAIN_IMAGES_SQL_HEADER)
+
 
 def create_initial_product_main_images_sql(transaction=None): # transaction 인자 추가
     """
@@ -34,66 +41,61 @@ def create_initial_product_main_images_sql(transaction=None): # transaction 인
                 f.write(initial_sql)
 
 
-def update_product_main_images_sql(product_id, main_image_urls, transaction): # transaction 인자 추가
+def build_main_image_rows(product_id, main_image_urls):
     """
-    product_main_images_sql.txt 파일에 제품 이미지 INSERT 문을 트랜잭션으로 추가합니다.
+    메인 이미지 URL 배열을 product_main_images 행으로 변환합니다.
+    첫 번째 이미지는 THUMBNAIL, 나머지는 GALLERY입니다.
 
     Args:
         product_id (int): 제품 ID
         main_image_urls (list): 이미지 URL 배열
-        transaction (FileTransaction): 트랜잭션 객체
+
+    Returns:
+        list of tuple: [(product_id, image_type, display_order, image_url), ...]
     """
-    if not main_image_urls or len(main_image_urls) == 0:
-        return []
+    rows = []
+    for display_order, image_url in enumerate(main_image_urls):
+        image_type = 'THUMBNAIL' if display_order == 0 else 'GALLERY'
+        rows.append((product_id, image_type, display_order, image_url))
+    return rows
 
-    # SQL 파일 내용 읽기 (트랜잭션에 의해 백업됨)
-    try:
-        with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        content = "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES"
 
-    # 내용 정리
-    content = content.strip()
+def format_main_image_values(row):
+    """
+    product_main_images 행 하나를 VALUES 튜플 문자열로 만듭니다.
 
-    # 마지막 세미콜론 제거
-    if content.endswith(';'):
-        content = content[:-1].rstrip()
+    Args:
+        row (tuple): (product_id, image_type, display_order, image_url)
 
-    # INSERT 문 생성
-    insert_statements = []
+    Returns:
+        str: VALUES 튜플 문자열
+    """
+    product_id, image_type, display_order, image_url = row
 
-    for idx, image_url in enumerate(main_image_urls):
-        display_order = idx
-        image_type = 'THUMBNAIL' if display_order == 0 else 'GALLERY'
+    # SQL 이스케이프
+    escaped_image_url = image_url.replace("'", "''")
 
-        # SQL 이스케이프
-        escaped_image_url = image_url.replace("'", "''")
-
-        insert_statement = f"({product_id}, '{image_type}', {display_order}, '{escaped_image_url}')"
-        insert_statements.append(insert_statement)
-
-    # VALUES로 끝나는지 확인 (첫 데이터 추가)
-    if content.endswith('VALUES'):
-        new_content = content
-        for i, stmt in enumerate(insert_statements):
-            if i == 0:
-                new_content += f"\n{stmt}"
-            else:
-                new_content += f",\n{stmt}"
-        new_content += ";"
-    else:
-        # 기존 데이터가 있으므로 콤마 추가 후 새 데이터 추가
-        new_content = content
-        for stmt in insert_statements:
-            new_content += f",\n{stmt}"
-        new_content += ";"
+    return f"({product_id}, '{image_type}', {display_order}, '{escaped_image_url}')"
 
-    # 트랜잭션을 사용하여 SQL 파일 저장
-    transaction.write_file(SQL_FILE_PATH, new_content)
 
-    return insert_statements
+def update_product_main_images_sql(product_id, main_image_urls, transaction): # transaction 인자 추가
+    """
+    제품 이미지 VALUES 튜플을 세그먼트 파일에 트랜잭션으로 추가합니다.
+    최종 INSERT 문은 export_all_sql() 호출 시 product_main_images_sql.txt로 만들어집니다.
+
+    Args:
+        product_id (int): 제품 ID
+        main_image_urls (list): 이미지 URL 배열
+        transaction (FileTransaction): 트랜잭션 객체
+    """
+    if not main_image_urls or len(main_image_urls) == 0:
+        return []
 
+    # INSERT 문 생성
+    insert_statements = [format_main_image_values(row)
+                         for row in build_main_image_rows(product_id, main_image_urls)]
+
+    # 세그먼트 파일 끝에 추가 (파일 전체를 다시 쓰지 않음)
+    MAIN_IMAGES_SQL_WRITER.append(insert_statements, transaction)
 
-# 모듈 임포트 시 초기 SQL 파일 생성 (트랜잭션 없이)
-create_initial_product_main_images_sql()
\ No newline at end of file
+    return insert_statements
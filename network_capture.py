@@ -0,0 +1,289 @@
+"""
+네트워크 응답 캡처 모듈
+상세 페이지(React)는 XHR/fetch로 받은 JSON으로 화면을 그립니다.
+페이지가 열리기 전에 fetch / XMLHttpRequest를 감싸는 스크립트를 CDP(Page.addScriptToEvaluateOnNewDocument)로
+심어 두고, 로드가 끝나면 기록된 JSON 응답(과 __NEXT_DATA__)을 한 번에 읽어 상품 필드를 만듭니다.
+옵션 드롭다운 클릭, 제공고시 아코디언 펼치기 없이 기본 정보 / 옵션 / 제공고시를 얻을 수 있습니다.
+
+- 응답 JSON의 필드 이름은 아래 *_KEYS 후보 목록으로 찾음 (API가 바뀌면 후보만 추가)
+- 결과 형식은 detail_bundle과 같음 (crawl.extract_product_record(prefetched=...)로 검증/저장)
+- 메인 이미지는 캐러셀 DOM에서, 상세 이미지는 기존 detailImg에서 수집
+- 추천 / 함께 본 상품 응답에도 상품명과 브랜드가 있으므로, 현재 페이지의 상품 번호(goodsNo)가 있는 응답과
+  상품 번호가 일치하는 상품만 사용
+- 상품명을 찾지 못하면 None (crawl에서 다른 추출 방식으로 대체)
+"""
+
+import weakref
+
+from detail_bundle import build_bundle_record
+from listing import extract_goods_no
+from mainImgCol import CAROUSEL_SLIDE_SELECTOR, CAROUSEL_SLIDES_JS
+
+# 캡처할 응답 URL (정규식, 자사 도메인의 JSON 응답만)
+CAPTURE_URL_PATTERN = r"oliveyoung\.co\.kr"
+
+# 페이지당 최대 캡처 응답 수
+MAX_CAPTURED_RESPONSES = 50
+
+# JSON 필드 이름 후보 (앞에 있을수록 우선)
+GOODS_NO_KEYS = ("goodsNo", "goodsNumber", "prdNo")
+PRODUCT_NAME_KEYS = ("goodsName", "goodsNm", "prdNm", "productName")
+BRAND_NAME_KEYS = ("brandName", "brandNm", "onlBrndNm", "brndNm")
+CATEGORY_NAME_KEYS = ("dispCatNm", "lastDispCatNm", "categoryName", "catNm")
+PRICE_KEYS = ("finalPrice", "salePrice", "finalPrc", "salePrc", "price")
+OPTION_LIST_KEYS = ("optionList", "goodsOptionList", "options", "itemList")
+OPTION_NAME_KEYS = ("optionName", "optNm", "itemName", "itemNm", "goodsName", "goodsNm")
+OPTION_IMAGE_KEYS = ("imageUrl", "imgUrl", "thumbnailUrl", "optionImageUrl", "thnlPath")
+OPTION_SOLDOUT_KEYS = ("soldOut", "isSoldOut", "soldOutYn", "soldoutYn")
+NOTICE_LIST_KEYS = ("goodsNoticeList", "noticeList", "goodsInfoNoticeList", "artcInfoList")
+NOTICE_TITLE_KEYS = ("title", "titleNm", "artcNm", "name")
+NOTICE_VALUE_KEYS = ("content", "contents", "artcCont", "value")
+
+# fetch / XMLHttpRequest 응답 중 JSON을 window.__networkCapture에 기록하는 스크립트 (모든 문서에서 먼저 실행)
+NETWORK_CAPTURE_SCRIPT = """
+(function () {
+    if (window.__networkCapture) { return; }
+    var store = window.__networkCapture = [];
+    var pattern = new RegExp(%(pattern)r);
+    function keep(url, type, text) {
+        if (!url || !pattern.test(url) || (type || '').indexOf('json') === -1 || store.length >= %(limit)d) { return; }
+        try { store.push({url: url, data: JSON.parse(text)}); } catch (e) {}
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            return originalFetch.apply(this, arguments).then(function (response) {
+                try {
+                    var type = response.headers.get('content-type');
+                    if ((type || '').indexOf('json') !== -1) {
+                        response.clone().text().then(function (text) { keep(response.url, type, text); });
+                    }
+                } catch (e) {}
+                return response;
+            });
+        };
+    }
+    var open = XMLHttpRequest.prototype.open;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__captureUrl = url;
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        xhr.addEventListener('load', function () {
+            if (xhr.responseType && xhr.responseType !== 'text') { return; }
+            keep(xhr.responseURL || xhr.__captureUrl, xhr.getResponseHeader('content-type'), xhr.responseText);
+        });
+        return send.apply(this, arguments);
+    };
+})();
+""" % {"pattern": CAPTURE_URL_PATTERN, "limit": MAX_CAPTURED_RESPONSES}
+
+# 기록된 응답과 __NEXT_DATA__(서버 렌더링 데이터), 캐러셀 이미지를 한 번에 읽는 스크립트
+# (arguments[0]: CAROUSEL_SLIDE_SELECTOR, 슬라이드는 mainImgCol.CAROUSEL_SLIDES_JS로 읽음)
+_COLLECT_SCRIPT = CAROUSEL_SLIDES_JS + """
+var nextData = null;
+var nextScript = document.getElementById('__NEXT_DATA__');
+if (nextScript) { try { nextData = JSON.parse(nextScript.textContent); } catch (e) {} }
+
+return {
+    responses: window.__networkCapture || [],
+    next_data: nextData,
+    main_image_urls: readSlideSources(arguments[0])
+};
+"""
+
+# 캡처 스크립트를 심은 드라이버
+_INSTALLED_DRIVERS = weakref.WeakSet()
+
+
+def install_network_capture(driver):
+    """
+    이후 열리는 모든 페이지에 응답 캡처 스크립트를 심습니다. (드라이버마다 1회, driver.get 전에 호출)
+
+    Returns:
+        bool: 설치 여부 (CDP를 지원하지 않으면 False)
+    """
+    if driver in _INSTALLED_DRIVERS:
+        return True
+
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_CAPTURE_SCRIPT})
+    except Exception as e:
+        print(f"[NetworkCapture] ⚠ 응답 캡처 스크립트 설치 실패: {e}")
+        return False
+
+    _INSTALLED_DRIVERS.add(driver)
+    return True
+
+
+def _iter_dicts(value):
+    """JSON 값 안의 모든 dict를 앞에서부터 순회합니다."""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _first_value(data, keys):
+    """dict에서 후보 키 중 값이 있는 첫 번째 값을 반환합니다."""
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _find_text(payloads, keys):
+    for data in payloads:
+        for item in _iter_dicts(data):
+            value = _first_value(item, keys)
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+    return None
+
+
+def _find_list(payloads, list_keys, item_keys):
+    """후보 키의 값이 dict 리스트이고, 항목에 item_keys 중 하나가 있는 첫 번째 리스트"""
+    for data in payloads:
+        for item in _iter_dicts(data):
+            for key in list_keys:
+                value = item.get(key)
+                if (isinstance(value, list) and value and isinstance(value[0], dict)
+                        and _first_value(value[0], item_keys) is not None):
+                    return value
+    return None
+
+
+def _has_goods_no(item, goods_no):
+    """dict의 상품 번호 필드가 goods_no와 같으면 True"""
+    return any(str(item.get(key) or "") == goods_no for key in GOODS_NO_KEYS)
+
+
+def select_payloads(responses, goods_no):
+    """
+    캡처한 응답 중 현재 상품의 응답만 남깁니다.
+    (요청 URL에 상품 번호가 있거나, 본문에 상품 번호가 같은 항목이 있는 응답)
+
+    Args:
+        responses: [{"url", "data"}, ...]
+        goods_no: 현재 페이지의 상품 번호
+
+    Returns:
+        list: JSON 값 리스트
+    """
+    payloads = []
+    for response in responses:
+        data = response.get("data")
+        if goods_no in (response.get("url") or "") or any(_has_goods_no(item, goods_no) for item in _iter_dicts(data)):
+            payloads.append(data)
+    return payloads
+
+
+def _is_soldout(value):
+    if isinstance(value, str):
+        return value.strip().upper() in ("Y", "TRUE")
+    return bool(value)
+
+
+def parse_api_payloads(payloads, goods_no=None):
+    """
+    캡처한 JSON에서 상품 필드를 찾습니다. (브라우저와 무관한 순수 함수)
+
+    Args:
+        payloads: JSON 값 리스트 (응답 본문, __NEXT_DATA__)
+        goods_no: 현재 페이지의 상품 번호 (지정하면 상품 번호가 같은 상품만 사용)
+
+    Returns:
+        dict or None: detail_bundle 스크립트 결과 형식 (main_image_urls는 빈 리스트)
+                      goods_no를 지정했는데 상품 번호가 같은 상품이 없으면 None
+    """
+    product = None
+    for data in payloads:
+        for item in _iter_dicts(data):
+            if goods_no and not _has_goods_no(item, goods_no):
+                continue
+            if isinstance(_first_value(item, PRODUCT_NAME_KEYS), str) and _first_value(item, BRAND_NAME_KEYS):
+                product = item
+                break
+        if product:
+            break
+
+    if goods_no and product is None:
+        return None
+
+    product_name = _first_value(product, PRODUCT_NAME_KEYS) if product else _find_text(payloads, PRODUCT_NAME_KEYS)
+    brand = _first_value(product, BRAND_NAME_KEYS) if product else _find_text(payloads, BRAND_NAME_KEYS)
+    price = _first_value(product, PRICE_KEYS) if product else None
+
+    options = None
+    option_items = _find_list(payloads, OPTION_LIST_KEYS, OPTION_NAME_KEYS)
+    if option_items and len(option_items) > 1:
+        options = [{
+            "name": _first_value(item, OPTION_NAME_KEYS),
+            "price": str(_first_value(item, PRICE_KEYS) or "") or None,
+            "image_url": _first_value(item, OPTION_IMAGE_KEYS),
+            "is_soldout": _is_soldout(_first_value(item, OPTION_SOLDOUT_KEYS)),
+        } for item in option_items]
+
+    detail_info = {}
+    for item in _find_list(payloads, NOTICE_LIST_KEYS, NOTICE_TITLE_KEYS) or []:
+        title = _first_value(item, NOTICE_TITLE_KEYS)
+        if isinstance(title, str) and title.strip():
+            detail_info[title.strip()] = str(_first_value(item, NOTICE_VALUE_KEYS) or "").strip()
+
+    if isinstance(product_name, str):
+        product_name = product_name.strip()
+
+    return {
+        "category": _find_text(payloads, CATEGORY_NAME_KEYS),
+        "brand": brand.strip() if isinstance(brand, str) else brand,
+        "product_name": product_name,
+        "single_name": product_name,
+        "single_price": str(price) if price is not None else None,
+        "single_thumbnail": _first_value(product, OPTION_IMAGE_KEYS) if product else None,
+        "main_image_urls": [],
+        "options": options,
+        "detail_info": detail_info,
+    }
+
+
+def extract_from_network(driver, num_images=3):
+    """
+    캡처한 응답으로 상세 페이지 데이터를 추출합니다. (스크립트 1회 실행, 클릭/스크롤 없음)
+
+    Args:
+        driver: install_network_capture()를 적용한 뒤 상세 페이지를 연 WebDriver
+        num_images: 수집할 메인 이미지 수
+
+    Returns:
+        dict or None: {"category", "brand", "product_name", "main_image_urls", "detail_info", "options"}
+                      (캡처가 없거나 상품명을 찾지 못하면 None)
+    """
+    if driver not in _INSTALLED_DRIVERS:
+        return None
+
+    # 추천 상품 응답을 현재 상품으로 잘못 읽지 않도록 상품 번호로 확인 (번호를 모르면 사용하지 않음)
+    goods_no = extract_goods_no(driver.current_url)
+    if not goods_no:
+        return None
+
+    collected = driver.execute_script(_COLLECT_SCRIPT, CAROUSEL_SLIDE_SELECTOR) or {}
+    payloads = select_payloads(collected.get("responses") or [], goods_no)
+    if collected.get("next_data"):
+        payloads.append(collected["next_data"])
+
+    bundle = parse_api_payloads(payloads, goods_no)
+    if not bundle or not bundle["product_name"]:
+        return None
+
+    bundle["main_image_urls"] = collected.get("main_image_urls") or []
+    record = build_bundle_record(bundle, num_images)
+    print(f"✓ 네트워크 응답 추출 완료: 응답 {len(payloads)}개, 옵션 {len(record['options'])}개, "
+          f"제공고시 {len(record['detail_info'])}개 항목")
+    return record
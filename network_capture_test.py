@@ -0,0 +1,52 @@
+from network_capture import parse_api_payloads, select_payloads
+from detail_bundle import build_bundle_record
+
+# 상세 API 응답 형태를 흉내 낸 JSON (상품 / 옵션 / 제공고시가 서로 다른 응답에 있음)
+GOODS_RESPONSE = {"data": {"goods": {
+    "goodsNo": "A000000123456", "goodsName": " 테스트 세럼 ", "brandName": "테스트브랜드",
+    "finalPrice": 12000, "dispCatNm": "에센스/세럼/앰플",
+}}}
+OPTION_RESPONSE = {"data": {"optionList": [
+    {"optionName": "01 라이트", "finalPrice": 12000, "imageUrl": "//img.test/o1.jpg?QT=1", "soldOutYn": "N"},
+    {"optionName": "02 미디엄", "finalPrice": "13,000", "imageUrl": None, "soldOutYn": "Y"},
+]}}
+NOTICE_RESPONSE = {"result": {"goodsNoticeList": [
+    {"title": "제조국", "content": "대한민국"},
+    {"title": "사용방법", "content": None},
+]}}
+
+bundle = parse_api_payloads([GOODS_RESPONSE, OPTION_RESPONSE, NOTICE_RESPONSE])
+bundle["main_image_urls"] = ["https://img.test/a.jpg?x=1&QT=85"]
+record = build_bundle_record(bundle)
+print(record)
+
+assert (record["category"], record["brand"], record["product_name"]) == ("에센스/세럼/앰플", "테스트브랜드", "테스트 세럼")
+assert [(o["name"], o["price"], o["is_soldout"]) for o in record["options"]] == [
+    ("01 라이트", "12000", False), ("02 미디엄", "13000", True)]
+assert record["options"][0]["image_url"] == "https://img.test/o1.jpg"
+assert record["detail_info"] == {"제조국": "대한민국", "사용방법": ""}
+
+# 옵션 목록이 없으면 상품 정보로 단일 옵션 구성
+single = build_bundle_record(parse_api_payloads([GOODS_RESPONSE]))
+assert [(o["name"], o["price"]) for o in single["options"]] == [("테스트 세럼", "12000")]
+
+# 추천 상품 응답이 먼저 있어도 현재 상품 번호의 응답과 상품만 사용
+RELATED_RESPONSE = {"data": {"relatedGoodsList": [
+    {"goodsNo": "A000000999999", "goodsName": "추천 상품", "brandName": "다른브랜드"},
+]}}
+responses = [
+    {"url": "https://www.oliveyoung.co.kr/api/related?goodsNo=A000000999999", "data": RELATED_RESPONSE},
+    {"url": "https://www.oliveyoung.co.kr/api/goods", "data": GOODS_RESPONSE},
+    {"url": "https://www.oliveyoung.co.kr/api/option?goodsNo=A000000123456", "data": OPTION_RESPONSE},
+]
+payloads = select_payloads(responses, "A000000123456")
+assert payloads == [GOODS_RESPONSE, OPTION_RESPONSE]
+matched = parse_api_payloads([RELATED_RESPONSE] + payloads, "A000000123456")
+assert (matched["product_name"], matched["brand"]) == ("테스트 세럼", "테스트브랜드")
+
+# 상품 번호가 같은 상품이 없으면 None (다른 추출 방식으로 대체)
+assert parse_api_payloads([RELATED_RESPONSE], "A000000123456") is None
+
+# 상품명이 없는 응답
+assert parse_api_payloads([{"data": []}])["product_name"] is None
+print("네트워크 응답 파싱 테스트 통과")
@@ -1,11 +1,10 @@
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 from typing import List, Dict
 import re
+from wait_engine import wait_for, element_hidden, elements_present, WAIT_FOR_JS
+from mainImgCol import IMAGE_SRC_JS, pick_image_src
 
 
 # ===============================================
@@ -42,6 +41,18 @@ OPTION_IMG_RELATIVE = "img"
 OPTION_NAME_RELATIVE = "span.OptionSelector_option-item-tit__8zEjW"
 OPTION_PRICE_RELATIVE = "span.OptionSelector_option-item-price__QiVwN"
 
+# 클래스명 해시(__9iV9W 등)가 바뀌어도 동작하는 선택자
+# CSS 모듈 클래스명의 앞부분으로 찾고, 기존 선택자를 후보로 함께 둠 (쉼표로 나열, 어느 쪽이든 일치하면 사용)
+OPTION_BUTTON_STABLE_SELECTOR = ('[class*="OptionSelector_option-selector__"] .option-wrapper button, '
+                                 + OPTION_BUTTON_SELECTOR)
+OPTION_ITEMS_STABLE_SELECTOR = ('ul[class*="OptionSelector_option-list__"] li[class*="OptionSelector_option-item__"], '
+                                f"{OPTION_LIST_CONTAINER_SELECTOR} {OPTION_ITEM_SELECTOR}")
+OPTION_NAME_STABLE_RELATIVE = f'[class*="OptionSelector_option-item-tit__"], {OPTION_NAME_RELATIVE}'
+OPTION_PRICE_STABLE_RELATIVE = f'[class*="OptionSelector_option-item-price__"], {OPTION_PRICE_RELATIVE}'
+
+# 옵션 리스트가 DOM에 없어 드롭다운을 열었을 때 아이템이 렌더링되기를 기다리는 최대 시간 (밀리초)
+OPTION_LIST_TIMEOUT_MS = 3000
+
 # ===============================================
 # 단일 옵션(기본 상품 정보)을 위한 상수 정의
 # ===============================================
@@ -56,6 +67,116 @@ MAIN_PRODUCT_PRICE_SELECTOR = "#main > div.page_product-details-wrapper___t38G >
 MAIN_THUMBNAIL_IMAGE_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_left-section__qXr0Q > div.GoodsDetailCarousel_visual-container__1kSZN > div > div > div.swiper-wrapper > div.swiper-slide.swiper-slide-active > div > img"
 
 
+# 옵션 리스트와 단일 옵션 정보를 읽는 스크립트 함수 (imageSrc는 mainImgCol.IMAGE_SRC_JS와 함께 사용)
+# readOptions(config): config는 OPTION_LIST_CONFIG 형식
+# 옵션 리스트가 이미 DOM에 있으면 드롭다운을 열지 않고, 직접 열었을 때만 다 읽은 뒤 다시 닫음
+# (버튼도 리스트도 없으면 options가 null인 단일 옵션 상품, detail_bundle 스크립트도 이 함수를 사용)
+OPTION_ITEMS_JS = WAIT_FOR_JS + """
+function textOf(el) {
+    if (!el) { return null; }
+    var text = (el.innerText || el.textContent || '').trim();
+    return text || null;
+}
+function queryAll(selector) {
+    var found = document.querySelectorAll(selector);
+    return found.length ? found : null;
+}
+async function readOptions(config) {
+    var result = {
+        options: null,
+        opened: false,
+        single_name: textOf(document.querySelector(config.single_name)),
+        single_price: textOf(document.querySelector(config.single_price)),
+        single_thumbnail: imageSrc(document.querySelector(config.single_thumbnail))
+    };
+
+    var items = queryAll(config.items);
+    var button = items ? null : document.querySelector(config.button);
+    if (button) {
+        button.click();
+        result.opened = true;
+        items = await waitFor(function () { return queryAll(config.items); }, config.timeout_ms);
+    }
+
+    if (items) {
+        result.options = Array.prototype.map.call(items, function (item) {
+            return {
+                name: textOf(item.querySelector(config.name)),
+                price: textOf(item.querySelector(config.price)),
+                image_url: imageSrc(item.querySelector(config.image)),
+                is_soldout: (item.getAttribute('class') || '').indexOf('is-soldout') !== -1
+            };
+        });
+    }
+    if (result.opened) { button.click(); }
+    return result;
+}
+"""
+
+# 모든 옵션 아이템을 한 번에 읽는 스크립트 (arguments[0]: OPTION_LIST_CONFIG, 마지막 인자: 완료 콜백)
+OPTION_LIST_SCRIPT = IMAGE_SRC_JS + OPTION_ITEMS_JS + """
+var done = arguments[arguments.length - 1];
+readOptions(arguments[0]).then(done, function (error) { done({error: String(error)}); });
+"""
+
+# OPTION_LIST_SCRIPT에 전달할 설정
+OPTION_LIST_CONFIG = {
+    "button": OPTION_BUTTON_STABLE_SELECTOR,
+    "items": OPTION_ITEMS_STABLE_SELECTOR,
+    "name": OPTION_NAME_STABLE_RELATIVE,
+    "price": OPTION_PRICE_STABLE_RELATIVE,
+    "image": OPTION_IMG_RELATIVE,
+    "single_name": MAIN_PRODUCT_NAME_SELECTOR,
+    "single_price": MAIN_PRODUCT_PRICE_SELECTOR,
+    "single_thumbnail": MAIN_THUMBNAIL_IMAGE_SELECTOR,
+    "timeout_ms": OPTION_LIST_TIMEOUT_MS,
+}
+
+
+def _option_image_url(src):
+    """옵션 이미지 src를 정제된 https URL로 바꿉니다. (http URL이 아니면 None)"""
+    if src and src.startswith('//'):
+        src = 'https:' + src
+    if src and src.startswith('http'):
+        return clean_image_url(src)
+    return None
+
+
+def build_option_list(raw) -> List[Dict]:
+    """
+    스크립트로 읽은 원시 옵션 데이터를 get_product_options()와 같은 형식의 옵션 리스트로 변환합니다.
+
+    Args:
+        raw: {"options": [{"name", "price", "image_url", "is_soldout"}, ...] 또는 None,
+              "single_name", "single_price", "single_thumbnail"}
+              (readOptions 스크립트 함수 / html_extract 결과)
+
+    Returns:
+        list: [{'index', 'name', 'price', 'image_url', 'is_soldout'}, ...]
+              옵션이 없으면 메인 상품 정보로 구성한 단일 옵션 1개
+    """
+    options = raw.get("options")
+
+    # 복수 옵션 상품
+    if options:
+        return [{
+            'index': idx + 1,
+            'name': item.get("name") or '옵션명 추출 실패',
+            'price': re.sub(r'[^\d]', '', item["price"]) if item.get("price") else '가격 추출 실패',
+            'image_url': _option_image_url(item.get("image_url")) or '이미지 요소 없음',
+            'is_soldout': bool(item.get("is_soldout")),
+        } for idx, item in enumerate(options)]
+
+    # 단일 옵션 상품 (메인 상품 정보로 옵션 1개 구성)
+    return [{
+        'index': 1,
+        'name': raw.get("single_name") or '단일 상품명',
+        'price': re.sub(r'[^\d]', '', raw["single_price"]) if raw.get("single_price") else '0',
+        'image_url': _option_image_url(raw.get("single_thumbnail")) or 'URL 추출 실패',
+        'is_soldout': False,
+    }]
+
+
 # ===============================================
 # 메인 함수: 옵션 정보 수집
 # ===============================================
@@ -63,6 +184,42 @@ MAIN_THUMBNAIL_IMAGE_SELECTOR = "#main > div.page_product-details-wrapper___t38G
 def get_product_options(driver: WebDriver) -> List[Dict]:
     """
     상품 상세 페이지에서 모든 옵션의 이미지 URL, 옵션명, 옵션 가격을 수집합니다.
+    모든 옵션을 스크립트 1회 실행으로 읽고(옵션 리스트가 DOM에 있으면 드롭다운을 열지 않음),
+    스크립트가 실패하면 드롭다운을 클릭해 옵션을 하나씩 읽습니다.
+    옵션이 없을 경우 (단일 옵션 상품), 메인 상품 정보를 가져와 단일 옵션으로 구성합니다.
+    """
+    try:
+        raw = driver.execute_async_script(OPTION_LIST_SCRIPT, OPTION_LIST_CONFIG)
+    except Exception as e:
+        raw = {"error": str(e)}
+
+    if not raw or raw.get("error"):
+        print(f"⚠ 옵션 일괄 수집 실패, 드롭다운을 클릭해 수집합니다: {(raw or {}).get('error')}")
+        return get_product_options_by_clicking(driver)
+
+    print("\n--- 옵션 정보 수집 시작 ---")
+    options_data = build_option_list(raw)
+
+    if raw.get("options"):
+        opened = "드롭다운 열고 닫음" if raw.get("opened") else "드롭다운 열지 않음"
+        print(f"✓ 총 {len(options_data)}개의 옵션을 발견했습니다. ({opened})")
+        for option in options_data:
+            soldout_mark = " [품절]" if option['is_soldout'] else ""
+            print(f"[옵션 {option['index']}]{soldout_mark} 이름: {option['name']}, 가격: {option['price']}원, "
+                  f"이미지: {option['image_url'][:50]}...")
+    else:
+        option = options_data[0]
+        print("⚠ 옵션 리스트를 찾을 수 없습니다. (단일 옵션 상품으로 판단)")
+        print(f"[단일 옵션 결과] 이름: {option['name']}, 가격: {option['price']}원")
+
+    print("--- 옵션 정보 수집 완료 ---\n")
+    return options_data
+
+
+def get_product_options_by_clicking(driver: WebDriver) -> List[Dict]:
+    """
+    상품 상세 페이지에서 모든 옵션의 이미지 URL, 옵션명, 옵션 가격을 수집합니다.
+    옵션 드롭다운을 클릭해 열고 옵션 아이템마다 요소를 찾아 읽은 뒤 다시 닫습니다.
     옵션이 없을 경우 (단일 옵션 상품), 메인 상품 정보를 가져와 단일 옵션으로 구성합니다.
     """
     options_data = []
@@ -77,11 +234,11 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
         driver.execute_script("arguments[0].click();", option_button)
         print("✓ 옵션 드롭다운 버튼 클릭 성공 (복수 옵션 상품으로 판단).")
 
-        # 드롭다운이 열릴 때까지 명시적 대기
-        WebDriverWait(driver, 3).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, OPTION_LIST_CONTAINER_SELECTOR))
-        )
-        time.sleep(1)
+        # 드롭다운의 옵션 아이템이 표시될 때까지 대기
+        if not wait_for(driver, "option.dropdown",
+                        elements_present(By.CSS_SELECTOR, f"{OPTION_LIST_CONTAINER_SELECTOR} {OPTION_ITEM_SELECTOR}"),
+                        timeout=3, budget=1):
+            raise TimeoutException("옵션 리스트가 표시되지 않았습니다.")
         is_multi_option = True
 
     except (NoSuchElementException, TimeoutException):
@@ -137,7 +294,7 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
                     # 옵션 이미지 추출
                     try:
                         img_element = item.find_element(By.CSS_SELECTOR, OPTION_IMG_RELATIVE)
-                        img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
+                        img_src = pick_image_src(img_element.get_attribute('src'), img_element.get_attribute('data-src'))
 
                         if img_src:
                             if img_src.startswith('//'):
@@ -193,7 +350,7 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
         # 메인 이미지 썸네일 URL 가져오기
         try:
             img_element = driver.find_element(By.CSS_SELECTOR, MAIN_THUMBNAIL_IMAGE_SELECTOR)
-            img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
+            img_src = pick_image_src(img_element.get_attribute('src'), img_element.get_attribute('data-src'))
 
             if img_src:
                 if img_src.startswith('//'):
@@ -215,7 +372,8 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
     try:
         if is_multi_option and option_button and option_button.is_displayed():
             driver.execute_script("arguments[0].click();", option_button)
-            time.sleep(0.5)
+            wait_for(driver, "option.close",
+                     element_hidden(By.CSS_SELECTOR, OPTION_LIST_CONTAINER_SELECTOR), timeout=2, budget=0.5)
             print("✓ 옵션 드롭다운 닫기 성공.")
     except Exception:
         pass
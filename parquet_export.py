@@ -0,0 +1,206 @@
+"""
+분석용 Parquet 내보내기 모듈
+SQLite 스테이징 DB(crawl_sink.SQLiteSink)의 크롤링 결과를 category_id로 파티션된
+Parquet 데이터셋(hive 형식: <테이블>/category_id=N/*.parquet)으로 저장합니다.
+
+- brand, category 이름 컬럼은 dictionary 인코딩 (반복 문자열을 정수 코드로 저장)
+- 가격/재고는 정수 컬럼, 품절 여부는 불리언 컬럼
+- products에는 옵션 수와 최저/최고 판매가를 함께 저장
+
+pyarrow가 필요합니다. (pip install pyarrow)
+분석 예: pyarrow.dataset.dataset("parquet_export/product_options", partitioning="hive")
+"""
+
+import os
+import sqlite3
+
+from category_mapping import get_category_name
+from crawl_sink import SQLITE_DB_PATH, DETAIL_INFO_COLUMNS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# 기본 출력 디렉토리
+PARQUET_EXPORT_DIR = "parquet_export"
+
+# 파티션 컬럼
+PARTITION_COLUMN = "category_id"
+
+# Parquet 압축 방식
+PARQUET_COMPRESSION = "zstd"
+
+# 상품별 카테고리/브랜드 (다른 테이블에 붙여 파티션과 필터에 사용)
+_PRODUCT_KEYS_SQL = """
+SELECT p.id, p.category_id, b.name
+FROM products p LEFT JOIN brands b ON b.id = p.brand_id
+"""
+
+
+def _dictionary(values):
+    """문자열 리스트를 dictionary 인코딩된 Arrow 배열로 만듭니다."""
+    return pa.array(values, type=pa.string()).dictionary_encode()
+
+
+def _read_products(conn):
+    """products 테이블 (옵션 가격 요약 포함)"""
+    rows = conn.execute("""
+        SELECT p.id, p.product_name, p.brand_id, b.name, p.category_id, p.product_detail_info_id, p.created_at,
+               COUNT(o.product_id), MIN(o.selling_price), MAX(o.selling_price)
+        FROM products p
+        LEFT JOIN brands b ON b.id = p.brand_id
+        LEFT JOIN product_options o ON o.product_id = p.id
+        GROUP BY p.id
+        ORDER BY p.id
+    """).fetchall()
+    columns = list(zip(*rows)) if rows else [[] for _ in range(10)]
+
+    return pa.table({
+        "id": pa.array(columns[0], type=pa.int64()),
+        "product_name": pa.array(columns[1], type=pa.string()),
+        "brand_id": pa.array(columns[2], type=pa.int64()),
+        "brand": _dictionary(columns[3]),
+        PARTITION_COLUMN: pa.array(columns[4], type=pa.int32()),
+        "category": _dictionary([get_category_name(category_id) for category_id in columns[4]]),
+        "product_detail_info_id": pa.array(columns[5], type=pa.int64()),
+        "created_at": pa.array(columns[6], type=pa.string()).cast(pa.timestamp("s")),
+        "option_count": pa.array(columns[7], type=pa.int32()),
+        "min_selling_price": pa.array(columns[8], type=pa.int64()),
+        "max_selling_price": pa.array(columns[9], type=pa.int64()),
+    })
+
+
+def _read_options(conn, product_keys):
+    """product_options 테이블 (카테고리/브랜드 포함)"""
+    rows = conn.execute("""
+        SELECT product_id, option_name, purchase_price, selling_price, current_stock, initial_stock,
+               safety_stock, image_url, display_order, is_deleted
+        FROM product_options
+        ORDER BY product_id, display_order
+    """).fetchall()
+    columns = list(zip(*rows)) if rows else [[] for _ in range(10)]
+    keys = [product_keys.get(product_id, (None, None)) for product_id in columns[0]]
+
+    return pa.table({
+        "product_id": pa.array(columns[0], type=pa.int64()),
+        PARTITION_COLUMN: pa.array([key[0] for key in keys], type=pa.int32()),
+        "brand": _dictionary([key[1] for key in keys]),
+        "option_name": pa.array(columns[1], type=pa.string()),
+        "purchase_price": pa.array(columns[2], type=pa.int64()),
+        "selling_price": pa.array(columns[3], type=pa.int64()),
+        "current_stock": pa.array(columns[4], type=pa.int32()),
+        "initial_stock": pa.array(columns[5], type=pa.int32()),
+        "safety_stock": pa.array(columns[6], type=pa.int32()),
+        "image_url": pa.array(columns[7], type=pa.string()),
+        "display_order": pa.array(columns[8], type=pa.int16()),
+        "is_soldout": pa.array([bool(value) for value in columns[9]], type=pa.bool_()),
+    })
+
+
+def _read_images(conn, product_keys):
+    """메인 이미지와 상세 이미지를 하나의 테이블로 (image_type: THUMBNAIL/GALLERY/DETAIL)"""
+    rows = conn.execute("""
+        SELECT product_id, image_type, display_order, image_url FROM product_main_images
+        UNION ALL
+        SELECT product_id, 'DETAIL', display_order, image_url FROM product_detail_images
+        ORDER BY 1, 2, 3
+    """).fetchall()
+    columns = list(zip(*rows)) if rows else [[] for _ in range(4)]
+
+    return pa.table({
+        "product_id": pa.array(columns[0], type=pa.int64()),
+        PARTITION_COLUMN: pa.array([product_keys.get(product_id, (None,))[0] for product_id in columns[0]],
+                                   type=pa.int32()),
+        "image_type": _dictionary(columns[1]),
+        "display_order": pa.array(columns[2], type=pa.int16()),
+        "image_url": pa.array(columns[3], type=pa.string()),
+    })
+
+
+def _read_detail_info(conn):
+    """product_detail_info 테이블 (상품 ID와 카테고리 포함)"""
+    rows = conn.execute(f"""
+        SELECT p.id, p.category_id, d.id, {', '.join(f'd.{column}' for column in DETAIL_INFO_COLUMNS)}
+        FROM product_detail_info d
+        JOIN products p ON p.product_detail_info_id = d.id
+        ORDER BY d.id
+    """).fetchall()
+    columns = list(zip(*rows)) if rows else [[] for _ in range(3 + len(DETAIL_INFO_COLUMNS))]
+
+    data = {
+        "product_id": pa.array(columns[0], type=pa.int64()),
+        PARTITION_COLUMN: pa.array(columns[1], type=pa.int32()),
+        "id": pa.array(columns[2], type=pa.int64()),
+    }
+    for idx, column in enumerate(DETAIL_INFO_COLUMNS):
+        data[column] = pa.array(columns[3 + idx], type=pa.string())
+    return pa.table(data)
+
+
+def _directory_size(path):
+    """디렉토리 전체 크기(바이트)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def export_parquet(db_path=SQLITE_DB_PATH, output_dir=PARQUET_EXPORT_DIR):
+    """
+    스테이징 DB를 category_id로 파티션된 Parquet 데이터셋으로 내보냅니다.
+    같은 파티션의 기존 파일은 덮어씁니다.
+
+    Args:
+        db_path: SQLite DB 파일 경로
+        output_dir: 출력 디렉토리
+
+    Returns:
+        dict: {데이터셋 경로: 행 수}
+    """
+    if pa is None:
+        raise ImportError("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"스테이징 DB를 찾을 수 없습니다: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    try:
+        product_keys = {product_id: (category_id, brand)
+                        for product_id, category_id, brand in conn.execute(_PRODUCT_KEYS_SQL)}
+        tables = {
+            "products": _read_products(conn),
+            "product_options": _read_options(conn, product_keys),
+            "product_images": _read_images(conn, product_keys),
+            "product_detail_info": _read_detail_info(conn),
+        }
+    finally:
+        conn.close()
+
+    results = {}
+    for name, table in tables.items():
+        path = os.path.join(output_dir, name)
+        pq.write_to_dataset(
+            table,
+            root_path=path,
+            partition_cols=[PARTITION_COLUMN],
+            existing_data_behavior="delete_matching",
+            compression=PARQUET_COMPRESSION,
+        )
+        results[path] = table.num_rows
+        print(f"✓ {path} ({table.num_rows}행, {_directory_size(path) / 1024:.1f}KB)")
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 사용법: python parquet_export.py [DB 경로] [출력 디렉토리]
+    export_parquet(
+        sys.argv[1] if len(sys.argv) > 1 else SQLITE_DB_PATH,
+        sys.argv[2] if len(sys.argv) > 2 else PARQUET_EXPORT_DIR
+    )
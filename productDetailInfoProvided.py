@@ -1,10 +1,8 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-import os
-import re
-import json
+from selenium.common.exceptions import TimeoutException
+from sql_segment_writer import get_segment_writer
+from id_sequence import ID_SEQUENCE
+from wait_engine import wait_for, element_present, elements_present
 
 FIELD_MAP = {
     "내용물의 용량 또는 중량": "capacity",
@@ -20,6 +18,22 @@ FIELD_MAP = {
     "소비자상담 전화번호": "customer_service_number",
 }
 
+# 상품정보 제공고시 펼침 버튼
+DETAIL_INFO_BUTTON_XPATH = '//*[@id="tab-panels"]/section/ul/li[1]/button/span'
+
+# 상품정보 제공고시 테이블과 행 선택자
+DETAIL_INFO_TABLE_SELECTOR = "div.Accordion_content__aIya4 table.Accordion_table__mcFPq"
+DETAIL_INFO_ROW_SELECTOR = f"{DETAIL_INFO_TABLE_SELECTOR} tr"
+
+# SQL 파일 경로
+SQL_FILE_PATH = "product_detailinfo_provided_sql.txt"
+
+# product_detail_info INSERT 문 머리말
+DETAIL_INFO_SQL_HEADER = f"INSERT INTO product_detail_info (id, {', '.join(FIELD_MAP.values())}, created_at, updated_at) VALUES"
+
+# 기본 product_detail_info VALUES 세그먼트 기록기
+DETAIL_INFO_SQL_WRITER = get_segment_writer(SQL_FILE_PATH, DETAIL_INFO_SQL_HEADER)
+
 
 def escape_sql(value) -> str:
     """SQL에서 작은 따옴표 문제 방지"""
@@ -28,110 +42,114 @@ def escape_sql(value) -> str:
     return str(value).replace("'", "''")
 
 
-def load_detailinfo_data():
-    """detailinfo_data.json 파일에서 데이터 로드"""
-    filename = "detailinfo_data.json"
+def get_next_detailinfo_id(transaction=None):
+    """
+    다음 detailinfo ID를 가져옵니다.
+    ID는 통합 시퀀스(id_sequence.json)의 "detailinfo" 블록에서 꺼내므로
+    detailinfo_data.json을 매번 읽고 쓰지 않습니다.
 
-    if not os.path.exists(filename):
-        # 파일이 없으면 초기값 생성
-        data = {
-            "last_id": 0,
-            "next_id": 1
-        }
-        print(f"[INFO] '{filename}' 파일이 없어 초기값 생성: {data}")
+    Args:
+        transaction: FileTransaction 또는 GroupCommitTransaction 객체
+                     (롤백되면 꺼낸 ID를 시퀀스에 되돌림)
+    """
+    current_next_id = ID_SEQUENCE.next_id("detailinfo")
+    print(f"[INFO] 할당할 ID: {current_next_id}")
 
-        # 파일 저장
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    if transaction:
+        transaction.add_rollback_hook(lambda: ID_SEQUENCE.unget("detailinfo", current_next_id))
 
-        return data
+    return current_next_id
 
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # 필수 필드 확인
-        if "last_id" not in data or "next_id" not in data:
-            print(f"[WARNING] '{filename}' 파일에 필수 필드가 없어 초기화")
-            data = {
-                "last_id": 0,
-                "next_id": 1
-            }
-
-        print(f"[INFO] '{filename}' 파일에서 데이터 로드: {data}")
-        return data
-
-    except (json.JSONDecodeError, Exception) as e:
-        print(f"[ERROR] '{filename}' 파일 읽기 실패: {e}")
-        # 오류 시 기본값 반환
-        return {
-            "last_id": 0,
-            "next_id": 1
-        }
-
-
-def save_detailinfo_data(data, transaction=None):
-    """detailinfo_data.json 파일에 데이터 저장"""
-    filename = "detailinfo_data.json"
-
-    # JSON 문자열 생성
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-
-    # trailing comma 방지
-    import re
-    json_str = re.sub(r',\s*\n\s*}', '\n}', json_str)
-    json_str = re.sub(r',\s*\n\s*]', '\n]', json_str)
-
-    # 저장
-    if transaction:
-        transaction.write_file(filename, json_str)
-    else:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(json_str)
 
-    print(f"[INFO] '{filename}' 파일 업데이트: {data}")
+def extract_product_detailinfo(driver):
+    """
+    상품정보 제공고시 테이블을 읽어 {항목명: 값} 딕셔너리로 반환합니다. (파일 저장 없음)
 
+    Args:
+        driver: Selenium WebDriver
 
-def save_detailinfo_data(data, transaction=None):
-    """detailinfo_data.json 파일에 데이터 저장"""
-    filename = "detailinfo_data.json"
+    Returns:
+        dict: 상품정보 제공고시 항목 (수집 실패 시 예외 발생)
+    """
+    # 웹 요소 찾기 및 클릭
+    button = wait_for(driver, "detail_info.button",
+                      element_present(By.XPATH, DETAIL_INFO_BUTTON_XPATH), timeout=10)
+    if not button:
+        raise TimeoutException("상품정보 제공고시 버튼을 찾을 수 없습니다.")
+
+    # scrollIntoView는 동기 실행이므로 바로 클릭
+    driver.execute_script("arguments[0].scrollIntoView(true);", button)
+    driver.execute_script("arguments[0].click();", button)
+
+    # 펼쳐진 테이블의 행이 표시될 때까지 대기
+    wait_for(driver, "detail_info.table", elements_present(By.CSS_SELECTOR, DETAIL_INFO_ROW_SELECTOR),
+             timeout=5, budget=1.5)
+
+    # 테이블 데이터 수집
+    table = driver.find_element(By.CSS_SELECTOR, DETAIL_INFO_TABLE_SELECTOR)
+    rows = table.find_elements(By.TAG_NAME, "tr")
+    product_info = {}
+
+    for row in rows:
+        try:
+            key = row.find_element(By.TAG_NAME, "th").text.strip()
+            value = row.find_element(By.TAG_NAME, "td").text.strip()
+            product_info[key] = value
+        except:
+            continue
+
+    print(f"상품정보 제공고시 {len(product_info)}개 항목 수집 완료")
+    return product_info
+
+
+def build_detailinfo_row(product_info):
+    """
+    상품정보 제공고시 딕셔너리를 FIELD_MAP 컬럼 순서의 값 리스트로 변환합니다.
 
-    # JSON 문자열 생성
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    Args:
+        product_info: {항목명: 값} 딕셔너리
 
-    # trailing comma 방지
-    import re
-    json_str = re.sub(r',\s*\n\s*}', '\n}', json_str)
-    json_str = re.sub(r',\s*\n\s*]', '\n]', json_str)
+    Returns:
+        list: FIELD_MAP.values() 순서의 문자열 값 (없는 항목은 "")
+    """
+    return [str(product_info.get(key, "")) for key in FIELD_MAP]
 
-    # 저장
-    if transaction:
-        transaction.write_file(filename, json_str)
-    else:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(json_str)
 
-    print(f"[INFO] '{filename}' 파일 업데이트: {data}")
+def format_detailinfo_values(product_detail_info_id, column_values):
+    """
+    product_detail_info VALUES 튜플 한 개를 만듭니다.
 
+    Args:
+        product_detail_info_id: 상세정보 ID
+        column_values: build_detailinfo_row()가 반환한 값 리스트
 
-def get_next_detailinfo_id(transaction=None):
-    """다음 detailinfo ID를 가져오고 데이터 업데이트"""
-    # 데이터 로드
-    data = load_detailinfo_data()
+    Returns:
+        str: VALUES 튜플 문자열
+    """
+    values = ', '.join(f"'{escape_sql(value)}'" for value in column_values)
+    return f"({product_detail_info_id}, {values}, NOW(), NOW())"
 
-    # 현재 next_id 가져오기
-    current_next_id = data["next_id"]
 
-    print(f"[INFO] 할당할 ID: {current_next_id}")
+def save_product_detailinfo(product_detail_info_id, product_info, transaction=None,
+                            filename: str = SQL_FILE_PATH):
+    """
+    상품정보 제공고시 VALUES 튜플을 세그먼트 파일 끝에 추가합니다.
 
-    # 데이터 업데이트: last_id = 현재 next_id, next_id = next_id + 1
-    data["last_id"] = current_next_id
-    data["next_id"] = current_next_id + 1
+    Args:
+        product_detail_info_id: 상세정보 ID
+        product_info: {항목명: 값} 딕셔너리
+        transaction: FileTransaction 객체 (트랜잭션 사용 시)
+        filename: SQL 파일명
 
-    # 저장
-    save_detailinfo_data(data, transaction)
+    Returns:
+        str: 생성된 VALUES 튜플
+    """
+    values_sql = format_detailinfo_values(product_detail_info_id, build_detailinfo_row(product_info))
+    print(f"[DEBUG] 생성된 VALUES: {values_sql}")
 
-    return current_next_id
+    get_segment_writer(filename, DETAIL_INFO_SQL_HEADER).append([values_sql], transaction)
+    print(f"✓ 레코드 저장 완료 (ID: {product_detail_info_id})")
+    return values_sql
 
 
 def get_product_dtailinfo_provided(driver, transaction=None, filename: str = None):
@@ -148,123 +166,17 @@ def get_product_dtailinfo_provided(driver, transaction=None, filename: str = Non
         tuple: (product_info dict, product_detail_info_id)
     """
 
-    # 1. 다음 ID 가져오기 (JSON 파일 참조)
+    # 1. 다음 ID 가져오기 (통합 시퀀스)
     product_detail_info_id = get_next_detailinfo_id(transaction)
     print(f"[INFO] 생성된 상세정보 ID: {product_detail_info_id}")
 
     try:
-        # 웹 요소 찾기 및 클릭
-        wait = WebDriverWait(driver, 10)
-        button = wait.until(
-            EC.presence_of_element_located(
-                (By.XPATH, '//*[@id="tab-panels"]/section/ul/li[1]/button/span')
-            )
-        )
-
-        driver.execute_script("arguments[0].scrollIntoView(true);", button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", button)
-        time.sleep(1)
-
-        # 테이블 데이터 수집
-        table = driver.find_element(By.CSS_SELECTOR, "div.Accordion_content__aIya4 table.Accordion_table__mcFPq")
-        rows = table.find_elements(By.TAG_NAME, "tr")
-        product_info = {}
-
-        for row in rows:
-            try:
-                key = row.find_element(By.TAG_NAME, "th").text.strip()
-                value = row.find_element(By.TAG_NAME, "td").text.strip()
-                product_info[key] = value
-            except:
-                continue
-
-        print(f"상품정보 제공고시 {len(product_info)}개 항목 수집 완료")
-
-        # SQL 값 준비
-        ordered_values = []
-        for key, column in FIELD_MAP.items():
-            value = product_info.get(key, "")
-            ordered_values.append(f"'{escape_sql(str(value))}'")
-
-        columns = ', '.join(FIELD_MAP.values())
-        values = ', '.join(ordered_values)
-
-        # SQL 문 생성
-        values_sql = f"({product_detail_info_id}, {values}, NOW(), NOW())"
-
-        # SQL 문장 전체
-        full_sql = f"INSERT INTO product_detail_info (id, {columns}, created_at, updated_at)\nVALUES\n{values_sql});"
-
-        print(f"[DEBUG] 생성된 SQL: {full_sql}")
+        product_info = extract_product_detailinfo(driver)
 
-        # 6. 파일 저장
+        # 파일 저장 (세그먼트 파일 끝에 VALUES만 추가)
         if filename:
             try:
-                # 파일 존재 여부 및 내용 확인
-                file_exists = False
-                existing_content = ""
-
-                if transaction:
-                    # 트랜잭션 모드일 때는 실제 파일을 읽어봅니다
-                    try:
-                        with open(filename, 'r', encoding='utf-8') as f:
-                            existing_content = f.read()
-                        file_exists = True
-                        print(f"[DEBUG] 트랜잭션 모드: 파일 존재함, 길이: {len(existing_content)}")
-                    except FileNotFoundError:
-                        file_exists = False
-                        print("[DEBUG] 트랜잭션 모드: 파일 없음")
-                else:
-                    # 일반 모드일 때는 직접 확인
-                    file_exists = os.path.exists(filename)
-                    if file_exists and os.path.getsize(filename) > 0:
-                        with open(filename, 'r', encoding='utf-8') as f:
-                            existing_content = f.read()
-                        print(f"[DEBUG] 일반 모드: 파일 존재함, 길이: {len(existing_content)}")
-                    else:
-                        file_exists = False
-                        print("[DEBUG] 일반 모드: 파일 없거나 비어있음")
-
-                if not file_exists or existing_content.strip() == "":
-                    # 첫 번째 레코드: INSERT 문 전체 작성
-                    if transaction:
-                        transaction.write_file(filename, full_sql)
-                    else:
-                        with open(filename, "w", encoding='utf-8') as f:
-                            f.write(full_sql)
-                    print(f"✓ 첫 번째 레코드 저장 완료 (ID: {product_detail_info_id})")
-                else:
-                    # 기존 파일이 있으면 VALUES만 추가
-                    content = existing_content.strip()
-
-                    # 마지막 문자 상태에 따라 처리
-                    if content.endswith(');'):
-                        # 정상 종료된 경우: );를 ),로 교체
-                        content = content[:-2] + '),'
-                    elif content.endswith(';'):
-                        # 세미콜론만 있는 경우: ;를 ,로 교체
-                        content = content[:-1] + ','
-                    elif content.endswith(')'):
-                        # 괄호만 있는 경우: 콤마 추가
-                        content = content + ','
-                    elif content.endswith(','):
-                        # 이미 콤마로 끝난 경우: 그대로 사용
-                        pass
-                    else:
-                        # 예상치 못한 형식: 콤마 추가
-                        content = content + ','
-
-                        # 새로운 VALUES 추가 (항상 );로 종료)
-                    new_content = content + f"\n{values_sql};"
-
-                    if transaction:
-                        transaction.write_file(filename, new_content)
-                    else:
-                        with open(filename, "w", encoding='utf-8') as f:
-                            f.write(new_content)
-
-                    print(f"✓ 추가 레코드 저장 완료 (ID: {product_detail_info_id})")
+                save_product_detailinfo(product_detail_info_id, product_info, transaction, filename)
 
             except Exception as file_error:
                 print(f"✗ 파일 저장 중 오류 발생: {file_error}")
@@ -277,4 +189,4 @@ def get_product_dtailinfo_provided(driver, transaction=None, filename: str = Non
         print(f"✗ 상품정보 제공고시 수집 실패: {e}")
         import traceback
         traceback.print_exc()
-        return {}, product_detail_info_id
\ No newline at end of file
+        return {}, product_detail_info_id
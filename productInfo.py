@@ -55,6 +55,13 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 
+# 상세 페이지 기본 정보 XPath
+CATEGORY_XPATH = '//*[@id="main"]/div[1]/div/a[3]'
+BRAND_LINK_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/a'
+BRAND_BUTTON_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/button'
+PRODUCT_NAME_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[2]/h3'
+
+
 def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     상품 상세페이지에서 카테고리, 브랜드, 상품명 정보만 추출합니다.
@@ -70,17 +77,16 @@ def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[s
     try:
         # 1. 카테고리 정보 추출
         try:
-            category_element = driver.find_element(By.XPATH, '//*[@id="main"]/div[1]/div/a[3]')
+            category_element = driver.find_element(By.XPATH, CATEGORY_XPATH)
             text = category_element.text or category_element.get_attribute("textContent")
             category = text.strip() if text else None
         except NoSuchElementException:
-            print("카테고리 요소를 찾을 수 없습니다. (XPath: //*[@id=\"main\"]/div[1]/div/a[3])")
+            print(f"카테고리 요소를 찾을 수 없습니다. (XPath: {CATEGORY_XPATH})")
 
         # 2. 브랜드 정보 추출 (우선 a 시도, 없으면 button 시도)
         # 첫번째 시도: a 요소
         try:
-            brand_element = driver.find_element(By.XPATH,
-                                                '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/a')
+            brand_element = driver.find_element(By.XPATH, BRAND_LINK_XPATH)
             text = brand_element.text or brand_element.get_attribute("textContent")
             brand = text.strip() if text else None
             if brand:
@@ -91,8 +97,7 @@ def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[s
         # 두번째 시도: button 요소 (앞에서 brand가 None일 때만)
         if not brand:
             try:
-                brand_btn_element = driver.find_element(By.XPATH,
-                                                        '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/button')
+                brand_btn_element = driver.find_element(By.XPATH, BRAND_BUTTON_XPATH)
                 text = brand_btn_element.text or brand_btn_element.get_attribute("textContent")
                 brand = text.strip() if text else None
                 if brand:
@@ -104,12 +109,11 @@ def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[s
 
         # 3. 상품명 정보 추출
         try:
-            product_name_element = driver.find_element(By.XPATH,
-                                                       '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[2]/h3')
+            product_name_element = driver.find_element(By.XPATH, PRODUCT_NAME_XPATH)
             text = product_name_element.text or product_name_element.get_attribute("textContent")
             product_name = text.strip() if text else None
         except NoSuchElementException:
-            print("상품명 요소를 찾을 수 없습니다. (XPath: //*[@id=\"main\"]/div[2]/div/div[2]/div/div[1]/div[2]/h3)")
+            print(f"상품명 요소를 찾을 수 없습니다. (XPath: {PRODUCT_NAME_XPATH})")
 
         return category, brand, product_name
 
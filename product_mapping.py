@@ -2,49 +2,51 @@ import json
 import random
 import os
 from datetime import datetime, timedelta
+from sql_segment_writer import get_segment_writer
+from id_allocator import NameIdAllocator
+from id_sequence import ID_SEQUENCE
 
 # JSON 파일 경로
 JSON_FILE_PATH = "product_data.json"
 SQL_FILE_PATH = "product_data_sql.txt"
 
+# 제품명 -> 제품 ID 할당기 (product_data.json 스냅샷 + product_data.json.journal)
+# 새 ID는 통합 시퀀스(id_sequence.json)의 "product" 블록에서 꺼냄
+PRODUCT_ID_ALLOCATOR = NameIdAllocator(JSON_FILE_PATH, "products", sequence=ID_SEQUENCE, sequence_name="product")
+
+# products INSERT 문 머리말
+PRODUCT_SQL_HEADER = "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, use_restock_noti, product_name, product_code, search_keywords, exposure_status, sale_status, description, is_cancelable, is_deleted, created_at, updated_at) VALUES"
+
+# products 테이블 컬럼 (PRODUCT_SQL_HEADER와 같은 순서)
+PRODUCT_COLUMNS = [
+    "id", "product_detail_info_id", "brand_id", "category_id", "delivery_policy_id", "use_restock_noti",
+    "product_name", "product_code", "search_keywords", "exposure_status", "sale_status", "description",
+    "is_cancelable", "is_deleted", "created_at", "updated_at",
+]
+
+# products VALUES 세그먼트 기록기
+PRODUCT_SQL_WRITER = get_segment_writer(SQL_FILE_PATH, PRODUCT_SQL_HEADER)
+
 def create_product_id_with_transaction(product_name, transaction):
     """
-    새로운 제품 ID를 생성하고 JSON 파일에 트랜잭션으로 기록합니다.
+    새로운 제품 ID를 생성하고 할당 저널에 트랜잭션으로 기록합니다.
+    중복 확인과 할당은 메모리 인덱스에서 처리되므로 JSON 파일 전체를 읽고 쓰지 않습니다.
 
     Args:
         product_name (str): 제품명
-        transaction: FileTransaction 객체
+        transaction: FileTransaction 또는 GroupCommitTransaction 객체
 
     Returns:
         int: 새로 생성된 제품 ID 또는 0(중복된 경우)
     """
-    # JSON 데이터 로드
-    data = load_product_data()
-
-    # 이미 존재하는 제품명인지 확인
-    if product_name in data["products"]:
-        return 0
-
-    # 새 ID 할당
-    new_id = data["next_id"]
-    data["products"][product_name] = new_id
-
-    # next_id 증가
-    data["next_id"] += 1
-
-    # JSON 파일 저장 (트랜잭션 적용)
-    transaction.write_json(JSON_FILE_PATH, data)
-
-    return new_id
+    return PRODUCT_ID_ALLOCATOR.allocate(product_name, transaction)
 
 def load_product_data():
-    """JSON 파일에서 제품 데이터를 로드합니다."""
-    try:
-        with open(JSON_FILE_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        # 파일이 없을 경우 기본 구조 생성
-        return {"products": {}, "next_id": 1}
+    """
+    제품 데이터를 {"products": {...}, "next_id": N} 형식으로 반환합니다.
+    (product_data.json 스냅샷 + 할당 저널 반영)
+    """
+    return PRODUCT_ID_ALLOCATOR.snapshot()
 
 
 def save_product_data(data):
@@ -63,24 +65,7 @@ def create_product_id(product_name):
     Returns:
         int: 새로 생성된 제품 ID 또는 0(중복된 경우)
     """
-    # JSON 데이터 로드
-    data = load_product_data()
-
-    # 이미 존재하는 제품명인지 확인
-    if product_name in data["products"]:
-        return 0
-
-    # 새 ID 할당
-    new_id = data["next_id"]
-    data["products"][product_name] = new_id
-
-    # next_id 증가
-    data["next_id"] += 1
-
-    # JSON 파일 저장
-    save_product_data(data)
-
-    return new_id
+    return PRODUCT_ID_ALLOCATOR.allocate(product_name)
 
 
 def generate_random_datetime():
@@ -134,9 +119,21 @@ def create_initial_product_data_sql():
             f.write(initial_sql)
 
 
-def update_product_data_sql(product_id, product_detail_info_id, brand_id, category_id, product_name):
+def build_product_row(product_id, product_detail_info_id, brand_id, category_id, product_name, created_at):
     """
-    product_data_sql.txt 파일에 INSERT 문을 추가합니다. (수정된 버전)
+    products 행 하나를 PRODUCT_COLUMNS 순서의 값 튜플로 만듭니다. (고정값 컬럼 포함)
+
+    Returns:
+        tuple: 컬럼 값 (불리언은 bool, 시각은 문자열)
+    """
+    return (product_id, product_detail_info_id, brand_id, category_id, 2, False,
+            product_name, 'NONE', product_name, 'EXPOSURE', 'ON_SALE', '설명없음',
+            True, False, created_at, created_at)
+
+
+def format_product_values(product_id, product_detail_info_id, brand_id, category_id, product_name, created_at):
+    """
+    products VALUES 튜플 한 개를 만듭니다.
 
     Args:
         product_id (int): 제품 ID
@@ -144,55 +141,41 @@ def update_product_data_sql(product_id, product_detail_info_id, brand_id, catego
         brand_id (int): 브랜드 ID
         category_id (int): 카테고리 ID
         product_name (str): 제품명
+        created_at (str): 'YYYY-MM-DD HH:MM:SS' 형식의 생성 시각
 
     Returns:
-        str: 생성된 INSERT 문
+        str: VALUES 튜플 문자열
     """
-    # 랜덤한 datetime 생성
-    created_at = generate_random_datetime()
+    return f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{product_name}', 'NONE', '{product_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
 
-    # INSERT 문 생성 (괄호로 감싸진 값들)
-    insert_statement = f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{product_name}', 'NONE', '{product_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
 
-    # SQL 파일 읽기
-    try:
-        with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        # 파일이 없을 경우 초기 내용 생성
-        content = """INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, \
-                                           use_restock_noti, product_name, product_code, search_keywords, \
-                                           exposure_status, sale_status, description, is_cancelable, is_deleted, \
-                                           created_at, updated_at) \
-                     VALUES"""
-
-    # 내용 정리
-    content = content.strip()
-
-    # 마지막 문자 확인 및 처리
-    if content.endswith(';'):
-        # 세미콜론으로 끝나면 제거 (VALUES; 또는 데이터행); 모두 처리)
-        content = content[:-1].rstrip()
-
-    # VALUES로 끝나는지 확인 (첫 데이터 추가)
-    if content.endswith('VALUES'):
-        # 첫 데이터이므로 줄바꿈 후 추가하고 세미콜론으로 마무리
-        new_content = content + f"\n{insert_statement};"
-    else:
-        # 기존 데이터가 있으므로 콤마 추가 후 새 데이터 추가
-        new_content = content + f",\n{insert_statement};"
-
-    # SQL 파일 저장
-    with open(SQL_FILE_PATH, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+def update_product_data_sql(product_id, product_detail_info_id, brand_id, category_id, product_name, transaction=None):
+    """
+    products VALUES 튜플을 세그먼트 파일에 추가합니다.
+    최종 INSERT 문은 export_all_sql() 호출 시 product_data_sql.txt로 만들어집니다.
 
-    return insert_statement
+    Args:
+        product_id (int): 제품 ID
+        product_detail_info_id (int): 제품 상세 정보 ID
+        brand_id (int): 브랜드 ID
+        category_id (int): 카테고리 ID
+        product_name (str): 제품명
+        transaction: FileTransaction 객체 (트랜잭션 사용 시)
 
+    Returns:
+        str: 생성된 VALUES 튜플
+    """
+    # 랜덤한 datetime 생성
+    created_at = generate_random_datetime()
 
+    # INSERT 문 생성 (괄호로 감싸진 값들)
+    insert_statement = format_product_values(product_id, product_detail_info_id, brand_id, category_id,
+                                             product_name, created_at)
 
+    # 세그먼트 파일 끝에 추가 (파일 전체를 다시 쓰지 않음)
+    PRODUCT_SQL_WRITER.append([insert_statement], transaction)
 
-# 모듈 임포트 시 초기 SQL 파일 생성
-create_initial_product_data_sql()
+    return insert_statement
 
 
 # 테스트 함수
@@ -228,7 +211,8 @@ def test_sql_update():
 
         print(f"생성된 INSERT 문: {insert_stmt}")
 
-        # 업데이트된 내용 확인
+        # 세그먼트를 SQL 파일로 내보낸 뒤 내용 확인
+        PRODUCT_SQL_WRITER.export()
         try:
             with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
                 updated_content = f.read()
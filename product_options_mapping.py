@@ -1,13 +1,29 @@
 import random
-import os
 from typing import List, Dict
+from sql_segment_writer import get_segment_writer
+
+# SQL 파일 경로
+SQL_FILE_PATH = "product_options_sql.txt"
+
+# product_options INSERT 문 머리말
+PRODUCT_OPTIONS_SQL_HEADER = (
+    "INSERT INTO product_options\n"
+    "(product_id, option_name, purchase_price, selling_price,\n"
+    " current_stock, initial_stock, safety_stock,\n"
+    " image_url, display_order,\n"
+    " is_deleted, created_at, updated_at)\n"
+    "VALUES"
+)
+
+# 기본 product_options VALUES 세그먼트 기록기
+PRODUCT_OPTIONS_SQL_WRITER = get_segment_writer(SQL_FILE_PATH, PRODUCT_OPTIONS_SQL_HEADER)
 
 
 def create_product_options_sql(product_id: int, product_options: List[Dict], transaction,
-                               filename: str = "product_options_sql.txt") -> bool:
+                               filename: str = SQL_FILE_PATH) -> bool:
     """
-    수집된 상품 옵션 정보를 product_options 테이블 INSERT문에 VALUES만 추가합니다.
-    기존 INSERT문이 있으면 마지막 세미콜론을 쉼표로 변경하고 새 데이터를 추가합니다.
+    수집된 상품 옵션 정보를 product_options 테이블 VALUES 세그먼트에 추가합니다.
+    최종 INSERT문은 export_all_sql() 호출 시 SQL 파일로 만들어집니다.
 
     Args:
         product_id: 상품 ID
@@ -24,12 +40,6 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
         return False
 
     try:
-        # 기존 파일 내용 읽기
-        file_content = ""
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-
         # 새로운 VALUES 생성
         sql_values = []
         for idx, option in enumerate(product_options):
@@ -56,30 +66,8 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
             )
             sql_values.append(sql_value)
 
-        # 기존 파일이 있고 INSERT문이 있는 경우
-        if file_content and "INSERT INTO product_options" in file_content:
-            # 마지막 세미콜론을 쉼표로 변경
-            if file_content.rstrip().endswith(';'):
-                file_content = file_content.rstrip()[:-1] + ','
-
-            # 새 VALUES 추가
-            new_content = file_content + "\n" + ",\n".join(sql_values) + ";\n\n"
-
-            # 전체 파일 덮어쓰기
-            transaction.write_file(filename, new_content)
-        else:
-            # 파일이 없거나 INSERT문이 없는 경우 - 새로 생성
-            sql_text = ""
-            sql_text += "INSERT INTO product_options\n"
-            sql_text += "(product_id, option_name, purchase_price, selling_price,\n"
-            sql_text += " current_stock, initial_stock, safety_stock,\n"
-            sql_text += " image_url, display_order,\n"
-            sql_text += " is_deleted, created_at, updated_at)\n"
-            sql_text += "VALUES\n"
-            sql_text += ",\n".join(sql_values)
-            sql_text += ";\n\n"
-
-            transaction.write_file(filename, sql_text)
+        # 세그먼트 파일 끝에 VALUES만 추가 (파일 전체를 다시 쓰지 않음)
+        get_segment_writer(filename, PRODUCT_OPTIONS_SQL_HEADER).append(sql_values, transaction)
 
         print(f"✓ Product ID {product_id}의 옵션 {len(product_options)}개가 '{filename}'에 추가되었습니다.")
         return True
@@ -89,25 +77,20 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
         return False
 
 
-def create_product_options_sql_with_validation(product_id: int, product_options: List[Dict], transaction,
-                                               filename: str = "product_options_sql.txt") -> bool:
+def build_product_option_rows(product_id: int, product_options: List[Dict]) -> List[tuple]:
     """
-    유효성 검증을 포함한 product_options SQL 생성 함수 (기존 INSERT문에 VALUES만 추가)
+    유효한 옵션만 골라 product_options 행으로 변환합니다.
+    (옵션명/가격 추출에 실패한 옵션은 제외, 재고는 랜덤 생성)
 
     Args:
         product_id: 상품 ID
         product_options: get_product_options()에서 반환된 옵션 리스트
-        transaction: FileTransaction 객체
-        filename: SQL 파일명
 
     Returns:
-        bool: 성공 여부
+        list of tuple: [(product_id, option_name, purchase_price, selling_price,
+                         current_stock, initial_stock, safety_stock,
+                         image_url, display_order, is_deleted), ...]
     """
-
-    if not product_options:
-        print("⚠ 저장할 옵션 데이터가 없습니다.")
-        return False
-
     # 유효한 옵션만 필터링
     valid_options = []
     for option in product_options:
@@ -119,83 +102,108 @@ def create_product_options_sql_with_validation(product_id: int, product_options:
         else:
             print(f"⚠ 유효하지 않은 옵션 스킵: {option.get('name', 'N/A')}")
 
-    if not valid_options:
-        print("✗ 유효한 옵션이 없습니다.")
-        return False
+    rows = []
+    for idx, option in enumerate(valid_options):
+        option_name = option.get('name', '옵션명 없음')
 
-    try:
-        # 기존 파일 내용 읽기
-        file_content = ""
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+        try:
+            selling_price = int(option.get('price', '0'))
+        except (ValueError, TypeError):
+            selling_price = 0
 
-        # 새로운 VALUES 생성
-        sql_values = []
-        debug_lines = []
+        purchase_price = selling_price // 2
 
-        for idx, option in enumerate(valid_options):
-            option_name = option.get('name', '옵션명 없음').replace("'", "''")
+        if option.get('is_soldout', False):
+            current_stock = 0
+            initial_stock = random.randint(50, 100)
+        else:
+            current_stock = random.randint(50, 150)
+            initial_stock = current_stock + random.randint(0, 50)
 
-            try:
-                selling_price = int(option.get('price', '0'))
-            except (ValueError, TypeError):
-                selling_price = 0
+        safety_stock = 10
+        image_url = option.get('image_url', '')
+        display_order = idx
+        is_deleted = bool(option.get('is_soldout', False))
 
-            purchase_price = selling_price // 2
+        rows.append((product_id, option_name, purchase_price, selling_price,
+                     current_stock, initial_stock, safety_stock,
+                     image_url, display_order, is_deleted))
 
-            if option.get('is_soldout', False):
-                current_stock = 0
-                initial_stock = random.randint(50, 100)
-            else:
-                current_stock = random.randint(50, 150)
-                initial_stock = current_stock + random.randint(0, 50)
+    return rows
 
-            safety_stock = 10
-            image_url = option.get('image_url', '').replace("'", "''")
-            display_order = idx
-            is_deleted = 'true' if option.get('is_soldout', False) else 'false'
 
-            sql_value = (
-                f"({product_id}, '{option_name}', {purchase_price}, {selling_price}, "
-                f"{current_stock}, {initial_stock}, {safety_stock}, "
-                f"'{image_url}', {display_order}, "
-                f"{is_deleted}, NOW(), NOW())"
-            )
+def format_product_option_values(row: tuple) -> str:
+    """
+    product_options 행 하나를 VALUES 튜플 문자열로 만듭니다.
 
-            sql_values.append(sql_value)
-            debug_lines.append(f"  [{idx}] {option_name}: {selling_price}원, 재고: {current_stock}, 품절: {is_deleted}")
+    Args:
+        row: build_product_option_rows()가 반환한 행
 
-        # 기존 파일이 있고 INSERT문이 있는 경우
-        if file_content and "INSERT INTO product_options" in file_content:
-            # 마지막 세미콜론을 쉼표로 변경
-            if file_content.rstrip().endswith(';'):
-                file_content = file_content.rstrip()[:-1] + ','
+    Returns:
+        str: VALUES 튜플 문자열
+    """
+    (product_id, option_name, purchase_price, selling_price,
+     current_stock, initial_stock, safety_stock,
+     image_url, display_order, is_deleted) = row
 
-            # 새 VALUES 추가
-            new_content = file_content + "\n" + ",\n".join(sql_values) + ";\n\n"
+    option_name = option_name.replace("'", "''")
+    image_url = image_url.replace("'", "''")
+    is_deleted = 'true' if is_deleted else 'false'
 
-            # 전체 파일 덮어쓰기
-            transaction.write_file(filename, new_content)
-        else:
-            # 파일이 없거나 INSERT문이 없는 경우 - 새로 생성
-            sql_text = ""
-            sql_text += "INSERT INTO product_options\n"
-            sql_text += "(product_id, option_name, purchase_price, selling_price,\n"
-            sql_text += " current_stock, initial_stock, safety_stock,\n"
-            sql_text += " image_url, display_order,\n"
-            sql_text += " is_deleted, created_at, updated_at)\n"
-            sql_text += "VALUES\n"
-            sql_text += ",\n".join(sql_values)
-            sql_text += ";\n\n"
-
-            transaction.write_file(filename, sql_text)
+    return (
+        f"({product_id}, '{option_name}', {purchase_price}, {selling_price}, "
+        f"{current_stock}, {initial_stock}, {safety_stock}, "
+        f"'{image_url}', {display_order}, "
+        f"{is_deleted}, NOW(), NOW())"
+    )
+
+
+def create_product_options_sql_with_validation(product_id: int, product_options: List[Dict], transaction,
+                                               filename: str = SQL_FILE_PATH) -> bool:
+    """
+    유효성 검증을 포함한 product_options SQL 생성 함수 (VALUES 세그먼트에만 추가)
+
+    Args:
+        product_id: 상품 ID
+        product_options: get_product_options()에서 반환된 옵션 리스트
+        transaction: FileTransaction 객체
+        filename: SQL 파일명
+
+    Returns:
+        bool: 성공 여부
+    """
+
+    if not product_options:
+        print("⚠ 저장할 옵션 데이터가 없습니다.")
+        return False
+
+    # 유효한 옵션만 행으로 변환
+    rows = build_product_option_rows(product_id, product_options)
+
+    if not rows:
+        print("✗ 유효한 옵션이 없습니다.")
+        return False
+
+    try:
+        # 새로운 VALUES 생성
+        sql_values = []
+        debug_lines = []
+
+        for row in rows:
+            sql_values.append(format_product_option_values(row))
+
+            _, option_name, _, selling_price, current_stock, _, _, _, display_order, is_deleted = row
+            debug_lines.append(f"  [{display_order}] {option_name}: {selling_price}원, 재고: {current_stock}, "
+                               f"품절: {'true' if is_deleted else 'false'}")
+
+        # 세그먼트 파일 끝에 VALUES만 추가 (파일 전체를 다시 쓰지 않음)
+        get_segment_writer(filename, PRODUCT_OPTIONS_SQL_HEADER).append(sql_values, transaction)
 
         # 디버깅 출력
         for line in debug_lines:
             print(line)
 
-        print(f"\n✓ Product ID {product_id}의 유효한 옵션 {len(valid_options)}개가 '{filename}'에 추가되었습니다.")
+        print(f"\n✓ Product ID {product_id}의 유효한 옵션 {len(rows)}개가 '{filename}'에 추가되었습니다.")
         return True
 
     except Exception as e:
@@ -4,8 +4,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
-from file_transaction import FileTransaction
+from file_transaction import FileTransaction, MODE_WAL
 from crawl import crawl_product_on_detail_page
+from sql_segment_writer import export_all_sql
+from wait_engine import WAIT_ENGINE, wait_for, wait_settled, all_of, document_ready, element_present
 
 
 def create_driver():
@@ -62,24 +64,17 @@ def crawl_single_product(driver, product_url):
         print("페이지 로딩 중...")
         driver.get(product_url)
 
-        # Cloudflare 우회 및 페이지 로딩 대기
-        print("Cloudflare 체크 및 페이지 안정화 대기 중... (최대 15초)")
-        time.sleep(10)  # 초기 대기 시간 증가
-
-        # 페이지가 정상적으로 로드되었는지 확인
-        try:
-            # 페이지 로드 완료 대기
-            WebDriverWait(driver, 15).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
+        # Cloudflare 확인 페이지를 통과해 상세 정보 영역이 표시되고 안정화될 때까지 대기
+        # (확인 시간은 매번 달라 적응형 타임아웃 미사용)
+        print("Cloudflare 체크 및 페이지 안정화 대기 중... (최대 30초)")
+        if wait_for(driver, "detail.load", all_of(document_ready(), element_present(By.ID, "main")),
+                    timeout=30, budget=13, adaptive=False):
             print("✓ 페이지 로드 완료")
-        except Exception as e:
-            print(f"페이지 로드 대기 타임아웃: {e}")
+            wait_settled(driver, "detail.settle", timeout=5)
+        else:
+            print("페이지 로드 대기 타임아웃")
             # 계속 진행
 
-        # 추가 안정화 대기
-        time.sleep(3)
-
         print(f"페이지 제목: {driver.title}")
         print(f"현재 URL: {driver.current_url}")
 
@@ -89,7 +84,7 @@ def crawl_single_product(driver, product_url):
         crawl_success = False
 
         try:
-            with FileTransaction() as transaction:
+            with FileTransaction(mode=MODE_WAL) as transaction:
                 # 상세 페이지 크롤링 함수 호출 (product_counter는 1로 고정)
                 crawl_product_on_detail_page(driver, transaction, product_counter=1)
                 # 예외가 없으면 자동으로 commit됨
@@ -184,6 +179,12 @@ def main():
         traceback.print_exc()
 
     finally:
+        # 누적된 VALUES 세그먼트를 최종 SQL 파일로 내보내기
+        export_all_sql()
+
+        # 단계별 대기 시간 / 절약 시간 보고
+        WAIT_ENGINE.report()
+
         # 드라이버 종료
         if driver:
             print("\n드라이버 종료 중...")
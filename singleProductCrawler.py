@@ -4,8 +4,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
-from file_transaction import FileTransaction
+from file_transaction import FileTransaction, MODE_WAL
 from crawl import crawl_product_on_detail_page
+from sql_segment_writer import export_all_sql
+from wait_engine import WAIT_ENGINE, wait_for, all_of, document_ready, element_present
 
 
 def create_driver():
@@ -40,7 +42,9 @@ def crawl_single_product(driver, product_url):
 
         # 상품 상세 페이지로 이동
         driver.get(product_url)
-        time.sleep(5)  # 페이지 로딩 대기
+        # 페이지 로딩 대기
+        wait_for(driver, "detail.load", all_of(document_ready(), element_present(By.ID, "main")),
+                 timeout=15, budget=5)
 
         print(f"페이지 제목: {driver.title}")
         print(f"현재 URL: {driver.current_url}")
@@ -51,7 +55,7 @@ def crawl_single_product(driver, product_url):
         crawl_success = False
 
         try:
-            with FileTransaction() as transaction:
+            with FileTransaction(mode=MODE_WAL) as transaction:
                 # 상세 페이지 크롤링 함수 호출 (product_counter는 1로 고정)
                 crawl_product_on_detail_page(driver, transaction, product_counter=1)
                 # 예외가 없으면 자동으로 commit됨
@@ -146,6 +150,12 @@ def main():
         traceback.print_exc()
 
     finally:
+        # 누적된 VALUES 세그먼트를 최종 SQL 파일로 내보내기
+        export_all_sql()
+
+        # 단계별 대기 시간 / 절약 시간 보고
+        WAIT_ENGINE.report()
+
         # 드라이버 종료
         if driver:
             print("\n드라이버 종료 중...")
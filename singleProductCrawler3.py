@@ -1,49 +1,12 @@
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
-from file_transaction import FileTransaction
+from file_transaction import FileTransaction, MODE_WAL
 from crawl import crawl_product_on_detail_page
-
-
-def create_driver():
-    """드라이버 생성 함수"""
-    options = uc.ChromeOptions()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-
-    # 추가 안정성 옵션
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--log-level=3")  # 로그 레벨 감소
-
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
-
-    print("Chrome 드라이버 초기화 중...")
-    # version_main 제거하여 자동 버전 매칭
-    driver = uc.Chrome(options=options, use_subprocess=True)
-
-    # 드라이버 초기화 대기
-    time.sleep(2)
-
-    # 빈 페이지로 이동하여 드라이버 안정화
-    try:
-        driver.get("about:blank")
-        time.sleep(1)
-        print("✓ 드라이버 초기화 완료")
-    except Exception as e:
-        print(f"✗ 드라이버 초기화 중 오류: {e}")
-        raise
-
-    # 페이지 로드 타임아웃 설정
-    driver.set_page_load_timeout(60)
-
-    return driver
+from sql_segment_writer import export_all_sql
+from wait_engine import WAIT_ENGINE, wait_for, wait_settled, all_of, document_ready, element_present
+from driver_pool import DriverPool
+from lean_profile import LEAN_PROFILE
 
 
 def crawl_single_product(driver, product_url):
@@ -87,24 +50,18 @@ def crawl_single_product(driver, product_url):
             print(f"✗ 페이지 로딩 실패: {e}")
             return False
 
-        # Cloudflare 우회 및 페이지 로딩 대기
-        print("Cloudflare 체크 및 페이지 안정화 대기 중... (최대 15초)")
-        time.sleep(10)  # 초기 대기 시간 증가
-
-        # 페이지가 정상적으로 로드되었는지 확인
-        try:
-            # 페이지 로드 완료 대기
-            WebDriverWait(driver, 15).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
+        # Cloudflare 확인 페이지를 통과해 상세 정보 영역이 표시되고 안정화될 때까지 대기
+        # (확인 시간은 매번 달라 적응형 타임아웃 미사용)
+        print("Cloudflare 체크 및 페이지 안정화 대기 중... (최대 30초)")
+        if wait_for(driver, "detail.load", all_of(document_ready(), element_present(By.ID, "main")),
+                    timeout=30, budget=13, adaptive=False):
             print("✓ 페이지 로드 완료")
-        except Exception as e:
-            print(f"페이지 로드 대기 타임아웃: {e}")
+            LEAN_PROFILE.measure(driver, "상세 페이지")
+            wait_settled(driver, "detail.settle", timeout=5)
+        else:
+            print("페이지 로드 대기 타임아웃")
             # 계속 진행
 
-        # 추가 안정화 대기
-        time.sleep(3)
-
         print(f"페이지 제목: {driver.title}")
         print(f"현재 URL: {driver.current_url}")
 
@@ -114,7 +71,7 @@ def crawl_single_product(driver, product_url):
         crawl_success = False
 
         try:
-            with FileTransaction() as transaction:
+            with FileTransaction(mode=MODE_WAL) as transaction:
                 # 상세 페이지 크롤링 함수 호출 (product_counter는 1로 고정)
                 crawl_product_on_detail_page(driver, transaction, product_counter=1)
                 # 예외가 없으면 자동으로 commit됨
@@ -161,45 +118,44 @@ def crawl_single_product(driver, product_url):
 
 def main():
     """메인 실행 함수"""
-    driver = None
+    # 준비된 브라우저 세션을 URL마다 재사용 (Cloudflare 확인 통과는 드라이버를 만들 때 한 번만)
+    pool = DriverPool()
 
     try:
-        # 드라이버 생성
-        print("드라이버 생성 중...")
-        driver = create_driver()
-        print("✓ 드라이버 생성 완료")
-
-        # 사용자로부터 상품 URL 입력받기
         print("\n" + "=" * 60)
         print("단일 상품 크롤러 (Single Product Crawler)")
         print("=" * 60)
-        print("\n크롤링할 상품 상세 페이지 URL을 입력하세요:")
-        print("예시: https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo=A000000123456")
-
-        product_url = input("\nURL 입력: ").strip()
 
-        # URL 검증
-        if not product_url:
-            print("\n✗ URL이 입력되지 않았습니다.")
-            return
+        while True:
+            # 사용자로부터 상품 URL 입력받기 (빈 입력이면 종료)
+            print("\n크롤링할 상품 상세 페이지 URL을 입력하세요 (빈 입력: 종료):")
+            print("예시: https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo=A000000123456")
 
-        if not product_url.startswith("http"):
-            print("\n✗ 올바른 URL 형식이 아닙니다. (http:// 또는 https://로 시작해야 합니다)")
-            return
+            product_url = input("\nURL 입력: ").strip()
 
-        # 크롤링 실행
-        print("\n크롤링을 시작합니다...")
-        success = crawl_single_product(driver, product_url)
+            # URL 검증
+            if not product_url:
+                print("\nURL이 입력되지 않아 종료합니다.")
+                break
 
-        # 결과 출력
-        print("\n" + "=" * 60)
-        if success:
-            print("✓ 크롤링 성공!")
-            print("  → 상품 데이터가 파일에 저장되었습니다.")
-        else:
-            print("✗ 크롤링 실패")
-            print("  → 데이터가 저장되지 않았습니다.")
-        print("=" * 60)
+            if not product_url.startswith("http"):
+                print("\n✗ 올바른 URL 형식이 아닙니다. (http:// 또는 https://로 시작해야 합니다)")
+                continue
+
+            # 크롤링 실행
+            print("\n크롤링을 시작합니다...")
+            with pool.session() as driver:
+                success = crawl_single_product(driver, product_url)
+
+            # 결과 출력
+            print("\n" + "=" * 60)
+            if success:
+                print("✓ 크롤링 성공!")
+                print("  → 상품 데이터가 파일에 저장되었습니다.")
+            else:
+                print("✗ 크롤링 실패")
+                print("  → 데이터가 저장되지 않았습니다.")
+            print("=" * 60)
 
     except KeyboardInterrupt:
         print("\n\n사용자에 의해 프로그램이 중단되었습니다.")
@@ -209,42 +165,18 @@ def main():
         traceback.print_exc()
 
     finally:
-        # 드라이버 종료
-        if driver:
-            print("\n드라이버 종료 중...")
+        # 누적된 VALUES 세그먼트를 최종 SQL 파일로 내보내기
+        export_all_sql()
 
-            try:
-                # 최종 스크린샷 저장 (디버깅용)
-                try:
-                    driver.save_screenshot("final_screenshot.png")
-                    print("최종 스크린샷 저장: final_screenshot.png")
-                except:
-                    pass
-
-                # 모든 창 닫기
-                for handle in driver.window_handles:
-                    try:
-                        driver.switch_to.window(handle)
-                        driver.close()
-                        time.sleep(0.1)
-                    except:
-                        pass
-
-                # 드라이버 참조 제거
-                driver_ref = driver
-                del driver
-
-                # garbage collection 강제 실행
-                import gc
-                gc.collect()
-
-                print("✓ 드라이버 종료 완료")
+        # 단계별 대기 시간 / 절약 시간 보고
+        WAIT_ENGINE.report()
 
-            except Exception as e:
-                print(f"✗ 드라이버 종료 중 오류 (무시): {e}")
+        # 페이지당 전송량 / 리소스 차단으로 절약한 전송량 보고
+        LEAN_PROFILE.report()
 
-            print("\n프로그램 종료")
-            time.sleep(1)
+        # 드라이버 종료 (driver.quit으로 브라우저 프로세스까지 정리)
+        pool.close()
+        print("\n프로그램 종료")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+"""
+SQL VALUES 세그먼트 기록 모듈
+상품별 VALUES 튜플은 세그먼트 파일 끝에 추가(append)만 하고,
+최종 INSERT ... VALUES ...; 문장은 내보내기(export) 시점에만 조립합니다.
+파일 크기와 관계없이 상품 1개당 기록 비용이 일정합니다.
+SQL 파일을 외부에서 수정하면 다음 내보내기 전에 세그먼트에 다시 반영합니다.
+"""
+
+import hashlib
+import json
+import os
+
+# 세그먼트 파일을 저장할 디렉토리
+SEGMENT_DIR = ".sql_segments"
+
+# 세그먼트 파일 안에서 VALUES 튜플 뒤에 붙는 구분자
+SEGMENT_SEPARATOR = ",\n"
+
+# 내보내기 시 한 번에 복사할 바이트 수
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# 마지막 동기화 시점의 SQL 파일 정보를 저장하는 파일 접미사
+STAMP_SUFFIX = ".stamp"
+
+# {SQL 파일 경로: SqlSegmentWriter}
+_WRITERS = {}
+
+
+class SqlSegmentWriter:
+    """
+    하나의 SQL 출력 파일에 대응하는 append-only 세그먼트 기록기
+    세그먼트 파일에는 'VALUES 튜플 + 구분자'가 순서대로 쌓입니다.
+    """
+
+    def __init__(self, sql_file_path, header, segment_dir=SEGMENT_DIR):
+        """
+        Args:
+            sql_file_path: 최종 SQL 파일 경로 (예: product_data_sql.txt)
+            header: 'VALUES'로 끝나는 INSERT 문 머리말
+            segment_dir: 세그먼트 파일을 저장할 디렉토리
+        """
+        self.sql_file_path = sql_file_path
+        self.header = header.rstrip()
+        self.segment_dir = segment_dir
+        self.segment_path = os.path.join(segment_dir, f"{os.path.basename(sql_file_path)}.seg")
+        self.stamp_path = self.segment_path + STAMP_SUFFIX
+        self._ready = False
+
+    def _ensure_segment(self):
+        """세그먼트 파일이 없으면 기존 SQL 파일 내용으로 생성하고, 외부 수정을 반영합니다."""
+        if self._ready:
+            return
+
+        if not os.path.exists(self.segment_dir):
+            os.makedirs(self.segment_dir)
+
+        if not os.path.exists(self.segment_path):
+            self._seed_from_sql_file()
+        else:
+            self._sync_external_changes()
+
+        self._ready = True
+
+    def _read_sql_body(self):
+        """
+        SQL 파일에서 VALUES 뒤의 튜플 부분만 읽어옵니다.
+
+        Returns:
+            str: 끝의 ';'를 제외한 VALUES 튜플 문자열 (파일이 없으면 빈 문자열)
+        """
+        if not os.path.exists(self.sql_file_path):
+            return ""
+
+        with open(self.sql_file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        values_idx = content.find("VALUES")
+        if values_idx == -1:
+            return ""
+
+        body = content[values_idx + len("VALUES"):].strip()
+        if body.endswith(';'):
+            body = body[:-1].rstrip()
+        return body
+
+    def _seed_from_sql_file(self, tail=b""):
+        """
+        기존 SQL 파일의 VALUES 부분을 세그먼트 형식으로 옮깁니다.
+
+        Args:
+            tail: SQL 파일 내용 뒤에 이어 붙일 세그먼트 바이트
+                  (마지막 동기화 이후 추가된 튜플)
+        """
+        body = self._read_sql_body()
+
+        temp_path = self.segment_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            if body:
+                f.write((body + SEGMENT_SEPARATOR).encode('utf-8'))
+            f.write(tail)
+        os.replace(temp_path, self.segment_path)
+
+        self._record_stamp(self._file_hash(self.sql_file_path))
+        print(f"[Segment] 세그먼트 생성: {self.sql_file_path} -> {self.segment_path}")
+
+    def _sync_external_changes(self):
+        """
+        마지막 동기화 이후 SQL 파일이 외부에서 바뀌었으면 세그먼트를 다시 만듭니다.
+        바뀐 SQL 파일 내용 뒤에 그 사이 세그먼트에 추가된 튜플만 이어 붙이므로
+        외부 수정과 새로 수집한 데이터가 모두 유지됩니다.
+        """
+        stamp = self._load_stamp()
+        if stamp is None or not os.path.exists(self.sql_file_path):
+            return
+
+        stat = os.stat(self.sql_file_path)
+        if stat.st_size == stamp.get("sql_size") and stat.st_mtime_ns == stamp.get("sql_mtime_ns"):
+            return
+
+        sql_hash = self._file_hash(self.sql_file_path)
+        if sql_hash == stamp.get("sql_sha256"):
+            # 내용은 같고 수정 시각만 바뀐 경우
+            self._record_stamp(sql_hash, stamp.get("segment_size", 0))
+            return
+
+        with open(self.segment_path, 'rb') as f:
+            f.seek(stamp.get("segment_size", 0))
+            tail = f.read()
+
+        print(f"⚠ [Segment] SQL 파일이 외부에서 수정되어 세그먼트를 다시 만듭니다: {self.sql_file_path}")
+        self._seed_from_sql_file(tail)
+
+    def _load_stamp(self):
+        """
+        마지막 동기화 정보를 읽어옵니다.
+
+        Returns:
+            dict: {"sql_size", "sql_mtime_ns", "sql_sha256", "segment_size"} (없으면 None)
+        """
+        if not os.path.exists(self.stamp_path):
+            return None
+
+        try:
+            with open(self.stamp_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ [Segment] 동기화 정보를 읽을 수 없습니다: {e}")
+            return None
+
+    def _record_stamp(self, sql_hash, segment_size=None):
+        """
+        현재 SQL 파일과 세그먼트가 같은 내용임을 기록합니다.
+
+        Args:
+            sql_hash: SQL 파일 내용의 SHA-256 (파일이 없으면 None)
+            segment_size: SQL 파일에 반영된 세그먼트 바이트 수 (None이면 현재 크기)
+        """
+        if segment_size is None:
+            segment_size = os.path.getsize(self.segment_path)
+
+        stamp = {"sql_size": None, "sql_mtime_ns": None, "sql_sha256": sql_hash,
+                 "segment_size": segment_size}
+        if os.path.exists(self.sql_file_path):
+            stat = os.stat(self.sql_file_path)
+            stamp["sql_size"] = stat.st_size
+            stamp["sql_mtime_ns"] = stat.st_mtime_ns
+
+        temp_path = self.stamp_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(stamp, f)
+        os.replace(temp_path, self.stamp_path)
+
+    @staticmethod
+    def _file_hash(file_path):
+        """
+        파일 내용의 SHA-256을 계산합니다.
+
+        Returns:
+            str: 16진수 해시 (파일이 없으면 None)
+        """
+        if not os.path.exists(file_path):
+            return None
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(EXPORT_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def append(self, values, transaction=None):
+        """
+        VALUES 튜플들을 세그먼트 파일 끝에 추가합니다.
+
+        Args:
+            values: "(1, 'a', ...)" 형식의 VALUES 튜플 문자열 리스트
+            transaction: FileTransaction 객체 (트랜잭션 사용 시)
+
+        Returns:
+            int: 추가한 튜플 수
+        """
+        if not values:
+            return 0
+
+        self._ensure_segment()
+
+        chunk = "".join(value + SEGMENT_SEPARATOR for value in values)
+
+        if transaction:
+            transaction.append_file(self.segment_path, chunk)
+        else:
+            with open(self.segment_path, 'a', encoding='utf-8') as f:
+                f.write(chunk)
+
+        return len(values)
+
+    def reset(self, values, transaction=None):
+        """
+        세그먼트 내용을 주어진 VALUES 튜플들로 통째로 교체합니다.
+        (전체 재생성이 필요한 경우에만 사용)
+
+        Args:
+            values: "(1, 'a', ...)" 형식의 VALUES 튜플 문자열 리스트
+            transaction: FileTransaction 객체 (트랜잭션 사용 시)
+
+        Returns:
+            int: 기록한 튜플 수
+        """
+        if not os.path.exists(self.segment_dir):
+            os.makedirs(self.segment_dir)
+
+        content = "".join(value + SEGMENT_SEPARATOR for value in values)
+
+        if transaction:
+            transaction.write_file(self.segment_path, content)
+        else:
+            with open(self.segment_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        # 통째로 교체한 세그먼트가 기준이므로 이전 동기화 정보는 버림
+        if os.path.exists(self.stamp_path):
+            os.remove(self.stamp_path)
+
+        self._ready = True
+        return len(values)
+
+    def export(self, output_path=None):
+        """
+        세그먼트를 하나의 INSERT ... VALUES ...; 문장으로 조립해 저장합니다.
+
+        Args:
+            output_path: 저장할 파일 경로 (None이면 원래 SQL 파일 경로)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        if self._ready:
+            self._sync_external_changes()
+        else:
+            self._ensure_segment()
+
+        output_path = output_path or self.sql_file_path
+        separator = SEGMENT_SEPARATOR.encode('utf-8')
+
+        # 마지막 구분자를 제외한 바이트 수
+        remaining = os.path.getsize(self.segment_path)
+        if remaining >= len(separator):
+            remaining -= len(separator)
+
+        segment_size = os.path.getsize(self.segment_path)
+        digest = hashlib.sha256()
+
+        def write(data):
+            dst.write(data)
+            digest.update(data)
+
+        temp_path = output_path + ".tmp"
+        with open(self.segment_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            write(self.header.encode('utf-8'))
+            if remaining > 0:
+                write(b"\n")
+                while remaining > 0:
+                    chunk = src.read(min(EXPORT_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    write(chunk)
+                    remaining -= len(chunk)
+            write(b";")
+        os.replace(temp_path, output_path)
+
+        if os.path.abspath(output_path) == os.path.abspath(self.sql_file_path):
+            self._record_stamp(digest.hexdigest(), segment_size)
+
+        print(f"[Segment] SQL 파일 내보내기 완료: {output_path}")
+        return output_path
+
+
+def get_segment_writer(sql_file_path, header):
+    """
+    SQL 파일 경로에 대응하는 세그먼트 기록기를 반환합니다.
+    같은 경로로 다시 호출하면 기존 기록기를 재사용합니다.
+
+    Args:
+        sql_file_path: 최종 SQL 파일 경로
+        header: 'VALUES'로 끝나는 INSERT 문 머리말
+
+    Returns:
+        SqlSegmentWriter: 세그먼트 기록기
+    """
+    writer = _WRITERS.get(sql_file_path)
+    if writer is None:
+        writer = SqlSegmentWriter(sql_file_path, header)
+        _WRITERS[sql_file_path] = writer
+    return writer
+
+
+def export_all_sql():
+    """
+    등록된 모든 세그먼트를 최종 SQL 파일로 내보냅니다.
+
+    Returns:
+        list: 내보낸 SQL 파일 경로 리스트
+    """
+    exported = []
+    for writer in _WRITERS.values():
+        try:
+            exported.append(writer.export())
+        except Exception as e:
+            print(f"✗ SQL 내보내기 실패 ({writer.sql_file_path}): {e}")
+    return exported
+
+
+if __name__ == "__main__":
+    # 세그먼트를 가진 모듈을 불러와 기록기를 등록한 뒤 전체 내보내기
+    import brand_mapping
+    import product_mapping
+    import main_images_mapping
+    import product_options_mapping
+
+    try:
+        import productDetailInfoProvided
+    except ImportError as e:
+        print(f"상품정보 제공고시 모듈을 불러올 수 없습니다: {e}")
+
+    for path in export_all_sql():
+        print(f"  - {path}")
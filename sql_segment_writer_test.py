@@ -0,0 +1,48 @@
+import os
+import tempfile
+from sql_segment_writer import SqlSegmentWriter
+
+# 임시 디렉토리에서 세그먼트 추가 -> 내보내기 확인
+work_dir = tempfile.mkdtemp()
+sql_file = os.path.join(work_dir, "test_sql.txt")
+
+with open(sql_file, 'w', encoding='utf-8') as f:
+    f.write("INSERT INTO test (id, name) VALUES\n(1, 'a');")
+
+writer = SqlSegmentWriter(sql_file, "INSERT INTO test (id, name) VALUES",
+                          segment_dir=os.path.join(work_dir, ".sql_segments"))
+writer.append(["(2, 'b')", "(3, 'c')"])
+writer.export()
+
+with open(sql_file, 'r', encoding='utf-8') as f:
+    result = f.read()
+
+print(result)
+assert result == "INSERT INTO test (id, name) VALUES\n(1, 'a'),\n(2, 'b'),\n(3, 'c');"
+
+# 내보내기 후 SQL 파일을 외부에서 수정 -> 수정 내용과 새로 추가한 튜플이 모두 유지
+with open(sql_file, 'w', encoding='utf-8') as f:
+    f.write("INSERT INTO test (id, name) VALUES\n(1, 'a'),\n(3, 'c');")
+
+writer.append(["(4, 'd')"])
+writer.export()
+
+with open(sql_file, 'r', encoding='utf-8') as f:
+    result = f.read()
+
+assert result == "INSERT INTO test (id, name) VALUES\n(1, 'a'),\n(3, 'c'),\n(4, 'd');"
+
+# 새 기록기(재시작)도 외부 수정을 반영
+with open(sql_file, 'w', encoding='utf-8') as f:
+    f.write("INSERT INTO test (id, name) VALUES\n(3, 'c');")
+
+restarted = SqlSegmentWriter(sql_file, "INSERT INTO test (id, name) VALUES",
+                             segment_dir=os.path.join(work_dir, ".sql_segments"))
+restarted.append(["(5, 'e')"])
+restarted.export()
+
+with open(sql_file, 'r', encoding='utf-8') as f:
+    result = f.read()
+
+assert result == "INSERT INTO test (id, name) VALUES\n(3, 'c'),\n(5, 'e');"
+print("외부 수정 반영 테스트 통과")
@@ -1,15 +1,36 @@
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import traceback
-from file_transaction import FileTransaction
-from crawl import crawl_product_on_detail_page
-
+from crawl import crawl_product_url
+from listing import harvest_product_links, build_listing_page_url, set_rows_per_page, CURRENT_PAGE_XPATH, \
+    LISTING_ROWS_PER_PAGE
+from listing_pager import ListingPager, LISTING_PREFETCH_TABS
+from crawl_frontier import CrawlFrontier, frontier_path
+from crawled_index import CrawledIndex, skip_known_links
+from category_scheduler import crawl_categories
+from worker_pool import CrawlWorkerPool
+from lean_profile import LEAN_PROFILE
+from driver_pool import DriverPool
+from crawl_sink import SqlTextSink
+from sql_segment_writer import export_all_sql
+from wait_engine import WAIT_ENGINE, wait_for, wait_settled, any_of, element_present, text_equals, url_changes
+
+# 상품 목록 영역 (DOM 안정화 감시 대상)
+LISTING_ROOT_SELECTOR = "#Contents"
+
+# 목록 페이지 순회 방식
+# url: pageIdx를 바꾼 URL로 바로 열고 다음 페이지를 탭에 미리 로드 / click: 페이지 번호 링크 클릭
+PAGINATION_URL = "url"
+PAGINATION_CLICK = "click"
+
+
+def create_driver(profile_dir=None):
+    """
+    드라이버 생성 함수 (DriverPool의 factory로 사용)
 
-def create_driver():
-    """드라이버 생성 함수"""
+    Args:
+        profile_dir: Chrome 사용자 데이터 디렉토리 (DriverPool이 지정, 확인 통과 쿠키가 다음 실행까지 남음)
+    """
     options = uc.ChromeOptions()
     options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -18,7 +39,7 @@ def create_driver():
     options.add_argument(
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
 
-    return uc.Chrome(options=options, version_main=137, use_subprocess=True)
+    return uc.Chrome(options=options, user_data_dir=profile_dir, version_main=137, use_subprocess=True)
 
 
 def go_back_to_original_page(driver, original_url):
@@ -36,15 +57,12 @@ def go_back_to_original_page(driver, original_url):
     print("GET 요청으로 직접 페이지 이동")
     try:
         driver.get(original_url)
-        time.sleep(3)  # 페이지 로딩 대기
 
         # 페이지가 완전히 로드될 때까지 대기
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "Container"))
-            )
+        if wait_for(driver, "listing.load", element_present(By.ID, "Container"), timeout=10, budget=3,
+                    adaptive=False):
             print("✓ GET 요청으로 페이지 이동 완료")
-        except:
+        else:
             print("페이지 로드 대기 중 타임아웃, 계속 진행")
 
     except Exception as e:
@@ -53,7 +71,9 @@ def go_back_to_original_page(driver, original_url):
         try:
             print("GET 요청 실패, 뒤로가기 시도")
             driver.execute_script("window.history.back();")
-            time.sleep(3)
+            # 페이지 이동 또는 양식 재제출 경고창 대기
+            wait_for(driver, "listing.back", any_of(url_changes(current_url_before), lambda d: d.switch_to.alert),
+                     timeout=5, budget=3)
 
             # 경고창 처리 (양식 재제출 확인)
             try:
@@ -61,7 +81,8 @@ def go_back_to_original_page(driver, original_url):
                 print(f"경고창 발견: {alert.text}")
                 alert.accept()  # '계속' 버튼 클릭
                 print("경고창 처리 완료")
-                time.sleep(2)
+                wait_for(driver, "listing.load", element_present(By.ID, "Container"), timeout=10, budget=2,
+                         adaptive=False)
             except:
                 # 경고창 없음
                 pass
@@ -79,8 +100,8 @@ def go_back_to_original_page(driver, original_url):
     except:
         print("페이지 제목을 가져올 수 없음")
 
-    # 페이지가 안정화될 때까지 추가 대기
-    time.sleep(2)
+    # 상품 목록이 안정화될 때까지 대기
+    wait_settled(driver, "listing.settle", LISTING_ROOT_SELECTOR, timeout=5, budget=2)
 
     return True
 
@@ -88,7 +109,7 @@ def go_back_to_original_page(driver, original_url):
 def get_current_page_number(driver):
     """현재 페이지 번호를 가져오는 함수"""
     try:
-        current_page_element = driver.find_element(By.XPATH, '//*[@id="Container"]/div[2]/strong[@title="현재 페이지"]')
+        current_page_element = driver.find_element(By.XPATH, CURRENT_PAGE_XPATH)
         current_page = int(current_page_element.text.strip())
         return current_page
     except Exception as e:
@@ -96,6 +117,12 @@ def get_current_page_number(driver):
         return None
 
 
+def _wait_for_page(driver, page):
+    """현재 페이지 번호가 page로 바뀌고 상품 목록이 안정화될 때까지 대기"""
+    wait_for(driver, "listing.page", text_equals(By.XPATH, CURRENT_PAGE_XPATH, page), timeout=10, budget=3)
+    wait_settled(driver, "listing.settle", LISTING_ROOT_SELECTOR, timeout=5)
+
+
 def click_next_page(driver, current_page):
     """
     다음 페이지로 이동하는 함수
@@ -123,7 +150,7 @@ def click_next_page(driver, current_page):
             )
             print(f"✓ {next_page}페이지 버튼 찾음 (data-page-no)")
             next_button.click()
-            time.sleep(3)
+            _wait_for_page(driver, next_page)
             return True
         except:
             print(f"{next_page}페이지 직접 버튼을 찾지 못함")
@@ -135,7 +162,7 @@ def click_next_page(driver, current_page):
             )
             print(f"✓ '다음 10 페이지' 버튼 찾음")
             next_10_button.click()
-            time.sleep(3)
+            _wait_for_page(driver, next_page)
             return True
         except:
             print("'다음 10 페이지' 버튼을 찾지 못함")
@@ -149,7 +176,7 @@ def click_next_page(driver, current_page):
                     if page_no and int(page_no) == next_page:
                         print(f"✓ {next_page}페이지 버튼 찾음 (순회)")
                         link.click()
-                        time.sleep(3)
+                        _wait_for_page(driver, next_page)
                         return True
                 except:
                     continue
@@ -201,170 +228,105 @@ def has_next_page(driver, current_page):
         return False
 
 
-def crawl_products_on_current_page(driver, original_url, max_products=0):
+def crawl_links(driver, links, sink, pool=None, frontier=None, index=None):
+    """
+    수집한 상품 링크의 상세 페이지를 차례로 크롤링하거나 워커 풀에 넘기는 함수
+
+    Args:
+        driver: 웹드라이버
+        links: [{"goods_no", "url", "name"}, ...]
+        sink: 저장소
+        pool: 상세 페이지 추출 워커 풀 (None이면 이 드라이버로 순차 크롤링)
+        frontier: URL 상태를 기록할 크롤링 프론티어 (None이면 기록 안 함)
+        index: 저장했거나 이미 존재하는 상품을 기록할 수집 완료 인덱스 (None이면 기록 안 함)
+
+    Returns:
+        int: 처리한 상품 수 (pool 사용 시 워커 풀에 넘긴 상품 수)
+    """
+    product_counter = 0
+    for link in links:
+        product_counter += 1
+        print(f"\n{'─' * 30}")
+        print(f"상품 {product_counter}: {link['name'] or '상품명 없음'}")
+        print(f"상세 페이지 URL: {link['url']}")
+
+        if pool:
+            # 워커 풀에 넘기고, 이미 도착한 결과는 바로 기록
+            pool.submit(link["url"], product_counter)
+            pool.collect()
+            continue
+
+        # 상세 페이지 크롤링 (트랜잭션, 오류 처리는 crawl_product_url에서 수행)
+        crawl_product_url(driver, link["url"], product_counter, sink, frontier=frontier, index=index)
+
+    return product_counter
+
+
+def crawl_products_on_current_page(driver, original_url, max_products=0, sink=None, pool=None,
+                                   frontier=None, page=None, index=None, links=None):
     """
     현재 페이지의 모든 상품을 크롤링하는 함수
+    목록에서 상세 페이지 URL을 한 번에 수집한 뒤 각 상세 페이지로 바로 이동하고,
+    목록 페이지는 페이지가 끝날 때 한 번만 다시 불러옵니다. (상품마다 클릭 → 뒤로가기 반복 없음)
+    pool을 지정하면 URL을 워커 풀에 넘기고, 목록 드라이버는 목록 페이지에 그대로 머뭅니다.
 
     Args:
         driver: 웹드라이버
         original_url: 현재 페이지 URL
         max_products: 최대 크롤링할 상품 수 (0이면 모두)
+        sink: 저장소 (SqlTextSink 또는 SQLiteSink, None이면 상품마다 개별 트랜잭션의 SQL 텍스트 저장소)
+        pool: 상세 페이지 추출 워커 풀 (CrawlWorkerPool, None이면 이 드라이버로 순차 크롤링)
+        frontier: 크롤링 프론티어 (지정하면 페이지의 모든 링크를 기록하고, 이전 실행에서 처리한 상품은 건너뜀)
+        page: 현재 페이지 번호 (frontier 사용 시 필요)
+        index: 수집 완료 인덱스 (지정하면 이미 수집한 상품은 상세 페이지를 열지 않고 건너뜀)
+        links: 이미 수집한 페이지의 상품 링크 (ListingPager 사용 시, 지정하면 목록을 읽지 않고 목록 페이지로 복귀하지 않음)
 
     Returns:
-        int: 처리한 상품 수
+        int: 처리한 상품 수 (pool 사용 시 워커 풀에 넘긴 상품 수)
     """
     product_counter = 0
+    sink = sink or SqlTextSink()
+    go_back = links is None and not pool
 
     try:
-        # 각 행을 순회 (ul[2]부터 ul[7]까지)
-        for row_num in range(2, 8):  # 2부터 7까지 (6개 행)
-            # 최대 상품 수에 도달했는지 확인
-            if max_products > 0 and product_counter >= max_products:
-                break
-
-            ul_xpath = f'//*[@id="Contents"]/ul[{row_num}]'
-
-            try:
-                # 해당 행의 ul 요소 찾기
-                row_element = driver.find_element(By.XPATH, ul_xpath)
-                print(f"\n{'=' * 50}")
-                print(f"행 {row_num - 1} 처리 중 (XPath: {ul_xpath})")
-                print(f"{'=' * 50}")
-
-                # 해당 행의 모든 상품 찾기 (각 li 요소)
-                products = row_element.find_elements(By.XPATH, "./li")
-                print(f"이 행에서 찾은 상품 수: {len(products)}")
-
-                # 각 상품을 순회
-                for product_idx in range(1, len(products) + 1):
-                    # 최대 상품 수에 도달했는지 확인
-                    if max_products > 0 and product_counter >= max_products:
-                        print(f"최대 상품 수({max_products})에 도달하여 크롤링 중단")
-                        break
-
-                    try:
-                        product_counter += 1
-
-                        # 각 상품의 링크 XPath 생성
-                        product_xpath = f'{ul_xpath}/li[{product_idx}]/div/a'
-                        print(f"\n{'─' * 30}")
-                        print(f"상품 {product_counter} 클릭 시도 (XPath: {product_xpath})")
-
-                        # 상품 링크 찾기
-                        product_link = driver.find_element(By.XPATH, product_xpath)
-
-                        # 상품명 가져오기 (있을 경우)
-                        try:
-                            product_name = product_link.get_attribute("title") or product_link.get_attribute(
-                                "textContent") or "상품명 없음"
-                            print(f"상품명: {product_name}")
-                        except:
-                            product_name = f"상품_{product_counter}"
-                            print(f"상품명: {product_name} (기본값)")
-
-                        # 상품 클릭
-                        product_link.click()
-                        time.sleep(5)  # 상세 페이지 로딩 대기
-
-                        # 상세 페이지 URL 저장
-                        detail_url = driver.current_url
-                        print(f"상세 페이지 URL: {detail_url}")
-
-                        # ========================================
-                        # 상세페이지에서 데이터 크롤링 (트랜잭션 적용)
-                        # ========================================
-                        # 트랜잭션을 사용하여 원자성 보장
-                        crawl_success = False
-                        try:
-                            with FileTransaction() as transaction:
-                                # 상세 페이지 크롤링 함수 호출
-                                crawl_product_on_detail_page(driver, transaction, product_counter)
-                                # 예외가 없으면 자동으로 commit됨
-                                crawl_success = True
-
-                        except ValueError as ve:
-                            # 비즈니스 로직 예외 (중복 상품, 필수 데이터 누락 등)
-                            print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
-                            print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
-                            # 트랜잭션은 자동으로 rollback됨
-
-                        except Exception as detail_error:
-                            # 일반 예외 (네트워크 오류, 크롤링 실패 등)
-                            print(f"✗ 상품 {product_counter} 크롤링 중 오류: {detail_error}")
-                            traceback.print_exc()
-
-                            # 상세 페이지 크롤링 오류 스크린샷 저장
-                            try:
-                                driver.save_screenshot(f"error_detail_page_{product_counter}.png")
-                                print(f"상세 페이지 오류 스크린샷 저장: error_detail_page_{product_counter}.png")
-                            except:
-                                pass
-
-                            # 트랜잭션은 자동으로 rollback됨
-
-                        # 크롤링 결과 요약
-                        if crawl_success:
-                            print(f"✓ 상품 {product_counter} 처리 완료 및 커밋됨")
-                        else:
-                            print(f"✗ 상품 {product_counter} 처리 실패 및 롤백됨")
-
-                        # 트랜잭션 블록 밖에서 뒤로가기 (성공/실패 여부와 관계없이)
-                        try:
-                            go_back_to_original_page(driver, original_url)
-                        except Exception as back_error:
-                            print(f"✗ 뒤로가기 중 오류 발생: {back_error}")
-                            traceback.print_exc()
-
-                            # 뒤로가기 실패 시 원본 URL로 직접 이동 재시도
-                            try:
-                                print("원본 페이지로 직접 이동 재시도...")
-                                driver.get(original_url)
-                                time.sleep(3)
-                                print("✓ 원본 페이지로 복귀 성공")
-                            except Exception as navigate_error:
-                                print(f"✗ 원본 페이지 복귀 실패: {navigate_error}")
-                                # 이 경우에도 계속 진행하도록 함
-                                pass
-
-                        # 상품 간 약간의 대기 시간 추가
-                        time.sleep(2)
-
-                    except Exception as e:
-                        print(f"상품 {product_counter} 처리 중 오류: {e}")
-                        traceback.print_exc()
-
-                        # 오류 발생시 스크린샷 저장
-                        try:
-                            driver.save_screenshot(f"error_product_{product_counter}.png")
-                            print(f"오류 스크린샷 저장: error_product_{product_counter}.png")
-                        except:
-                            pass
-
-                        # 오류 발생해도 계속 진행
-                        continue
-
-            except Exception as e:
-                print(f"행 {row_num} 처리 중 오류: {e}")
-                traceback.print_exc()
-
-                # 오류 발생시 스크린샷 저장
-                try:
-                    driver.save_screenshot(f"error_row_{row_num}.png")
-                    print(f"행 오류 스크린샷 저장: error_row_{row_num}.png")
-                except:
-                    pass
-
-                # 오류 발생해도 계속 진행
-                continue
+        # 목록의 상품 링크 수집 (ul[2]부터 ul[7]까지, 스크립트 1회 실행)
+        if links is None:
+            links = harvest_product_links(driver)
+        if frontier:
+            # 재시작 시 이 페이지를 다시 열지 않도록 페이지의 모든 링크를 기록한 뒤, 남은 링크만 처리
+            links = frontier.add_page(page, links)
+        links = skip_known_links(links, frontier, index)
+        if max_products > 0:
+            links = links[:max_products]
+        print(f"\n이 페이지에서 수집한 상품 링크 수: {len(links)}")
+
+        product_counter = crawl_links(driver, links, sink, pool, frontier, index)
 
     except Exception as e:
         print(f"현재 페이지 크롤링 중 오류: {e}")
         traceback.print_exc()
 
+        # 오류 발생시 스크린샷 저장
+        try:
+            driver.save_screenshot(f"error_listing_{product_counter}.png")
+            print(f"오류 스크린샷 저장: error_listing_{product_counter}.png")
+        except:
+            pass
+
+    # 페이지네이션을 위해 목록 페이지로 한 번만 복귀 (워커 풀 사용 시 목록을 떠나지 않음, URL 순회 시 불필요)
+    if product_counter > 0 and go_back:
+        try:
+            go_back_to_original_page(driver, original_url)
+        except Exception as back_error:
+            print(f"✗ 목록 페이지 복귀 중 오류 발생: {back_error}")
+            traceback.print_exc()
+
     return product_counter
 
 
-def crawl_all_products(driver, start_url, max_products=0):
+def crawl_all_products(driver, start_url, max_products=0, group_commit_size=20, sink=None, workers=0, resume=True,
+                       skip_known=True, pagination=PAGINATION_URL, rows_per_page=LISTING_ROWS_PER_PAGE,
+                       prefetch_tabs=LISTING_PREFETCH_TABS):
     """
     모든 페이지의 상품을 크롤링하는 메인 함수
 
@@ -372,13 +334,151 @@ def crawl_all_products(driver, start_url, max_products=0):
         driver: 웹드라이버
         start_url: 시작 URL
         max_products: 최대 크롤링할 상품 수 (0이면 모두)
+        group_commit_size: 한 번에 커밋할 상품 수 (0이면 상품마다 개별 커밋, sink가 None일 때만 사용)
+        sink: 저장소 (None이면 SqlTextSink(group_commit_size))
+        workers: 상세 페이지 추출 워커(브라우저) 수 (1 이하면 이 드라이버로 순차 크롤링)
+        resume: True면 크롤링 프론티어에 진행 상황을 기록하고, 이전 실행이 중단된 지점부터 이어서 크롤링
+        skip_known: True면 수집 완료 인덱스로 이미 수집한 상품을 상세 페이지를 열기 전에 건너뜀
+        pagination: 목록 페이지 순회 방식 (PAGINATION_URL 또는 PAGINATION_CLICK)
+        rows_per_page: URL 순회 시 요청할 한 페이지 상품 수 (허용되는 값 이하의 가장 큰 값으로 요청)
+        prefetch_tabs: URL 순회 시 미리 열어 둘 다음 목록 페이지 탭 수
     """
-    driver.get(start_url)
-    time.sleep(10)  # Cloudflare 우회 대기
+    if pagination == PAGINATION_URL:
+        # 한 페이지 상품 수가 바뀌면 페이지 번호도 달라지므로, 바꾼 URL 기준으로 프론티어를 씀
+        start_url = set_rows_per_page(start_url, rows_per_page)
+
+    frontier = CrawlFrontier(frontier_path(start_url), start_url) if resume else None
+    index = CrawledIndex() if skip_known else None
+    try:
+        with (sink or SqlTextSink(group_commit_size)) as sink:
+            if workers > 1:
+                # 이 드라이버는 목록 페이지만 순회하고, 상세 페이지는 워커가 추출 (기록은 이 프로세스에서만)
+                with CrawlWorkerPool(workers, sink, frontier=frontier, index=index) as pool:
+                    _crawl_all_pages(driver, start_url, max_products, sink, pool, frontier, index, pagination,
+                                     prefetch_tabs)
+            else:
+                _crawl_all_pages(driver, start_url, max_products, sink, frontier=frontier, index=index,
+                                 pagination=pagination, prefetch_tabs=prefetch_tabs)
+    finally:
+        if frontier:
+            frontier.close()
+        if index:
+            index.close()
 
-    print("페이지 제목:", driver.title)
 
+def _crawl_all_pages(driver, start_url, max_products, sink, pool=None, frontier=None, index=None,
+                     pagination=PAGINATION_URL, prefetch_tabs=LISTING_PREFETCH_TABS):
+    """
+    crawl_all_products의 페이지 순회 본체
+
+    Args:
+        driver: 웹드라이버
+        start_url: 시작 URL
+        max_products: 최대 크롤링할 상품 수 (0이면 모두)
+        sink: 저장소
+        pool: 상세 페이지 추출 워커 풀 (None이면 순차 크롤링)
+        frontier: 크롤링 프론티어 (None이면 1페이지부터 순회, 진행 상황 기록 안 함)
+        index: 수집 완료 인덱스 (None이면 모든 상품의 상세 페이지를 엶)
+        pagination: 목록 페이지 순회 방식 (PAGINATION_URL 또는 PAGINATION_CLICK)
+        prefetch_tabs: URL 순회 시 미리 열어 둘 다음 목록 페이지 탭 수
+    """
     total_products_crawled = 0
+    first_page = 1
+
+    if frontier:
+        # 이전 실행에서 수집만 하고 처리하지 못한 상품부터 처리 (목록 페이지를 다시 열지 않음)
+        pending_links = skip_known_links(frontier.pending(), frontier, index)
+        if max_products > 0:
+            pending_links = pending_links[:max_products]
+        if pending_links:
+            print(f"\n이전 실행에서 남은 상품 {len(pending_links)}개를 먼저 처리합니다.")
+            total_products_crawled += crawl_links(driver, pending_links, sink, pool, frontier, index)
+
+        if frontier.listing_done:
+            print("\n✓ 목록은 이전 실행에서 마지막 페이지까지 수집했습니다. 크롤링 완료!")
+            return
+        if max_products > 0 and total_products_crawled >= max_products:
+            print(f"\n✓ 최대 상품 수({max_products})에 도달하여 크롤링 완료!")
+            return
+
+        # 마지막으로 수집한 페이지의 다음 페이지부터 순회
+        first_page = frontier.next_page
+        if first_page > 1:
+            print(f"목록 {first_page}페이지부터 이어서 순회합니다.")
+
+    if pagination == PAGINATION_URL:
+        _crawl_pages_by_url(driver, start_url, first_page, max_products, total_products_crawled, sink, pool,
+                            frontier, index, prefetch_tabs)
+    else:
+        _crawl_pages_by_clicking(driver, start_url, first_page, max_products, total_products_crawled, sink, pool,
+                                 frontier, index)
+
+
+def _crawl_pages_by_url(driver, start_url, first_page, max_products, total_products_crawled, sink, pool, frontier,
+                        index, prefetch_tabs):
+    """
+    목록 페이지를 pageIdx URL로 바로 열며 순회 (다음 페이지는 탭에 미리 로드, 클릭/페이지 번호 대기 없음)
+
+    Args:
+        start_url: 목록 URL (rowsPerPage 포함)
+        first_page: 시작 페이지 번호
+        total_products_crawled: 이전 실행에서 남은 상품 처리 수
+        나머지는 _crawl_all_pages와 같음
+    """
+    pager = ListingPager(driver, start_url, first_page, prefetch_tabs)
+    last_page = None
+    try:
+        for page, links in pager:
+            last_page = page
+            print(f"\n{'#' * 60}")
+            print(f"페이지 {page} 처리 시작")
+            print(f"{'#' * 60}")
+
+            remaining_products = max_products - total_products_crawled if max_products > 0 else 0
+            products_crawled = crawl_products_on_current_page(
+                driver, pager.page_url(page), remaining_products, sink, pool, frontier, page, index, links
+            )
+            total_products_crawled += products_crawled
+
+            print(f"\n페이지 {page} 완료: {products_crawled}개 상품 처리")
+            print(f"누적 처리 상품 수: {total_products_crawled}")
+
+            if max_products > 0 and total_products_crawled >= max_products:
+                print(f"\n✓ 최대 상품 수({max_products})에 도달하여 크롤링 완료!")
+                break
+    finally:
+        pager.close()
+
+    if pager.listing_done:
+        print("\n✓ 더 이상 다음 페이지가 없습니다. 크롤링 완료!")
+        if frontier:
+            frontier.finish_listing()
+
+    print(f"\n{'=' * 60}")
+    print("크롤링 완료!")
+    if last_page:
+        print(f"마지막 처리 페이지: {last_page} (목록 페이지 {pager.pages}개, 미리 로드한 탭 {pager.prefetched}개)")
+    print(f"총 처리한 상품 수: {total_products_crawled}")
+    print(f"{'=' * 60}")
+
+
+def _crawl_pages_by_clicking(driver, start_url, first_page, max_products, total_products_crawled, sink, pool,
+                             frontier, index):
+    """
+    목록 페이지를 페이지 번호 링크 클릭으로 순회 (사이트가 pageIdx URL을 받지 않을 때 사용)
+
+    Args:
+        start_url: 목록 URL
+        first_page: 시작 페이지 번호
+        total_products_crawled: 이전 실행에서 남은 상품 처리 수
+        나머지는 _crawl_all_pages와 같음
+    """
+    driver.get(build_listing_page_url(start_url, first_page) if first_page > 1 else start_url)
+    # Cloudflare 확인 페이지를 통과해 목록이 표시될 때까지 대기 (확인 시간은 매번 달라 적응형 타임아웃 미사용)
+    wait_for(driver, "listing.cloudflare", element_present(By.XPATH, CURRENT_PAGE_XPATH),
+             timeout=30, budget=10, adaptive=False)
+
+    print("페이지 제목:", driver.title)
 
     while True:
         # 현재 페이지 번호 확인
@@ -398,7 +498,7 @@ def crawl_all_products(driver, start_url, max_products=0):
         # 현재 페이지의 상품 크롤링
         remaining_products = max_products - total_products_crawled if max_products > 0 else 0
         products_crawled = crawl_products_on_current_page(
-            driver, current_page_url, remaining_products
+            driver, current_page_url, remaining_products, sink, pool, frontier, current_page, index
         )
 
         total_products_crawled += products_crawled
@@ -414,6 +514,8 @@ def crawl_all_products(driver, start_url, max_products=0):
         # 다음 페이지가 있는지 확인
         if not has_next_page(driver, current_page):
             print(f"\n✓ 더 이상 다음 페이지가 없습니다. 크롤링 완료!")
+            if frontier:
+                frontier.finish_listing()
             break
 
         # 다음 페이지로 이동
@@ -424,10 +526,7 @@ def crawl_all_products(driver, start_url, max_products=0):
             print(f"✗ 다음 페이지로 이동 실패. 크롤링 중단.")
             break
 
-        # 페이지 로딩 대기
-        time.sleep(3)
-
-        # 페이지 이동 확인
+        # 페이지 이동 확인 (click_next_page에서 페이지 번호 변경까지 대기함)
         new_page = get_current_page_number(driver)
         if new_page and new_page > current_page:
             print(f"✓ 페이지 {new_page}로 이동 성공")
@@ -435,7 +534,8 @@ def crawl_all_products(driver, start_url, max_products=0):
             print(f"✗ 페이지 이동 실패 또는 페이지 번호 확인 불가")
             # 재시도
             driver.refresh()
-            time.sleep(3)
+            wait_for(driver, "listing.load", element_present(By.XPATH, CURRENT_PAGE_XPATH), timeout=10, budget=3,
+                     adaptive=False)
             new_page = get_current_page_number(driver)
             if not new_page or new_page <= current_page:
                 print("재시도 실패. 크롤링 중단.")
@@ -452,11 +552,15 @@ def crawl_all_products(driver, start_url, max_products=0):
 
 def main():
     """메인 실행 함수"""
+    # 프로필을 유지하고 준비(Cloudflare 확인 통과)가 끝난 드라이버 사용
+    # (이미지/폰트/미디어와 외부 트래커 다운로드 차단도 풀에서 적용)
+    pool = DriverPool(factory=create_driver, name="traversal")
+    pooled = None
     driver = None
 
     try:
-        # 드라이버 생성
-        driver = create_driver()
+        pooled = pool.acquire()
+        driver = pooled.driver
 
         # 시작 URL
         # 클렌징 비누
@@ -512,53 +616,49 @@ def main():
         else:
             print(f"{max_products}개의 상품을 크롤링합니다...")
 
-        # 크롤링 실행
-        crawl_all_products(driver, url, max_products)
+        print("상세 페이지를 동시에 추출할 브라우저 수를 입력하세요 (1: 순차 크롤링)")
+        try:
+            workers = int(input("입력: ").strip())
+        except ValueError:
+            print("잘못된 입력입니다. 순차 크롤링합니다.")
+            workers = 1
+
+        print("여러 카테고리를 번갈아 크롤링하려면 매니페스트 파일 경로 또는 all을 입력하세요 (엔터: 위 URL만 크롤링)")
+        manifest = input("입력: ").strip()
+
+        # 크롤링 실행 (매니페스트 사용 시 입력한 상품 수는 카테고리별 예산)
+        if manifest:
+            crawl_categories(driver, None if manifest == "all" else manifest, workers=workers,
+                             default_budget=max_products)
+        else:
+            crawl_all_products(driver, url, max_products, workers=workers)
 
     except Exception as e:
         print(f"메인 실행 중 오류: {e}")
         traceback.print_exc()
 
     finally:
-        # 드라이버 종료
-        if driver:
-            print("\n드라이버 종료 시도 중...")
+        # 누적된 VALUES 세그먼트를 최종 SQL 파일로 내보내기
+        export_all_sql()
 
+        # 단계별 대기 시간 / 절약 시간 보고
+        WAIT_ENGINE.report()
+
+        # 페이지당 전송량 / 리소스 차단으로 절약한 전송량 보고
+        LEAN_PROFILE.report()
+
+        # 드라이버 종료 (driver.quit으로 브라우저 프로세스까지 정리)
+        if pooled:
             try:
-                # 창 닫기 전에 스크린샷 찍기 (디버깅용)
+                # 종료 전에 스크린샷 찍기 (디버깅용)
                 driver.save_screenshot("final_screenshot.png")
                 print("최종 스크린샷 저장됨: final_screenshot.png")
-            except:
+            except Exception:
                 pass
-
-            try:
-                # 1. 먼저 모든 창 닫기
-                for handle in driver.window_handles:
-                    try:
-                        driver.switch_to.window(handle)
-                        driver.close()
-                        time.sleep(0.1)
-                    except:
-                        pass
-
-                # 2. 명시적으로 드라이버 참조 제거 (메모리 해제)
-                driver_ref = driver
-                del driver
-
-                # 3. garbage collection 강제 실행
-                import gc
-                gc.collect()
-
-                print("✓ 드라이버 종료 프로세스 완료")
-
-            except Exception as e:
-                print(f"✗ 드라이버 종료 중 오류 발생 (무시): {e}")
-
-            print("프로그램 완전 종료")
-
-            # 프로그램 종료 전 짧은 대기
-            time.sleep(1)
+            pool.release(pooled)
+        pool.close()
+        print("프로그램 완전 종료")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
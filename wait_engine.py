@@ -0,0 +1,371 @@
+"""
+조건 기반 대기 엔진
+고정된 time.sleep 대신 "조건이 만족될 때까지" 짧은 간격으로 확인하고,
+조건이 만족되는 즉시 다음 단계로 진행합니다.
+
+- 조건(predicate): driver를 받아 만족 시 참 값을 반환하는 함수 (아래 document_ready 등)
+- DOM 안정화(settle): MutationObserver로 마지막 DOM 변경 시각을 기록하고,
+  일정 시간(quiet) 동안 변경이 없으면 안정화된 것으로 판단
+- 적응형 타임아웃: 단계(stage)별로 조건이 만족된 대기 시간을 기록하고,
+  표본이 충분하면 관측값의 상위 백분위 x 여유 배수로 타임아웃을 줄임
+  줄인 타임아웃으로 대기하다 타임아웃되면 표본을 비워 다음 대기부터 원래 타임아웃으로 복귀
+  (타임아웃된 대기는 표본에 넣지 않으므로, 보통 타임아웃되는 단계의 타임아웃은 줄어들지 않음)
+  페이지 로드처럼 타임아웃되면 이후 추출이 틀어지는 단계는 adaptive=False로 사용
+- 절약 시간 보고: 단계별로 대체한 고정 대기(budget)와 실제 대기 시간을 비교해 출력
+
+사용 예:
+    wait_for(driver, "detail.load", element_present(By.ID, "main"), timeout=15, budget=5)
+    wait_settled(driver, "listing.settle", root_selector="#Contents", budget=2)
+    WAIT_ENGINE.report()
+"""
+
+import time
+from collections import deque
+
+# 브라우저 안에서 조건을 기다리는 스크립트 함수 (execute_async_script용)
+# waitFor(check, timeoutMs): check()가 참 값을 반환하거나 시간이 지나면 그 값으로 resolve
+# option, detail_bundle, html_extract 스크립트가 이 함수를 그대로 사용
+WAIT_FOR_JS = """
+function waitFor(check, timeoutMs) {
+    return new Promise(function (resolve) {
+        var start = Date.now();
+        (function poll() {
+            var value = check();
+            if (value || Date.now() - start >= timeoutMs) { resolve(value); return; }
+            setTimeout(poll, 50);
+        })();
+    });
+}
+"""
+
+# 기본 최대 대기 시간 (초)
+DEFAULT_TIMEOUT = 10
+
+# 조건 확인 간격 (초)
+POLL_INTERVAL = 0.1
+
+# DOM이 이 시간(초) 동안 변경되지 않으면 안정화된 것으로 판단
+SETTLE_QUIET = 0.3
+
+# 적응형 타임아웃 계산에 필요한 최소 표본 수
+ADAPTIVE_MIN_SAMPLES = 5
+
+# 단계별로 보관할 최근 표본 수
+ADAPTIVE_WINDOW = 50
+
+# 관측 대기 시간의 상위 백분위
+ADAPTIVE_PERCENTILE = 0.95
+
+# 백분위 값에 곱할 여유 배수
+ADAPTIVE_MARGIN = 3.0
+
+# 적응형 타임아웃의 하한 (초)
+ADAPTIVE_MIN_TIMEOUT = 1.0
+
+# 마지막 DOM 변경 시각을 기록하는 MutationObserver 설치 스크립트
+# (페이지가 바뀌면 window 변수가 사라지므로 매번 설치 여부를 확인)
+_SETTLE_SCRIPT = """
+var root = arguments[0] ? document.querySelector(arguments[0]) : document.documentElement;
+if (!root) { return null; }
+var key = '__waitEngine:' + (arguments[0] || '');
+window.__waitEngine = window.__waitEngine || {};
+var state = window.__waitEngine[key];
+if (!state || state.root !== root) {
+    state = {root: root, last: performance.now()};
+    new MutationObserver(function () { state.last = performance.now(); })
+        .observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+    window.__waitEngine[key] = state;
+}
+return document.readyState === 'complete' ? performance.now() - state.last : null;
+"""
+
+# 화면 안(스크롤 위치까지)의 지연 로딩 이미지가 모두 로드되었는지 확인하는 스크립트
+_LAZY_IMAGES_SCRIPT = """
+var images = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < images.length; i++) {
+    var img = images[i];
+    if (img.getBoundingClientRect().top > window.innerHeight) { continue; }
+    var src = img.getAttribute('src') || '';
+    if (!src || src.indexOf('data:image') === 0 || !img.complete) { return false; }
+}
+return true;
+"""
+
+
+# ============================================================
+# 조건(predicate) 함수
+# ============================================================
+
+def document_ready():
+    """document.readyState가 complete인지 확인"""
+    def predicate(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return predicate
+
+
+def element_present(by, selector):
+    """요소가 존재하면 해당 요소를 반환"""
+    def predicate(driver):
+        elements = driver.find_elements(by, selector)
+        return elements[0] if elements else None
+    return predicate
+
+
+def elements_present(by, selector):
+    """요소가 하나 이상 존재하면 요소 리스트를 반환"""
+    def predicate(driver):
+        return driver.find_elements(by, selector) or None
+    return predicate
+
+
+def element_clickable(by, selector):
+    """요소가 화면에 보이고 활성화되어 있으면 해당 요소를 반환"""
+    def predicate(driver):
+        elements = driver.find_elements(by, selector)
+        if elements and elements[0].is_displayed() and elements[0].is_enabled():
+            return elements[0]
+        return None
+    return predicate
+
+
+def element_hidden(by, selector):
+    """요소가 없거나 화면에 보이지 않는지 확인"""
+    def predicate(driver):
+        return all(not element.is_displayed() for element in driver.find_elements(by, selector))
+    return predicate
+
+
+def url_changes(previous_url):
+    """현재 URL이 previous_url과 달라졌는지 확인"""
+    def predicate(driver):
+        return driver.current_url != previous_url
+    return predicate
+
+
+def text_equals(by, selector, expected):
+    """요소의 텍스트가 expected와 같은지 확인"""
+    def predicate(driver):
+        elements = driver.find_elements(by, selector)
+        return bool(elements) and elements[0].text.strip() == str(expected)
+    return predicate
+
+
+def attribute_changes(by, selector, attribute, previous_value):
+    """요소의 속성 값이 previous_value에서 바뀌면 새 값을 반환"""
+    def predicate(driver):
+        elements = driver.find_elements(by, selector)
+        if not elements:
+            return None
+        value = elements[0].get_attribute(attribute)
+        return value if value and value != previous_value else None
+    return predicate
+
+
+def lazy_images_loaded(selector):
+    """현재 화면까지의 지연 로딩 이미지(selector)가 모두 로드되었는지 확인"""
+    def predicate(driver):
+        return driver.execute_script(_LAZY_IMAGES_SCRIPT, selector)
+    return predicate
+
+
+def dom_settled(root_selector=None, quiet=SETTLE_QUIET):
+    """
+    페이지 로드가 끝났고 root_selector 아래 DOM이 quiet초 동안 변경되지 않았는지 확인
+    (root_selector가 None이면 문서 전체)
+    """
+    def predicate(driver):
+        idle_ms = driver.execute_script(_SETTLE_SCRIPT, root_selector)
+        return idle_ms is not None and idle_ms >= quiet * 1000
+    return predicate
+
+
+def all_of(*predicates):
+    """모든 조건이 만족되면 마지막 조건의 결과를 반환"""
+    def predicate(driver):
+        result = None
+        for condition in predicates:
+            result = condition(driver)
+            if not result:
+                return None
+        return result
+    return predicate
+
+
+def any_of(*predicates):
+    """조건 중 하나라도 만족되면 그 결과를 반환"""
+    def predicate(driver):
+        for condition in predicates:
+            result = condition(driver)
+            if result:
+                return result
+        return None
+    return predicate
+
+
+# ============================================================
+# 대기 엔진
+# ============================================================
+
+class WaitEngine:
+    """
+    단계(stage)별 대기 시간을 기록하며 조건 기반 대기를 수행하는 엔진
+    """
+
+    def __init__(self, default_timeout=DEFAULT_TIMEOUT, poll_interval=POLL_INTERVAL):
+        """
+        Args:
+            default_timeout: timeout을 지정하지 않았을 때의 최대 대기 시간 (초)
+            poll_interval: 조건 확인 간격 (초)
+        """
+        self.default_timeout = default_timeout
+        self.poll_interval = poll_interval
+        # {단계: deque([성공한 대기 시간, ...])}
+        self._samples = {}
+        # {단계: {"count", "timeouts", "waited", "budget"}}
+        self._stats = {}
+
+    def timeout_for(self, stage, ceiling):
+        """
+        단계의 적응형 타임아웃을 계산합니다.
+        표본이 부족하면 ceiling을 그대로 사용하고, ceiling보다 길어지지는 않습니다.
+
+        Args:
+            stage: 단계 이름
+            ceiling: 최대 타임아웃 (초)
+
+        Returns:
+            float: 사용할 타임아웃 (초)
+        """
+        samples = self._samples.get(stage)
+        if not samples or len(samples) < ADAPTIVE_MIN_SAMPLES:
+            return ceiling
+
+        ordered = sorted(samples)
+        observed = ordered[min(len(ordered) - 1, int(len(ordered) * ADAPTIVE_PERCENTILE))]
+        return min(ceiling, max(ADAPTIVE_MIN_TIMEOUT, observed * ADAPTIVE_MARGIN))
+
+    def wait(self, stage, predicate, driver=None, timeout=None, budget=0, adaptive=True):
+        """
+        조건이 만족될 때까지 대기합니다. 타임아웃이 지나도 예외를 던지지 않습니다.
+
+        Args:
+            stage: 단계 이름 (통계/적응형 타임아웃 구분용)
+            predicate: driver를 받아 만족 시 참 값을 반환하는 함수
+            driver: Selenium WebDriver (predicate에 그대로 전달)
+            timeout: 최대 대기 시간 (None이면 default_timeout)
+            budget: 이 대기가 대체한 고정 대기 시간 (절약 시간 보고용, 초)
+            adaptive: False이면 적응형 타임아웃을 쓰지 않고 항상 timeout까지 대기
+
+        Returns:
+            조건의 결과 (타임아웃 시 None)
+        """
+        ceiling = timeout if timeout is not None else self.default_timeout
+        limit = self.timeout_for(stage, ceiling) if adaptive else ceiling
+
+        start = time.monotonic()
+        result = None
+        while True:
+            try:
+                result = predicate(driver)
+            except Exception:
+                # 요소가 아직 없거나(stale 포함) 페이지가 바뀌는 중이면 다시 확인
+                result = None
+
+            elapsed = time.monotonic() - start
+            if result or elapsed >= limit:
+                break
+            time.sleep(min(self.poll_interval, max(0, limit - elapsed)))
+
+        self._record(stage, elapsed, budget, bool(result), limit < ceiling)
+        return result if result else None
+
+    def settle(self, stage, driver=None, root_selector=None, quiet=SETTLE_QUIET, timeout=None, budget=0):
+        """
+        페이지 로드가 끝나고 DOM 변경이 quiet초 동안 없을 때까지 대기합니다.
+
+        Args:
+            stage: 단계 이름
+            driver: Selenium WebDriver
+            root_selector: 변경을 감시할 요소의 CSS 선택자 (None이면 문서 전체)
+            quiet: 안정화로 판단할 무변경 시간 (초)
+            timeout: 최대 대기 시간 (None이면 default_timeout)
+            budget: 이 대기가 대체한 고정 대기 시간 (초)
+
+        Returns:
+            bool: 안정화 여부 (타임아웃 시 False)
+        """
+        return bool(self.wait(stage, dom_settled(root_selector, quiet), driver, timeout, budget))
+
+    def _record(self, stage, elapsed, budget, satisfied, shortened=False):
+        """
+        단계별 통계와 적응형 타임아웃 표본을 기록합니다.
+
+        Args:
+            stage: 단계 이름
+            elapsed: 실제 대기 시간 (초)
+            budget: 대체한 고정 대기 시간 (초)
+            satisfied: 조건 만족 여부
+            shortened: 적응형 타임아웃으로 줄인 한도로 대기했는지 여부
+        """
+        stats = self._stats.setdefault(stage, {"count": 0, "timeouts": 0, "waited": 0.0, "budget": 0.0})
+        stats["count"] += 1
+        stats["waited"] += elapsed
+        stats["budget"] += budget
+
+        if satisfied:
+            self._samples.setdefault(stage, deque(maxlen=ADAPTIVE_WINDOW)).append(elapsed)
+        else:
+            stats["timeouts"] += 1
+            if shortened:
+                # 줄인 타임아웃이 너무 짧았음 → 표본을 비워 원래 타임아웃으로 복귀
+                self._samples.pop(stage, None)
+                stats["resets"] = stats.get("resets", 0) + 1
+                print(f"[WaitEngine] ⚠ '{stage}' 적응형 타임아웃({elapsed:.1f}초) 초과, 원래 타임아웃으로 복귀")
+
+    def stats(self):
+        """
+        단계별 통계를 반환합니다.
+
+        Returns:
+            dict: {단계: {"count", "timeouts", "waited", "budget", "saved"}}
+        """
+        return {
+            stage: dict(stats, saved=stats["budget"] - stats["waited"])
+            for stage, stats in self._stats.items()
+        }
+
+    def report(self):
+        """단계별 대기 시간과 고정 대기 대비 절약 시간을 출력합니다."""
+        stats = self.stats()
+        if not stats:
+            return
+
+        print(f"\n{'=' * 60}")
+        print("[WaitEngine] 단계별 대기 시간")
+        print(f"{'─' * 60}")
+        total_waited = 0.0
+        total_saved = 0.0
+        for stage, item in sorted(stats.items()):
+            average = item["waited"] / item["count"]
+            timeout_note = f", 타임아웃 {item['timeouts']}회" if item["timeouts"] else ""
+            print(f"  {stage}: {item['count']}회, 평균 {average:.2f}초, "
+                  f"절약 {item['saved']:.1f}초 (고정 대기 {item['budget']:.1f}초){timeout_note}")
+            total_waited += item["waited"]
+            total_saved += item["saved"]
+        print(f"{'─' * 60}")
+        print(f"  총 대기 {total_waited:.1f}초, 고정 대기 대비 절약 {total_saved:.1f}초")
+        print(f"{'=' * 60}")
+
+
+# 파이프라인 전체가 공유하는 대기 엔진
+WAIT_ENGINE = WaitEngine()
+
+
+def wait_for(driver, stage, predicate, timeout=None, budget=0, adaptive=True):
+    """WAIT_ENGINE.wait의 driver 우선 인자 순서 버전"""
+    return WAIT_ENGINE.wait(stage, predicate, driver, timeout, budget, adaptive)
+
+
+def wait_settled(driver, stage, root_selector=None, quiet=SETTLE_QUIET, timeout=None, budget=0):
+    """WAIT_ENGINE.settle의 driver 우선 인자 순서 버전"""
+    return WAIT_ENGINE.settle(stage, driver, root_selector, quiet, timeout, budget)
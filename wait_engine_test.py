@@ -0,0 +1,42 @@
+import time
+from wait_engine import WaitEngine, all_of, any_of, ADAPTIVE_MIN_SAMPLES, ADAPTIVE_MIN_TIMEOUT
+
+engine = WaitEngine(poll_interval=0.01)
+
+# 조건이 만족되면 바로 반환하고, 고정 대기(budget) 대비 절약 시간을 기록
+ready_at = time.monotonic() + 0.05
+result = engine.wait("load", lambda d: time.monotonic() >= ready_at and "ok", timeout=2, budget=1)
+assert result == "ok"
+assert engine.stats()["load"]["saved"] > 0.8
+
+# 예외가 나는 조건은 만족하지 않은 것으로 보고 타임아웃 시 None 반환
+def broken(driver):
+    raise RuntimeError("아직 요소 없음")
+
+assert engine.wait("missing", broken, timeout=0.05) is None
+assert engine.stats()["missing"]["timeouts"] == 1
+
+# 표본이 충분하면 관측 대기 시간 기준으로 타임아웃 단축 (하한 적용)
+assert engine.timeout_for("fast", 10) == 10
+for _ in range(ADAPTIVE_MIN_SAMPLES):
+    engine.wait("fast", lambda d: True, timeout=10)
+print(f"적응형 타임아웃: {engine.timeout_for('fast', 10)}초")
+assert engine.timeout_for("fast", 10) == ADAPTIVE_MIN_TIMEOUT
+
+# 줄인 타임아웃으로 기다리다 타임아웃되면 표본을 비워 원래 타임아웃으로 복귀
+assert engine.wait("fast", lambda d: False, timeout=10) is None
+assert engine.timeout_for("fast", 10) == 10
+assert engine.stats()["fast"]["resets"] == 1
+
+# 타임아웃된 대기는 표본에 넣지 않으므로 보통 타임아웃되는 단계의 타임아웃은 줄지 않음
+for _ in range(ADAPTIVE_MIN_SAMPLES):
+    engine.wait("usually_missing", lambda d: False, timeout=0.02)
+assert engine.timeout_for("usually_missing", 0.02) == 0.02
+
+# 조건 조합
+assert all_of(lambda d: True, lambda d: "last")(None) == "last"
+assert all_of(lambda d: True, lambda d: False)(None) is None
+assert any_of(lambda d: None, lambda d: "second")(None) == "second"
+
+engine.report()
+print("대기 엔진 테스트 통과")
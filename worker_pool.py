@@ -0,0 +1,366 @@
+"""
+멀티 브라우저 워커 풀 모듈
+브라우저(undetected-chromedriver)를 워커 프로세스마다 하나씩 띄워 상세 페이지를 병렬로 추출합니다.
+
+- 워커: 작업 큐에서 상세 페이지 URL을 꺼내 추출(crawl.extract_product_record)만 수행하고 레코드를 결과 큐로 보냄
+- 기록: 메인 프로세스가 결과 큐의 레코드를 저장소에 혼자 기록 (단일 writer)
+        → FileTransaction / SQLite 트랜잭션과 ID 시퀀스는 메인 프로세스에만 있으므로 ID 중복이 생기지 않음
+- 중복 상품: 워커는 저장소를 보지 않고 추출만 하며, 메인 프로세스가 기록할 때 실제 저장소로 확인
+- 프론티어: frontier를 지정하면 넘긴 URL과 처리 결과를 메인 프로세스에서 기록 (중단 후 재시작용)
+- 수집 완료 인덱스: index를 지정하면 저장했거나 이미 존재하는 상품을 메인 프로세스에서 기록
+
+사용 예:
+    with CrawlWorkerPool(workers=4, sink=sink) as pool:
+        for counter, url in enumerate(urls, start=1):
+            pool.submit(url, counter)
+            pool.collect()  # 도착한 결과를 바로 기록 (기다리지 않음)
+"""
+
+import multiprocessing
+import queue
+import time
+import traceback
+
+try:
+    import undetected_chromedriver as uc
+except ImportError:
+    uc = None
+
+from crawl import (DEFAULT_SINK, DuplicateProductError, open_detail_page, extract_product_record,
+                   crawl_product_on_detail_page, RESULT_RECORD, RESULT_SKIPPED, RESULT_DUPLICATE, RESULT_FAILED)
+from driver_pool import DriverPool
+from lean_profile import LEAN_PROFILE
+
+# 기본 워커(브라우저) 수
+DEFAULT_WORKERS = 4
+
+# 워커가 브라우저를 동시에 띄우지 않도록 워커 번호마다 늦추는 시간 (초)
+WORKER_START_STAGGER = 2.0
+
+# 결과 큐를 기다리는 간격 (초), 이 간격마다 워커가 살아 있는지 확인
+RESULT_POLL_INTERVAL = 1.0
+
+# 결과 메시지 종류 (RECORD / SKIPPED / DUPLICATE / FAILED는 crawl의 결과 종류를 그대로 사용)
+RESULT_DONE = "done"        # 워커 종료
+
+
+def create_worker_driver(profile_dir=None):
+    """
+    워커용 드라이버 생성 함수 (test-traversal.create_driver와 같은 옵션)
+    여러 브라우저가 동시에 뜨므로 창 최대화는 하지 않습니다.
+
+    Args:
+        profile_dir: Chrome 사용자 데이터 디렉토리 (driver_pool이 워커마다 지정)
+    """
+    if uc is None:
+        raise ImportError("undetected-chromedriver 패키지가 필요합니다: pip install undetected-chromedriver")
+
+    options = uc.ChromeOptions()
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    options.add_argument(
+        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
+
+    return uc.Chrome(options=options, user_data_dir=profile_dir, version_main=137, use_subprocess=True)
+
+
+def _worker_main(worker_id, tasks, results, mode, driver_factory):
+    """
+    워커 프로세스 본체: 작업 큐가 끝날 때(None)까지 상세 페이지를 추출해 결과 큐로 보냅니다.
+
+    Args:
+        worker_id: 워커 번호
+        tasks: 작업 큐 ((product_counter, url) 또는 종료 신호 None)
+        results: 결과 큐 ((종류, worker_id, product_counter, url, 레코드 또는 오류 메시지))
+        mode: 추출 방식 (crawl.EXTRACT_MODE_*)
+        driver_factory: 드라이버 생성 함수 (프로세스 간 전달 가능한 모듈 수준 함수, profile_dir 인자를 받음)
+    """
+    # 워커마다 프로필을 따로 두고, 준비된 드라이버를 재사용하면서 N페이지마다 재활용
+    drivers = DriverPool(factory=driver_factory, name=f"worker{worker_id}")
+    try:
+        time.sleep(worker_id * WORKER_START_STAGGER)
+        drivers.release(drivers.acquire(), pages=0)
+        print(f"[Worker {worker_id}] 브라우저 시작")
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+
+            product_counter, url = task
+            print(f"[Worker {worker_id}] 상품 {product_counter} 추출 시작: {url}")
+            try:
+                with drivers.session() as driver:
+                    open_detail_page(driver, url, mode)
+                    # 중복 확인은 메인 프로세스가 실제 저장소(self.sink)로 저장 직전에 수행
+                    record = extract_product_record(driver, product_counter, mode=mode, check_duplicate=False)
+                results.put((RESULT_RECORD, worker_id, product_counter, url, record))
+            except ValueError as ve:
+                results.put((RESULT_SKIPPED, worker_id, product_counter, url, str(ve)))
+            except Exception as e:
+                traceback.print_exc()
+                results.put((RESULT_FAILED, worker_id, product_counter, url, str(e)))
+
+    except Exception as e:
+        print(f"[Worker {worker_id}] ✗ 워커 오류로 종료: {e}")
+        traceback.print_exc()
+
+    finally:
+        drivers.close()
+        LEAN_PROFILE.report()
+        results.put((RESULT_DONE, worker_id, None, None, None))
+
+
+class CrawlWorkerPool:
+    """
+    상세 페이지 추출 워커 풀
+    워커 프로세스는 추출만 하고, 저장소 기록은 메인 프로세스(collect/close 호출 측)에서만 수행합니다.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, sink=None, mode=None, driver_factory=create_worker_driver,
+                 frontier=None, index=None, on_result=None):
+        """
+        Args:
+            workers: 워커(브라우저) 수
+            sink: 저장소 (None이면 crawl 모듈의 기본 저장소)
+            mode: 추출 방식 (None이면 crawl.DEFAULT_EXTRACT_MODE)
+            driver_factory: 워커에서 드라이버를 만드는 모듈 수준 함수
+            frontier: URL 상태를 기록할 크롤링 프론티어 (메인 프로세스에서만 기록, None이면 기록 안 함)
+            index: 저장했거나 이미 존재하는 상품을 기록할 수집 완료 인덱스 (None이면 기록 안 함)
+            on_result: URL 하나의 처리가 끝날 때마다 호출할 함수 (url, 결과 종류 RESULT_*)
+        """
+        self.workers = max(1, workers)
+        self.sink = sink or DEFAULT_SINK
+        self.mode = mode
+        self.driver_factory = driver_factory
+        self.frontier = frontier
+        self.index = index
+        self.on_result = on_result
+        self.frontiers = {}  # {URL: submit에서 지정한 프론티어} (카테고리별 프론티어를 쓸 때)
+
+        # 브라우저 프로세스와 섞이지 않도록 spawn 방식으로 워커 생성
+        self.context = multiprocessing.get_context("spawn")
+        self.tasks = None
+        self.results = None
+        self.processes = []
+        self.finished_workers = 0
+
+        # 통계
+        self.submitted = 0
+        self.saved = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started_at = None
+
+    def start(self):
+        """워커 프로세스를 시작합니다."""
+        if self.processes:
+            return
+
+        self.tasks = self.context.Queue()
+        self.results = self.context.Queue()
+        self.started_at = time.monotonic()
+
+        for worker_id in range(self.workers):
+            process = self.context.Process(
+                target=_worker_main,
+                args=(worker_id, self.tasks, self.results, self.mode, self.driver_factory),
+                daemon=True,
+            )
+            process.start()
+            self.processes.append(process)
+
+        print(f"[WorkerPool] 워커 {self.workers}개 시작")
+
+    def submit(self, url, product_counter, frontier=None):
+        """
+        상세 페이지 URL을 작업 큐에 넣습니다.
+
+        Args:
+            url: 상세 페이지 URL
+            product_counter: 상품 번호 (로깅용)
+            frontier: 이 URL의 상태를 기록할 프론티어 (None이면 풀의 frontier)
+        """
+        self.start()
+        if frontier:
+            self.frontiers[url] = frontier
+        frontier = frontier or self.frontier
+        if frontier:
+            frontier.begin(url)
+        self.tasks.put((product_counter, url))
+        self.submitted += 1
+
+    @property
+    def in_flight(self):
+        """작업 큐에 넣었지만 아직 결과를 기록하지 않은 URL 수"""
+        return self.submitted - self.saved - self.skipped - self.failed
+
+    def wait_for_capacity(self, limit):
+        """
+        처리 중인 URL이 limit개 미만이 될 때까지 결과를 기록하며 기다립니다.
+        (목록 순회가 워커보다 너무 앞서 나가지 않도록 작업 큐 길이를 제한할 때 사용)
+
+        Args:
+            limit: 처리 중 URL 최대 수
+        """
+        while self.processes and self.in_flight >= limit and self.finished_workers < len(self.processes):
+            try:
+                message = self.results.get(timeout=RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                if not self._workers_alive():
+                    print("[WorkerPool] ⚠ 모든 워커가 종료되어 더 기다리지 않습니다.")
+                    break
+                continue
+            self._write(message)
+
+    def _write(self, message):
+        """결과 메시지 하나를 처리합니다. (추출 성공이면 저장소에 기록)"""
+        kind, worker_id, product_counter, url, payload = message
+
+        if kind == RESULT_DONE:
+            self.finished_workers += 1
+            print(f"[WorkerPool] 워커 {worker_id} 종료")
+            return
+
+        if kind == RESULT_SKIPPED:
+            self.skipped += 1
+            print(f"✗ 상품 {product_counter} 검증 오류 (워커 {worker_id}): {payload}")
+            self._record(url, kind, payload)
+            return
+
+        if kind == RESULT_FAILED:
+            self.failed += 1
+            print(f"✗ 상품 {product_counter} 크롤링 중 오류 (워커 {worker_id}): {payload}")
+            self._record(url, RESULT_FAILED, payload)
+            return
+
+        # 추출된 레코드를 다시 검증하고 기록 (driver 없이 prefetched로 처리)
+        try:
+            with self.sink.product() as transaction:
+                product_id = crawl_product_on_detail_page(None, transaction, product_counter, self.sink,
+                                                          prefetched=payload)
+                # 완료 기록은 상품이 디스크에 반영된 뒤에 (그룹 커밋 flush 전에 중단되면 재시작 시 다시 처리)
+                transaction.add_commit_hook(self._commit_hook(url, product_id))
+            self.saved += 1
+            print(f"✓ 상품 {product_counter} 처리 완료 및 커밋됨 (워커 {worker_id})")
+            self._record(url, RESULT_RECORD, product_id=product_id)
+        except DuplicateProductError as de:
+            self.skipped += 1
+            print(f"✗ 상품 {product_counter} 검증 오류: {de}")
+            self._record(url, RESULT_DUPLICATE, de)
+        except ValueError as ve:
+            self.skipped += 1
+            print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
+            self._record(url, RESULT_SKIPPED, ve)
+        except Exception as e:
+            self.failed += 1
+            print(f"✗ 상품 {product_counter} 저장 중 오류: {e}")
+            traceback.print_exc()
+            self._record(url, RESULT_FAILED, e)
+
+    def _commit_hook(self, url, product_id):
+        """저장한 상품이 디스크에 반영된 뒤 프론티어와 수집 완료 인덱스에 기록하는 함수를 만듭니다."""
+        frontier = self.frontiers.get(url) or self.frontier
+
+        def hook():
+            if frontier:
+                frontier.mark_done(url, product_id)
+            if self.index:
+                self.index.add(url)
+
+        return hook
+
+    def _record(self, url, kind, reason=None, product_id=None):
+        """
+        URL 하나의 최종 결과를 프론티어 / 수집 완료 인덱스 / on_result 콜백에 알립니다.
+        (저장한 상품의 프론티어 / 인덱스 기록은 _commit_hook이 커밋 후에 처리)
+
+        Args:
+            url: 상세 페이지 URL
+            kind: RESULT_RECORD(저장) / RESULT_DUPLICATE / RESULT_SKIPPED / RESULT_FAILED
+            reason: 건너뜀 / 실패 이유
+            product_id: 저장된 Product ID
+        """
+        frontier = self.frontiers.pop(url, None) or self.frontier
+        if frontier and kind != RESULT_RECORD:
+            if kind == RESULT_FAILED:
+                frontier.mark_failed(url, reason)
+            else:
+                frontier.mark_skipped(url, reason)
+
+        if self.index and kind == RESULT_DUPLICATE:
+            self.index.add(url)
+
+        if self.on_result:
+            self.on_result(url, kind)
+
+    def _workers_alive(self):
+        return any(process.is_alive() for process in self.processes)
+
+    def collect(self, block=False):
+        """
+        도착한 결과를 저장소에 기록합니다.
+
+        Args:
+            block: True면 모든 워커가 종료될 때까지 기다림
+
+        Returns:
+            int: 처리한 결과 수
+        """
+        if not self.processes:
+            return 0
+
+        handled = 0
+        while self.finished_workers < len(self.processes):
+            try:
+                message = self.results.get(timeout=RESULT_POLL_INTERVAL) if block else self.results.get_nowait()
+            except queue.Empty:
+                if not block:
+                    break
+                # 종료 메시지 없이 모든 워커가 죽은 경우 (브라우저 충돌 등)
+                if not self._workers_alive() and self.results.empty():
+                    print("[WorkerPool] ⚠ 종료 메시지 없이 모든 워커가 종료됨")
+                    break
+                continue
+
+            self._write(message)
+            handled += 1
+
+        return handled
+
+    def close(self):
+        """
+        작업 큐를 닫고 남은 결과를 모두 기록한 뒤 워커를 정리합니다.
+
+        Returns:
+            dict: {"submitted", "saved", "skipped", "failed"}
+        """
+        if self.processes:
+            for _ in self.processes:
+                self.tasks.put(None)
+
+            self.collect(block=True)
+
+            for process in self.processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+
+            elapsed = time.monotonic() - self.started_at
+            rate = self.saved / elapsed * 60 if elapsed > 0 else 0
+            print(f"[WorkerPool] 완료: 요청 {self.submitted}개, 저장 {self.saved}개, "
+                  f"건너뜀 {self.skipped}개, 실패 {self.failed}개 "
+                  f"({elapsed:.1f}초, 분당 {rate:.1f}개, 워커 {self.workers}개)")
+            self.processes = []
+
+        return {"submitted": self.submitted, "saved": self.saved, "skipped": self.skipped, "failed": self.failed}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False